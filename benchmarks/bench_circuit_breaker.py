@@ -0,0 +1,60 @@
+"""CircuitBreaker contention benchmark.
+
+Measures successful-call throughput through one shared breaker at 1, 8 and
+64 threads. The plain breaker uses the lock-free CLOSED fast path; the
+windowed breaker records every outcome under the lock and serves as the
+serialized reference.
+
+Run: python benchmarks/bench_circuit_breaker.py [calls_per_thread]
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+
+from kstlib.resilience import CircuitBreaker
+
+THREAD_COUNTS = (1, 8, 64)
+DEFAULT_CALLS = 20_000
+
+
+def _noop() -> int:
+    return 1
+
+
+def run(breaker: CircuitBreaker, threads: int, calls: int) -> float:
+    """Return calls per second for ``threads`` workers doing ``calls`` each."""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        call = breaker.call
+        for _ in range(calls):
+            call(_noop)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+    assert breaker.stats.successful_calls == threads * calls
+    return threads * calls / elapsed
+
+
+def main() -> None:
+    """Print a throughput table."""
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CALLS
+    print(f"{'threads':>8} {'fast path (calls/s)':>22} {'locked window (calls/s)':>26}")
+    for threads in THREAD_COUNTS:
+        fast = run(CircuitBreaker(max_failures=5), threads, calls)
+        locked = run(CircuitBreaker(window_size=100), threads, calls)
+        print(f"{threads:>8} {fast:>22,.0f} {locked:>26,.0f}")
+
+
+if __name__ == "__main__":
+    main()
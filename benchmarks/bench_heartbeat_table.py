@@ -0,0 +1,63 @@
+"""Fleet liveness check benchmark: JSON state files vs. a HeartbeatTable.
+
+Writes one heartbeat per simulated process, then measures how long a
+supervisor takes to check the whole fleet. The file path parses JSON and an
+ISO timestamp per process (what ``Watchdog.from_state_file`` does). The
+table path is one ``HeartbeatTable.dead()`` scan.
+
+Run: python benchmarks/bench_heartbeat_table.py [processes]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from kstlib.resilience import Heartbeat, HeartbeatTable
+
+DEFAULT_PROCESSES = 64
+ROUNDS = 200
+
+
+def bench_files(directory: Path, processes: int) -> float:
+    """Return microseconds per fleet check over JSON state files."""
+    paths = [directory / f"bot-{i}.heartbeat" for i in range(processes)]
+    for path in paths:
+        Heartbeat(path).beat()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        dead = [path for path in paths if not Heartbeat.is_alive(path, max_age_seconds=30)]
+    elapsed = time.perf_counter() - start
+    assert not dead
+    return elapsed / ROUNDS * 1e6
+
+
+def bench_table(directory: Path, processes: int) -> float:
+    """Return microseconds per fleet check over one shared table."""
+    with HeartbeatTable(directory / "fleet.hbt", slots=processes) as table:
+        for i in range(processes):
+            table.claim(f"bot-{i}")
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            dead = table.dead(max_age=30)
+        elapsed = time.perf_counter() - start
+    assert not dead
+    return elapsed / ROUNDS * 1e6
+
+
+def main() -> None:
+    """Print per-check latency for both backends."""
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PROCESSES
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        files = bench_files(directory, processes)
+        table = bench_table(directory, processes)
+    print(f"{'backend':>12} {f'us per check ({processes} processes)':>32}")
+    print(f"{'json files':>12} {files:>32,.1f}")
+    print(f"{'table':>12} {table:>32,.1f}")
+
+
+if __name__ == "__main__":
+    main()
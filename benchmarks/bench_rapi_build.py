@@ -0,0 +1,113 @@
+"""RapiClient request build time benchmark.
+
+Measures endpoint resolution plus request construction (path formatting,
+query extraction, header merging, auth) per call, without sending
+anything. The "templated" rows use the precompiled endpoint templates and
+memoized ``resolve()``; the "legacy" rows replay the previous per-call
+steps (regex scan and ``str.replace`` per placeholder, re-merged header
+dicts) for comparison. Both end by building the same ``httpx.Request``,
+which dominates the remaining cost.
+
+Run: python benchmarks/bench_rapi_build.py [calls]
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sys
+import time
+from typing import Any
+
+import httpx
+
+from kstlib.logging import TRACE_LEVEL
+from kstlib.rapi import RapiClient, RapiConfigManager
+
+DEFAULT_CALLS = 50_000
+log = logging.getLogger("kstlib.rapi.client")
+_PARAM = re.compile(r"\{([a-zA-Z_][a-zA-Z0-9_]*|\d+)\}")
+
+CONFIG = {
+    "api": {
+        "ex": {
+            "base_url": "https://api.example.com",
+            "credentials": "ex_key",
+            "auth_type": "api_key",
+            "headers": {"Accept": "application/json", "User-Agent": "bench"},
+            "endpoints": {
+                "time": {"path": "/api/v3/time", "auth": False},
+                "klines": {
+                    "path": "/api/v3/klines/{symbol}/{interval}",
+                    "query": {"limit": "500"},
+                    "headers": {"X-Endpoint": "klines"},
+                },
+            },
+        }
+    }
+}
+CREDENTIALS = {"ex_key": {"source": "env", "var": "PATH"}}
+
+CASES: list[tuple[str, str, dict[str, Any]]] = [
+    ("no params", "ex.time", {}),
+    ("path+query+auth", "klines", {"symbol": "BTCUSDT", "interval": "1m", "startTime": 1700000000000}),
+]
+
+
+def _trace(msg: str, *args: Any) -> None:
+    log.log(TRACE_LEVEL, msg, *args)
+
+
+def legacy_build(client: RapiClient, manager: RapiConfigManager, ref: str, kwargs: dict[str, Any]) -> httpx.Request:
+    """Replay the per-call build steps used before endpoint templates."""
+    api, endpoint = manager._resolve_full(ref) if "." in ref else manager._resolve_short(ref)
+    _trace("Path template: %s", endpoint.path)
+    if kwargs:
+        _trace("Path/query kwargs: %s", kwargs)
+    path = endpoint.path
+    for placeholder in _PARAM.findall(path):
+        path = path.replace(f"{{{placeholder}}}", str(kwargs[placeholder]))
+    url = f"{api.base_url}{path}"
+    if "\x00" in url or not url.lower().startswith(("http://", "https://")):
+        raise ValueError(url)
+    path_params = {m.group(1) for m in re.finditer(_PARAM.pattern, endpoint.path) if not m.group(1).isdigit()}
+    query = dict(endpoint.query)
+    query.update({k: str(v) for k, v in kwargs.items() if k not in path_params})
+    _trace("Final URL: %s", url)
+    if query:
+        _trace("Query params: %s", query)
+    headers = client._merge_headers(api.headers, endpoint.headers, {})
+    if api.credentials and endpoint.auth:
+        client._apply_auth(headers, api, query, None)
+    request = httpx.Request(endpoint.method, url, params=query or None, headers=headers)
+    _trace(">>> %s %s", request.method, request.url)
+    for name, value in request.headers.items():
+        _trace(">>> %s: %s", name, value)
+    return request
+
+
+def templated_build(client: RapiClient, manager: RapiConfigManager, ref: str, kwargs: dict[str, Any]) -> httpx.Request:
+    """Build the request the way RapiClient.call does."""
+    api, endpoint = manager.resolve(ref)
+    return client._build_request(api, endpoint, (), kwargs, None, None)
+
+
+def main() -> None:
+    """Print per-call build time for each endpoint shape."""
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CALLS
+    manager = RapiConfigManager(CONFIG)
+    client = RapiClient(config_manager=manager, credentials_config=CREDENTIALS)
+
+    print(f"{'case':>16} {'variant':>10} {'us/call':>10} {'calls/s':>12}")
+    for label, ref, kwargs in CASES:
+        for variant, build in (("legacy", legacy_build), ("templated", templated_build)):
+            build(client, manager, ref, kwargs)  # warm-up (credential resolution)
+            start = time.perf_counter()
+            for _ in range(calls):
+                build(client, manager, ref, kwargs)
+            per_call = (time.perf_counter() - start) / calls * 1e6
+            print(f"{label:>16} {variant:>10} {per_call:>10.2f} {1e6 / per_call:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
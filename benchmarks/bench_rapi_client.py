@@ -0,0 +1,89 @@
+"""RapiClient sequential call latency benchmark.
+
+Sends sequential GET calls to a local keep-alive HTTP server. The pooled
+client reuses one connection per API; the per-call variant closes the pool
+after every call, which is what RapiClient did before it kept long-lived
+clients. Each new client also loads the CA bundle into a fresh SSL
+context, even for plain HTTP. Loopback shows that cost and the TCP
+handshake; against a remote TLS endpoint the gap also grows by the TLS
+handshake and network round trips.
+
+Run: python benchmarks/bench_rapi_client.py [calls]
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from kstlib.rapi import RapiClient, RapiConfigManager
+
+DEFAULT_CALLS = 2_000
+BODY = b'{"symbol": "BTCUSDT", "price": "65000.00"}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Keep-alive JSON responder standing in for a REST API."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+def run(client: RapiClient, calls: int, *, reconnect: bool) -> list[float]:
+    """Return per-call latencies in milliseconds."""
+    client.call("local.ticker")  # warm-up
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        client.call("local.ticker")
+        latencies.append((time.perf_counter() - start) * 1000)
+        if reconnect:
+            client.close()
+    return latencies
+
+
+def main() -> None:
+    """Print a latency table."""
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CALLS
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    manager = RapiConfigManager(
+        {
+            "api": {
+                "local": {
+                    "base_url": f"http://127.0.0.1:{server.server_address[1]}",
+                    "endpoints": {"ticker": {"path": "/ticker"}},
+                }
+            }
+        }
+    )
+
+    print(f"{'client':>10} {'mean (ms)':>10} {'p50 (ms)':>10} {'p99 (ms)':>10} {'calls/s':>10}")
+    try:
+        for label, reconnect in (("per-call", True), ("pooled", False)):
+            with RapiClient(config_manager=manager) as client:
+                latencies = run(client, calls, reconnect=reconnect)
+            ordered = sorted(latencies)
+            mean = statistics.fmean(ordered)
+            p99 = ordered[max(0, int(len(ordered) * 0.99) - 1)]
+            print(f"{label:>10} {mean:>10.3f} {statistics.median(ordered):>10.3f} {p99:>10.3f} {1000 / mean:>10,.0f}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
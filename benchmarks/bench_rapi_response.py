@@ -0,0 +1,131 @@
+"""RapiResponse allocation and decode cost benchmark.
+
+Builds RapiResponse objects from canned ``httpx.Response`` objects and
+reports time and allocated bytes per response (``tracemalloc``). The
+"eager" rows replay the previous parsing (text decode, JSON decode and a
+header dict copy on every response). The lazy rows use the current
+class and touch only ``status_code``, ``data`` or everything. With
+``orjson`` installed, an extra row uses it as ``json_decoder``.
+
+Run: python benchmarks/bench_rapi_response.py [responses]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from kstlib.rapi import RapiResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_RESPONSES = 2_000
+
+HEADERS = {
+    "Content-Type": "application/json",
+    "Date": "Sat, 18 Oct 2026 10:00:00 GMT",
+    "Server": "nginx",
+    "X-Mbx-Used-Weight-1m": "12",
+    "Cache-Control": "no-cache",
+}
+BODIES = {
+    "small": json.dumps({"symbol": "BTCUSDT", "price": "67000.01"}).encode(),
+    "klines x500": json.dumps([[1700000000000 + i, "1.0", "2.0", "0.5", "1.5", "10.0"] for i in range(500)]).encode(),
+}
+
+
+def eager(raw: httpx.Response, _decoder: Any) -> RapiResponse:
+    """Replay the former eager parsing."""
+    text = raw.text
+    data = raw.json() if "application/json" in raw.headers.get("content-type", "") else None
+    return RapiResponse(raw.status_code, dict(raw.headers), data, text, 0.0, "ex.ep")
+
+
+def lazy(raw: httpx.Response, decoder: Any) -> RapiResponse:
+    """Build the response the way RapiClient does."""
+    return RapiResponse(
+        raw.status_code, raw.headers, elapsed=0.0, endpoint_ref="ex.ep", content=raw.content, json_decoder=decoder
+    )
+
+
+def touch_status(response: RapiResponse) -> None:
+    """Only check the status."""
+    _ = response.ok
+
+
+def touch_data(response: RapiResponse) -> None:
+    """Check the status and read the JSON data."""
+    _ = response.ok and response.data
+
+
+def touch_all(response: RapiResponse) -> None:
+    """Read every decoded field."""
+    _ = response.data, response.text, response.headers
+
+
+def fresh(body: bytes, count: int) -> list[httpx.Response]:
+    """Return unread responses (httpx caches ``.text`` on first access)."""
+    return [httpx.Response(200, headers=HEADERS, content=body) for _ in range(count)]
+
+
+def measure(
+    body: bytes,
+    count: int,
+    build: Callable[[httpx.Response, Any], RapiResponse],
+    touch: Callable[[RapiResponse], None],
+    decoder: Any,
+) -> tuple[float, float]:
+    """Return (microseconds, retained allocated bytes) per response."""
+    raws = fresh(body, count)
+    start = time.perf_counter()
+    for raw in raws:
+        touch(build(raw, decoder))
+    per_call = (time.perf_counter() - start) / count * 1e6
+
+    raws = fresh(body, count)
+    kept: list[RapiResponse] = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for raw in raws:
+        response = build(raw, decoder)
+        touch(response)
+        kept.append(response)
+    allocated = (tracemalloc.get_traced_memory()[0] - before) / count
+    tracemalloc.stop()
+    return per_call, allocated
+
+
+def main() -> None:
+    """Print time and retained allocation per response for each variant."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RESPONSES
+    try:
+        import orjson
+
+        fast: Any = orjson.loads
+    except ImportError:
+        fast = None
+
+    variants: list[tuple[str, Callable[..., RapiResponse], Callable[[RapiResponse], None], Any]] = [
+        ("eager", eager, touch_all, None),
+        ("lazy status", lazy, touch_status, None),
+        ("lazy data", lazy, touch_data, None),
+        ("lazy all", lazy, touch_all, None),
+    ]
+    if fast is not None:
+        variants.append(("lazy data+orjson", lazy, touch_data, fast))
+
+    print(f"{'body':>12} {'variant':>17} {'us/resp':>9} {'bytes/resp':>11}")
+    for label, body in BODIES.items():
+        for name, build, touch, decoder in variants:
+            per_call, allocated = measure(body, count, build, touch, decoder)
+            print(f"{label:>12} {name:>17} {per_call:>9.2f} {allocated:>11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,8 @@
     HARD_MIN_POOL_MAX_SIZE,
     HARD_MIN_POOL_MIN_SIZE,
 )
+from kstlib.resilience.deadline import check_deadline, clamp_timeout
+from kstlib.resilience.exceptions import DeadlineExceededError
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -177,6 +179,7 @@ async def acquire(self) -> aiosqlite.Connection:
         Raises:
             PoolExhaustedError: If no connection available within timeout.
             DatabaseConnectionError: If connection creation fails after retries.
+            DeadlineExceededError: If the ``deadline()`` budget ran out.
         """
         if self._closed:
             raise DatabaseConnectionError("Pool is closed")
@@ -189,9 +192,11 @@ async def acquire(self) -> aiosqlite.Connection:
             try:
                 # Try to get from pool with timeout
                 try:
-                    conn = await asyncio.wait_for(self._pool.get(), timeout=self.acquire_timeout)
+                    timeout = clamp_timeout(self.acquire_timeout, "pool acquire")
+                    conn = await asyncio.wait_for(self._pool.get(), timeout=timeout)
                     self._stats.idle_connections -= 1
                 except asyncio.TimeoutError:
+                    check_deadline("pool acquire")
                     # Pool empty, try to create new if under max
                     async with self._lock:
                         if len(self._connections) < self.max_size:
@@ -217,7 +222,7 @@ async def acquire(self) -> aiosqlite.Connection:
                 self._stats.total_acquired += 1
                 return conn
 
-            except PoolExhaustedError:
+            except (PoolExhaustedError, DeadlineExceededError):
                 raise
             except Exception as e:
                 self._stats.total_errors += 1
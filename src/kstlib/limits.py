@@ -95,6 +95,10 @@
 HARD_MIN_HALF_OPEN_CALLS = 1
 HARD_MAX_HALF_OPEN_CALLS = 10
 
+#: Circuit breaker sliding window bounds (calls or seconds) - protects against unbounded memory.
+HARD_MIN_CIRCUIT_WINDOW_SIZE = 1
+HARD_MAX_CIRCUIT_WINDOW_SIZE = 10_000
+
 #: Watchdog timeout bounds (seconds) - protects against too short or impossibly long timeouts.
 HARD_MIN_WATCHDOG_TIMEOUT = 1
 HARD_MAX_WATCHDOG_TIMEOUT = 3600  # 1 hour
@@ -139,6 +143,18 @@
 HARD_MIN_RAPI_BACKOFF = 1.0
 HARD_MAX_RAPI_BACKOFF = 5.0
 
+#: RAPI retry budget ratio bounds (retry tokens per call) - caps retry amplification.
+HARD_MIN_RAPI_RETRY_BUDGET_RATIO = 0.0
+HARD_MAX_RAPI_RETRY_BUDGET_RATIO = 1.0
+
+#: RAPI retry budget floor bounds (retries per second always allowed).
+HARD_MIN_RAPI_RETRY_BUDGET_PER_SECOND = 0.0
+HARD_MAX_RAPI_RETRY_BUDGET_PER_SECOND = 100.0
+
+#: RAPI retry budget capacity bounds (tokens) - limits retry bursts.
+HARD_MIN_RAPI_RETRY_BUDGET_MAX_TOKENS = 1.0
+HARD_MAX_RAPI_RETRY_BUDGET_MAX_TOKENS = 1000.0
+
 #: Alert throttle rate bounds - protects against too permissive or impossible thresholds.
 HARD_MIN_THROTTLE_RATE = 1
 HARD_MAX_THROTTLE_RATE = 1000
@@ -233,6 +249,7 @@
 DEFAULT_MAX_SOPS_CACHE_ENTRIES = 64
 
 DEFAULT_HEARTBEAT_INTERVAL = 10  # seconds
+DEFAULT_HEARTBEAT_FSYNC = False
 DEFAULT_SHUTDOWN_TIMEOUT = 30  # seconds
 DEFAULT_CIRCUIT_MAX_FAILURES = 5
 DEFAULT_CIRCUIT_RESET_TIMEOUT = 60  # seconds
@@ -250,6 +267,9 @@
 DEFAULT_RAPI_MAX_RETRIES = 3
 DEFAULT_RAPI_RETRY_DELAY = 1.0  # seconds
 DEFAULT_RAPI_BACKOFF = 2.0
+DEFAULT_RAPI_RETRY_BUDGET_RATIO = 0.2  # retries up to 20% of calls
+DEFAULT_RAPI_RETRY_BUDGET_PER_SECOND = 1.0
+DEFAULT_RAPI_RETRY_BUDGET_MAX_TOKENS = 10.0
 
 DEFAULT_THROTTLE_RATE = 10  # alerts per period
 DEFAULT_THROTTLE_PER = 60.0  # seconds
@@ -465,6 +485,7 @@ class ResilienceLimits:
         circuit_reset_timeout: Cooldown before recovery attempt.
         circuit_half_open_calls: Calls allowed in half-open state.
         watchdog_timeout: Seconds before watchdog triggers timeout.
+        heartbeat_fsync: Whether heartbeat writes are flushed to disk.
     """
 
     heartbeat_interval: float
@@ -473,6 +494,7 @@ class ResilienceLimits:
     circuit_reset_timeout: float
     circuit_half_open_calls: int
     watchdog_timeout: float
+    heartbeat_fsync: bool = DEFAULT_HEARTBEAT_FSYNC
 
 
 def clamp_with_limits(value: float, hard_min: float, hard_max: float) -> float:
@@ -521,6 +543,8 @@ def get_resilience_limits(
     if config is None:
         config = _load_config()
 
+    raw_fsync = _get_nested(config, "resilience", "heartbeat", "fsync")
+
     return ResilienceLimits(
         heartbeat_interval=_parse_float_config(
             _get_nested(config, "resilience", "heartbeat", "interval"),
@@ -558,6 +582,7 @@ def get_resilience_limits(
             HARD_MIN_WATCHDOG_TIMEOUT,
             HARD_MAX_WATCHDOG_TIMEOUT,
         ),
+        heartbeat_fsync=DEFAULT_HEARTBEAT_FSYNC if raw_fsync is None else bool(raw_fsync),
     )
 
 
@@ -651,6 +676,9 @@ class RapiLimits:
         max_retries: Maximum retry attempts.
         retry_delay: Delay between retries in seconds.
         retry_backoff: Backoff multiplier for exponential retry.
+        retry_budget_ratio: Retry tokens earned per call (client-wide budget).
+        retry_budget_per_second: Retries per second allowed regardless of volume.
+        retry_budget_max_tokens: Retry budget capacity (largest retry burst).
     """
 
     timeout: float
@@ -658,6 +686,9 @@ class RapiLimits:
     max_retries: int
     retry_delay: float
     retry_backoff: float
+    retry_budget_ratio: float = DEFAULT_RAPI_RETRY_BUDGET_RATIO
+    retry_budget_per_second: float = DEFAULT_RAPI_RETRY_BUDGET_PER_SECOND
+    retry_budget_max_tokens: float = DEFAULT_RAPI_RETRY_BUDGET_MAX_TOKENS
 
     @property
     def max_response_size_display(self) -> str:
@@ -724,6 +755,24 @@ def get_rapi_limits(
             HARD_MIN_RAPI_BACKOFF,
             HARD_MAX_RAPI_BACKOFF,
         ),
+        retry_budget_ratio=_parse_float_config(
+            _get_nested(config, "rapi", "limits", "retry_budget_ratio"),
+            DEFAULT_RAPI_RETRY_BUDGET_RATIO,
+            HARD_MIN_RAPI_RETRY_BUDGET_RATIO,
+            HARD_MAX_RAPI_RETRY_BUDGET_RATIO,
+        ),
+        retry_budget_per_second=_parse_float_config(
+            _get_nested(config, "rapi", "limits", "retry_budget_per_second"),
+            DEFAULT_RAPI_RETRY_BUDGET_PER_SECOND,
+            HARD_MIN_RAPI_RETRY_BUDGET_PER_SECOND,
+            HARD_MAX_RAPI_RETRY_BUDGET_PER_SECOND,
+        ),
+        retry_budget_max_tokens=_parse_float_config(
+            _get_nested(config, "rapi", "limits", "retry_budget_max_tokens"),
+            DEFAULT_RAPI_RETRY_BUDGET_MAX_TOKENS,
+            HARD_MIN_RAPI_RETRY_BUDGET_MAX_TOKENS,
+            HARD_MAX_RAPI_RETRY_BUDGET_MAX_TOKENS,
+        ),
     )
 
 
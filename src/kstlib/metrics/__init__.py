@@ -6,6 +6,7 @@
 - **Memory Tracking**: Monitor peak memory usage with tracemalloc
 - **Call Statistics**: Track call count, avg/min/max durations
 - **Step Tracking**: Numbered step tracking with summary
+- **Event Loop**: asyncio lag percentiles and blocking-call stacks
 
 All behavior is config-driven with sensible defaults.
 
@@ -51,6 +52,14 @@
     >>> sw.lap("Step 1")  # doctest: +SKIP
     >>> sw.stop()  # doctest: +SKIP
     >>> sw.summary()  # doctest: +SKIP
+
+    Event-loop lag and blocking calls:
+
+    >>> from kstlib.metrics import EventLoopMonitor
+    >>> async with EventLoopMonitor(block_threshold=0.1) as monitor:  # doctest: +SKIP
+    ...     await run_bot()
+    >>> monitor.stats().p99  # doctest: +SKIP
+    0.0042
 """
 
 from kstlib.metrics.decorators import (
@@ -66,12 +75,17 @@
     metrics_context,
     metrics_summary,
     print_all_call_stats,
+    register_call_stats,
     reset_all_call_stats,
 )
+from kstlib.metrics.event_loop import BlockingEvent, EventLoopMonitor, EventLoopStats
 from kstlib.metrics.exceptions import MetricsError
 
 __all__ = [
+    "BlockingEvent",
     "CallStats",
+    "EventLoopMonitor",
+    "EventLoopStats",
     "MetricsError",
     "MetricsRecord",
     "Stopwatch",
@@ -84,5 +98,6 @@
     "metrics_context",
     "metrics_summary",
     "print_all_call_stats",
+    "register_call_stats",
     "reset_all_call_stats",
 ]
@@ -989,6 +989,24 @@ def get_call_stats(func_name: str) -> CallStats | None:
         return _call_stats_registry.get(func_name)
 
 
+def register_call_stats(name: str) -> CallStats:
+    """Return the tracked call statistics for ``name``, creating them if needed.
+
+    Lets code that measures durations itself (rather than through
+    ``@call_stats``) report into the shared registry.
+
+    Examples:
+        >>> stats = register_call_stats("event_loop.lag")
+        >>> stats.record(0.002)
+        >>> get_call_stats("event_loop.lag") is stats
+        True
+    """
+    with _registry_lock:
+        if name not in _call_stats_registry:
+            _call_stats_registry[name] = CallStats(name=name)
+        return _call_stats_registry[name]
+
+
 def get_all_call_stats() -> dict[str, CallStats]:
     """Get all tracked call statistics."""
     with _registry_lock:
@@ -1048,12 +1066,7 @@ def call_stats(
     """
 
     def decorator(fn: Callable[P, R]) -> Callable[P, R]:
-        label = name or fn.__name__
-
-        with _registry_lock:
-            if label not in _call_stats_registry:
-                _call_stats_registry[label] = CallStats(name=label)
-            stats = _call_stats_registry[label]
+        stats = register_call_stats(name or fn.__name__)
 
         @functools.wraps(fn)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
@@ -1086,5 +1099,6 @@ def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
     "metrics_context",
     "metrics_summary",
     "print_all_call_stats",
+    "register_call_stats",
     "reset_all_call_stats",
 ]
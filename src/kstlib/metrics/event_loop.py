@@ -0,0 +1,313 @@
+"""Event-loop lag sampling and blocking-call detection for asyncio.
+
+:class:`EventLoopMonitor` schedules a timer every ``interval`` seconds and
+measures how late it fires. That delay is the time callbacks spent holding
+the loop. Samples go into a bounded window for percentiles and into the
+shared ``kstlib.metrics`` call-stats registry (``<name>.lag``).
+
+A watcher thread checks that the timer keeps firing. If the loop has not
+ticked for longer than ``block_threshold``, the watcher captures the stack of
+the loop thread, which shows the callback that is blocking. When the loop
+resumes, the event is recorded as a :class:`BlockingEvent`, counted under
+``<name>.blocked``, logged, and passed to the optional ``on_alert``
+callback.
+
+Examples:
+    >>> async def main():  # doctest: +SKIP
+    ...     async with EventLoopMonitor(block_threshold=0.1) as monitor:
+    ...         await run_bot()
+    ...     print(monitor.stats().p99)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import math
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from typing_extensions import Self
+
+from kstlib.metrics.decorators import register_call_stats
+
+log = logging.getLogger(__name__)
+
+# Type alias for alert callback (channel, message, context)
+OnAlertCallback = Callable[[str, str, Mapping[str, Any]], Awaitable[None] | None]
+
+#: Blocking events kept for inspection.
+MAX_BLOCKING_EVENTS = 32
+
+
+def _percentile(ordered: list[float], p: float) -> float:
+    """Nearest-rank percentile of sorted samples (0.0 if empty)."""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+@dataclass(frozen=True, slots=True)
+class BlockingEvent:
+    """One period during which a callback held the event loop.
+
+    Attributes:
+        duration: How long the loop was blocked (seconds).
+        stack: Stack of the loop thread while blocked ("" if not captured).
+        timestamp: Wall-clock time when the loop resumed (``time.time()``).
+    """
+
+    duration: float
+    stack: str
+    timestamp: float
+
+
+@dataclass(frozen=True, slots=True)
+class EventLoopStats:
+    """Snapshot of event-loop lag.
+
+    Attributes:
+        samples: Lag samples in the window.
+        p50: Median lag (seconds).
+        p90: 90th percentile lag (seconds).
+        p99: 99th percentile lag (seconds).
+        max: Highest lag in the window (seconds).
+        blocked: Blocking events since the monitor was created.
+    """
+
+    samples: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+    blocked: int
+
+
+class EventLoopMonitor:
+    """Sample event-loop lag and catch callbacks that block the loop.
+
+    Args:
+        interval: Timer period for lag samples (seconds).
+        block_threshold: Lag that counts as a blocking call (seconds,
+            None = lag sampling only).
+        window: Lag samples kept for percentiles.
+        name: Prefix of the ``kstlib.metrics`` call-stats entries.
+        on_lag: Called with each lag sample, e.g.
+            ``AdmissionController.record_lag``.
+        on_alert: Callback for alerting (channel, message, context), called
+            on the loop for each blocking event.
+
+    Examples:
+        >>> monitor = EventLoopMonitor(interval=0.01, block_threshold=0.05)
+        >>> monitor.percentile(99)
+        0.0
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        interval: float = 0.05,
+        block_threshold: float | None = 0.1,
+        window: int = 1024,
+        name: str = "event_loop",
+        on_lag: Callable[[float], None] | None = None,
+        on_alert: OnAlertCallback | None = None,
+    ) -> None:
+        """Initialize event-loop monitor.
+
+        Raises:
+            ValueError: If interval, block_threshold or window is out of range.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if block_threshold is not None and block_threshold <= 0:
+            raise ValueError("block_threshold must be positive")
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self._interval = interval
+        self._block_threshold = block_threshold
+        self._name = name
+        self._on_lag = on_lag
+        self._on_alert = on_alert
+        self._lags: deque[float] = deque(maxlen=window)
+        self._events: deque[BlockingEvent] = deque(maxlen=MAX_BLOCKING_EVENTS)
+        self._blocked = 0
+        self._lock = threading.Lock()
+        self._lag_stats = register_call_stats(f"{name}.lag")
+        self._blocked_stats = register_call_stats(f"{name}.blocked")
+        self._task: asyncio.Task[None] | None = None
+        self._watcher: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._loop_thread_id: int | None = None
+        self._last_tick = 0.0
+        self._captured_stack: str | None = None
+
+    @property
+    def interval(self) -> float:
+        """Timer period for lag samples (seconds)."""
+        return self._interval
+
+    @property
+    def block_threshold(self) -> float | None:
+        """Lag that counts as a blocking call (seconds)."""
+        return self._block_threshold
+
+    @property
+    def running(self) -> bool:
+        """True while the monitor samples a loop."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def events(self) -> list[BlockingEvent]:
+        """Most recent blocking events, oldest first."""
+        with self._lock:
+            return list(self._events)
+
+    def percentile(self, p: float) -> float:
+        """Return the ``p``-th percentile of lag in the window (0.0 if empty).
+
+        Args:
+            p: Percentile in (0, 100].
+        """
+        with self._lock:
+            ordered = sorted(self._lags)
+        return _percentile(ordered, p)
+
+    def stats(self) -> EventLoopStats:
+        """Return a snapshot of lag percentiles and blocking counts."""
+        with self._lock:
+            ordered = sorted(self._lags)
+            blocked = self._blocked
+        return EventLoopStats(
+            samples=len(ordered),
+            p50=_percentile(ordered, 50),
+            p90=_percentile(ordered, 90),
+            p99=_percentile(ordered, 99),
+            max=ordered[-1] if ordered else 0.0,
+            blocked=blocked,
+        )
+
+    async def _record(self, lag: float) -> None:
+        """Record one lag sample and handle a blocking event if it is one.
+
+        Args:
+            lag: How late the timer fired (seconds).
+        """
+        lag = max(0.0, lag)
+        with self._lock:
+            self._lags.append(lag)
+            stack, self._captured_stack = self._captured_stack, None
+        self._lag_stats.record(lag)
+        if self._on_lag is not None:
+            with contextlib.suppress(Exception):
+                self._on_lag(lag)
+        if self._block_threshold is not None and lag >= self._block_threshold:
+            await self._report_blocking(lag, stack or "")
+
+    async def _report_blocking(self, duration: float, stack: str) -> None:
+        """Record, log and alert one blocking event."""
+        event = BlockingEvent(duration=duration, stack=stack, timestamp=time.time())
+        with self._lock:
+            self._events.append(event)
+            self._blocked += 1
+        self._blocked_stats.record(duration)
+        log.warning("Event loop blocked for %.3fs%s", duration, f"\n{stack}" if stack else "")
+
+        if self._on_alert is not None:
+            with contextlib.suppress(Exception):
+                result = self._on_alert(
+                    "event_loop",
+                    f"Event loop '{self._name}' blocked for {duration:.3f}s",
+                    {"duration": duration, "threshold": self._block_threshold, "stack": stack},
+                )
+                if inspect.isawaitable(result):
+                    await result
+
+    async def _sample(self) -> None:
+        """Sleep ``interval`` in a loop and record how late each wake-up is."""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._last_tick = time.monotonic()
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            await self._record(loop.time() - expected)
+
+    def _watch(self) -> None:
+        """Capture the loop thread's stack when ticks stop arriving."""
+        threshold = self._block_threshold
+        if threshold is None:  # pragma: no cover - thread only started with a threshold
+            return
+        poll = min(self._interval, threshold) / 2
+        captured_for = 0.0
+        while not self._stop.wait(poll):
+            tick = self._last_tick
+            if tick == captured_for or time.monotonic() - tick < self._interval + threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id or 0)  # noqa: SLF001
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            with self._lock:
+                self._captured_stack = stack
+            captured_for = tick
+
+    async def astart(self) -> None:
+        """Start monitoring the running event loop. No-op if running."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        if self._block_threshold is not None:
+            self._stop.clear()
+            self._watcher = threading.Thread(target=self._watch, name=f"kstlib-{self._name}-watch", daemon=True)
+            self._watcher.start()
+
+    async def astop(self) -> None:
+        """Stop sampling and the watcher thread."""
+        self._stop.set()
+        watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher.join(timeout=1.0)
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager, starting the monitor."""
+        await self.astart()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Exit async context manager, stopping the monitor."""
+        await self.astop()
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"EventLoopMonitor(interval={self._interval}, block_threshold={self._block_threshold}, name={self._name!r})"
+        )
+
+
+__all__ = [
+    "BlockingEvent",
+    "EventLoopMonitor",
+    "EventLoopStats",
+    "OnAlertCallback",
+]
@@ -29,6 +29,7 @@
 from kstlib.pipeline.steps.callable import CallableStep
 from kstlib.pipeline.steps.python import PythonStep
 from kstlib.pipeline.steps.shell import ShellStep
+from kstlib.resilience.deadline import remaining_time
 
 if TYPE_CHECKING:
     from kstlib.pipeline.base import AbstractStep
@@ -48,6 +49,8 @@ class PipelineRunner:
 
     Supports conditional execution (``when``), error policies
     (``fail_fast`` / ``continue``), timeout cascading, and dry-run mode.
+    Inside a :func:`~kstlib.resilience.deadline.deadline` block, step
+    timeouts are clamped to the remaining budget.
 
     Args:
         config: Pipeline configuration.
@@ -157,15 +160,8 @@ def run(self, *, dry_run: bool = False) -> PipelineResult:
                 pipeline_result.results.append(StepResult(name=step_config.name, status=StepStatus.SKIPPED))
                 continue
 
-            # Resolve timeout cascade: step timeout > pipeline default
-            effective_config = step_config
-            if step_config.timeout is None:
-                # Apply pipeline default timeout via a new StepConfig
-                effective_config = _with_timeout(step_config, self._config.default_timeout)
-
             # Execute step
-            executor = _STEP_EXECUTORS[step_config.type]
-            result = executor.execute(effective_config, dry_run=dry_run)
+            result = self._execute_step(step_config, dry_run)
             pipeline_result.results.append(result)
 
             logger.info(
@@ -217,6 +213,37 @@ def _should_execute(
         # StepCondition.ALWAYS (default)
         return True
 
+    def _execute_step(self, step_config: StepConfig, dry_run: bool) -> StepResult:
+        """Execute one step with its effective timeout.
+
+        The timeout cascades step timeout > pipeline default, then is
+        clamped to the remaining ``deadline()`` budget. A step is not started
+        once that budget is spent.
+
+        Args:
+            step_config: Step configuration.
+            dry_run: Whether to simulate execution.
+
+        Returns:
+            The step result (TIMEOUT without running if the deadline passed).
+        """
+        timeout = step_config.timeout if step_config.timeout is not None else self._config.default_timeout
+        left = remaining_time()
+        if left is not None:
+            if left <= 0:
+                return StepResult(
+                    name=step_config.name,
+                    status=StepStatus.TIMEOUT,
+                    error="Deadline exceeded before step started",
+                )
+            timeout = min(timeout, left)
+
+        effective_config = step_config
+        if timeout != step_config.timeout:
+            effective_config = _with_timeout(step_config, timeout)
+        executor = _STEP_EXECUTORS[step_config.type]
+        return executor.execute(effective_config, dry_run=dry_run)
+
     def _execute_on_failure_steps(
         self,
         failed_step: StepConfig,
@@ -240,11 +267,7 @@ def _execute_on_failure_steps(
             if not found:
                 continue
             if step_config.when == StepCondition.ON_FAILURE:
-                effective_config = step_config
-                if step_config.timeout is None:
-                    effective_config = _with_timeout(step_config, self._config.default_timeout)
-                executor = _STEP_EXECUTORS[step_config.type]
-                result = executor.execute(effective_config, dry_run=dry_run)
+                result = self._execute_step(step_config, dry_run)
                 pipeline_result.results.append(result)
                 logger.info(
                     "Cleanup step '%s' -> %s (%.3fs)",
@@ -9,6 +9,13 @@
     - Multi-source credentials (env, file, sops, provider)
     - Header merging at three levels (service, endpoint, runtime)
     - Automatic retry with exponential backoff
+    - Concurrent batch calls with per-API rate limits (call_many)
+    - Per-endpoint response cache with ETag revalidation
+    - Opt-in coalescing of identical in-flight reads
+    - Config-driven pagination with bounded read-ahead (paginate)
+    - Priority scheduling of rate-limited calls with aging
+    - Quota tracking from rate_limit config and usage headers
+    - Per-endpoint stats with connect/TTFB/total latency histograms (stats)
     - TRACE-level logging for debugging
     - Hard limits with deep defense
 
@@ -79,12 +86,21 @@
             path: "/user/repos"
 """
 
+from kstlib.rapi.batch import BatchCall, BatchResult
+from kstlib.rapi.cache import CacheStats, DiskResponseStore, MemoryResponseStore, ResponseStore
 from kstlib.rapi.client import RapiClient, RapiResponse, call, call_async
+from kstlib.rapi.coalesce import CoalesceStats, RequestCoalescer
 from kstlib.rapi.config import (
     ApiConfig,
+    CacheConfig,
     EndpointConfig,
+    EndpointTemplate,
     HmacConfig,
+    HttpConfig,
+    PaginationConfig,
     RapiConfigManager,
+    RateBucket,
+    RateLimitConfig,
     SafeguardConfig,
     load_rapi_config,
 )
@@ -100,27 +116,52 @@
     ResponseTooLargeError,
     SafeguardMissingError,
 )
+from kstlib.rapi.quota import QuotaStats, QuotaTracker
+from kstlib.rapi.scheduler import RequestScheduler, SchedulerStats
+from kstlib.rapi.stats import EndpointStats, LatencyHistogram, LatencySummary, stats_table
 
 __all__ = [
     "ApiConfig",
+    "BatchCall",
+    "BatchResult",
+    "CacheConfig",
+    "CacheStats",
+    "CoalesceStats",
     "ConfirmationRequiredError",
     "CredentialError",
     "CredentialRecord",
     "CredentialResolver",
+    "DiskResponseStore",
     "EndpointAmbiguousError",
     "EndpointConfig",
     "EndpointNotFoundError",
+    "EndpointStats",
+    "EndpointTemplate",
     "EnvVarError",
     "HmacConfig",
+    "HttpConfig",
+    "LatencyHistogram",
+    "LatencySummary",
+    "MemoryResponseStore",
+    "PaginationConfig",
+    "QuotaStats",
+    "QuotaTracker",
     "RapiClient",
     "RapiConfigManager",
     "RapiError",
     "RapiResponse",
+    "RateBucket",
+    "RateLimitConfig",
+    "RequestCoalescer",
     "RequestError",
+    "RequestScheduler",
+    "ResponseStore",
     "ResponseTooLargeError",
     "SafeguardConfig",
     "SafeguardMissingError",
+    "SchedulerStats",
     "call",
     "call_async",
     "load_rapi_config",
+    "stats_table",
 ]
@@ -0,0 +1,110 @@
+"""Batch call descriptions and results for RAPI module.
+
+:meth:`RapiClient.call_many <kstlib.rapi.RapiClient.call_many>` and its
+variants take a list of :class:`BatchCall` items and report one
+:class:`BatchResult` per item, so a failing call does not abort the batch.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from kstlib.rapi.client import RapiResponse
+
+
+@dataclass(frozen=True, slots=True)
+class BatchCall:
+    """One call of a batch.
+
+    Attributes:
+        endpoint_ref: Endpoint reference (full or short).
+        args: Positional path parameters.
+        kwargs: Keyword path parameters and query params.
+        body: Request body.
+        headers: Runtime headers.
+
+    Examples:
+        >>> BatchCall("binance.ticker", kwargs={"symbol": "BTCUSDT"}).endpoint_ref
+        'binance.ticker'
+    """
+
+    endpoint_ref: str
+    args: tuple[Any, ...] = ()
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+    body: Any = None
+    headers: Mapping[str, str] | None = None
+
+
+#: Accepted batch items: a BatchCall, an endpoint ref, or (endpoint ref, kwargs).
+BatchItem: TypeAlias = BatchCall | str | tuple[str, Mapping[str, Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    """Outcome of one call of a batch.
+
+    Exactly one of ``response`` and ``error`` is set.
+
+    Attributes:
+        index: Position of the call in the input.
+        call: The call that was made.
+        response: Response, if the call returned one.
+        error: Exception raised by the call, if any.
+
+    Examples:
+        >>> result = BatchResult(0, BatchCall("api.ep"), error=ValueError("bad"))
+        >>> result.ok
+        False
+    """
+
+    index: int
+    call: BatchCall
+    response: RapiResponse | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the call returned a 2xx response."""
+        return self.response is not None and self.response.ok
+
+
+def to_batch_calls(items: Iterable[BatchItem]) -> list[BatchCall]:
+    """Normalize batch items to BatchCall objects.
+
+    Args:
+        items: BatchCall objects, endpoint refs or (endpoint ref, kwargs) pairs.
+
+    Returns:
+        List of BatchCall in input order.
+
+    Raises:
+        TypeError: If an item has an unsupported type.
+
+    Examples:
+        >>> to_batch_calls(["api.time", ("api.ticker", {"symbol": "ETHUSDT"})])[1].kwargs
+        {'symbol': 'ETHUSDT'}
+    """
+    calls: list[BatchCall] = []
+    for item in items:
+        if isinstance(item, BatchCall):
+            calls.append(item)
+        elif isinstance(item, str):
+            calls.append(BatchCall(item))
+        elif isinstance(item, tuple) and len(item) == 2 and isinstance(item[0], str):
+            calls.append(BatchCall(item[0], kwargs=dict(item[1])))
+        else:
+            raise TypeError(f"Unsupported batch item: {item!r}")
+    return calls
+
+
+__all__ = [
+    "BatchCall",
+    "BatchItem",
+    "BatchResult",
+    "to_batch_calls",
+]
@@ -0,0 +1,367 @@
+"""Response cache for GET endpoints of RAPI module.
+
+Endpoints opt in with a ``cache:`` entry in the rapi config (see
+:class:`~kstlib.rapi.config.CacheConfig`). Fresh entries are served without a
+request. Stale entries that carry an ``ETag`` or ``Last-Modified`` header are
+revalidated with a conditional request, and a ``304 Not Modified`` reply
+refreshes them.
+
+Entries live in a :class:`ResponseStore`: :class:`MemoryResponseStore`
+(bounded LRU, default) or :class:`DiskResponseStore` (one JSON file per
+entry, shared across processes and restarts).
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from kstlib.rapi.client import RapiResponse
+    from kstlib.rapi.config import CacheConfig
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEntry:
+    """Cached response of a GET endpoint.
+
+    Attributes:
+        status_code: HTTP status code.
+        headers: Response headers.
+        data: Parsed JSON body (or None).
+        text: Raw response text.
+        endpoint_ref: Full endpoint reference.
+        expires_at: Wall-clock time (``time.time()``) when the entry goes stale.
+        etag: ``ETag`` header, used for ``If-None-Match``.
+        last_modified: ``Last-Modified`` header, used for ``If-Modified-Since``.
+
+    Examples:
+        >>> entry = CacheEntry(200, {}, {"ok": True}, "", "api.ep", expires_at=0.0)
+        >>> entry.fresh
+        False
+        >>> CacheEntry.from_dict(entry.to_dict()) == entry
+        True
+    """
+
+    status_code: int
+    headers: dict[str, str]
+    data: Any
+    text: str
+    endpoint_ref: str
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def fresh(self) -> bool:
+        """Return True until the entry expires."""
+        return time.time() < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        """Return True if the entry carries a validator."""
+        return self.etag is not None or self.last_modified is not None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable dict."""
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> CacheEntry:
+        """Build an entry from :meth:`to_dict` output."""
+        return cls(**data)
+
+
+@dataclass
+class CacheStats:
+    """Statistics for a response cache.
+
+    Attributes:
+        hits: Calls served from a fresh entry.
+        misses: Calls that needed a request (including revalidations).
+        revalidated: Stale entries refreshed by a ``304 Not Modified`` reply.
+        stored: Responses written to the store.
+
+    Examples:
+        >>> stats = CacheStats()
+        >>> stats.record_hit()
+        >>> stats.record_miss()
+        >>> stats.hit_ratio
+        0.5
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stored: int = 0
+
+    def record_hit(self) -> None:
+        """Record a call served from cache."""
+        self.hits += 1
+
+    def record_miss(self) -> None:
+        """Record a call that needed a request."""
+        self.misses += 1
+
+    def record_revalidated(self) -> None:
+        """Record a ``304 Not Modified`` refresh."""
+        self.revalidated += 1
+
+    def record_stored(self) -> None:
+        """Record a response written to the store."""
+        self.stored += 1
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from cache (0.0 if none)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseStore(ABC):
+    """Abstract storage for cached responses.
+
+    Implementations must be safe to call from several threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for ``key``, fresh or stale, or None."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry under ``key``."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry for ``key`` if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+
+class MemoryResponseStore(ResponseStore):
+    """In-process store evicting the least recently used entries.
+
+    Args:
+        max_entries: Maximum number of entries kept.
+
+    Examples:
+        >>> store = MemoryResponseStore(max_entries=1)
+        >>> store.set("a", CacheEntry(200, {}, None, "a", "api.ep", expires_at=0.0))
+        >>> store.set("b", CacheEntry(200, {}, None, "b", "api.ep", expires_at=0.0))
+        >>> store.get("a") is None
+        True
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize memory store.
+
+        Raises:
+            ValueError: If max_entries is below 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for ``key`` and mark it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting the oldest one when full."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove the entry for ``key`` if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries)
+
+
+class DiskResponseStore(ResponseStore):
+    """Store keeping one JSON file per entry in a directory.
+
+    Writes go through a temporary file and an atomic rename, so readers in
+    other processes never see a partial entry. Unreadable files count as
+    misses.
+
+    Args:
+        directory: Cache directory (created if missing).
+
+    Examples:
+        >>> store = DiskResponseStore("~/.cache/kstlib/rapi")  # doctest: +SKIP
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize disk store."""
+        self._directory = Path(directory).expanduser()
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def directory(self) -> Path:
+        """Cache directory."""
+        return self._directory
+
+    def _path(self, key: str) -> Path:
+        if not key.isalnum():
+            raise ValueError(f"Invalid cache key: {key!r}")
+        return self._directory / f"{key}.json"
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Read the entry for ``key``, or None if missing or unreadable."""
+        path = self._path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            return CacheEntry.from_dict(payload)
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError) as e:
+            log.debug("Ignoring unreadable cache entry %s: %s", key, e)
+            return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Write the entry for ``key`` atomically."""
+        path = self._path(key)
+        fd, tmp_name = tempfile.mkstemp(dir=self._directory, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry.to_dict(), handle)
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def delete(self, key: str) -> None:
+        """Remove the entry for ``key`` if present."""
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self._directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+def cache_key(*parts: Any) -> str:
+    """Return a stable hash of the values that identify a cached call.
+
+    Examples:
+        >>> cache_key("GET", "api.ep", {"b": 1, "a": 2}) == cache_key("GET", "api.ep", {"a": 2, "b": 1})
+        True
+    """
+    raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    """Case-insensitive header lookup."""
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def freshness_lifetime(headers: Mapping[str, str], config: CacheConfig) -> float | None:
+    """Return how long a response stays fresh, or None if it must not be stored.
+
+    Args:
+        headers: Response headers.
+        config: Endpoint cache settings.
+
+    Returns:
+        Seconds of freshness (0 = revalidate on every call), or None for
+        ``Cache-Control: no-store``.
+
+    Examples:
+        >>> from kstlib.rapi.config import CacheConfig
+        >>> freshness_lifetime({"Cache-Control": "public, max-age=30"}, CacheConfig(ttl=300))
+        30.0
+        >>> freshness_lifetime({"cache-control": "no-store"}, CacheConfig()) is None
+        True
+        >>> freshness_lifetime({}, CacheConfig(ttl=300))
+        300.0
+    """
+    if not config.respect_headers:
+        return float(config.ttl)
+    directives: dict[str, str | None] = {}
+    for part in (_header(headers, "cache-control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            age = float(_header(headers, "age") or 0)
+            return max(0.0, float(max_age) - age)
+        except ValueError:
+            log.debug("Ignoring invalid max-age: %r", max_age)
+    return float(config.ttl)
+
+
+def build_entry(response: RapiResponse, lifetime: float) -> CacheEntry:
+    """Build a cache entry from a response, expiring ``lifetime`` seconds from now.
+
+    The parsed body is copied, so later changes to ``response.data`` do not
+    reach the cache.
+    """
+    return CacheEntry(
+        status_code=response.status_code,
+        headers=dict(response.headers),
+        data=copy.deepcopy(response.data),
+        text=response.text,
+        endpoint_ref=response.endpoint_ref,
+        expires_at=time.time() + lifetime,
+        etag=_header(response.headers, "etag"),
+        last_modified=_header(response.headers, "last-modified"),
+    )
+
+
+__all__ = [
+    "CacheEntry",
+    "CacheStats",
+    "DiskResponseStore",
+    "MemoryResponseStore",
+    "ResponseStore",
+    "build_entry",
+    "cache_key",
+    "freshness_lifetime",
+]
@@ -6,35 +6,77 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import contextvars
+import copy
 import hashlib
 import hmac
+import importlib.util
 import json
+import threading
 import time
-from dataclasses import dataclass, field
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from email.utils import parsedate_to_datetime
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode
 
 import httpx
-
-from kstlib.limits import get_rapi_limits
+from typing_extensions import Self
+
+from kstlib.limits import HARD_MAX_RAPI_RETRY_DELAY, get_rapi_limits
+from kstlib.rapi.batch import BatchCall, BatchItem, BatchResult, to_batch_calls
+from kstlib.rapi.cache import (
+    CacheEntry,
+    CacheStats,
+    MemoryResponseStore,
+    ResponseStore,
+    build_entry,
+    cache_key,
+    freshness_lifetime,
+)
+from kstlib.rapi.coalesce import CoalesceStats, RequestCoalescer
 from kstlib.rapi.config import (
     ApiConfig,
+    CacheConfig,
     EndpointConfig,
+    EndpointTemplate,
     HmacConfig,
+    HttpConfig,
+    PaginationConfig,
     RapiConfigManager,
     load_rapi_config,
 )
 from kstlib.rapi.credentials import CredentialRecord, CredentialResolver
 from kstlib.rapi.exceptions import (
     ConfirmationRequiredError,
+    EndpointNotFoundError,
+    RapiError,
     RequestError,
     ResponseTooLargeError,
 )
+from kstlib.rapi.pagination import PagePlanner
+from kstlib.rapi.quota import QuotaStats, QuotaTracker
+from kstlib.rapi.scheduler import DEFAULT_AGING, RequestScheduler, SchedulerStats
+from kstlib.rapi.stats import AttemptTimer, ClientStats, EndpointStats, error_class
+from kstlib.rapi.streaming import STREAM_MODES, RecordDecoder, SizeGuard
+from kstlib.resilience.admission import Priority
+from kstlib.resilience.deadline import check_deadline, clamp_timeout
+from kstlib.resilience.exceptions import RetryExhaustedError
+from kstlib.resilience.retry import RetryBudget, RetryPolicy
 from kstlib.ssl import build_ssl_context
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import AsyncIterator, Callable, Generator, Iterable, Iterator, Mapping
+
+    from kstlib.rapi.streaming import StreamMode
+    from kstlib.resilience.adaptive_limiter import AdaptiveLimiter
+    from kstlib.resilience.hedge import HedgePolicy
+    from kstlib.resilience.rate_limiter import RateLimiter
 
 from kstlib.logging import TRACE_LEVEL, get_logger
 
@@ -46,6 +88,104 @@ def _log_trace(msg: str, *args: Any) -> None:
     log.log(TRACE_LEVEL, msg, *args)
 
 
+#: Read-only methods eligible for hedging and coalescing.
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+#: Status codes retried when the server sends a ``Retry-After`` header.
+#: Also reported as drops to the adaptive concurrency limiter.
+_RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+#: Status codes whose ``Retry-After`` pauses every call to an API with a ``rate_limit:`` section.
+_QUOTA_PAUSE_STATUSES = frozenset({418, 429, 503})
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date).
+
+    Args:
+        value: Raw header value.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid.
+
+    Examples:
+        >>> _parse_retry_after("2")
+        2.0
+        >>> _parse_retry_after("soon") is None
+        True
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class _RetryAfterResponse(Exception):  # noqa: N818 - internal control flow, not an error
+    """Retryable response carrying the server's ``Retry-After`` delay."""
+
+    def __init__(self, response: httpx.Response, elapsed: float, retry_after: float) -> None:
+        super().__init__(f"HTTP {response.status_code}, retry after {retry_after:.1f}s")
+        self.response = response
+        self.elapsed = elapsed
+        self.retry_after = retry_after
+
+
+def _attempt_request(
+    request: httpx.Request,
+    timeout: float,
+    trace: Callable[..., Any],
+    cookies: httpx.Cookies | None = None,
+) -> httpx.Request:
+    """Return a copy of ``request`` with the timeout, trace hook and cookies of one attempt.
+
+    Hedged attempts of a call run concurrently from the same request, and
+    httpx hands its ``extensions`` dict down to the transport. Each attempt
+    therefore gets its own copy instead of overwriting the shared one.
+    ``cookies`` is the pooled client's jar when the API sets ``http.cookies``;
+    a ``Cookie`` header already on the request wins.
+    """
+    attempt = httpx.Request(
+        request.method,
+        request.url,
+        headers=request.headers,
+        content=request.content,
+        extensions={**request.extensions, "timeout": httpx.Timeout(timeout).as_dict(), "trace": trace},
+    )
+    if cookies and "cookie" not in attempt.headers:
+        cookies.set_cookie_header(attempt)
+    return attempt
+
+
+def _body_size(message: httpx.Request | httpx.Response) -> int:
+    """Return the body size on the wire (``Content-Length``, else the read body)."""
+    content_length = message.headers.get("content-length")
+    if content_length:
+        return int(content_length)
+    return len(message.content) if isinstance(message, httpx.Response) else 0
+
+
+def _check_priority(value: int) -> int:
+    """Return a call priority, rejecting values that are not ints.
+
+    Examples:
+        >>> _check_priority(Priority.HIGH)
+        <Priority.HIGH: 1>
+        >>> _check_priority("urgent")
+        Traceback (most recent call last):
+        ...
+        TypeError: request_priority must be an int, got str
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise TypeError(f"request_priority must be an int, got {type(value).__name__}")
+
+
 def _validate_safeguard(
     endpoint_config: EndpointConfig,
     args: tuple[Any, ...],
@@ -77,17 +217,45 @@ def _validate_safeguard(
         raise ConfirmationRequiredError(endpoint_config.full_ref, expected=expected, actual=confirm)
 
 
-@dataclass
+#: Marks a lazy field that has not been computed yet.
+_UNSET: Any = object()
+
+
+def _is_json(content_type: str) -> bool:
+    """Return True if a Content-Type announces a JSON body."""
+    return "application/json" in content_type or ("application/vnd." in content_type and "+json" in content_type)
+
+
+def _charset(content_type: str) -> str:
+    """Return the charset of a Content-Type, defaulting to UTF-8."""
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "charset" and value.strip():
+            return value.strip().strip("\"'")
+    return "utf-8"
+
+
 class RapiResponse:
     """Response from an API call.
 
+    Holds the raw body and headers as received. ``text``, ``data`` and
+    ``headers`` are decoded on first access and kept, so callers that only
+    check ``status_code`` never pay for decoding. Values passed to the
+    constructor are used as is.
+
     Attributes:
         status_code: HTTP status code.
         headers: Response headers.
         data: Parsed JSON response (or None if not JSON).
         text: Raw response text.
+        content: Raw response body.
         elapsed: Request duration in seconds.
         endpoint_ref: Full endpoint reference used.
+        from_cache: True if served from the response cache without a
+            new body (fresh hit or ``304 Not Modified`` revalidation).
+
+    Args:
+        json_decoder: Decoder for JSON bodies (default: ``json.loads``).
 
     Examples:
         >>> response = RapiResponse(status_code=200, data={"ip": "1.2.3.4"})
@@ -95,20 +263,133 @@ class RapiResponse:
         True
         >>> response.data["ip"]
         '1.2.3.4'
+        >>> raw = RapiResponse(200, {"Content-Type": "application/json"}, content=b'{"ip": "5.6.7.8"}')
+        >>> raw.data["ip"], raw.text
+        ('5.6.7.8', '{"ip": "5.6.7.8"}')
     """
 
-    status_code: int
-    headers: dict[str, str] = field(default_factory=dict)
-    data: Any = None
-    text: str = ""
-    elapsed: float = 0.0
-    endpoint_ref: str = ""
+    __slots__ = (
+        "_content",
+        "_data",
+        "_headers",
+        "_json_decoder",
+        "_raw_headers",
+        "_text",
+        "elapsed",
+        "endpoint_ref",
+        "from_cache",
+        "status_code",
+    )
+
+    def __init__(  # noqa: PLR0917 - positional order of the former dataclass
+        self,
+        status_code: int,
+        headers: Mapping[str, str] | None = None,
+        data: Any = _UNSET,
+        text: str | None = None,
+        elapsed: float = 0.0,
+        endpoint_ref: str = "",
+        from_cache: bool = False,
+        *,
+        content: bytes | None = None,
+        json_decoder: Callable[[bytes], Any] | None = None,
+    ) -> None:
+        """Initialize RapiResponse."""
+        self.status_code = status_code
+        self.elapsed = elapsed
+        self.endpoint_ref = endpoint_ref
+        self.from_cache = from_cache
+        self._raw_headers: Mapping[str, str] = headers if headers is not None else {}
+        self._headers: dict[str, str] | None = None
+        self._content = content
+        self._text = text
+        self._data = None if data is _UNSET and content is None else data
+        self._json_decoder = json_decoder
 
     @property
     def ok(self) -> bool:
         """Return True if status code indicates success (2xx)."""
         return 200 <= self.status_code < 300
 
+    @property
+    def headers(self) -> dict[str, str]:
+        """Response headers as a plain dict (copied on first access)."""
+        if self._headers is None:
+            self._headers = dict(self._raw_headers)
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: dict[str, str]) -> None:
+        self._raw_headers = self._headers = value
+
+    @property
+    def content(self) -> bytes:
+        """Raw response body."""
+        if self._content is None:
+            return (self._text or "").encode()
+        return self._content
+
+    @property
+    def text(self) -> str:
+        """Body decoded with the Content-Type charset (UTF-8 by default)."""
+        if self._text is None:
+            encoding = _charset(self._content_type())
+            try:
+                self._text = (self._content or b"").decode(encoding, errors="replace")
+            except LookupError:
+                self._text = (self._content or b"").decode("utf-8", errors="replace")
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+
+    @property
+    def data(self) -> Any:
+        """Parsed JSON body, or None if the body is not (valid) JSON."""
+        if self._data is _UNSET:
+            self._data = None
+            if self._content and _is_json(self._content_type()):
+                decode = self._json_decoder or json.loads
+                try:
+                    self._data = decode(self._content)
+                except ValueError:
+                    log.debug("Response is not valid JSON despite content-type")
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._data = value
+
+    def _content_type(self) -> str:
+        headers = self._raw_headers
+        if isinstance(headers, httpx.Headers):
+            return str(headers.get("content-type", ""))
+        return next((value for key, value in headers.items() if key.lower() == "content-type"), "")
+
+    def __eq__(self, other: object) -> bool:
+        """Compare status, headers, body and metadata."""
+        if not isinstance(other, RapiResponse):
+            return NotImplemented
+        return (
+            self.status_code == other.status_code
+            and self.headers == other.headers
+            and self.text == other.text
+            and self.data == other.data
+            and self.elapsed == other.elapsed
+            and self.endpoint_ref == other.endpoint_ref
+            and self.from_cache == other.from_cache
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a summary without decoding the body."""
+        return (
+            f"RapiResponse(status_code={self.status_code}, endpoint_ref={self.endpoint_ref!r}, "
+            f"elapsed={self.elapsed:.3f}, from_cache={self.from_cache}, size={len(self.content)})"
+        )
+
 
 class RapiClient:
     """Config-driven REST API client.
@@ -121,9 +402,22 @@ class RapiClient:
     - External ``*.rapi.yml`` files (via from_file)
     - Auto-discovery of ``*.rapi.yml`` in current directory (via discover)
 
+    Each API gets one long-lived HTTP client with a connection pool sized by
+    its ``http:`` section, so keep-alive connections are reused across calls.
+    Close the client with :meth:`close`/:meth:`aclose` or use it as a
+    (async) context manager.
+
     Args:
         config_manager: Optional RapiConfigManager (loads from config if None).
         credentials_config: Optional credentials configuration.
+        concurrency_limiter: Optional adaptive limiter shared by all calls.
+        hedge_policy: Optional hedging for async read-only calls.
+        rate_limiters: Optional rate limiter per API name.
+        response_store: Store for endpoints with a ``cache:`` entry.
+        coalesce: Share in-flight GET/HEAD/OPTIONS requests between
+            concurrent identical calls.
+        json_decoder: Decoder for JSON response bodies.
+        priority_aging: Wait that raises a queued call by one priority level.
 
     Examples:
         >>> client = RapiClient()  # doctest: +SKIP
@@ -133,6 +427,10 @@ class RapiClient:
 
         >>> client = RapiClient.from_file("github.rapi.yml")  # doctest: +SKIP
         >>> client = RapiClient.discover()  # doctest: +SKIP
+
+        >>> with RapiClient() as client:  # doctest: +SKIP
+        ...     client.preconnect()
+        ...     client.call("binance.ticker", symbol="BTCUSDT")
     """
 
     def __init__(
@@ -142,6 +440,13 @@ def __init__(
         *,
         ssl_verify: bool | None = None,
         ssl_ca_bundle: str | None = None,
+        concurrency_limiter: AdaptiveLimiter | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        rate_limiters: Mapping[str, RateLimiter] | None = None,
+        response_store: ResponseStore | None = None,
+        coalesce: bool = False,
+        json_decoder: Callable[[bytes], Any] | None = None,
+        priority_aging: float | None = DEFAULT_AGING,
     ) -> None:
         """Initialize RapiClient.
 
@@ -152,6 +457,30 @@ def __init__(
                 If None, uses global config from kstlib.conf.yml.
             ssl_ca_bundle: Override CA bundle path.
                 If None, uses global config from kstlib.conf.yml.
+            concurrency_limiter: Optional
+                :class:`~kstlib.resilience.adaptive_limiter.AdaptiveLimiter`.
+                Each HTTP attempt holds a slot. Its latency feeds the limit,
+                and timeouts or 429/503 replies count as drops.
+            hedge_policy: Optional :class:`~kstlib.resilience.hedge.HedgePolicy`.
+                ``call_async`` on GET/HEAD/OPTIONS endpoints starts a second
+                request when the first one is slower than the policy delay.
+            rate_limiters: Optional :class:`~kstlib.resilience.RateLimiter`
+                per API name. Every HTTP attempt to that API, retries
+                included, takes a token first. Waiting attempts get tokens
+                by call ``priority`` (see :class:`~kstlib.rapi.RequestScheduler`).
+            response_store: Where GET endpoints with a ``cache:`` entry keep
+                responses (default: in-memory LRU). Pass a
+                :class:`~kstlib.rapi.DiskResponseStore` to share the cache
+                across processes.
+            coalesce: If True, concurrent calls to a GET/HEAD/OPTIONS
+                endpoint with the same credentials, arguments, body and
+                headers share one in-flight request. Callers receive the
+                same response object (or exception).
+            json_decoder: Decoder for JSON bodies, called with the raw bytes
+                on first access to ``response.data`` (e.g. ``orjson.loads``).
+                Defaults to ``json.loads``.
+            priority_aging: Seconds a rate-limited call waits to gain one
+                priority level (None = strict priority).
         """
         self._config_manager = config_manager or load_rapi_config()
 
@@ -165,12 +494,43 @@ def __init__(
         self._credential_resolver = CredentialResolver(merged_credentials or None)
         self._limits = get_rapi_limits()
 
+        # Shared across calls so retries stay a fraction of regular traffic
+        self._retry_budget = RetryBudget(
+            ratio=self._limits.retry_budget_ratio,
+            min_per_second=self._limits.retry_budget_per_second,
+            max_tokens=self._limits.retry_budget_max_tokens,
+        )
+        self._concurrency_limiter = concurrency_limiter
+        self._hedge_policy = hedge_policy
+        self._rate_limiters = dict(rate_limiters or {})
+        self._schedulers = {
+            name: RequestScheduler(limiter, aging=priority_aging) for name, limiter in self._rate_limiters.items()
+        }
+        self._response_store = response_store if response_store is not None else MemoryResponseStore()
+        self._cache_stats = CacheStats()
+        self._coalescer = RequestCoalescer() if coalesce else None
+        self._json_decoder = json_decoder
+        self._stats = ClientStats()
+        self._quotas = {
+            name: QuotaTracker(api.rate_limit)
+            for name, api in self._config_manager.apis.items()
+            if api.rate_limit is not None
+        }
+
         # Build SSL context (cascade: kwargs > global config > default)
         self._ssl_context = build_ssl_context(
             ssl_verify=ssl_verify,
             ssl_ca_bundle=ssl_ca_bundle,
         )
 
+        # Long-lived HTTP clients per API; async clients are bound to their loop
+        self._clients: dict[str, httpx.Client] = {}
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            dict[str, httpx.AsyncClient],
+        ] = weakref.WeakKeyDictionary()
+        self._clients_lock = threading.Lock()
+
         log.debug(
             "RapiClient initialized (timeout=%.1fs, max_retries=%d)",
             self._limits.timeout,
@@ -235,6 +595,52 @@ def discover(
         config_manager = RapiConfigManager.discover(directory, pattern)
         return cls(config_manager, credentials_config)
 
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Hit, miss and revalidation counters of the response cache."""
+        return self._cache_stats
+
+    @property
+    def coalesce_stats(self) -> CoalesceStats | None:
+        """In-flight coalescing statistics, or None if coalescing is off."""
+        return self._coalescer.stats if self._coalescer is not None else None
+
+    @property
+    def scheduler_stats(self) -> dict[str, SchedulerStats]:
+        """Queue depth and dispatch statistics per rate-limited API."""
+        return {name: scheduler.stats for name, scheduler in self._schedulers.items()}
+
+    @property
+    def quota_stats(self) -> dict[str, QuotaStats]:
+        """Quota throttling statistics per API with a ``rate_limit:`` section."""
+        return {name: quota.stats for name, quota in self._quotas.items()}
+
+    @property
+    def quota_usage(self) -> dict[str, dict[str, int]]:
+        """Weight used in the current window, per API and bucket."""
+        return {name: quota.usage for name, quota in self._quotas.items()}
+
+    def stats(self) -> dict[str, EndpointStats]:
+        """Return traffic statistics per endpoint reference (``api.endpoint``).
+
+        Counts HTTP attempts (cache hits excluded), retries, errors by
+        class and bytes, with connect / TTFB / total latency percentiles
+        from bounded histograms. The result is an immutable snapshot, so
+        the method can be registered as a monitoring collector.
+
+        Examples:
+            >>> client = RapiClient()  # doctest: +SKIP
+            >>> client.call("binance.depth", symbol="BTCUSDT")  # doctest: +SKIP
+            >>> client.stats()["binance.depth"].ttfb.p99  # doctest: +SKIP
+            0.084
+            >>> mon.add_collector("rapi", client.stats)  # doctest: +SKIP
+        """
+        return self._stats.snapshot()
+
+    def reset_stats(self) -> None:
+        """Forget the statistics returned by :meth:`stats`."""
+        self._stats.reset()
+
     @property
     def config_manager(self) -> RapiConfigManager:
         """Get the configuration manager.
@@ -271,6 +677,7 @@ def call(
         headers: Mapping[str, str] | None = None,
         timeout: float | None = None,
         confirm: str | None = None,
+        request_priority: int = Priority.NORMAL,
         **kwargs: Any,
     ) -> RapiResponse:
         """Make a synchronous API call.
@@ -282,6 +689,10 @@ def call(
             headers: Runtime headers (override service/endpoint headers).
             timeout: Request timeout (uses config default if None).
             confirm: Confirmation string for dangerous endpoints with safeguard.
+            request_priority: Order among calls waiting for a rate limiter
+                token (lower is more important, see
+                :class:`~kstlib.resilience.admission.Priority`). Named so it
+                cannot shadow a ``priority`` path or query parameter.
             **kwargs: Keyword arguments for path parameters and query params.
 
         Returns:
@@ -291,6 +702,7 @@ def call(
             ConfirmationRequiredError: If safeguard requires confirmation.
             RequestError: If request fails after retries.
             ResponseTooLargeError: If response exceeds max size.
+            TypeError: If request_priority is not an int.
 
         Examples:
             >>> client = RapiClient()  # doctest: +SKIP
@@ -298,9 +710,12 @@ def call(
             >>> client.call("httpbin.delayed", 5)  # doctest: +SKIP
             >>> client.call("httpbin.post_data", body={"key": "value"})  # doctest: +SKIP
             >>> client.call("admin.delete_user", userId="123", confirm="DELETE USER 123")  # doctest: +SKIP
+            >>> client.call("exchange.new_order", body=order, request_priority=Priority.CRITICAL)  # doctest: +SKIP
         """
         log.debug("Calling endpoint: %s", endpoint_ref)
 
+        priority = _check_priority(request_priority)
+
         # Resolve endpoint
         api_config, endpoint_config = self._config_manager.resolve(endpoint_ref)
         _log_trace("Resolved to: %s", endpoint_config.full_ref)
@@ -308,19 +723,41 @@ def call(
         # Validate safeguard before proceeding
         _validate_safeguard(endpoint_config, args, kwargs, confirm)
 
-        # Build request
-        request = self._build_request(
-            api_config,
-            endpoint_config,
-            args,
-            kwargs,
-            body,
-            headers,
+        # Serve fresh cached responses without building a request
+        key, stale = None, None
+        if endpoint_config.cache is not None:
+            key = cache_key(api_config.credentials, endpoint_config.full_ref, args, kwargs, body, headers)
+            cached, stale = self._cache_lookup(key)
+            if cached is not None:
+                return cached
+
+        def fetch() -> RapiResponse:
+            # Build request
+            request = self._build_request(
+                api_config,
+                endpoint_config,
+                args,
+                kwargs,
+                body,
+                headers,
+            )
+            if stale is not None:
+                self._add_validators(request, stale, endpoint_config.cache)
+
+            # Execute with retries
+            effective_timeout = timeout if timeout is not None else self._limits.timeout
+            response = self._execute_with_retry(request, endpoint_config, effective_timeout, priority=priority)
+            if key is not None and endpoint_config.cache is not None:
+                return self._cache_store(key, stale, response, endpoint_config.cache)
+            return response
+
+        # Share the request with identical calls already in flight
+        flight_key = self._flight_key(
+            api_config, endpoint_config, args, kwargs, body=body, headers=headers, priority=priority
         )
-
-        # Execute with retries
-        effective_timeout = timeout if timeout is not None else self._limits.timeout
-        return self._execute_with_retry(request, endpoint_config, effective_timeout)
+        if flight_key is not None and self._coalescer is not None:
+            return self._coalescer.run(flight_key, fetch)
+        return fetch()
 
     async def call_async(
         self,
@@ -330,6 +767,7 @@ async def call_async(
         headers: Mapping[str, str] | None = None,
         timeout: float | None = None,
         confirm: str | None = None,
+        request_priority: int = Priority.NORMAL,
         **kwargs: Any,
     ) -> RapiResponse:
         """Make an asynchronous API call.
@@ -341,6 +779,10 @@ async def call_async(
             headers: Runtime headers (override service/endpoint headers).
             timeout: Request timeout (uses config default if None).
             confirm: Confirmation string for dangerous endpoints with safeguard.
+            request_priority: Order among calls waiting for a rate limiter
+                token (lower is more important, see
+                :class:`~kstlib.resilience.admission.Priority`). Named so it
+                cannot shadow a ``priority`` path or query parameter.
             **kwargs: Keyword arguments for path parameters and query params.
 
         Returns:
@@ -350,9 +792,12 @@ async def call_async(
             ConfirmationRequiredError: If safeguard requires confirmation.
             RequestError: If request fails after retries.
             ResponseTooLargeError: If response exceeds max size.
+            TypeError: If request_priority is not an int.
         """
         log.debug("Calling endpoint (async): %s", endpoint_ref)
 
+        priority = _check_priority(request_priority)
+
         # Resolve endpoint
         api_config, endpoint_config = self._config_manager.resolve(endpoint_ref)
         _log_trace("Resolved to: %s", endpoint_config.full_ref)
@@ -360,45 +805,776 @@ async def call_async(
         # Validate safeguard before proceeding
         _validate_safeguard(endpoint_config, args, kwargs, confirm)
 
-        # Build request
-        request = self._build_request(
-            api_config,
-            endpoint_config,
+        # Serve fresh cached responses without building a request
+        key, stale = None, None
+        if endpoint_config.cache is not None:
+            key = cache_key(api_config.credentials, endpoint_config.full_ref, args, kwargs, body, headers)
+            cached, stale = self._cache_lookup(key)
+            if cached is not None:
+                return cached
+
+        async def fetch() -> RapiResponse:
+            # Build request
+            request = self._build_request(
+                api_config,
+                endpoint_config,
+                args,
+                kwargs,
+                body,
+                headers,
+            )
+            if stale is not None:
+                self._add_validators(request, stale, endpoint_config.cache)
+
+            # Execute with retries (hedged for read-only endpoints if configured)
+            effective_timeout = timeout if timeout is not None else self._limits.timeout
+            if self._hedge_policy is not None and endpoint_config.method.upper() in _SAFE_METHODS:
+                response = await self._hedge_policy.run(
+                    lambda: self._execute_with_retry_async(
+                        request, endpoint_config, effective_timeout, priority=priority
+                    ),
+                )
+            else:
+                response = await self._execute_with_retry_async(
+                    request,
+                    endpoint_config,
+                    effective_timeout,
+                    priority=priority,
+                )
+            if key is not None and endpoint_config.cache is not None:
+                return self._cache_store(key, stale, response, endpoint_config.cache)
+            return response
+
+        # Share the request with identical calls already in flight
+        flight_key = self._flight_key(
+            api_config, endpoint_config, args, kwargs, body=body, headers=headers, priority=priority
+        )
+        if flight_key is not None and self._coalescer is not None:
+            return await self._coalescer.run_async(flight_key, fetch)
+        return await fetch()
+
+    def stream(
+        self,
+        endpoint_ref: str,
+        *args: Any,
+        mode: StreamMode = "bytes",
+        chunk_size: int | None = None,
+        body: Any = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        confirm: str | None = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Stream a response body instead of loading it in memory.
+
+        The request is sent when iteration starts. Connection errors and
+        ``Retry-After`` replies are retried before the first chunk; once the
+        body is flowing, errors propagate. ``max_response_size`` is enforced
+        on the bytes received so far. Close the iterator (or exhaust it) to
+        release the connection, e.g. with :func:`contextlib.closing` when
+        breaking out early.
+
+        Args:
+            endpoint_ref: Endpoint reference (full: api.endpoint or short: endpoint).
+            *args: Positional arguments for path parameters.
+            mode: ``"bytes"`` (raw chunks), ``"lines"`` (text lines without
+                line endings) or ``"ndjson"`` (one decoded JSON value per line).
+            chunk_size: Read size in bytes (httpx default if None).
+            body: Request body (dict for JSON, str for raw).
+            headers: Runtime headers (override service/endpoint headers).
+            timeout: Timeout per network operation (uses config default if None).
+            confirm: Confirmation string for dangerous endpoints with safeguard.
+            **kwargs: Keyword arguments for path parameters and query params.
+
+        Returns:
+            Iterator over chunks, lines or records.
+
+        Raises:
+            ValueError: If the mode is unknown.
+            ConfirmationRequiredError: If safeguard requires confirmation.
+            RequestError: If the server replies with a non-2xx status, or
+                connecting fails after retries (raised while iterating).
+            ResponseTooLargeError: If the body exceeds max size (raised while iterating).
+
+        Examples:
+            >>> client = RapiClient()  # doctest: +SKIP
+            >>> for trade in client.stream("exchange.trades_export", mode="ndjson", day="2024-01-02"):  # doctest: +SKIP
+            ...     process(trade)
+        """
+        request, endpoint_config = self._prepare_stream(
+            endpoint_ref,
             args,
             kwargs,
-            body,
-            headers,
+            body=body,
+            headers=headers,
+            confirm=confirm,
+            mode=mode,
         )
+        effective_timeout = timeout if timeout is not None else self._limits.timeout
+        return self._iter_stream(request, endpoint_config, effective_timeout, mode, chunk_size)
 
-        # Execute with retries
+    def stream_async(
+        self,
+        endpoint_ref: str,
+        *args: Any,
+        mode: StreamMode = "bytes",
+        chunk_size: int | None = None,
+        body: Any = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        confirm: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Async variant of :meth:`stream`, used with ``async for``.
+
+        Close the iterator with ``aclose()`` (or exhaust it) to release the
+        connection.
+
+        Returns:
+            Async iterator over chunks, lines or records.
+
+        Raises:
+            ValueError: If the mode is unknown.
+            ConfirmationRequiredError: If safeguard requires confirmation.
+            RequestError: If the server replies with a non-2xx status, or
+                connecting fails after retries (raised while iterating).
+            ResponseTooLargeError: If the body exceeds max size (raised while iterating).
+
+        Examples:
+            >>> async for line in client.stream_async("logs.tail", mode="lines"):  # doctest: +SKIP
+            ...     print(line)
+        """
+        request, endpoint_config = self._prepare_stream(
+            endpoint_ref,
+            args,
+            kwargs,
+            body=body,
+            headers=headers,
+            confirm=confirm,
+            mode=mode,
+        )
         effective_timeout = timeout if timeout is not None else self._limits.timeout
-        return await self._execute_with_retry_async(
-            request,
-            endpoint_config,
-            effective_timeout,
+        return self._iter_stream_async(request, endpoint_config, effective_timeout, mode, chunk_size)
+
+    def _prepare_stream(
+        self,
+        endpoint_ref: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        body: Any,
+        headers: Mapping[str, str] | None,
+        confirm: str | None,
+        mode: str,
+    ) -> tuple[httpx.Request, EndpointConfig]:
+        """Validate a stream call and build its request."""
+        if mode not in STREAM_MODES:
+            raise ValueError(f"Invalid stream mode: {mode!r} (expected one of {sorted(STREAM_MODES)})")
+        log.debug("Streaming endpoint: %s", endpoint_ref)
+        api_config, endpoint_config = self._config_manager.resolve(endpoint_ref)
+        _log_trace("Resolved to: %s", endpoint_config.full_ref)
+        _validate_safeguard(endpoint_config, args, kwargs, confirm)
+        request = self._build_request(api_config, endpoint_config, args, kwargs, body, headers)
+        return request, endpoint_config
+
+    def _check_stream_response(self, response: httpx.Response, endpoint_config: EndpointConfig, elapsed: float) -> None:
+        """Check the status line and headers of a streamed response.
+
+        Raises:
+            ResponseTooLargeError: If Content-Length exceeds max size.
+            _RetryAfterResponse: If the server asked to retry later.
+            RequestError: If the status is not 2xx.
+        """
+        _log_trace("<<< %d %s (%.3fs, streamed)", response.status_code, response.reason_phrase, elapsed)
+        content_length = response.headers.get("content-length")
+        if content_length and int(content_length) > self._limits.max_response_size:
+            raise ResponseTooLargeError(int(content_length), self._limits.max_response_size)
+        if response.status_code in _RETRY_AFTER_STATUSES:
+            retry_after = _parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None and retry_after <= HARD_MAX_RAPI_RETRY_DELAY:
+                log.warning("HTTP %d, server asked to retry after %.1fs", response.status_code, retry_after)
+                raise _RetryAfterResponse(response, elapsed, retry_after)
+        if not response.is_success:
+            raise RequestError(
+                f"HTTP {response.status_code} streaming {endpoint_config.full_ref}",
+                status_code=response.status_code,
+                retryable=response.status_code >= 500,
+            )
+
+    @staticmethod
+    def _stream_exhausted(error: RetryExhaustedError) -> RequestError:
+        """Map an exhausted retry policy of a stream to a RequestError."""
+        last = error.last_error
+        status_code = last.response.status_code if isinstance(last, _RetryAfterResponse) else None
+        return RequestError(
+            f"Stream failed after {error.attempts} attempts: {last}",
+            status_code=status_code,
+            retryable=False,
         )
 
-    def _extract_query_params(
+    def _iter_stream(
+        self,
+        request: httpx.Request,
+        endpoint_config: EndpointConfig,
+        timeout: float,
+        mode: StreamMode,
+        chunk_size: int | None,
+    ) -> Iterator[Any]:
+        """Open a streamed response and yield its records."""
+        policy = self._retry_policy()
+        attempt = 0
+
+        def open_once() -> httpx.Response:
+            nonlocal attempt
+            attempt += 1
+            if attempt > 1:
+                self._stats.record_retry(endpoint_config.full_ref)
+            response, elapsed = self._send(
+                request, timeout, endpoint_config.api_name, endpoint=endpoint_config.name, stream=True
+            )
+            try:
+                self._check_stream_response(response, endpoint_config, elapsed)
+            except BaseException:
+                response.close()
+                raise
+            return response
+
+        try:
+            response = policy.call(open_once)
+        except RetryExhaustedError as e:
+            raise self._stream_exhausted(e) from e
+        guard = SizeGuard(self._limits.max_response_size)
+        try:
+            decoder = RecordDecoder(mode, response.charset_encoding or "utf-8")
+            for chunk in response.iter_bytes(chunk_size):
+                guard.add(chunk)
+                yield from decoder.feed(chunk)
+            yield from decoder.flush()
+        except ResponseTooLargeError:
+            self._stats.record_error(endpoint_config.full_ref, "too_large", attempt=False)
+            raise
+        finally:
+            response.close()
+            self._stats.record_received(endpoint_config.full_ref, guard.received)
+
+    async def _iter_stream_async(
         self,
+        request: httpx.Request,
         endpoint_config: EndpointConfig,
+        timeout: float,
+        mode: StreamMode,
+        chunk_size: int | None,
+    ) -> AsyncIterator[Any]:
+        """Async variant of :meth:`_iter_stream`."""
+        policy = self._retry_policy()
+        attempt = 0
+
+        async def open_once() -> httpx.Response:
+            nonlocal attempt
+            attempt += 1
+            if attempt > 1:
+                self._stats.record_retry(endpoint_config.full_ref)
+            response, elapsed = await self._send_async(
+                request, timeout, endpoint_config.api_name, endpoint=endpoint_config.name, stream=True
+            )
+            try:
+                self._check_stream_response(response, endpoint_config, elapsed)
+            except BaseException:
+                await response.aclose()
+                raise
+            return response
+
+        try:
+            response = await policy.acall(open_once)
+        except RetryExhaustedError as e:
+            raise self._stream_exhausted(e) from e
+        guard = SizeGuard(self._limits.max_response_size)
+        try:
+            decoder = RecordDecoder(mode, response.charset_encoding or "utf-8")
+            async for chunk in response.aiter_bytes(chunk_size):
+                guard.add(chunk)
+                for record in decoder.feed(chunk):
+                    yield record
+            for record in decoder.flush():
+                yield record
+        except ResponseTooLargeError:
+            self._stats.record_error(endpoint_config.full_ref, "too_large", attempt=False)
+            raise
+        finally:
+            await response.aclose()
+            self._stats.record_received(endpoint_config.full_ref, guard.received)
+
+    def _flight_key(
+        self,
+        api_config: ApiConfig,
+        endpoint_config: EndpointConfig,
+        args: tuple[Any, ...],
+        kwargs: Mapping[str, Any],
+        *,
+        body: Any,
+        headers: Mapping[str, str] | None,
+        priority: int = Priority.NORMAL,
+    ) -> str | None:
+        """Return the coalescing key of a call, or None if it must not be shared.
+
+        The key hashes the call inputs (path and query parameters, body and
+        runtime headers) rather than the signed request, whose timestamp
+        and signature differ between otherwise identical calls. Calls only
+        share a request of their own priority, so an urgent call never waits
+        in the rate limiter queue behind a low-priority one.
+        """
+        method = endpoint_config.method.upper()
+        if self._coalescer is None or method not in _SAFE_METHODS:
+            return None
+        return cache_key(
+            api_config.credentials, method, endpoint_config.full_ref, args, kwargs, body, headers, int(priority)
+        )
+
+    def _cache_lookup(self, key: str) -> tuple[RapiResponse | None, CacheEntry | None]:
+        """Look up a cached response.
+
+        Returns:
+            Tuple of (fresh response or None, stale entry or None).
+        """
+        entry = self._response_store.get(key)
+        if entry is not None and entry.fresh:
+            self._cache_stats.record_hit()
+            _log_trace("Cache hit: %s", entry.endpoint_ref)
+            return self._response_from_entry(entry, 0.0), None
+        self._cache_stats.record_miss()
+        return None, entry
+
+    @staticmethod
+    def _add_validators(request: httpx.Request, entry: CacheEntry, cache_config: CacheConfig | None) -> None:
+        """Turn a request for a stale entry into a conditional request."""
+        if cache_config is None or not cache_config.revalidate:
+            return
+        if entry.etag is not None:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            request.headers["If-Modified-Since"] = entry.last_modified
+
+    @staticmethod
+    def _response_from_entry(entry: CacheEntry, elapsed: float) -> RapiResponse:
+        """Build a response flagged as served from cache.
+
+        Every hit gets its own copy of the parsed body: a caller that changes
+        ``response.data`` must not change the cached entry.
+        """
+        return RapiResponse(
+            status_code=entry.status_code,
+            headers=dict(entry.headers),
+            data=copy.deepcopy(entry.data),
+            text=entry.text,
+            elapsed=elapsed,
+            endpoint_ref=entry.endpoint_ref,
+            from_cache=True,
+        )
+
+    def _cache_store(
+        self,
+        key: str,
+        stale: CacheEntry | None,
+        response: RapiResponse,
+        cache_config: CacheConfig,
+    ) -> RapiResponse:
+        """Store a fresh response or refresh a stale entry on ``304``.
+
+        Returns:
+            The response to hand to the caller.
+        """
+        if response.status_code == httpx.codes.NOT_MODIFIED and stale is not None:
+            lifetime = freshness_lifetime(response.headers, cache_config)
+            refreshed = replace(stale, expires_at=time.time() + (lifetime or 0.0))
+            self._response_store.set(key, refreshed)
+            self._cache_stats.record_revalidated()
+            _log_trace("Cache revalidated: %s", stale.endpoint_ref)
+            return self._response_from_entry(refreshed, response.elapsed)
+        if response.status_code != httpx.codes.OK:
+            return response
+        lifetime = freshness_lifetime(response.headers, cache_config)
+        if lifetime is None:
+            self._response_store.delete(key)
+            return response
+        entry = build_entry(response, lifetime)
+        if lifetime > 0 or entry.revalidatable:
+            self._response_store.set(key, entry)
+            self._cache_stats.record_stored()
+        return response
+
+    def _call_item(self, index: int, call: BatchCall, timeout: float | None) -> BatchResult:
+        """Run one batch call, capturing its exception."""
+        try:
+            response = self.call(
+                call.endpoint_ref, *call.args, body=call.body, headers=call.headers, timeout=timeout, **call.kwargs
+            )
+        except Exception as e:
+            return BatchResult(index, call, error=e)
+        return BatchResult(index, call, response=response)
+
+    async def _call_item_async(
+        self,
+        index: int,
+        call: BatchCall,
+        timeout: float | None,
+        semaphore: asyncio.Semaphore,
+    ) -> BatchResult:
+        """Run one async batch call under the batch semaphore, capturing its exception."""
+        async with semaphore:
+            try:
+                response = await self.call_async(
+                    call.endpoint_ref, *call.args, body=call.body, headers=call.headers, timeout=timeout, **call.kwargs
+                )
+            except Exception as e:
+                return BatchResult(index, call, error=e)
+        return BatchResult(index, call, response=response)
+
+    def iter_many(
+        self,
+        calls: Iterable[BatchItem],
+        *,
+        max_concurrency: int = 10,
+        timeout: float | None = None,
+    ) -> Iterator[BatchResult]:
+        """Run calls on a thread pool and yield results as they complete.
+
+        At most ``max_concurrency`` calls run at once. Per-API
+        ``rate_limiters`` and the ``deadline()`` budget apply to every call.
+        Leaving the loop early cancels calls that have not started.
+
+        Args:
+            calls: BatchCall objects, endpoint refs or (endpoint ref, kwargs) pairs.
+            max_concurrency: Maximum calls in flight.
+            timeout: Request timeout per call (uses config default if None).
+
+        Yields:
+            BatchResult per call in completion order (see ``index``).
+
+        Raises:
+            ValueError: If max_concurrency is below 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        batch = to_batch_calls(calls)
+        if not batch:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(batch)), thread_name_prefix="kstlib-rapi")
+        try:
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._call_item, index, call, timeout)
+                for index, call in enumerate(batch)
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def call_many(
+        self,
+        calls: Iterable[BatchItem],
+        *,
+        max_concurrency: int = 10,
+        timeout: float | None = None,
+    ) -> list[BatchResult]:
+        """Run calls concurrently and return results in input order.
+
+        A failing call does not abort the batch: its exception is reported
+        in ``BatchResult.error``.
+
+        Args:
+            calls: BatchCall objects, endpoint refs or (endpoint ref, kwargs) pairs.
+            max_concurrency: Maximum calls in flight.
+            timeout: Request timeout per call (uses config default if None).
+
+        Returns:
+            One BatchResult per call, in input order.
+
+        Raises:
+            ValueError: If max_concurrency is below 1.
+
+        Examples:
+            >>> client = RapiClient(rate_limiters={"binance": RateLimiter(rate=20)})  # doctest: +SKIP
+            >>> results = client.call_many(
+            ...     [("binance.ticker", {"symbol": s}) for s in symbols],
+            ...     max_concurrency=8,
+            ... )  # doctest: +SKIP
+            >>> prices = {r.call.kwargs["symbol"]: r.response.data for r in results if r.ok}  # doctest: +SKIP
+        """
+        return sorted(self.iter_many(calls, max_concurrency=max_concurrency, timeout=timeout), key=lambda r: r.index)
+
+    async def iter_many_async(
+        self,
+        calls: Iterable[BatchItem],
+        *,
+        max_concurrency: int = 10,
+        timeout: float | None = None,
+    ) -> AsyncIterator[BatchResult]:
+        """Async variant of :meth:`iter_many`, yielding results as they complete.
+
+        Args:
+            calls: BatchCall objects, endpoint refs or (endpoint ref, kwargs) pairs.
+            max_concurrency: Maximum calls in flight.
+            timeout: Request timeout per call (uses config default if None).
+
+        Yields:
+            BatchResult per call in completion order (see ``index``).
+
+        Raises:
+            ValueError: If max_concurrency is below 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks = [
+            asyncio.ensure_future(self._call_item_async(index, call, timeout, semaphore))
+            for index, call in enumerate(to_batch_calls(calls))
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def call_many_async(
+        self,
+        calls: Iterable[BatchItem],
+        *,
+        max_concurrency: int = 10,
+        timeout: float | None = None,
+    ) -> list[BatchResult]:
+        """Async variant of :meth:`call_many`, returning results in input order.
+
+        Args:
+            calls: BatchCall objects, endpoint refs or (endpoint ref, kwargs) pairs.
+            max_concurrency: Maximum calls in flight.
+            timeout: Request timeout per call (uses config default if None).
+
+        Returns:
+            One BatchResult per call, in input order.
+
+        Raises:
+            ValueError: If max_concurrency is below 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return list(
+            await asyncio.gather(
+                *(
+                    self._call_item_async(index, call, timeout, semaphore)
+                    for index, call in enumerate(to_batch_calls(calls))
+                )
+            )
+        )
+
+    def paginate(
+        self,
+        endpoint_ref: str,
+        *args: Any,
+        body: Any = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        prefetch: int | None = None,
+        max_pages: int | None = None,
+        **kwargs: Any,
+    ) -> Generator[Any, None, None]:
+        """Iterate over the records of a paginated endpoint.
+
+        Pages are requested with :meth:`call` following the endpoint's
+        ``pagination:`` config and their records are yielded lazily. While
+        a page is consumed, up to ``prefetch`` further pages are already
+        requested in background threads (at most one for ``cursor`` and
+        ``link`` styles). Pages requested past the last one are discarded.
+
+        Args:
+            endpoint_ref: Endpoint reference (full: api.endpoint or short: endpoint).
+            *args: Positional arguments for path parameters.
+            body: Request body sent with every page.
+            headers: Runtime headers sent with every page.
+            timeout: Request timeout per page (uses config default if None).
+            prefetch: Override the configured read-ahead (pages).
+            max_pages: Override the configured page bound.
+            **kwargs: Path parameters and query params sent with every page.
+
+        Returns:
+            Generator over records. Close it to stop early and release
+            the prefetch threads.
+
+        Raises:
+            ValueError: If the endpoint has no pagination config.
+            TypeError: If a page has no list of records (raised while
+                iterating).
+            RequestError: If a page request fails or returns a non-2xx
+                status (raised while iterating).
+
+        Examples:
+            >>> client = RapiClient()  # doctest: +SKIP
+            >>> for trade in client.paginate("exchange.my_trades", symbol="BTCUSDT"):  # doctest: +SKIP
+            ...     ledger.add(trade)
+        """
+        endpoint_config, pagination = self._pagination(endpoint_ref, prefetch, max_pages)
+        return self._iter_pages(endpoint_config, pagination, args, kwargs, body=body, headers=headers, timeout=timeout)
+
+    def paginate_async(
+        self,
+        endpoint_ref: str,
+        *args: Any,
+        body: Any = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        prefetch: int | None = None,
+        max_pages: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Async variant of :meth:`paginate`, used with ``async for``.
+
+        Read-ahead pages are requested as tasks on the running loop.
+
+        Returns:
+            Async iterator over records.
+
+        Raises:
+            ValueError: If the endpoint has no pagination config.
+            RequestError: If a page request fails (raised while iterating).
+
+        Examples:
+            >>> async for repo in client.paginate_async("github.org_repos", org="python"):  # doctest: +SKIP
+            ...     print(repo["name"])
+        """
+        endpoint_config, pagination = self._pagination(endpoint_ref, prefetch, max_pages)
+        return self._iter_pages_async(
+            endpoint_config, pagination, args, kwargs, body=body, headers=headers, timeout=timeout
+        )
+
+    def _pagination(
+        self,
+        endpoint_ref: str,
+        prefetch: int | None,
+        max_pages: int | None,
+    ) -> tuple[EndpointConfig, PaginationConfig]:
+        """Resolve a paginated endpoint and apply per-call overrides."""
+        _, endpoint_config = self._config_manager.resolve(endpoint_ref)
+        pagination = endpoint_config.pagination
+        if pagination is None:
+            raise ValueError(f"Endpoint {endpoint_config.full_ref} has no pagination config")
+        if prefetch is not None:
+            pagination = replace(pagination, prefetch=prefetch)
+        if max_pages is not None:
+            pagination = replace(pagination, max_pages=max_pages)
+        return endpoint_config, pagination
+
+    @staticmethod
+    def _checked_page(response: RapiResponse) -> RapiResponse:
+        """Reject non-2xx pages, which carry no records."""
+        if not response.ok:
+            raise RequestError(
+                f"HTTP {response.status_code} paginating {response.endpoint_ref}",
+                status_code=response.status_code,
+                response_body=response.text,
+            )
+        return response
+
+    def _iter_pages(
+        self,
+        endpoint_config: EndpointConfig,
+        pagination: PaginationConfig,
+        args: tuple[Any, ...],
         kwargs: dict[str, Any],
-    ) -> dict[str, str]:
-        """Extract query parameters from kwargs (excluding path params)."""
-        import re
+        *,
+        body: Any,
+        headers: Mapping[str, str] | None,
+        timeout: float | None,
+    ) -> Generator[Any, None, None]:
+        """Fetch pages with bounded read-ahead and yield their records."""
+        planner = PagePlanner(pagination, kwargs)
+        ahead = pagination.prefetch if planner.parallel else min(pagination.prefetch, 1)
+        executor = ThreadPoolExecutor(max_workers=ahead + 1, thread_name_prefix="rapi-page")
+        pending: deque[Future[RapiResponse]] = deque()
+        index = 0
+
+        def fetch(params: dict[str, Any]) -> RapiResponse:
+            page_kwargs = {**kwargs, **params}
+            response = self.call(
+                endpoint_config.full_ref, *args, body=body, headers=headers, timeout=timeout, **page_kwargs
+            )
+            return self._checked_page(response)
 
-        query_params = dict(endpoint_config.query)
-        path_params: set[str] = set()
+        def request_pages(in_flight: int) -> None:
+            nonlocal index
+            while len(pending) < in_flight:
+                params = planner.params(index)
+                if params is None:
+                    return
+                pending.append(executor.submit(contextvars.copy_context().run, fetch, params))
+                index += 1
 
-        for match in re.finditer(r"\{([a-zA-Z_][a-zA-Z0-9_]*|\d+)\}", endpoint_config.path):
-            param = match.group(1)
-            if not param.isdigit():
-                path_params.add(param)
+        try:
+            request_pages(ahead + 1)
+            while pending:
+                records = planner.observe(pending.popleft().result())
+                if planner.finished:
+                    for future in pending:
+                        future.cancel()
+                    pending.clear()
+                # Keep `ahead` pages in flight while the caller consumes this one
+                request_pages(ahead)
+                yield from records
+                request_pages(1)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    async def _iter_pages_async(
+        self,
+        endpoint_config: EndpointConfig,
+        pagination: PaginationConfig,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        body: Any,
+        headers: Mapping[str, str] | None,
+        timeout: float | None,
+    ) -> AsyncIterator[Any]:
+        """Async variant of :meth:`_iter_pages`."""
+        planner = PagePlanner(pagination, kwargs)
+        ahead = pagination.prefetch if planner.parallel else min(pagination.prefetch, 1)
+        pending: deque[asyncio.Future[RapiResponse]] = deque()
+        index = 0
+
+        async def fetch(params: dict[str, Any]) -> RapiResponse:
+            page_kwargs = {**kwargs, **params}
+            response = await self.call_async(
+                endpoint_config.full_ref, *args, body=body, headers=headers, timeout=timeout, **page_kwargs
+            )
+            return self._checked_page(response)
 
-        for key, value in kwargs.items():
-            if key not in path_params:
-                query_params[key] = str(value)
+        def request_pages(in_flight: int) -> None:
+            nonlocal index
+            while len(pending) < in_flight:
+                params = planner.params(index)
+                if params is None:
+                    return
+                pending.append(asyncio.ensure_future(fetch(params)))
+                index += 1
 
-        return query_params
+        try:
+            request_pages(ahead + 1)
+            while pending:
+                records = planner.observe(await pending.popleft())
+                if planner.finished:
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    pending.clear()
+                request_pages(ahead)
+                for record in records:
+                    yield record
+                request_pages(1)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
     def _prepare_body(
         self,
@@ -452,50 +1628,51 @@ def _build_request(
         Returns:
             Prepared httpx.Request.
         """
+        template = self._template(api_config, endpoint_config)
+        tracing = log.isEnabledFor(TRACE_LEVEL)
+
         # Build URL with path parameter substitution
-        _log_trace("Path template: %s", endpoint_config.path)
-        if args:
-            _log_trace("Path args (positional): %s", args)
-        if kwargs:
-            _log_trace("Path/query kwargs: %s", kwargs)
-        path = endpoint_config.build_path(*args, **kwargs)
-        url = f"{api_config.base_url}{path}"
-
-        # Security: reject null bytes in URL to prevent injection
-        if "\x00" in url:
-            raise RequestError("Null bytes not allowed in URL", retryable=False)
-
-        # Security: validate URL scheme to prevent SSRF via config injection
-        if not url.lower().startswith(("http://", "https://")):
-            raise RequestError(f"Invalid URL scheme (only http/https allowed): {url}", retryable=False)
+        if tracing:
+            _log_trace("Path template: %s", endpoint_config.path)
+            if args:
+                _log_trace("Path args (positional): %s", args)
+            if kwargs:
+                _log_trace("Path/query kwargs: %s", kwargs)
+        url = template.url(args, kwargs)
+
+        # Security: null bytes and non-HTTP schemes (SSRF via config injection)
+        # are detected once when the template is compiled
+        if template.url_error is not None:
+            raise RequestError(f"{template.url_error}: {url!r}", retryable=False)
 
         # Extract query params from kwargs
-        query_params = self._extract_query_params(endpoint_config, kwargs)
+        query_params = template.query(kwargs)
 
-        _log_trace("Final URL: %s", url)
-        if query_params:
-            _log_trace("Query params: %s", query_params)
+        if tracing:
+            _log_trace("Final URL: %s", url)
+            if query_params:
+                _log_trace("Query params: %s", query_params)
 
-        # Merge headers (service < endpoint < runtime)
-        merged_headers = self._merge_headers(
-            api_config.headers,
-            endpoint_config.headers,
-            dict(runtime_headers) if runtime_headers else {},
-        )
+        # Merge headers (service + endpoint precomputed < runtime)
+        merged_headers = dict(template.static_headers)
+        if runtime_headers:
+            merged_headers.update(runtime_headers)
+        if tracing:
+            _log_trace("Headers merged: static=%d -> total=%d", len(template.static_headers), len(merged_headers))
 
         # Prepare body first (needed for HMAC signing if sign_body=True)
         content = self._prepare_body(body, merged_headers)
 
         # Apply authentication (may modify headers and query_params for HMAC)
         # Skip auth if endpoint explicitly disables it (auth: false)
-        if api_config.credentials and endpoint_config.auth:
+        if template.auth_type is not None:
             self._apply_auth(merged_headers, api_config, query_params, content)
 
         # Create request
         request = httpx.Request(
             method=endpoint_config.method,
             url=url,
-            params=query_params if query_params else None,
+            params=query_params or None,
             headers=merged_headers,
             content=content,
         )
@@ -503,38 +1680,19 @@ def _build_request(
         self._log_request(request)
         return request
 
-    def _merge_headers(
-        self,
-        service_headers: dict[str, str],
-        endpoint_headers: dict[str, str],
-        runtime_headers: dict[str, str],
-    ) -> dict[str, str]:
-        """Merge headers from three levels.
-
-        Order: service < endpoint < runtime (later overrides earlier).
+    def _template(self, api_config: ApiConfig, endpoint_config: EndpointConfig) -> EndpointTemplate:
+        """Return the precompiled template of an endpoint.
 
-        Args:
-            service_headers: Service-level headers.
-            endpoint_headers: Endpoint-level headers.
-            runtime_headers: Runtime headers.
-
-        Returns:
-            Merged headers dictionary.
+        Configs that do not come from the client's manager are compiled on
+        the fly.
         """
-        merged = {}
-        merged.update(service_headers)
-        merged.update(endpoint_headers)
-        merged.update(runtime_headers)
-
-        _log_trace(
-            "Headers merged: service=%d, endpoint=%d, runtime=%d -> total=%d",
-            len(service_headers),
-            len(endpoint_headers),
-            len(runtime_headers),
-            len(merged),
-        )
-
-        return merged
+        try:
+            template = self._config_manager.template(endpoint_config.full_ref)
+        except RapiError:
+            template = None
+        if template is None or template.endpoint is not endpoint_config or template.api is not api_config:
+            template = EndpointTemplate.compile(api_config, endpoint_config)
+        return template
 
     def _apply_auth(
         self,
@@ -655,6 +1813,8 @@ def _apply_hmac_auth(
 
     def _log_request(self, request: httpx.Request) -> None:
         """Log request details at TRACE level."""
+        if not log.isEnabledFor(TRACE_LEVEL):
+            return
         _log_trace(">>> %s %s", request.method, request.url)
 
         # Log headers (redact sensitive ones)
@@ -666,6 +1826,8 @@ def _log_request(self, request: httpx.Request) -> None:
 
     def _log_response(self, response: httpx.Response, elapsed: float) -> None:
         """Log response details at TRACE level."""
+        if not log.isEnabledFor(TRACE_LEVEL):
+            return
         _log_trace("<<< %d %s (%.3fs)", response.status_code, response.reason_phrase, elapsed)
         _log_trace("<<< Content-Type: %s", response.headers.get("content-type", "unknown"))
         _log_trace("<<< Content-Length: %s", response.headers.get("content-length", "unknown"))
@@ -679,18 +1841,458 @@ def _log_response(self, response: httpx.Response, elapsed: float) -> None:
         except Exception:
             _log_trace("<<< Body: [unable to decode]")
 
+    def _retry_policy(self) -> RetryPolicy:
+        """Build the retry policy from the current limits."""
+        return RetryPolicy(
+            max_attempts=self._limits.max_retries + 1,
+            base_delay=self._limits.retry_delay,
+            multiplier=self._limits.retry_backoff,
+            max_delay=HARD_MAX_RAPI_RETRY_DELAY,
+            jitter="full",
+            retry_on=(httpx.TimeoutException, httpx.NetworkError, httpx.HTTPStatusError, _RetryAfterResponse),
+            budget=self._retry_budget,
+            name="rapi",
+        )
+
+    def _handle_response(
+        self,
+        response: httpx.Response,
+        endpoint_config: EndpointConfig,
+        elapsed: float,
+    ) -> RapiResponse:
+        """Check size, detect server-requested retries and parse a response.
+
+        Raises:
+            ResponseTooLargeError: If response is too large.
+            _RetryAfterResponse: If the server asked to retry later.
+        """
+        self._log_response(response, elapsed)
+
+        # Check response size (header and actual body)
+        content_length = response.headers.get("content-length")
+        size = int(content_length) if content_length else 0
+        if size <= self._limits.max_response_size:
+            size = len(response.content)
+        if size > self._limits.max_response_size:
+            self._stats.record_error(endpoint_config.full_ref, "too_large", attempt=False)
+            raise ResponseTooLargeError(size, self._limits.max_response_size)
+
+        # Honor Retry-After on throttling/unavailable responses (bounded)
+        if response.status_code in _RETRY_AFTER_STATUSES:
+            retry_after = _parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None and retry_after <= HARD_MAX_RAPI_RETRY_DELAY:
+                log.warning("HTTP %d, server asked to retry after %.1fs", response.status_code, retry_after)
+                raise _RetryAfterResponse(response, elapsed, retry_after)
+
+        return self._parse_response(response, endpoint_config, elapsed)
+
+    def _exhausted(self, error: RetryExhaustedError, endpoint_config: EndpointConfig) -> RapiResponse:
+        """Map an exhausted retry policy to the last response or a RequestError."""
+        last = error.last_error
+        if isinstance(last, _RetryAfterResponse):
+            return self._parse_response(last.response, endpoint_config, last.elapsed)
+        raise RequestError(
+            f"Request failed after {error.attempts} attempts: {last}",
+            retryable=False,
+        ) from error
+
+    def _http_config(self, api_name: str) -> HttpConfig:
+        """Return an API's ``http`` settings, or the defaults for an unknown API."""
+        api_config = self._config_manager.get_api(api_name)
+        return api_config.http if api_config is not None else HttpConfig()
+
+    def _client_options(self, api_name: str) -> dict[str, Any]:
+        """Build httpx client options from an API's ``http`` settings.
+
+        Args:
+            api_name: Name of the API.
+
+        Returns:
+            Keyword arguments for ``httpx.Client``/``httpx.AsyncClient``.
+        """
+        http = self._http_config(api_name)
+        http2 = http.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            log.warning(
+                "HTTP/2 requested for API '%s' but 'h2' is not installed, using HTTP/1.1. "
+                "Install with: pip install kstlib[http2]",
+                api_name,
+            )
+            http2 = False
+        return {
+            "timeout": self._limits.timeout,
+            "verify": self._ssl_context,
+            "follow_redirects": False,
+            "http2": http2,
+            # The pooled client outlives calls: only keep Set-Cookie when the API opts in
+            "cookies": CookieJar() if http.cookies else CookieJar(DefaultCookiePolicy(allowed_domains=[])),
+            "limits": httpx.Limits(
+                max_connections=http.max_connections,
+                max_keepalive_connections=http.max_keepalive_connections,
+                keepalive_expiry=http.keepalive_expiry,
+            ),
+        }
+
+    def _http_client(self, api_name: str) -> httpx.Client:
+        """Return the pooled sync client for an API, creating it on first use."""
+        client = self._clients.get(api_name)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(api_name)
+                if client is None:
+                    client = httpx.Client(**self._client_options(api_name))
+                    self._clients[api_name] = client
+                    log.debug("Opened HTTP client for API '%s'", api_name)
+        return client
+
+    def _async_http_client(self, api_name: str) -> httpx.AsyncClient:
+        """Return the pooled async client for an API on the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(api_name)
+            if client is None:
+                client = httpx.AsyncClient(**self._client_options(api_name))
+                clients[api_name] = client
+                log.debug("Opened async HTTP client for API '%s'", api_name)
+        return client
+
+    def _preconnect_targets(self, api_names: tuple[str, ...]) -> list[ApiConfig]:
+        """Resolve APIs to warm up (default: those with ``http.preconnect``)."""
+        if api_names:
+            targets = []
+            for name in api_names:
+                api_config = self._config_manager.get_api(name)
+                if api_config is None:
+                    raise EndpointNotFoundError(name, self._config_manager.list_apis())
+                targets.append(api_config)
+            return targets
+        return [api for api in self._config_manager.apis.values() if api.http.preconnect]
+
+    def preconnect(self, *api_names: str) -> dict[str, bool]:
+        """Open pooled connections before the first call.
+
+        Sends a ``HEAD`` request to each API's base URL so the TCP and TLS
+        handshakes happen at startup. The status code is ignored; only
+        network errors count as failures.
+
+        Args:
+            *api_names: APIs to warm up (default: APIs with
+                ``http.preconnect: true``).
+
+        Returns:
+            Mapping of API name to whether a connection was opened.
+
+        Raises:
+            EndpointNotFoundError: If an API name is unknown.
+
+        Examples:
+            >>> client = RapiClient()  # doctest: +SKIP
+            >>> client.preconnect("binance")  # doctest: +SKIP
+            {'binance': True}
+        """
+        results: dict[str, bool] = {}
+        for api_config in self._preconnect_targets(api_names):
+            try:
+                self._http_client(api_config.name).head(api_config.base_url)
+                results[api_config.name] = True
+            except httpx.HTTPError as e:
+                log.warning("Preconnect to API '%s' failed: %s", api_config.name, e)
+                results[api_config.name] = False
+        return results
+
+    async def preconnect_async(self, *api_names: str) -> dict[str, bool]:
+        """Async variant of :meth:`preconnect`, warming APIs concurrently.
+
+        Args:
+            *api_names: APIs to warm up (default: APIs with
+                ``http.preconnect: true``).
+
+        Returns:
+            Mapping of API name to whether a connection was opened.
+
+        Raises:
+            EndpointNotFoundError: If an API name is unknown.
+        """
+
+        async def warm(api_config: ApiConfig) -> bool:
+            try:
+                await self._async_http_client(api_config.name).head(api_config.base_url)
+            except httpx.HTTPError as e:
+                log.warning("Preconnect to API '%s' failed: %s", api_config.name, e)
+                return False
+            return True
+
+        targets = self._preconnect_targets(api_names)
+        results = await asyncio.gather(*(warm(api_config) for api_config in targets))
+        return {api_config.name: ok for api_config, ok in zip(targets, results, strict=True)}
+
+    def load_credentials(self, *api_names: str) -> dict[str, CredentialRecord]:
+        """Resolve API credentials before the first call.
+
+        Credentials are resolved concurrently (see
+        :meth:`CredentialResolver.resolve_many`) and cached, so the first
+        call does not wait for a ``sops`` decrypt or token lookup, and a
+        missing credential fails at startup instead of on first use.
+
+        Args:
+            *api_names: APIs whose credentials to load (default: all).
+
+        Returns:
+            Mapping of credential name to record.
+
+        Raises:
+            CredentialError: If a credential cannot be resolved.
+            EndpointNotFoundError: If an API name is unknown.
+
+        Examples:
+            >>> client = RapiClient()  # doctest: +SKIP
+            >>> sorted(client.load_credentials())  # doctest: +SKIP
+            ['binance_key', 'kraken_key']
+        """
+        targets = self._preconnect_targets(api_names) if api_names else self._config_manager.apis.values()
+        names = [api.credentials for api in targets if api.credentials]
+        return self._credential_resolver.resolve_many(names)
+
+    def close(self) -> None:
+        """Close the pooled sync HTTP clients.
+
+        Async clients are closed by :meth:`aclose`. The client stays usable;
+        new connections are opened on the next call.
+        """
+        with self._clients_lock:
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            client.close()
+        if clients:
+            log.debug("Closed %d HTTP client(s)", len(clients))
+
+    async def aclose(self) -> None:
+        """Close the pooled clients: sync ones and async ones of this loop."""
+        self.close()
+        with self._clients_lock:
+            clients = self._async_clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+        if clients:
+            log.debug("Closed %d async HTTP client(s)", len(clients))
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Exit context manager, closing pooled clients."""
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Exit async context manager, closing pooled clients."""
+        await self.aclose()
+
+    def _send(
+        self,
+        request: httpx.Request,
+        timeout: float,
+        api_name: str,
+        *,
+        endpoint: str = "",
+        stream: bool = False,
+        priority: int = Priority.NORMAL,
+    ) -> tuple[httpx.Response, float]:
+        """Send one HTTP attempt, within the API quota and rate/concurrency limits.
+
+        Args:
+            request: Prepared HTTP request.
+            timeout: Request timeout in seconds, clamped to the remaining
+                ``deadline()`` budget.
+            api_name: API whose pooled client sends the request.
+            endpoint: Endpoint name, for the weight it takes from the API quota.
+            stream: If True, return once headers arrive and leave the body
+                unread (the caller must close the response).
+            priority: Order among attempts waiting for a rate limiter token.
+
+        Returns:
+            Tuple of (response, elapsed seconds).
+
+        Raises:
+            DeadlineExceededError: If the ``deadline()`` budget ran out.
+        """
+        scheduler = self._schedulers.get(api_name)
+        if scheduler is not None:
+            scheduler.acquire(priority)
+        quota = self._quotas.get(api_name)
+        if quota is not None:
+            quota.reserve(endpoint)
+            sent_at = time.time()
+        limiter = self._concurrency_limiter
+        if limiter is not None:
+            limiter.acquire()
+        ref = f"{api_name}.{endpoint}"
+        timer = AttemptTimer()
+        start_time = timer.start
+        try:
+            # Inside the try: a budget spent while waiting for a slot must release it
+            timeout = clamp_timeout(timeout, "request")
+            http_client = self._http_client(api_name)
+            cookies = http_client.cookies if self._http_config(api_name).cookies else None
+            attempt = _attempt_request(request, timeout, timer.trace, cookies)
+            response = http_client.send(attempt, stream=True) if stream else http_client.send(attempt)
+        except httpx.TimeoutException as e:
+            if limiter is not None:
+                limiter.release(time.monotonic() - start_time, dropped=True)
+            self._record_failure(ref, request, e)
+            check_deadline("request")
+            raise
+        except BaseException as e:
+            if limiter is not None:
+                limiter.release()
+            self._record_failure(ref, request, e)
+            raise
+        elapsed = time.monotonic() - start_time
+        if limiter is not None:
+            limiter.release(elapsed, dropped=response.status_code in _RETRY_AFTER_STATUSES)
+        if quota is not None:
+            self._update_quota(quota, response, sent_at)
+        self._record_attempt(ref, request, response, timer=timer, elapsed=elapsed, stream=stream)
+        return response, elapsed
+
+    async def _send_async(
+        self,
+        request: httpx.Request,
+        timeout: float,
+        api_name: str,
+        *,
+        endpoint: str = "",
+        stream: bool = False,
+        priority: int = Priority.NORMAL,
+    ) -> tuple[httpx.Response, float]:
+        """Async variant of :meth:`_send`.
+
+        Args:
+            request: Prepared HTTP request.
+            timeout: Request timeout in seconds.
+            api_name: API whose pooled client sends the request.
+            endpoint: Endpoint name, for the weight it takes from the API quota.
+            stream: If True, leave the body unread.
+            priority: Order among attempts waiting for a rate limiter token.
+
+        Returns:
+            Tuple of (response, elapsed seconds).
+
+        Raises:
+            DeadlineExceededError: If the ``deadline()`` budget ran out.
+        """
+        scheduler = self._schedulers.get(api_name)
+        if scheduler is not None:
+            await scheduler.acquire_async(priority)
+        quota = self._quotas.get(api_name)
+        if quota is not None:
+            await quota.reserve_async(endpoint)
+            sent_at = time.time()
+        limiter = self._concurrency_limiter
+        if limiter is not None:
+            await limiter.acquire_async()
+        ref = f"{api_name}.{endpoint}"
+        timer = AttemptTimer()
+        start_time = timer.start
+        try:
+            # Inside the try: a budget spent while waiting for a slot must release it
+            timeout = clamp_timeout(timeout, "request")
+            async_client = self._async_http_client(api_name)
+            cookies = async_client.cookies if self._http_config(api_name).cookies else None
+            attempt = _attempt_request(request, timeout, timer.atrace, cookies)
+            response = await (async_client.send(attempt, stream=True) if stream else async_client.send(attempt))
+        except httpx.TimeoutException as e:
+            if limiter is not None:
+                limiter.release(time.monotonic() - start_time, dropped=True)
+            self._record_failure(ref, request, e)
+            check_deadline("request")
+            raise
+        except BaseException as e:
+            if limiter is not None:
+                limiter.release()
+            self._record_failure(ref, request, e)
+            raise
+        elapsed = time.monotonic() - start_time
+        if limiter is not None:
+            limiter.release(elapsed, dropped=response.status_code in _RETRY_AFTER_STATUSES)
+        if quota is not None:
+            self._update_quota(quota, response, sent_at)
+        self._record_attempt(ref, request, response, timer=timer, elapsed=elapsed, stream=stream)
+        return response, elapsed
+
+    def _record_attempt(
+        self,
+        ref: str,
+        request: httpx.Request,
+        response: httpx.Response,
+        *,
+        timer: AttemptTimer,
+        elapsed: float,
+        stream: bool,
+    ) -> None:
+        """Add an attempt that got a response to the endpoint statistics."""
+        self._stats.record_attempt(
+            ref,
+            sent=_body_size(request),
+            # Streamed bodies are counted as they are read
+            received=0 if stream else _body_size(response),
+            total=elapsed,
+            ttfb=timer.ttfb,
+            connect=timer.connect,
+        )
+        if response.status_code >= 400:
+            self._stats.record_error(ref, error_class(status_code=response.status_code), attempt=False)
+
+    def _record_failure(self, ref: str, request: httpx.Request, error: BaseException) -> None:
+        """Add an attempt that raised to the endpoint statistics (cancellations excluded)."""
+        if isinstance(error, Exception):
+            self._stats.record_error(ref, error_class(error), sent=_body_size(request))
+
+    @staticmethod
+    def _update_quota(quota: QuotaTracker, response: httpx.Response, sent_at: float) -> None:
+        """Feed reported usage and server back-off requests to an API quota."""
+        quota.observe(response.headers, sent_at)
+        if response.status_code in _QUOTA_PAUSE_STATUSES:
+            retry_after = _parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None:
+                pause = min(retry_after, HARD_MAX_RAPI_RETRY_DELAY)
+                log.warning("HTTP %d, pausing calls to %s for %.1fs", response.status_code, response.url.host, pause)
+                quota.pause(pause)
+
     def _execute_with_retry(
         self,
         request: httpx.Request,
         endpoint_config: EndpointConfig,
         timeout: float,
+        *,
+        priority: int = Priority.NORMAL,
     ) -> RapiResponse:
         """Execute request with retry logic.
 
+        Retries follow :class:`~kstlib.resilience.retry.RetryPolicy`:
+        exponential backoff with full jitter, ``Retry-After`` support and a
+        client-wide retry budget.
+
         Args:
             request: Prepared HTTP request.
             endpoint_config: Endpoint configuration.
             timeout: Request timeout in seconds.
+            priority: Order among attempts waiting for a rate limiter token.
 
         Returns:
             RapiResponse.
@@ -699,66 +2301,45 @@ def _execute_with_retry(
             RequestError: If all retries fail.
             ResponseTooLargeError: If response is too large.
         """
-        last_error: Exception | None = None
-        delay = self._limits.retry_delay
-
-        for attempt in range(self._limits.max_retries + 1):
-            if attempt > 0:
-                log.debug("Retry %d/%d after %.1fs", attempt, self._limits.max_retries, delay)
-                _log_trace("Waiting %.1fs before retry...", delay)
-                time.sleep(delay)
-                delay *= self._limits.retry_backoff
-
-            _log_trace("Attempt %d/%d", attempt + 1, self._limits.max_retries + 1)
-
+        policy = self._retry_policy()
+        attempt = 0
+
+        def send_once() -> RapiResponse:
+            nonlocal attempt
+            attempt += 1
+            _log_trace("Attempt %d/%d", attempt, policy.max_attempts)
+            if attempt > 1:
+                self._stats.record_retry(endpoint_config.full_ref)
             try:
-                start_time = time.monotonic()
-                with httpx.Client(timeout=timeout, verify=self._ssl_context, follow_redirects=False) as client:
-                    response = client.send(request)
-                elapsed = time.monotonic() - start_time
-
-                self._log_response(response, elapsed)
-
-                # Check response size (header and actual body)
-                content_length = response.headers.get("content-length")
-                if content_length and int(content_length) > self._limits.max_response_size:
-                    raise ResponseTooLargeError(
-                        int(content_length),
-                        self._limits.max_response_size,
-                    )
-                actual_size = len(response.content)
-                if actual_size > self._limits.max_response_size:
-                    raise ResponseTooLargeError(actual_size, self._limits.max_response_size)
-
-                # Parse response
-                return self._parse_response(response, endpoint_config, elapsed)
-
+                response, elapsed = self._send(
+                    request, timeout, endpoint_config.api_name, endpoint=endpoint_config.name, priority=priority
+                )
+                return self._handle_response(response, endpoint_config, elapsed)
             except httpx.TimeoutException as e:
-                log.warning("Request timeout (attempt %d): %s", attempt + 1, e)
-                last_error = e
+                log.warning("Request timeout (attempt %d): %s", attempt, e)
+                raise
             except httpx.NetworkError as e:
-                log.warning("Network error (attempt %d): %s", attempt + 1, e)
-                last_error = e
-            except ResponseTooLargeError:
+                log.warning("Network error (attempt %d): %s", attempt, e)
                 raise
             except httpx.HTTPStatusError as e:
                 # Don't retry client errors (4xx), only server errors (5xx)
                 if 400 <= e.response.status_code < 500:
                     return self._parse_response(e.response, endpoint_config, 0.0)
-                log.warning("HTTP error (attempt %d): %s", attempt + 1, e)
-                last_error = e
+                log.warning("HTTP error (attempt %d): %s", attempt, e)
+                raise
 
-        # All retries exhausted
-        raise RequestError(
-            f"Request failed after {self._limits.max_retries + 1} attempts: {last_error}",
-            retryable=False,
-        )
+        try:
+            return policy.call(send_once)
+        except RetryExhaustedError as e:
+            return self._exhausted(e, endpoint_config)
 
     async def _execute_with_retry_async(
         self,
         request: httpx.Request,
         endpoint_config: EndpointConfig,
         timeout: float,
+        *,
+        priority: int = Priority.NORMAL,
     ) -> RapiResponse:
         """Execute async request with retry logic.
 
@@ -766,6 +2347,7 @@ async def _execute_with_retry_async(
             request: Prepared HTTP request.
             endpoint_config: Endpoint configuration.
             timeout: Request timeout in seconds.
+            priority: Order among attempts waiting for a rate limiter token.
 
         Returns:
             RapiResponse.
@@ -774,64 +2356,37 @@ async def _execute_with_retry_async(
             RequestError: If all retries fail.
             ResponseTooLargeError: If response is too large.
         """
-        import asyncio
-
-        last_error: Exception | None = None
-        delay = self._limits.retry_delay
-
-        for attempt in range(self._limits.max_retries + 1):
-            if attempt > 0:
-                log.debug("Retry %d/%d after %.1fs", attempt, self._limits.max_retries, delay)
-                _log_trace("Waiting %.1fs before retry...", delay)
-                await asyncio.sleep(delay)
-                delay *= self._limits.retry_backoff
-
-            _log_trace("Attempt %d/%d", attempt + 1, self._limits.max_retries + 1)
-
+        policy = self._retry_policy()
+        attempt = 0
+
+        async def send_once() -> RapiResponse:
+            nonlocal attempt
+            attempt += 1
+            _log_trace("Attempt %d/%d", attempt, policy.max_attempts)
+            if attempt > 1:
+                self._stats.record_retry(endpoint_config.full_ref)
             try:
-                start_time = time.monotonic()
-                async with httpx.AsyncClient(
-                    timeout=timeout, verify=self._ssl_context, follow_redirects=False
-                ) as client:
-                    response = await client.send(request)
-                elapsed = time.monotonic() - start_time
-
-                self._log_response(response, elapsed)
-
-                # Check response size (header and actual body)
-                content_length = response.headers.get("content-length")
-                if content_length and int(content_length) > self._limits.max_response_size:
-                    raise ResponseTooLargeError(
-                        int(content_length),
-                        self._limits.max_response_size,
-                    )
-                actual_size = len(response.content)
-                if actual_size > self._limits.max_response_size:
-                    raise ResponseTooLargeError(actual_size, self._limits.max_response_size)
-
-                # Parse response
-                return self._parse_response(response, endpoint_config, elapsed)
-
+                response, elapsed = await self._send_async(
+                    request, timeout, endpoint_config.api_name, endpoint=endpoint_config.name, priority=priority
+                )
+                return self._handle_response(response, endpoint_config, elapsed)
             except httpx.TimeoutException as e:
-                log.warning("Request timeout (attempt %d): %s", attempt + 1, e)
-                last_error = e
+                log.warning("Request timeout (attempt %d): %s", attempt, e)
+                raise
             except httpx.NetworkError as e:
-                log.warning("Network error (attempt %d): %s", attempt + 1, e)
-                last_error = e
-            except ResponseTooLargeError:
+                log.warning("Network error (attempt %d): %s", attempt, e)
                 raise
             except httpx.HTTPStatusError as e:
                 # Don't retry client errors (4xx)
                 if 400 <= e.response.status_code < 500:
                     return self._parse_response(e.response, endpoint_config, 0.0)
-                log.warning("HTTP error (attempt %d): %s", attempt + 1, e)
-                last_error = e
+                log.warning("HTTP error (attempt %d): %s", attempt, e)
+                raise
 
-        # All retries exhausted
-        raise RequestError(
-            f"Request failed after {self._limits.max_retries + 1} attempts: {last_error}",
-            retryable=False,
-        )
+        try:
+            return await policy.acall(send_once)
+        except RetryExhaustedError as e:
+            return self._exhausted(e, endpoint_config)
 
     def _parse_response(
         self,
@@ -849,24 +2404,14 @@ def _parse_response(
         Returns:
             Parsed RapiResponse.
         """
-        text = response.text
-        data: Any = None
-
-        # Try to parse as JSON (only when content-type confirms it)
-        content_type = response.headers.get("content-type", "")
-        if "application/json" in content_type or ("application/vnd." in content_type and "+json" in content_type):
-            try:
-                data = response.json()
-            except json.JSONDecodeError:
-                log.debug("Response is not valid JSON despite content-type")
-
+        # Text, JSON (only when content-type confirms it) and headers decode lazily
         return RapiResponse(
             status_code=response.status_code,
-            headers=dict(response.headers),
-            data=data,
-            text=text,
+            headers=response.headers,
             elapsed=elapsed,
             endpoint_ref=endpoint_config.full_ref,
+            content=response.content,
+            json_decoder=self._json_decoder,
         )
 
 
@@ -880,7 +2425,7 @@ def call(
 ) -> RapiResponse:
     """Make a quick synchronous API call using a temporary RapiClient.
 
-    Creates a temporary RapiClient and makes the call.
+    Creates a temporary RapiClient, makes the call and closes it.
 
     Args:
         endpoint_ref: Endpoint reference.
@@ -898,7 +2443,10 @@ def call(
         >>> response = call("httpbin.get_ip")  # doctest: +SKIP
     """
     client = RapiClient()
-    return client.call(endpoint_ref, *args, body=body, headers=headers, confirm=confirm, **kwargs)
+    try:
+        return client.call(endpoint_ref, *args, body=body, headers=headers, confirm=confirm, **kwargs)
+    finally:
+        client.close()
 
 
 async def call_async(
@@ -911,7 +2459,7 @@ async def call_async(
 ) -> RapiResponse:
     """Make a quick asynchronous API call using a temporary RapiClient.
 
-    Creates a temporary RapiClient and makes the async call.
+    Creates a temporary RapiClient, makes the async call and closes it.
 
     Args:
         endpoint_ref: Endpoint reference.
@@ -929,7 +2477,10 @@ async def call_async(
         >>> response = await call_async("httpbin.get_ip")  # doctest: +SKIP
     """
     client = RapiClient()
-    return await client.call_async(endpoint_ref, *args, body=body, headers=headers, confirm=confirm, **kwargs)
+    try:
+        return await client.call_async(endpoint_ref, *args, body=body, headers=headers, confirm=confirm, **kwargs)
+    finally:
+        await client.aclose()
 
 
 __all__ = [
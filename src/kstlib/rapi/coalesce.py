@@ -0,0 +1,173 @@
+"""In-flight request coalescing for RAPI module.
+
+When several callers request the same read-only endpoint with the same
+inputs at the same moment (for example every strategy on a candle close),
+:class:`RequestCoalescer` lets the first caller send the request and hands
+its response, or its exception, to every caller that arrives while it is
+still in flight. Nothing is kept once the request completes; use the
+response cache for that.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+    from typing import Any
+
+T = TypeVar("T")
+
+
+@dataclass
+class CoalesceStats:
+    """Statistics for request coalescing.
+
+    Attributes:
+        leaders: Calls that sent a request.
+        shared: Calls that reused the response of an in-flight request.
+
+    Examples:
+        >>> stats = CoalesceStats(leaders=1, shared=3)
+        >>> stats.shared_ratio
+        0.75
+    """
+
+    leaders: int = 0
+    shared: int = 0
+
+    @property
+    def shared_ratio(self) -> float:
+        """Fraction of calls that did not send their own request (0.0 if none)."""
+        total = self.leaders + self.shared
+        return self.shared / total if total else 0.0
+
+
+class _Flight(Generic[T]):
+    """Async in-flight request and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task[T]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+def _forget(inflight: dict[str, _Flight[Any]], key: str, flight: _Flight[Any]) -> None:
+    """Drop a finished flight unless a newer one took its key."""
+    if inflight.get(key) is flight:
+        del inflight[key]
+
+
+class RequestCoalescer:
+    """Share one in-flight call between concurrent callers with the same key.
+
+    Sync callers (threads) and async callers (coroutines) are tracked
+    separately; async flights are bound to their event loop. Callers
+    receive the same result object and should treat it as read-only.
+
+    Examples:
+        >>> coalescer = RequestCoalescer()
+        >>> coalescer.run("k", lambda: 42)
+        42
+        >>> coalescer.stats.leaders
+        1
+    """
+
+    def __init__(self) -> None:
+        """Initialize RequestCoalescer."""
+        self._stats = CoalesceStats()
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future[Any]] = {}
+        self._async_inflight: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            dict[str, _Flight[Any]],
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def stats(self) -> CoalesceStats:
+        """Coalescing statistics."""
+        return self._stats
+
+    def run(self, key: str, fn: Callable[[], T]) -> T:
+        """Call ``fn`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Identity of the call.
+            fn: Function sending the request.
+
+        Returns:
+            The result of ``fn``, possibly obtained by another thread.
+
+        Raises:
+            Exception: Whatever ``fn`` raised, re-raised in every caller.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+                self._stats.leaders += 1
+            else:
+                self._stats.shared += 1
+        if not leader:
+            return future.result()  # type: ignore[no-any-return]
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    async def run_async(self, key: str, factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Await ``factory()`` unless a call with the same key is already in flight.
+
+        The request runs in its own task. A caller that is cancelled stops
+        waiting without cancelling the request, unless it was the last
+        caller waiting for it.
+
+        Args:
+            key: Identity of the call.
+            factory: Zero-argument function returning the request coroutine.
+
+        Returns:
+            The result of the coroutine, possibly started by another caller.
+
+        Raises:
+            Exception: Whatever the coroutine raised, re-raised in every caller.
+        """
+        loop = asyncio.get_running_loop()
+        inflight = self._async_inflight.setdefault(loop, {})
+        flight = inflight.get(key)
+        if flight is None:
+            flight = inflight[key] = _Flight(loop.create_task(factory()))
+            flight.task.add_done_callback(lambda _: _forget(inflight, key, flight))
+            self._stats.leaders += 1
+        else:
+            self._stats.shared += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+
+__all__ = [
+    "CoalesceStats",
+    "RequestCoalescer",
+]
@@ -12,6 +12,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from dataclasses import dataclass, field
@@ -54,6 +55,79 @@ def _validate_path_param(name: str, value: str) -> None:
         raise ValueError(f"Path traversal not allowed in parameter '{name}': {value!r}")
 
 
+class PathFormatter:
+    """Path template split once into literal parts and placeholders.
+
+    Formatting joins the parts instead of scanning the template with a regex
+    and calling ``str.replace`` per placeholder on every call. Substituted
+    values are not scanned again for placeholders.
+
+    Args:
+        template: Path template (e.g., ``"/users/{userId}/items/{0}"``).
+
+    Examples:
+        >>> formatter = PathFormatter("/klines/{symbol}/{interval}")
+        >>> formatter.format(("BTCUSDT",), {"interval": "1m"})
+        '/klines/BTCUSDT/1m'
+        >>> sorted(formatter.params)
+        ['interval', 'symbol']
+    """
+
+    __slots__ = ("_parts", "_placeholders", "params", "template")
+
+    def __init__(self, template: str) -> None:
+        """Initialize PathFormatter."""
+        self.template = template
+        # re.split with a capture group alternates literal, placeholder, literal, ...
+        self._parts: tuple[str, ...] = tuple(_PATH_PARAM_PATTERN.split(template))
+        self._placeholders: tuple[str, ...] = self._parts[1::2]
+        #: Named placeholders, i.e. kwargs consumed by the path (not sent as query).
+        self.params: frozenset[str] = frozenset(p for p in self._placeholders if not p.isdigit())
+
+    def format(self, args: Sequence[Any], kwargs: Mapping[str, Any]) -> str:
+        """Substitute placeholders.
+
+        ``{0}``, ``{1}`` take positional arguments. Named placeholders take
+        keyword arguments, falling back to the next unused positional one.
+
+        Raises:
+            ValueError: If a parameter is missing or unsafe.
+        """
+        if not self._placeholders:
+            return self.template
+        values: dict[str, str] = {}
+        remaining = tuple(args)
+        for placeholder in self._placeholders:
+            if placeholder.isdigit():
+                idx = int(placeholder)
+                if idx >= len(remaining):
+                    raise ValueError(f"Missing positional argument {idx} for path {self.template}")
+                value = str(remaining[idx])
+            elif placeholder in kwargs:
+                value = str(kwargs[placeholder])
+            elif remaining:
+                value = str(remaining[0])
+                remaining = remaining[1:]
+            else:
+                raise ValueError(f"Missing parameter '{placeholder}' for path {self.template}")
+            _validate_path_param(placeholder, value)
+            values.setdefault(placeholder, value)
+        parts = list(self._parts)
+        parts[1::2] = [values[p] for p in self._placeholders]
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_path(template: str) -> PathFormatter:
+    """Return the (cached) formatter for a path template.
+
+    Examples:
+        >>> compile_path("/ip") is compile_path("/ip")
+        True
+    """
+    return PathFormatter(template)
+
+
 # Deep defense: allowed values for HMAC config (hardcoded limits)
 _ALLOWED_HMAC_ALGORITHMS = frozenset({"sha256", "sha512"})
 _ALLOWED_SIGNATURE_FORMATS = frozenset({"hex", "base64"})
@@ -216,6 +290,376 @@ class SafeguardConfig:
     required_methods: frozenset[str] = field(default_factory=lambda: _DEFAULT_SAFEGUARD_METHODS)
 
 
+@dataclass(frozen=True, slots=True)
+class HttpConfig:
+    """Connection pool settings for one API.
+
+    RapiClient keeps one long-lived HTTP client per API, so TCP and TLS
+    handshakes are paid once and then reused across calls.
+
+    Attributes:
+        max_connections: Maximum open connections to the API.
+        max_keepalive_connections: Idle connections kept in the pool.
+        keepalive_expiry: Seconds an idle connection stays in the pool.
+        http2: Negotiate HTTP/2 when the server supports it (needs ``h2``).
+        preconnect: Open a connection in ``RapiClient.preconnect()``.
+        cookies: Keep ``Set-Cookie`` from responses and send it on later
+            calls to the API. Off by default: the pooled client is shared
+            by every call, so a session cookie would leak between them.
+
+    Examples:
+        >>> config = HttpConfig(max_connections=10, http2=True)
+        >>> config.max_keepalive_connections
+        20
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0
+    http2: bool = False
+    preconnect: bool = False
+    cookies: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate pool settings."""
+        if self.max_connections < 1:
+            raise ValueError(f"max_connections must be at least 1, got {self.max_connections}")
+        if self.max_keepalive_connections < 0:
+            raise ValueError(f"max_keepalive_connections must not be negative, got {self.max_keepalive_connections}")
+        if self.keepalive_expiry < 0:
+            raise ValueError(f"keepalive_expiry must not be negative, got {self.keepalive_expiry}")
+
+
+@dataclass(frozen=True, slots=True)
+class CacheConfig:
+    """Response cache settings for one GET endpoint.
+
+    Attributes:
+        ttl: Seconds a response stays fresh when the server sends no
+            ``Cache-Control: max-age``.
+        revalidate: Revalidate stale entries with ``If-None-Match`` /
+            ``If-Modified-Since`` instead of fetching them again.
+        respect_headers: Let ``Cache-Control`` (``max-age``, ``no-cache``,
+            ``no-store``) override ``ttl``.
+
+    Examples:
+        >>> CacheConfig(ttl=300).revalidate
+        True
+    """
+
+    ttl: float = 60.0
+    revalidate: bool = True
+    respect_headers: bool = True
+
+    def __post_init__(self) -> None:
+        """Validate cache settings."""
+        if self.ttl < 0:
+            raise ValueError(f"cache ttl must not be negative, got {self.ttl}")
+
+
+@dataclass(frozen=True, slots=True)
+class RateBucket:
+    """One server-side quota window of an API.
+
+    Attributes:
+        name: Bucket name, referenced by endpoint weights.
+        limit: Weight allowed per window.
+        per: Window length in seconds. Windows are aligned to the clock
+            (a 60s bucket resets at every full minute).
+        header: Response header reporting the weight used in the current
+            window (e.g. ``X-MBX-USED-WEIGHT-1M``), if the server sends one.
+        default_weight: Weight of endpoints not listed in ``weights``.
+
+    Examples:
+        >>> RateBucket(name="weight_1m", limit=6000, per=60, header="X-MBX-USED-WEIGHT-1M").default_weight
+        1
+    """
+
+    name: str
+    limit: int
+    per: float
+    header: str | None = None
+    default_weight: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate bucket settings."""
+        if self.limit < 1:
+            raise ValueError(f"rate_limit bucket {self.name!r}: limit must be at least 1, got {self.limit}")
+        if self.per <= 0:
+            raise ValueError(f"rate_limit bucket {self.name!r}: per must be positive, got {self.per}")
+        if self.default_weight < 0:
+            raise ValueError(f"rate_limit bucket {self.name!r}: default_weight must not be negative")
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitConfig:
+    """Client-side quota tracking for one API.
+
+    Attributes:
+        buckets: Quota windows enforced by the server.
+        weights: Weight per endpoint name and bucket name. Buckets missing
+            for an endpoint use their ``default_weight``.
+
+    Examples:
+        >>> config = _parse_rate_limit_config(
+        ...     {
+        ...         "buckets": {
+        ...             "weight_1m": {"limit": 6000, "per": 60},
+        ...             "orders_10s": {"limit": 50, "per": 10, "default_weight": 0},
+        ...         },
+        ...         "weights": {"depth": 50, "new_order": {"orders_10s": 1}},
+        ...     }
+        ... )
+        >>> config.weights_for("depth")
+        {'weight_1m': 50, 'orders_10s': 50}
+        >>> config.weights_for("new_order")
+        {'weight_1m': 1, 'orders_10s': 1}
+        >>> config.weights_for("klines")
+        {'weight_1m': 1, 'orders_10s': 0}
+    """
+
+    buckets: tuple[RateBucket, ...]
+    weights: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Validate endpoint weights against the buckets."""
+        if not self.buckets:
+            raise ValueError("rate_limit needs at least one bucket")
+        names = {bucket.name for bucket in self.buckets}
+        for endpoint, weights in self.weights.items():
+            unknown = set(weights) - names
+            if unknown:
+                raise ValueError(f"rate_limit weights for {endpoint!r} use unknown buckets: {sorted(unknown)}")
+            if any(weight < 0 for weight in weights.values()):
+                raise ValueError(f"rate_limit weights for {endpoint!r} must not be negative")
+
+    def weights_for(self, endpoint: str) -> dict[str, int]:
+        """Return the weight of one call to ``endpoint`` in every bucket."""
+        weights = self.weights.get(endpoint, {})
+        return {bucket.name: weights.get(bucket.name, bucket.default_weight) for bucket in self.buckets}
+
+
+#: Supported pagination styles.
+PAGINATION_STYLES = frozenset({"cursor", "offset", "page", "link"})
+
+
+@dataclass(frozen=True, slots=True)
+class PaginationConfig:
+    """Pagination settings for one endpoint.
+
+    Styles:
+        - ``cursor``: send ``cursor_param`` with the value found at
+          ``cursor_path`` in the previous page; stop when it is empty.
+        - ``offset``: send ``offset_param``/``limit_param``; stop on a short page.
+        - ``page``: send ``page_param`` (from ``start_page``) and
+          ``limit_param``; stop on a short page.
+        - ``link``: follow the ``rel="next"`` URL of the ``Link`` header.
+
+    Attributes:
+        style: Pagination style.
+        items: Dotted path to the records in the JSON body (None = the
+            body is the list of records).
+        limit: Page size sent as ``limit_param``.
+        limit_param: Query param for the page size (None = not sent; a page
+            is then only considered last when it is empty).
+        offset_param: Query param for the offset (``offset`` style).
+        page_param: Query param for the page number (``page`` style).
+        start_page: First page number (``page`` style).
+        cursor_param: Query param for the cursor (``cursor`` style).
+        cursor_path: Dotted path to the next cursor in the JSON body.
+        max_pages: Maximum number of pages fetched (None = unbounded).
+        prefetch: Pages requested ahead of the one being consumed.
+            ``offset`` and ``page`` styles can fetch several pages ahead;
+            ``cursor`` and ``link`` styles at most one, since the next
+            request depends on the previous response.
+
+    Examples:
+        >>> PaginationConfig(style="offset", items="data", limit=500).offset_param
+        'offset'
+    """
+
+    style: str
+    items: str | None = None
+    limit: int = 100
+    limit_param: str | None = "limit"
+    offset_param: str = "offset"
+    page_param: str = "page"
+    start_page: int = 1
+    cursor_param: str = "cursor"
+    cursor_path: str = "next_cursor"
+    max_pages: int | None = None
+    prefetch: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate pagination settings."""
+        if self.style not in PAGINATION_STYLES:
+            raise ValueError(f"Invalid pagination style: {self.style!r} (expected one of {sorted(PAGINATION_STYLES)})")
+        if self.limit < 1:
+            raise ValueError(f"pagination limit must be at least 1, got {self.limit}")
+        if self.max_pages is not None and self.max_pages < 1:
+            raise ValueError(f"max_pages must be at least 1, got {self.max_pages}")
+        if self.prefetch < 0:
+            raise ValueError(f"prefetch must not be negative, got {self.prefetch}")
+
+
+def _parse_pagination_config(data: Any) -> PaginationConfig | None:
+    """Build a PaginationConfig from the ``pagination`` entry of an endpoint.
+
+    Args:
+        data: Style name, a mapping with ``style`` and options, or None.
+
+    Returns:
+        PaginationConfig, or None when the endpoint is not paginated.
+
+    Examples:
+        >>> _parse_pagination_config("link").style
+        'link'
+        >>> _parse_pagination_config({"style": "cursor", "cursor_path": "meta.next"}).cursor_path
+        'meta.next'
+    """
+    if data is None or data is False:
+        return None
+    if isinstance(data, str):
+        return PaginationConfig(style=data)
+    if isinstance(data, dict):
+        if "style" not in data:
+            raise ValueError(f"Pagination config needs a style: {data!r}")
+        unknown = set(data) - set(PaginationConfig.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Unknown pagination options: {sorted(unknown)}")
+        return PaginationConfig(**data)
+    raise ValueError(f"Invalid pagination config: {data!r}")
+
+
+def _parse_cache_config(data: Any) -> CacheConfig | None:
+    """Build a CacheConfig from the ``cache`` entry of an endpoint.
+
+    Args:
+        data: TTL in seconds, True for defaults, a mapping, or None/False.
+
+    Returns:
+        CacheConfig, or None when caching is off.
+
+    Examples:
+        >>> _parse_cache_config(300)
+        CacheConfig(ttl=300.0, revalidate=True, respect_headers=True)
+        >>> _parse_cache_config({"ttl": 10, "revalidate": False}).revalidate
+        False
+        >>> _parse_cache_config(None) is None
+        True
+    """
+    if data is None or data is False:
+        return None
+    if data is True:
+        return CacheConfig()
+    if isinstance(data, (int, float)):
+        return CacheConfig(ttl=float(data))
+    if isinstance(data, dict):
+        defaults = CacheConfig()
+        return CacheConfig(
+            ttl=float(data.get("ttl", defaults.ttl)),
+            revalidate=bool(data.get("revalidate", defaults.revalidate)),
+            respect_headers=bool(data.get("respect_headers", defaults.respect_headers)),
+        )
+    raise ValueError(f"Invalid cache config: {data!r}")
+
+
+def _parse_http_config(data: Any) -> HttpConfig:
+    """Build an HttpConfig from the ``http`` section of an API.
+
+    Args:
+        data: Mapping from YAML, an HttpConfig, or None for defaults.
+
+    Returns:
+        HttpConfig instance.
+
+    Examples:
+        >>> _parse_http_config({"http2": True, "keepalive_expiry": 30}).keepalive_expiry
+        30.0
+        >>> _parse_http_config(None) == HttpConfig()
+        True
+    """
+    if isinstance(data, HttpConfig):
+        return data
+    if not isinstance(data, dict):
+        return HttpConfig()
+    defaults = HttpConfig()
+    return HttpConfig(
+        max_connections=int(data.get("max_connections", defaults.max_connections)),
+        max_keepalive_connections=int(data.get("max_keepalive_connections", defaults.max_keepalive_connections)),
+        keepalive_expiry=float(data.get("keepalive_expiry", defaults.keepalive_expiry)),
+        http2=bool(data.get("http2", defaults.http2)),
+        preconnect=bool(data.get("preconnect", defaults.preconnect)),
+        cookies=bool(data.get("cookies", defaults.cookies)),
+    )
+
+
+def _parse_rate_limit_config(data: Any) -> RateLimitConfig | None:
+    """Build a RateLimitConfig from the ``rate_limit`` section of an API.
+
+    Buckets are a mapping of name to ``limit`` / ``per`` / ``header`` /
+    ``default_weight``. An endpoint weight is a number (same weight in
+    every bucket) or a mapping of bucket name to weight.
+
+    Args:
+        data: Mapping from YAML, a RateLimitConfig, or None.
+
+    Returns:
+        RateLimitConfig, or None when the API declares no quota.
+
+    Raises:
+        ValueError: If the section is malformed.
+
+    Examples:
+        >>> config = _parse_rate_limit_config({"buckets": {"w": {"limit": 1200, "per": 60}}, "weights": {"depth": 5}})
+        >>> config.buckets[0].limit, config.weights
+        (1200, {'depth': {'w': 5}})
+        >>> _parse_rate_limit_config(None) is None
+        True
+    """
+    if data is None or isinstance(data, RateLimitConfig):
+        return data
+    if isinstance(data, dict) and isinstance(data.get("buckets"), dict):
+        return _rate_limit_from_mapping(data)
+    raise ValueError(f"Invalid rate_limit config (expected a 'buckets' mapping): {data!r}")
+
+
+def _rate_limit_from_mapping(data: dict[str, Any]) -> RateLimitConfig:
+    """Build a RateLimitConfig from a ``rate_limit`` mapping."""
+    unknown = set(data) - {"buckets", "weights"}
+    if unknown:
+        raise ValueError(f"Unknown rate_limit options: {sorted(unknown)}")
+
+    buckets = []
+    for name, bucket in data["buckets"].items():
+        if not isinstance(bucket, dict) or "limit" not in bucket or "per" not in bucket:
+            raise ValueError(f"rate_limit bucket {name!r} needs 'limit' and 'per': {bucket!r}")
+        buckets.append(
+            RateBucket(
+                name=str(name),
+                limit=int(bucket["limit"]),
+                per=float(bucket["per"]),
+                header=bucket.get("header"),
+                default_weight=int(bucket.get("default_weight", 1)),
+            )
+        )
+
+    weights = {
+        str(endpoint): _endpoint_weights(endpoint, weight, buckets)
+        for endpoint, weight in (data.get("weights") or {}).items()
+    }
+    return RateLimitConfig(buckets=tuple(buckets), weights=weights)
+
+
+def _endpoint_weights(endpoint: str, weight: Any, buckets: list[RateBucket]) -> dict[str, int]:
+    """Normalize an endpoint weight (number or per-bucket mapping)."""
+    if isinstance(weight, dict):
+        return {str(name): int(value) for name, value in weight.items()}
+    if isinstance(weight, int) and not isinstance(weight, bool):
+        return {bucket.name: weight for bucket in buckets}
+    raise ValueError(f"Invalid rate_limit weight for {endpoint!r}: {weight!r}")
+
+
 def _extract_credentials_from_rapi(
     data: dict[str, Any],
     api_name: str,
@@ -418,6 +862,8 @@ def _parse_rapi_file(
                 "auth_type": auth_type,
                 "hmac_config": hmac_config,
                 "headers": data.get("headers", {}),
+                "http": data.get("http", {}),
+                "rate_limit": data.get("rate_limit"),
                 "endpoints": data.get("endpoints", {}),
             }
         }
@@ -589,6 +1035,8 @@ class EndpointConfig:
         auth: Whether to apply API-level authentication to this endpoint.
             Set to False for public endpoints that don't require auth.
         description: Human-readable description of the endpoint.
+        cache: Response cache settings (GET only, None = no caching).
+        pagination: Pagination settings (None = not paginated).
 
     Examples:
         >>> config = EndpointConfig(
@@ -611,6 +1059,8 @@ class EndpointConfig:
     auth: bool = True
     safeguard: str | None = None
     description: str | None = None
+    cache: CacheConfig | None = None
+    pagination: PaginationConfig | None = None
 
     def __post_init__(self) -> None:
         """Validate safeguard field (deep defense)."""
@@ -652,36 +1102,7 @@ def build_path(self, *args: Any, **kwargs: Any) -> str:
             >>> config.build_path(5)
             '/delay/5'
         """
-        path = self.path
-
-        # Find all placeholders
-        placeholders = _PATH_PARAM_PATTERN.findall(path)
-
-        for placeholder in placeholders:
-            if placeholder.isdigit():
-                # Positional: {0}, {1}
-                idx = int(placeholder)
-                if idx < len(args):
-                    value = str(args[idx])
-                    _validate_path_param(placeholder, value)
-                    path = path.replace(f"{{{placeholder}}}", value)
-                else:
-                    raise ValueError(f"Missing positional argument {idx} for path {self.path}")
-            elif placeholder in kwargs:
-                # Named: {name}
-                value = str(kwargs[placeholder])
-                _validate_path_param(placeholder, value)
-                path = path.replace(f"{{{placeholder}}}", value)
-            elif len(args) > 0:
-                # Try to use first positional arg for first named placeholder
-                value = str(args[0])
-                _validate_path_param(placeholder, value)
-                path = path.replace(f"{{{placeholder}}}", value)
-                args = args[1:]
-            else:
-                raise ValueError(f"Missing parameter '{placeholder}' for path {self.path}")
-
-        return path
+        return compile_path(self.path).format(args, kwargs)
 
     def build_safeguard(self, *args: Any, **kwargs: Any) -> str | None:
         """Build safeguard string with variable substitution.
@@ -739,6 +1160,8 @@ class ApiConfig:
         hmac_config: HMAC signing configuration (required when auth_type is hmac).
         headers: Service-level headers (applied to all endpoints).
         endpoints: Dictionary of endpoint configurations.
+        http: Connection pool settings.
+        rate_limit: Quota buckets and endpoint weights (None = untracked).
 
     Examples:
         >>> api = ApiConfig(
@@ -755,6 +1178,79 @@ class ApiConfig:
     hmac_config: HmacConfig | None = None
     headers: dict[str, str] = field(default_factory=dict)
     endpoints: dict[str, EndpointConfig] = field(default_factory=dict)
+    http: HttpConfig = field(default_factory=HttpConfig)
+    rate_limit: RateLimitConfig | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointTemplate:
+    """Request parts of an endpoint precomputed at config-load time.
+
+    Built once per endpoint by :class:`RapiConfigManager`, so a call only
+    fills in its arguments instead of re-parsing the path and re-merging
+    the static headers.
+
+    Attributes:
+        api: API service configuration.
+        endpoint: Endpoint configuration.
+        path: Compiled path formatter.
+        static_headers: Service headers merged with endpoint headers.
+        auth_type: Authentication applied to requests (bearer, basic,
+            api_key, hmac), or None for public endpoints.
+        url_error: Why the base URL is unusable (null byte, non-HTTP
+            scheme), or None. Reported when the endpoint is called.
+
+    Examples:
+        >>> api = ApiConfig(name="ex", base_url="https://ex.com", headers={"Accept": "application/json"})
+        >>> ep = EndpointConfig(name="ticker", api_name="ex", path="/ticker/{symbol}", headers={"X-Ep": "1"})
+        >>> template = EndpointTemplate.compile(api, ep)
+        >>> template.url((), {"symbol": "BTCUSDT"})
+        'https://ex.com/ticker/BTCUSDT'
+        >>> template.query({"symbol": "BTCUSDT", "limit": 5})
+        {'limit': '5'}
+        >>> template.static_headers
+        {'Accept': 'application/json', 'X-Ep': '1'}
+    """
+
+    api: ApiConfig
+    endpoint: EndpointConfig
+    path: PathFormatter
+    static_headers: dict[str, str]
+    auth_type: str | None
+    url_error: str | None
+
+    @classmethod
+    def compile(cls, api_config: ApiConfig, endpoint_config: EndpointConfig) -> EndpointTemplate:
+        """Precompute the request parts of an endpoint."""
+        url_error = None
+        if "\x00" in api_config.base_url or "\x00" in endpoint_config.path:
+            url_error = "Null bytes not allowed in URL"
+        elif not api_config.base_url.lower().startswith(("http://", "https://")):
+            url_error = "Invalid URL scheme (only http/https allowed)"
+        auth_type = None
+        if api_config.credentials and endpoint_config.auth:
+            auth_type = api_config.auth_type or "bearer"
+        return cls(
+            api=api_config,
+            endpoint=endpoint_config,
+            path=compile_path(endpoint_config.path),
+            static_headers={**api_config.headers, **endpoint_config.headers},
+            auth_type=auth_type,
+            url_error=url_error,
+        )
+
+    def url(self, args: Sequence[Any], kwargs: Mapping[str, Any]) -> str:
+        """Return the full URL for the given path parameters."""
+        return self.api.base_url + self.path.format(args, kwargs)
+
+    def query(self, kwargs: Mapping[str, Any]) -> dict[str, str]:
+        """Return default query params updated with non-path kwargs."""
+        query = dict(self.endpoint.query)
+        params = self.path.params
+        for key, value in kwargs.items():
+            if key not in params:
+                query[key] = str(value)
+        return query
 
 
 class RapiConfigManager:
@@ -804,6 +1300,8 @@ def __init__(
         self._endpoint_index: dict[str, list[str]] = {}  # endpoint_name -> [api_names]
         self._endpoint_sources: dict[str, str] = {}  # full_ref -> source file
         self._source_files: list[Path] = []  # Track loaded files for debugging
+        self._templates: dict[str, EndpointTemplate] = {}  # full_ref -> template
+        self._resolved: dict[str, EndpointTemplate] = {}  # endpoint_ref -> template (memo)
 
         self._load_apis()
 
@@ -858,7 +1356,7 @@ def from_files(
             base_dir: Base directory for resolving relative paths.
             safeguard_config: Safeguard configuration (default: DELETE and PUT require safeguard).
             defaults: Default values inherited from kstlib.conf.yml rapi.defaults section.
-                Supports: base_url, credentials, auth, headers.
+                Supports: base_url, credentials, auth, headers, http.
             strict: If True, raise error on endpoint collisions. If False, warn and overwrite.
 
         Returns:
@@ -1009,6 +1507,10 @@ def _load_apis(self) -> None:
 
                 method = ep_data.get("method", "GET").upper()
                 safeguard = ep_data.get("safeguard")
+                cache = _parse_cache_config(ep_data.get("cache"))
+                if cache is not None and method != "GET":
+                    log.warning("Ignoring cache on %s endpoint: %s.%s", method, api_name, ep_name)
+                    cache = None
 
                 endpoint = EndpointConfig(
                     name=ep_name,
@@ -1021,6 +1523,8 @@ def _load_apis(self) -> None:
                     auth=ep_data.get("auth", True),
                     safeguard=safeguard,
                     description=ep_data.get("description"),
+                    cache=cache,
+                    pagination=_parse_pagination_config(ep_data.get("pagination")),
                 )
 
                 # Validate safeguard requirement
@@ -1036,6 +1540,10 @@ def _load_apis(self) -> None:
 
                 log.debug("Loaded endpoint: %s.%s", api_name, ep_name)
 
+            rate_limit = _parse_rate_limit_config(api_data.get("rate_limit"))
+            for ep_name in sorted(set(rate_limit.weights) - set(endpoints) if rate_limit else ()):
+                log.warning("rate_limit weight for unknown endpoint: %s.%s", api_name, ep_name)
+
             # Create API config
             api_config = ApiConfig(
                 name=api_name,
@@ -1045,10 +1553,23 @@ def _load_apis(self) -> None:
                 hmac_config=api_data.get("hmac_config"),
                 headers=dict(api_data.get("headers", {})),
                 endpoints=endpoints,
+                http=_parse_http_config(api_data.get("http")),
+                rate_limit=rate_limit,
             )
             self._apis[api_name] = api_config
             log.debug("Loaded API: %s (%d endpoints)", api_name, len(endpoints))
 
+        self._compile_templates()
+
+    def _compile_templates(self) -> None:
+        """Precompute request templates and reset the resolve memo."""
+        self._templates = {
+            endpoint.full_ref: EndpointTemplate.compile(api, endpoint)
+            for api in self._apis.values()
+            for endpoint in api.endpoints.values()
+        }
+        self._resolved = {}
+
     def _merge_apis(
         self,
         other: RapiConfigManager,
@@ -1075,6 +1596,8 @@ def _merge_apis(
             if cred_name not in self._credentials_config:
                 self._credentials_config[cred_name] = cred_config
 
+        self._compile_templates()
+
     def _handle_api_conflict(
         self,
         api_name: str,
@@ -1162,14 +1685,48 @@ def resolve(self, endpoint_ref: str) -> tuple[ApiConfig, EndpointConfig]:
             >>> api, endpoint = manager.resolve("httpbin.get_ip")  # doctest: +SKIP
             >>> api, endpoint = manager.resolve("get_ip")  # doctest: +SKIP
         """
-        log.debug("Resolving endpoint reference: %s", endpoint_ref)
+        template = self.template(endpoint_ref)
+        return template.api, template.endpoint
+
+    def template(self, endpoint_ref: str) -> EndpointTemplate:
+        """Resolve an endpoint reference to its precompiled request template.
+
+        Successful resolutions are memoized per reference string.
+
+        Args:
+            endpoint_ref: Full reference (api.endpoint) or short (endpoint).
 
+        Returns:
+            EndpointTemplate of the endpoint.
+
+        Raises:
+            EndpointNotFoundError: If endpoint cannot be found.
+            EndpointAmbiguousError: If short reference matches multiple APIs.
+
+        Examples:
+            >>> manager = RapiConfigManager(
+            ...     {"api": {"ex": {"base_url": "https://ex.com", "endpoints": {"time": {"path": "/time"}}}}}
+            ... )
+            >>> manager.template("time").url((), {})
+            'https://ex.com/time'
+            >>> manager.template("time") is manager.template("ex.time")
+            True
+        """
+        template = self._resolved.get(endpoint_ref)
+        if template is not None:
+            return template
+
+        log.debug("Resolving endpoint reference: %s", endpoint_ref)
         if "." in endpoint_ref:
             # Full reference: api.endpoint
-            return self._resolve_full(endpoint_ref)
+            _, endpoint_config = self._resolve_full(endpoint_ref)
+        else:
+            # Short reference: endpoint only
+            _, endpoint_config = self._resolve_short(endpoint_ref)
 
-        # Short reference: endpoint only
-        return self._resolve_short(endpoint_ref)
+        template = self._templates[endpoint_config.full_ref]
+        self._resolved[endpoint_ref] = template
+        return template
 
     def _resolve_full(self, endpoint_ref: str) -> tuple[ApiConfig, EndpointConfig]:
         """Resolve full reference (api.endpoint)."""
@@ -1416,9 +1973,16 @@ def _resolve_include_patterns(patterns: list[str] | str) -> list[Path]:
 
 __all__ = [
     "ApiConfig",
+    "CacheConfig",
     "EndpointConfig",
+    "EndpointTemplate",
     "HmacConfig",
+    "HttpConfig",
+    "PaginationConfig",
+    "PathFormatter",
     "RapiConfigManager",
+    "RateBucket",
+    "RateLimitConfig",
     "SafeguardConfig",
     "load_rapi_config",
 ]
@@ -3,6 +3,11 @@
 This module provides multi-source credential resolution for REST API calls.
 Supports environment variables, files (JSON/YAML), SOPS-encrypted files,
 and kstlib.auth providers.
+
+Resolved records are cached until their ``expires_at``. Shortly before it,
+a cached record is still returned while a background thread resolves the
+credential again, so calls never wait for a token refresh or a ``sops``
+decrypt once the credential has been loaded.
 """
 
 from __future__ import annotations
@@ -11,6 +16,9 @@
 import logging
 import os
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -18,7 +26,7 @@
 from kstlib.rapi.exceptions import CredentialError
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Iterable, Mapping
 
 log = logging.getLogger(__name__)
 
@@ -32,6 +40,15 @@
 _MAX_FIELD_VALUE_SIZE = 10 * 1024  # 10KB max per field value
 _FIELD_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
+#: Seconds before ``expires_at`` at which a cached credential is refreshed in the background.
+DEFAULT_REFRESH_AHEAD = 60.0
+
+#: Credentials resolved in parallel by :meth:`CredentialResolver.resolve_many`.
+DEFAULT_RESOLVE_WORKERS = 8
+
+# Seconds before retrying a background refresh that failed
+_REFRESH_RETRY_DELAY = 5.0
+
 
 @dataclass(frozen=True, slots=True)
 class CredentialRecord:
@@ -137,6 +154,18 @@ def _validate_fields_mapping(
         _validate_field_name(source_field, credential_name)
 
 
+def _refresh_hold(previous: CredentialRecord | None, record: CredentialRecord) -> float | None:
+    """Return until when to skip refresh-ahead, or None if ``record`` renewed ``previous``.
+
+    A lookup that did not extend the expiry (a file or sops record that has
+    not been rotated yet) would be repeated on every resolve() until expiry.
+    """
+    expires_at = record.expires_at
+    if previous is None or previous.expires_at is None or expires_at is None or expires_at > previous.expires_at:
+        return None
+    return expires_at
+
+
 class CredentialResolver:
     """Resolve credentials from multiple sources.
 
@@ -146,22 +175,47 @@ class CredentialResolver:
     - sops: SOPS-encrypted file
     - provider: kstlib.auth provider (OAuth2/OIDC)
 
+    Records are cached until ``expires_at`` (forever if unknown). Within
+    ``refresh_ahead`` seconds of expiry, the cached record is returned and a
+    background thread resolves the credential again. A refresh that brings no
+    later expiry is not repeated before the record expires. Concurrent
+    resolutions of one credential share a single lookup.
+
     Args:
         credentials_config: Credentials section from config.
+        refresh_ahead: Seconds before expiry at which to refresh in the
+            background (0 disables refresh-ahead).
+        clock: Wall clock in seconds, compared with ``expires_at``.
 
     Examples:
         >>> resolver = CredentialResolver({"github": {"type": "env", "var": "GITHUB_TOKEN"}})
         >>> record = resolver.resolve("github")  # doctest: +SKIP
+        >>> records = resolver.resolve_many(["binance", "kraken"])  # doctest: +SKIP
     """
 
-    def __init__(self, credentials_config: Mapping[str, Any] | None = None) -> None:
+    def __init__(
+        self,
+        credentials_config: Mapping[str, Any] | None = None,
+        *,
+        refresh_ahead: float = DEFAULT_REFRESH_AHEAD,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
         """Initialize CredentialResolver.
 
         Args:
             credentials_config: Credentials section from config.
+            refresh_ahead: Seconds before expiry at which to refresh in the background.
+            clock: Wall clock in seconds.
         """
+        if refresh_ahead < 0:
+            raise ValueError(f"refresh_ahead must not be negative, got {refresh_ahead}")
         self._config = credentials_config or {}
         self._cache: dict[str, CredentialRecord] = {}
+        self._refresh_ahead = refresh_ahead
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future[CredentialRecord]] = {}
+        self._retry_refresh_at: dict[str, float] = {}
 
     def resolve(self, credential_name: str) -> CredentialRecord:
         """Resolve a credential by name.
@@ -175,11 +229,116 @@ def resolve(self, credential_name: str) -> CredentialRecord:
         Raises:
             CredentialError: If credential cannot be resolved.
         """
-        log.debug("Resolving credential: %s", credential_name)
+        record = self._cache.get(credential_name)
+        if record is not None:
+            expires_at = record.expires_at
+            if expires_at is None:
+                return record
+            now = self._clock()
+            if now < expires_at:
+                if now >= expires_at - self._refresh_ahead and now >= self._retry_refresh_at.get(credential_name, 0.0):
+                    self._refresh_in_background(credential_name)
+                return record
+            log.debug("Credential '%s' expired, resolving again", credential_name)
+
+        future, owner = self._claim(credential_name)
+        if not owner:
+            log.debug("Credential '%s' already being resolved, waiting", credential_name)
+            return future.result()
+        return self._fill(credential_name, future)
+
+    def resolve_many(
+        self,
+        credential_names: Iterable[str],
+        *,
+        max_workers: int = DEFAULT_RESOLVE_WORKERS,
+    ) -> dict[str, CredentialRecord]:
+        """Resolve several credentials concurrently (e.g. at startup).
 
-        if credential_name in self._cache:
-            log.debug("Credential '%s' found in cache", credential_name)
-            return self._cache[credential_name]
+        Independent credentials are resolved in parallel threads, so slow
+        sources such as ``sops`` decrypts overlap instead of adding up.
+
+        Args:
+            credential_names: Credential names; duplicates are resolved once.
+            max_workers: Maximum credentials resolved at the same time.
+
+        Returns:
+            Mapping of credential name to record, in input order.
+
+        Raises:
+            CredentialError: For the first failing credential (in input
+                order), once every resolution has finished.
+        """
+        names = list(dict.fromkeys(credential_names))
+        if len(names) <= 1 or max_workers <= 1:
+            return {name: self.resolve(name) for name in names}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(names)), thread_name_prefix="credentials") as pool:
+            futures = {name: pool.submit(self.resolve, name) for name in names}
+        return {name: future.result() for name, future in futures.items()}
+
+    def _claim(self, credential_name: str) -> tuple[Future[CredentialRecord], bool]:
+        """Return the in-flight lookup of a credential, starting one if needed.
+
+        Returns:
+            Tuple of (future, True if the caller must perform the lookup).
+        """
+        with self._lock:
+            future = self._inflight.get(credential_name)
+            if future is not None:
+                return future, False
+            future = self._inflight[credential_name] = Future()
+            return future, True
+
+    def _fill(self, credential_name: str, future: Future[CredentialRecord]) -> CredentialRecord:
+        """Look up a claimed credential, cache it and complete its future."""
+        try:
+            record = self._resolve_source(credential_name)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            previous = self._cache.get(credential_name)
+            if record.expires_at is None or record.expires_at > self._clock():
+                self._cache[credential_name] = record
+            hold = _refresh_hold(previous, record)
+            if hold is None:
+                self._retry_refresh_at.pop(credential_name, None)
+            else:
+                self._retry_refresh_at[credential_name] = hold
+            future.set_result(record)
+            return record
+        finally:
+            with self._lock:
+                self._inflight.pop(credential_name, None)
+
+    def _refresh_in_background(self, credential_name: str) -> None:
+        """Start resolving a credential again unless a lookup is in flight."""
+        future, owner = self._claim(credential_name)
+        if not owner:
+            return
+        log.debug("Refreshing credential '%s' ahead of expiry", credential_name)
+        threading.Thread(
+            target=self._refresh,
+            args=(credential_name, future),
+            name=f"credential-refresh-{credential_name}",
+            daemon=True,
+        ).start()
+
+    def _refresh(self, credential_name: str, future: Future[CredentialRecord]) -> None:
+        """Background refresh; failures keep the cached record until it expires."""
+        try:
+            self._fill(credential_name, future)
+        except Exception as e:
+            self._retry_refresh_at[credential_name] = self._clock() + _REFRESH_RETRY_DELAY
+            log.warning("Background refresh of credential '%s' failed: %s", credential_name, e)
+
+    def _resolve_source(self, credential_name: str) -> CredentialRecord:
+        """Resolve a credential from its configured source, bypassing the cache.
+
+        Raises:
+            CredentialError: If credential cannot be resolved.
+        """
+        log.debug("Resolving credential: %s", credential_name)
 
         if credential_name not in self._config:
             raise CredentialError(credential_name, "Not found in credentials config")
@@ -200,7 +359,6 @@ def resolve(self, credential_name: str) -> CredentialRecord:
         else:
             raise CredentialError(credential_name, f"Unknown credential type: {cred_type}")
 
-        self._cache[credential_name] = record
         log.debug("Credential '%s' resolved from %s", credential_name, record.source)
         return record
 
@@ -881,7 +1039,8 @@ def extract_value(data: Any, path: str) -> Any:
     def clear_cache(self) -> None:
         """Clear the credential cache."""
         self._cache.clear()
+        self._retry_refresh_at.clear()
         log.debug("Credential cache cleared")
 
 
-__all__ = ["CredentialRecord", "CredentialResolver"]
+__all__ = ["DEFAULT_REFRESH_AHEAD", "DEFAULT_RESOLVE_WORKERS", "CredentialRecord", "CredentialResolver"]
@@ -0,0 +1,155 @@
+"""Page planning for paginated RAPI endpoints.
+
+Endpoints declare a ``pagination:`` entry (see
+:class:`~kstlib.rapi.config.PaginationConfig`).
+:meth:`RapiClient.paginate <kstlib.rapi.RapiClient.paginate>` asks a
+:class:`PagePlanner` which query params to send for each page and feeds it
+the responses in page order. The planner extracts the records and decides
+when the result set is exhausted.
+
+``offset`` and ``page`` styles know every page's params upfront, so several
+pages can be in flight at once. ``cursor`` and ``link`` styles only know the
+next page once the previous response arrived.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, urlsplit
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from kstlib.rapi.client import RapiResponse
+    from kstlib.rapi.config import PaginationConfig
+
+
+def extract_path(data: Any, path: str | None) -> Any:
+    """Return the value at a dotted path (None if any key is missing).
+
+    Examples:
+        >>> extract_path({"data": {"items": [1, 2]}}, "data.items")
+        [1, 2]
+        >>> extract_path({"data": {}}, "data.items") is None
+        True
+        >>> extract_path([1], None)
+        [1]
+    """
+    if not path:
+        return data
+    for key in path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def next_link(headers: Mapping[str, str]) -> str | None:
+    """Return the ``rel="next"`` URL of a ``Link`` header, if any.
+
+    Examples:
+        >>> next_link({"link": '<https://x.io/a?page=2>; rel="next", <https://x.io/a?page=9>; rel="last"'})
+        'https://x.io/a?page=2'
+        >>> next_link({}) is None
+        True
+    """
+    value = next((v for k, v in headers.items() if k.lower() == "link"), None)
+    if not value:
+        return None
+    for part in value.split(","):
+        url, _, params = part.partition(";")
+        rels = {
+            rel.strip().strip('"').lower()
+            for param in params.split(";")
+            if param.strip().lower().startswith("rel=")
+            for rel in param.strip()[4:].strip('"').split()
+        }
+        if "next" in rels:
+            return url.strip().strip("<>")
+    return None
+
+
+class PagePlanner:
+    """Plan page requests for one pagination run.
+
+    Args:
+        config: Endpoint pagination settings.
+        kwargs: Call kwargs; an ``offset_param`` or ``page_param`` value
+            sets the starting point.
+
+    Examples:
+        >>> from kstlib.rapi.config import PaginationConfig
+        >>> planner = PagePlanner(PaginationConfig(style="offset", limit=2), {})
+        >>> planner.params(1)
+        {'offset': 2, 'limit': 2}
+    """
+
+    def __init__(self, config: PaginationConfig, kwargs: Mapping[str, Any]) -> None:
+        """Initialize PagePlanner."""
+        self.config = config
+        self.finished = False
+        self._observed = 0
+        self._next: dict[str, Any] | None = {}
+        self._start = 0
+        if config.style == "offset":
+            self._start = int(kwargs.get(config.offset_param, 0))
+        elif config.style == "page":
+            self._start = int(kwargs.get(config.page_param, config.start_page))
+
+    @property
+    def parallel(self) -> bool:
+        """Return True if page params are known before earlier pages arrive."""
+        return self.config.style in ("offset", "page")
+
+    def params(self, index: int) -> dict[str, Any] | None:
+        """Return the query params of page ``index``, or None if not known yet."""
+        config = self.config
+        if self.finished or (config.max_pages is not None and index >= config.max_pages):
+            return None
+        size = {config.limit_param: config.limit} if config.limit_param else {}
+        if config.style == "offset":
+            return {config.offset_param: self._start + index * config.limit, **size}
+        if config.style == "page":
+            return {config.page_param: self._start + index, **size}
+        if index != self._observed or self._next is None:
+            return None
+        return {**size, **self._next} if config.style == "cursor" else dict(self._next)
+
+    def observe(self, response: RapiResponse) -> list[Any]:
+        """Record the next page in order and return its records.
+
+        Raises:
+            TypeError: If the records are not a list.
+        """
+        config = self.config
+        records = extract_path(response.data, config.items)
+        if records is None:
+            records = []
+        if not isinstance(records, list):
+            raise TypeError(
+                f"Pagination items at {config.items or 'the response body'!r} is not a list; set pagination.items"
+            )
+        self._observed += 1
+        if config.style == "cursor":
+            cursor = extract_path(response.data, config.cursor_path)
+            previous = (self._next or {}).get(config.cursor_param)
+            # An empty or repeated cursor ends the run instead of looping forever
+            self._next = None if cursor in (None, "") or cursor == previous else {config.cursor_param: cursor}
+        elif config.style == "link":
+            url = next_link(response.headers)
+            self._next = dict(parse_qsl(urlsplit(url).query)) if url else None
+        if self.parallel:
+            short = len(records) < config.limit if config.limit_param else not records
+            self.finished = short
+        else:
+            self.finished = self._next is None
+        if config.max_pages is not None and self._observed >= config.max_pages:
+            self.finished = True
+        return records
+
+
+__all__ = [
+    "PagePlanner",
+    "extract_path",
+    "next_link",
+]
@@ -0,0 +1,211 @@
+"""Client-side tracking of server rate limit quotas.
+
+APIs such as exchanges meter requests by weight in fixed windows and report
+the weight used in response headers (``X-MBX-USED-WEIGHT-1M``). An API with
+a ``rate_limit:`` section (see :class:`~kstlib.rapi.config.RateLimitConfig`)
+gets a :class:`QuotaTracker`. Before each HTTP attempt the tracker reserves
+the endpoint weight in every bucket and waits for the window to reset when
+a bucket is full. Reported usage replaces the local estimate when it is
+higher, and a ``Retry-After`` on 418/429/503 pauses every call to the API.
+
+Windows are aligned to the wall clock: a 60 second bucket resets at every
+full minute, as exchange quotas do.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from kstlib.resilience.deadline import clamp_timeout
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from kstlib.rapi.config import RateBucket, RateLimitConfig
+
+
+@dataclass
+class QuotaStats:
+    """Throttling statistics of a quota tracker.
+
+    Attributes:
+        reserved: Attempts that reserved weight.
+        throttled: Attempts that waited for a window reset or a pause.
+        throttle_time: Total seconds spent waiting.
+        synced: Header reports that raised the local usage estimate.
+        pauses: ``Retry-After`` replies that paused the API.
+    """
+
+    reserved: int = 0
+    throttled: int = 0
+    throttle_time: float = 0.0
+    synced: int = 0
+    pauses: int = 0
+
+
+class QuotaTracker:
+    """Reserve endpoint weight against the quota windows of one API.
+
+    Args:
+        config: Buckets and endpoint weights of the API.
+        clock: Wall clock in seconds, used to align windows.
+
+    Examples:
+        >>> from kstlib.rapi.config import RateBucket, RateLimitConfig
+        >>> tracker = QuotaTracker(RateLimitConfig(buckets=(RateBucket("w", limit=10, per=60, header="x-used"),)))
+        >>> tracker.reserve("depth")
+        0.0
+        >>> tracker.observe({"x-used": "7"})
+        >>> tracker.usage
+        {'w': 7}
+    """
+
+    def __init__(self, config: RateLimitConfig, *, clock: Callable[[], float] = time.time) -> None:
+        """Initialize QuotaTracker."""
+        self._config = config
+        self._clock = clock
+        self._used = {bucket.name: 0 for bucket in config.buckets}
+        self._window = {bucket.name: self._window_of(bucket, clock()) for bucket in config.buckets}
+        self._weights: dict[str, dict[str, int]] = {}
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = QuotaStats()
+
+    @property
+    def config(self) -> RateLimitConfig:
+        """Buckets and endpoint weights."""
+        return self._config
+
+    @property
+    def stats(self) -> QuotaStats:
+        """Throttling statistics."""
+        return self._stats
+
+    @property
+    def usage(self) -> dict[str, int]:
+        """Weight used in the current window of every bucket."""
+        with self._lock:
+            self._roll(self._clock())
+            return dict(self._used)
+
+    def reserve(self, endpoint: str) -> float:
+        """Wait until ``endpoint`` fits in every bucket, then count its weight.
+
+        Args:
+            endpoint: Endpoint name, looked up in the configured weights.
+
+        Returns:
+            Seconds waited.
+
+        Raises:
+            DeadlineExceededError: If the ``deadline()`` budget ran out.
+        """
+        waited = 0.0
+        while True:
+            wait = self._try_reserve(endpoint, waited)
+            if wait <= 0:
+                return waited
+            wait = clamp_timeout(wait, "rapi quota")
+            time.sleep(wait)
+            waited += wait
+
+    async def reserve_async(self, endpoint: str) -> float:
+        """Async variant of :meth:`reserve`."""
+        waited = 0.0
+        while True:
+            wait = self._try_reserve(endpoint, waited)
+            if wait <= 0:
+                return waited
+            wait = clamp_timeout(wait, "rapi quota")
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def observe(self, headers: Mapping[str, str], sent_at: float | None = None) -> None:
+        """Sync local usage with the usage reported in response headers.
+
+        Args:
+            headers: Response headers (case-insensitive mapping, or plain
+                dict with lowercase names).
+            sent_at: Clock time the request was sent. Reports for a window
+                that has already reset are ignored.
+        """
+        with self._lock:
+            now = self._clock()
+            self._roll(now)
+            for bucket in self._config.buckets:
+                if bucket.header is None:
+                    continue
+                if sent_at is not None and self._window_of(bucket, sent_at) != self._window[bucket.name]:
+                    continue
+                reported = _header_int(headers, bucket.header)
+                if reported is not None and reported > self._used[bucket.name]:
+                    self._used[bucket.name] = reported
+                    self._stats.synced += 1
+
+    def pause(self, seconds: float) -> None:
+        """Hold every reservation for ``seconds`` (server asked to back off)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+            self._stats.pauses += 1
+
+    def _try_reserve(self, endpoint: str, waited: float) -> float:
+        """Reserve the endpoint weight or return the seconds to wait first."""
+        weights = self._weights.get(endpoint)
+        if weights is None:
+            weights = self._weights[endpoint] = self._config.weights_for(endpoint)
+        with self._lock:
+            now = self._clock()
+            self._roll(now)
+            wait = self._paused_until - now
+            for bucket in self._config.buckets:
+                used = self._used[bucket.name]
+                # A call heavier than the whole bucket still goes through an empty window
+                if used and used + weights[bucket.name] > bucket.limit:
+                    wait = max(wait, (self._window[bucket.name] + 1) * bucket.per - now)
+            if wait > 0:
+                return wait
+            for name, weight in weights.items():
+                self._used[name] += weight
+            self._stats.reserved += 1
+            if waited:
+                self._stats.throttled += 1
+                self._stats.throttle_time += waited
+            return 0.0
+
+    def _roll(self, now: float) -> None:
+        """Reset the buckets whose window ended. Must hold lock."""
+        for bucket in self._config.buckets:
+            window = self._window_of(bucket, now)
+            if window != self._window[bucket.name]:
+                self._window[bucket.name] = window
+                self._used[bucket.name] = 0
+
+    @staticmethod
+    def _window_of(bucket: RateBucket, now: float) -> int:
+        return int(now // bucket.per)
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        buckets = ", ".join(f"{b.name}={self._used[b.name]}/{b.limit}" for b in self._config.buckets)
+        return f"QuotaTracker({buckets})"
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> int | None:
+    """Return an integer header value (None if missing or not a number)."""
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+__all__ = [
+    "QuotaStats",
+    "QuotaTracker",
+]
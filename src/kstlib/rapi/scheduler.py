@@ -0,0 +1,277 @@
+"""Priority scheduling of rate-limited RAPI requests.
+
+When an API has a rate limiter (``RapiClient(rate_limiters=...)``), every
+HTTP attempt to it waits in that API's :class:`RequestScheduler` for a
+token. Waiting requests are dispatched most important first (lowest
+:class:`~kstlib.resilience.admission.Priority` value), in arrival order
+within a priority, so order placement is not stuck behind a backlog of
+polling calls.
+
+Aging keeps low-priority work moving: every ``aging`` seconds a request
+waits, it counts as one level more important. A ``LOW`` request that waited
+``3 * aging`` seconds goes before a ``CRITICAL`` request that just arrived.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from kstlib.resilience.admission import Priority
+from kstlib.resilience.deadline import check_deadline, clamp_timeout
+
+if TYPE_CHECKING:
+    from kstlib.resilience.rate_limiter import RateLimiter
+
+#: Default seconds of waiting that raise a request by one priority level.
+DEFAULT_AGING = 5.0
+
+
+@dataclass
+class SchedulerStats:
+    """Queue and dispatch statistics of a scheduler, keyed by priority.
+
+    Attributes:
+        depth: Requests waiting now.
+        max_depth: Highest number of requests waiting at once.
+        queued: Requests waiting now, per priority.
+        dispatched: Requests that got a token, per priority.
+        delayed: Dispatched requests that had to wait, per priority.
+        wait_time: Total seconds waited by dispatched requests, per priority.
+
+    Examples:
+        >>> stats = SchedulerStats()
+        >>> stats.record_dispatched(3, 0.5)
+        >>> stats.record_dispatched(3, 0.0)
+        >>> (stats.dispatched, stats.mean_wait(3))
+        ({3: 2}, 0.25)
+    """
+
+    depth: int = 0
+    max_depth: int = 0
+    queued: dict[int, int] = field(default_factory=dict)
+    dispatched: dict[int, int] = field(default_factory=dict)
+    delayed: dict[int, int] = field(default_factory=dict)
+    wait_time: dict[int, float] = field(default_factory=dict)
+
+    def record_queued(self, priority: int, delta: int) -> None:
+        """Track a request entering (+1) or leaving (-1) the queue."""
+        self.depth += delta
+        self.max_depth = max(self.max_depth, self.depth)
+        self.queued[priority] = self.queued.get(priority, 0) + delta
+
+    def record_dispatched(self, priority: int, waited: float) -> None:
+        """Record a request that got its token after ``waited`` seconds."""
+        self.dispatched[priority] = self.dispatched.get(priority, 0) + 1
+        self.wait_time[priority] = self.wait_time.get(priority, 0.0) + waited
+        if waited > 0:
+            self.delayed[priority] = self.delayed.get(priority, 0) + 1
+
+    def mean_wait(self, priority: int) -> float:
+        """Average wait of dispatched requests of a priority (0.0 if none)."""
+        count = self.dispatched.get(priority, 0)
+        return self.wait_time.get(priority, 0.0) / count if count else 0.0
+
+    @property
+    def total_dispatched(self) -> int:
+        """Dispatched requests over all priorities."""
+        return sum(self.dispatched.values())
+
+
+class _Ticket:
+    """A request waiting for a token."""
+
+    __slots__ = ("enqueued", "event", "future", "granted", "left", "loop", "priority")
+
+    def __init__(
+        self,
+        priority: int,
+        *,
+        event: threading.Event | None = None,
+        future: asyncio.Future[None] | None = None,
+    ) -> None:
+        self.priority = int(priority)
+        # Sync waiters block on an event, async waiters on a future of their loop
+        self.event = event
+        self.future = future
+        self.loop = future.get_loop() if future is not None else None
+        self.enqueued = time.monotonic()
+        self.granted = False
+        self.left = False
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class RequestScheduler:
+    """Hand out rate limiter tokens by priority, with aging.
+
+    Sync and async callers of any thread or loop share one queue. The
+    request at the head of the queue takes the next token as soon as the
+    limiter has one. Waits are bounded by the ``deadline()`` budget.
+
+    Args:
+        limiter: Rate limiter whose tokens are scheduled.
+        aging: Seconds of waiting that raise a request by one priority
+            level (None = strict priority, low priorities may starve).
+
+    Examples:
+        >>> from kstlib.resilience import RateLimiter
+        >>> scheduler = RequestScheduler(RateLimiter(rate=5))
+        >>> waited = scheduler.acquire(Priority.HIGH)
+        >>> scheduler.stats.dispatched
+        {1: 1}
+    """
+
+    def __init__(self, limiter: RateLimiter, *, aging: float | None = DEFAULT_AGING) -> None:
+        """Initialize RequestScheduler."""
+        if aging is not None and aging <= 0:
+            raise ValueError(f"aging must be positive, got {aging}")
+        self._limiter = limiter
+        self._aging = aging
+        self._queue: list[tuple[float, int, int, _Ticket]] = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._stats = SchedulerStats()
+
+    @property
+    def limiter(self) -> RateLimiter:
+        """Rate limiter whose tokens are scheduled."""
+        return self._limiter
+
+    @property
+    def stats(self) -> SchedulerStats:
+        """Queue and dispatch statistics."""
+        return self._stats
+
+    @property
+    def depth(self) -> int:
+        """Requests waiting for a token."""
+        return self._stats.depth
+
+    def acquire(self, priority: int = Priority.NORMAL) -> float:
+        """Wait for a token, blocking the calling thread.
+
+        Args:
+            priority: Request priority (lower is more important).
+
+        Returns:
+            Seconds waited.
+
+        Raises:
+            DeadlineExceededError: If the ``deadline()`` budget ran out.
+        """
+        event = threading.Event()
+        ticket = self._enqueue(_Ticket(priority, event=event))
+        timeout = clamp_timeout(None, "rapi scheduler")
+        try:
+            while not self._poll_granted(ticket):
+                event.wait(self._next_wait(ticket, timeout))
+        except BaseException:
+            self._leave(ticket)
+            raise
+        return time.monotonic() - ticket.enqueued
+
+    async def acquire_async(self, priority: int = Priority.NORMAL) -> float:
+        """Wait for a token without blocking the event loop.
+
+        Args:
+            priority: Request priority (lower is more important).
+
+        Returns:
+            Seconds waited.
+
+        Raises:
+            DeadlineExceededError: If the ``deadline()`` budget ran out.
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        ticket = self._enqueue(_Ticket(priority, future=future))
+        timeout = clamp_timeout(None, "rapi scheduler")
+        try:
+            while not self._poll_granted(ticket):
+                await asyncio.wait({future}, timeout=self._next_wait(ticket, timeout))
+        except BaseException:
+            self._leave(ticket)
+            raise
+        return time.monotonic() - ticket.enqueued
+
+    def _enqueue(self, ticket: _Ticket) -> _Ticket:
+        priority = ticket.priority
+        # With aging, priority p enqueued at t ranks as p - (now - t) / aging.
+        # Every waiter ages at the same rate, so t + p * aging orders them.
+        rank = ticket.enqueued + priority * self._aging if self._aging is not None else float(priority)
+        with self._lock:
+            heapq.heappush(self._queue, (rank, next(self._order), priority, ticket))
+            self._stats.record_queued(priority, 1)
+        return ticket
+
+    def _poll_granted(self, ticket: _Ticket) -> bool:
+        """Dispatch available tokens and tell whether ``ticket`` got one."""
+        with self._lock:
+            self._dispatch()
+            return ticket.granted
+
+    def _next_wait(self, ticket: _Ticket, timeout: float | None) -> float:
+        """Return how long to sleep before polling again."""
+        wait = max(self._limiter.time_until_token(), 0.001)
+        if timeout is not None:
+            remaining = ticket.enqueued + timeout - time.monotonic()
+            if remaining <= 0:
+                check_deadline("rapi scheduler")
+            wait = min(wait, max(remaining, 0.001))
+        return min(wait, 0.1)
+
+    def _dispatch(self) -> None:
+        """Grant tokens to the queue head while the limiter has some. Must hold lock."""
+        queue = self._queue
+        while queue:
+            ticket = queue[0][3]
+            if ticket.left:
+                heapq.heappop(queue)
+                continue
+            if self._limiter.time_until_token() > 0 or not self._limiter.try_acquire():
+                return
+            heapq.heappop(queue)
+            ticket.granted = True
+            self._stats.record_queued(ticket.priority, -1)
+            self._stats.record_dispatched(ticket.priority, time.monotonic() - ticket.enqueued)
+            if ticket.event is not None:
+                ticket.event.set()
+            elif ticket.loop is not None and ticket.future is not None and not ticket.loop.is_closed():
+                ticket.loop.call_soon_threadsafe(_resolve, ticket.future)
+
+    def _leave(self, ticket: _Ticket) -> None:
+        """Drop a waiter that gave up (cancelled or out of time).
+
+        A waiter can be granted a token just before it gives up. That token
+        was taken from the limiter but will not be used: it is refunded so
+        the next waiter gets it instead of the API running below its limit.
+        """
+        with self._lock:
+            if ticket.granted:
+                if not ticket.left:
+                    ticket.left = True
+                    self._limiter.refund()
+            elif not ticket.left:
+                ticket.left = True
+                self._stats.record_queued(ticket.priority, -1)
+            # The head may have changed
+            self._dispatch()
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"RequestScheduler(limiter={self._limiter!r}, aging={self._aging}, depth={self.depth})"
+
+
+__all__ = [
+    "DEFAULT_AGING",
+    "RequestScheduler",
+    "SchedulerStats",
+]
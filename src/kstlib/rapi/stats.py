@@ -0,0 +1,409 @@
+"""Per-endpoint request statistics for RapiClient.
+
+Every HTTP attempt sent by :class:`~kstlib.rapi.RapiClient` is recorded
+under its ``api.endpoint`` reference: attempts, retries, errors by class,
+bytes sent and received, and three latencies:
+
+- **connect**: TCP + TLS setup, only for attempts that opened a connection.
+- **ttfb**: time to the response headers.
+- **total**: time until the body was read (headers only for streams).
+
+Latencies go into :class:`LatencyHistogram` instances, which use a fixed
+set of log-spaced buckets. Memory does not grow with traffic and the whole
+client lifetime is covered, at the cost of percentiles rounded up to the
+bucket bound (about 9% wide).
+
+``client.stats()`` returns immutable :class:`EndpointStats` snapshots, so it
+can be registered as a monitoring collector as is, or rendered with
+:func:`stats_table`.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from kstlib.rapi.exceptions import ResponseTooLargeError
+from kstlib.resilience.exceptions import DeadlineExceededError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from kstlib.monitoring.table import MonitorTable
+
+#: Upper bound of the first histogram bucket (seconds).
+HISTOGRAM_MIN = 0.0001
+
+#: Buckets per doubling of latency (bucket width is ``2 ** (1 / 8)``, about 9%).
+HISTOGRAM_RESOLUTION = 8
+
+#: Number of histogram buckets; the last one also holds anything slower (~100s+).
+HISTOGRAM_BUCKETS = 20 * HISTOGRAM_RESOLUTION + 1
+
+
+@dataclass(frozen=True, slots=True)
+class LatencySummary:
+    """Percentiles of a latency histogram (seconds, 0.0 when empty).
+
+    Attributes:
+        count: Recorded samples.
+        mean: Average latency.
+        p50: Median latency.
+        p90: 90th percentile latency.
+        p99: 99th percentile latency.
+        max: Highest latency recorded.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    p50: float = 0.0
+    p90: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
+
+
+class LatencyHistogram:
+    """Bounded-memory latency histogram with log-spaced buckets.
+
+    Examples:
+        >>> histogram = LatencyHistogram()
+        >>> for ms in (10, 20, 30, 40, 500):
+        ...     histogram.record(ms / 1000)
+        >>> histogram.count
+        5
+        >>> 0.030 <= histogram.percentile(50) <= 0.033
+        True
+        >>> histogram.percentile(100)
+        0.5
+    """
+
+    __slots__ = ("_buckets", "count", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize LatencyHistogram."""
+        self._buckets = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def _index(seconds: float) -> int:
+        if seconds <= HISTOGRAM_MIN:
+            return 0
+        index = math.ceil(math.log2(seconds / HISTOGRAM_MIN) * HISTOGRAM_RESOLUTION)
+        return min(index, HISTOGRAM_BUCKETS - 1)
+
+    @staticmethod
+    def _bound(index: int) -> float:
+        return HISTOGRAM_MIN * 2 ** (index / HISTOGRAM_RESOLUTION)
+
+    def record(self, seconds: float) -> None:
+        """Add one sample."""
+        self._buckets[self._index(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float:
+        """Return the ``p``-th percentile (bucket upper bound, at most ``max``).
+
+        Args:
+            p: Percentile in (0, 100].
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+        for index, hits in enumerate(self._buckets):
+            seen += hits
+            if seen >= rank:
+                return min(self._bound(index), self.max)
+        return self.max
+
+    def summary(self) -> LatencySummary:
+        """Return count, mean and percentiles."""
+        if not self.count:
+            return LatencySummary()
+        return LatencySummary(
+            count=self.count,
+            mean=self.total / self.count,
+            p50=self.percentile(50),
+            p90=self.percentile(90),
+            p99=self.percentile(99),
+            max=self.max,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointStats:
+    """Snapshot of the traffic to one endpoint.
+
+    Attributes:
+        requests: HTTP attempts sent, retries included.
+        retries: Attempts that repeated a failed one.
+        errors: Failed attempts per class (``timeout``, ``network``,
+            ``http_4xx``, ``http_5xx``, ``too_large``, ``deadline`` or the
+            exception type name).
+        bytes_sent: Request body bytes.
+        bytes_received: Response body bytes.
+        connect: Connection setup latency of attempts that opened one.
+        ttfb: Time to response headers.
+        total: Time until the response body was read.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    errors: dict[str, int] = field(default_factory=dict)
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    connect: LatencySummary = field(default_factory=LatencySummary)
+    ttfb: LatencySummary = field(default_factory=LatencySummary)
+    total: LatencySummary = field(default_factory=LatencySummary)
+
+    @property
+    def error_count(self) -> int:
+        """Failed attempts over all classes."""
+        return sum(self.errors.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot as plain data (e.g. for JSON export)."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": dict(self.errors),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "connect": _summary_dict(self.connect),
+            "ttfb": _summary_dict(self.ttfb),
+            "total": _summary_dict(self.total),
+        }
+
+
+def _summary_dict(summary: LatencySummary) -> dict[str, float]:
+    return {
+        "count": summary.count,
+        "mean": summary.mean,
+        "p50": summary.p50,
+        "p90": summary.p90,
+        "p99": summary.p99,
+        "max": summary.max,
+    }
+
+
+def error_class(error: BaseException | None = None, status_code: int | None = None) -> str:
+    """Classify a failed attempt by exception or HTTP status.
+
+    Examples:
+        >>> error_class(status_code=503)
+        'http_5xx'
+        >>> error_class(httpx.ConnectTimeout("slow"))
+        'timeout'
+        >>> error_class(KeyError("x"))
+        'KeyError'
+    """
+    if error is None:
+        return f"http_{(status_code or 0) // 100}xx"
+    if isinstance(error, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(error, httpx.NetworkError):
+        return "network"
+    if isinstance(error, ResponseTooLargeError):
+        return "too_large"
+    if isinstance(error, DeadlineExceededError):
+        return "deadline"
+    return type(error).__name__
+
+
+class AttemptTimer:
+    """Timestamps of one HTTP attempt, fed by the httpcore ``trace`` extension.
+
+    Pass ``timer.trace`` (sync clients) or ``timer.atrace`` (async clients)
+    as the ``trace`` extension of the request sent for this attempt only.
+    """
+
+    __slots__ = ("connect", "connect_start", "headers_at", "start")
+
+    def __init__(self) -> None:
+        """Initialize AttemptTimer."""
+        self.start = time.monotonic()
+        self.connect_start: float | None = None
+        self.connect: float | None = None
+        self.headers_at: float | None = None
+
+    def trace(self, event: str, _info: Mapping[str, Any]) -> None:
+        """Record connection and response header events."""
+        if event.endswith(("connect_tcp.started", "connect_unix_socket.started")):
+            self.connect_start = time.monotonic()
+        elif event.endswith(("connect_tcp.complete", "connect_unix_socket.complete", "start_tls.complete")):
+            if self.connect_start is not None:
+                self.connect = time.monotonic() - self.connect_start
+        elif event.endswith("receive_response_headers.complete"):
+            self.headers_at = time.monotonic()
+
+    async def atrace(self, event: str, info: Mapping[str, Any]) -> None:
+        """Async variant of :meth:`trace`."""
+        self.trace(event, info)
+
+    @property
+    def ttfb(self) -> float | None:
+        """Seconds from the start of the attempt to the response headers."""
+        return None if self.headers_at is None else self.headers_at - self.start
+
+
+class _Recorder:
+    """Mutable counters of one endpoint."""
+
+    __slots__ = ("bytes_received", "bytes_sent", "connect", "errors", "requests", "retries", "total", "ttfb")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.errors: dict[str, int] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.connect = LatencyHistogram()
+        self.ttfb = LatencyHistogram()
+        self.total = LatencyHistogram()
+
+    def snapshot(self) -> EndpointStats:
+        return EndpointStats(
+            requests=self.requests,
+            retries=self.retries,
+            errors=dict(self.errors),
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            connect=self.connect.summary(),
+            ttfb=self.ttfb.summary(),
+            total=self.total.summary(),
+        )
+
+
+class ClientStats:
+    """Thread-safe registry of per-endpoint statistics.
+
+    Examples:
+        >>> stats = ClientStats()
+        >>> stats.record_attempt("ex.time", sent=0, received=120, total=0.05, ttfb=0.04)
+        >>> stats.record_error("ex.time", "timeout")
+        >>> snapshot = stats.snapshot()["ex.time"]
+        >>> (snapshot.requests, snapshot.errors, snapshot.bytes_received)
+        (2, {'timeout': 1}, 120)
+    """
+
+    def __init__(self) -> None:
+        """Initialize ClientStats."""
+        self._endpoints: dict[str, _Recorder] = {}
+        self._lock = threading.Lock()
+
+    def _recorder(self, ref: str) -> _Recorder:
+        """Return the counters of an endpoint. Must hold lock."""
+        recorder = self._endpoints.get(ref)
+        if recorder is None:
+            recorder = self._endpoints[ref] = _Recorder()
+        return recorder
+
+    def record_attempt(  # noqa: PLR0913
+        self,
+        ref: str,
+        *,
+        sent: int,
+        received: int,
+        total: float,
+        ttfb: float | None = None,
+        connect: float | None = None,
+    ) -> None:
+        """Record an attempt that got a response.
+
+        Args:
+            ref: Endpoint reference (``api.endpoint``).
+            sent: Request body bytes.
+            received: Response body bytes read so far.
+            total: Seconds until the response (body) was read.
+            ttfb: Seconds to the response headers (default: ``total``).
+            connect: Connection setup seconds, if a connection was opened.
+        """
+        with self._lock:
+            recorder = self._recorder(ref)
+            recorder.requests += 1
+            recorder.bytes_sent += sent
+            recorder.bytes_received += received
+            recorder.total.record(total)
+            recorder.ttfb.record(total if ttfb is None else ttfb)
+            if connect is not None:
+                recorder.connect.record(connect)
+
+    def record_error(self, ref: str, kind: str, *, sent: int = 0, attempt: bool = True) -> None:
+        """Record a failed attempt (``attempt=False``: the attempt was already counted)."""
+        with self._lock:
+            recorder = self._recorder(ref)
+            if attempt:
+                recorder.requests += 1
+                recorder.bytes_sent += sent
+            recorder.errors[kind] = recorder.errors.get(kind, 0) + 1
+
+    def record_retry(self, ref: str) -> None:
+        """Record that an attempt repeats a failed one."""
+        with self._lock:
+            self._recorder(ref).retries += 1
+
+    def record_received(self, ref: str, size: int) -> None:
+        """Add body bytes read after the attempt was recorded (streams)."""
+        with self._lock:
+            self._recorder(ref).bytes_received += size
+
+    def snapshot(self) -> dict[str, EndpointStats]:
+        """Return immutable statistics per endpoint reference, sorted by reference."""
+        with self._lock:
+            return {ref: self._endpoints[ref].snapshot() for ref in sorted(self._endpoints)}
+
+    def reset(self) -> None:
+        """Forget all statistics."""
+        with self._lock:
+            self._endpoints.clear()
+
+
+def stats_table(stats: Mapping[str, EndpointStats], title: str = "RAPI endpoints") -> MonitorTable:
+    """Render endpoint statistics as a monitoring table (latencies in ms).
+
+    Examples:
+        >>> table = stats_table({"ex.time": EndpointStats(requests=3)})
+        >>> table.row_count
+        1
+    """
+    from kstlib.monitoring.table import MonitorTable
+
+    table = MonitorTable(
+        headers=["Endpoint", "Requests", "Errors", "Retries", "TTFB p50", "TTFB p99", "Total p99", "Connect p99"],
+        title=title,
+    )
+    for ref, endpoint in stats.items():
+        table.add_row(
+            [
+                ref,
+                endpoint.requests,
+                endpoint.error_count,
+                endpoint.retries,
+                f"{endpoint.ttfb.p50 * 1000:.1f}",
+                f"{endpoint.ttfb.p99 * 1000:.1f}",
+                f"{endpoint.total.p99 * 1000:.1f}",
+                f"{endpoint.connect.p99 * 1000:.1f}",
+            ]
+        )
+    return table
+
+
+__all__ = [
+    "HISTOGRAM_BUCKETS",
+    "AttemptTimer",
+    "ClientStats",
+    "EndpointStats",
+    "LatencyHistogram",
+    "LatencySummary",
+    "error_class",
+    "stats_table",
+]
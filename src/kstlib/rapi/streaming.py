@@ -0,0 +1,127 @@
+"""Incremental decoding helpers for streamed RAPI responses.
+
+:meth:`RapiClient.stream <kstlib.rapi.RapiClient.stream>` reads a response
+body chunk by chunk instead of loading it in memory. The helpers here turn
+those chunks into the requested records and enforce ``max_response_size``
+on the bytes received so far, so an oversized download fails as soon as it
+crosses the limit.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from typing import TYPE_CHECKING, Any, Literal
+
+from kstlib.rapi.exceptions import ResponseTooLargeError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+#: What :meth:`RapiClient.stream` yields: raw bytes, text lines or NDJSON records.
+StreamMode = Literal["bytes", "lines", "ndjson"]
+
+STREAM_MODES: frozenset[str] = frozenset({"bytes", "lines", "ndjson"})
+
+
+class SizeGuard:
+    """Count streamed bytes and fail once they exceed a limit.
+
+    Args:
+        max_size: Maximum number of bytes allowed.
+
+    Examples:
+        >>> guard = SizeGuard(max_size=8)
+        >>> guard.add(b"12345")
+        >>> guard.add(b"6789")
+        Traceback (most recent call last):
+        ...
+        kstlib.rapi.exceptions.ResponseTooLargeError: Response size 9 exceeds limit 8
+    """
+
+    __slots__ = ("max_size", "received")
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize SizeGuard."""
+        self.max_size = max_size
+        self.received = 0
+
+    def add(self, chunk: bytes) -> None:
+        """Account for a chunk.
+
+        Raises:
+            ResponseTooLargeError: If the total exceeds ``max_size``.
+        """
+        self.received += len(chunk)
+        if self.received > self.max_size:
+            raise ResponseTooLargeError(self.received, self.max_size)
+
+
+class RecordDecoder:
+    r"""Turn byte chunks into records for a :data:`StreamMode`.
+
+    Lines are split on ``\n`` (a trailing ``\r`` is dropped) and may span
+    chunks. In ``ndjson`` mode blank lines are skipped and every other line
+    is decoded as JSON.
+
+    Args:
+        mode: Stream mode.
+        encoding: Text encoding of the body.
+
+    Raises:
+        ValueError: If the mode is unknown.
+
+    Examples:
+        >>> decoder = RecordDecoder("ndjson")
+        >>> list(decoder.feed(b'{"a": 1}\n{"a"'))
+        [{'a': 1}]
+        >>> list(decoder.feed(b": 2}"))
+        []
+        >>> list(decoder.flush())
+        [{'a': 2}]
+    """
+
+    __slots__ = ("_buffer", "_decoder", "mode")
+
+    def __init__(self, mode: StreamMode, encoding: str = "utf-8") -> None:
+        """Initialize RecordDecoder."""
+        if mode not in STREAM_MODES:
+            raise ValueError(f"Invalid stream mode: {mode!r} (expected one of {sorted(STREAM_MODES)})")
+        self.mode = mode
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._buffer = ""
+
+    def feed(self, chunk: bytes) -> Iterator[Any]:
+        """Yield the records completed by ``chunk``."""
+        if self.mode == "bytes":
+            if chunk:
+                yield chunk
+            return
+        self._buffer += self._decoder.decode(chunk)
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            yield from self._record(line)
+
+    def flush(self) -> Iterator[Any]:
+        """Yield the last record once the body is complete."""
+        if self.mode == "bytes":
+            return
+        tail = self._buffer + self._decoder.decode(b"", final=True)
+        self._buffer = ""
+        if tail:
+            yield from self._record(tail)
+
+    def _record(self, line: str) -> Iterator[Any]:
+        line = line.removesuffix("\r")
+        if self.mode == "lines":
+            yield line
+        elif line.strip():
+            yield json.loads(line)
+
+
+__all__ = [
+    "STREAM_MODES",
+    "RecordDecoder",
+    "SizeGuard",
+    "StreamMode",
+]
@@ -3,9 +3,16 @@
 This module provides core components for building resilient systems:
 
 - **Heartbeat**: Periodic liveness signaling via state files
-- **GracefulShutdown**: Orderly shutdown with prioritized callbacks
+- **HeartbeatTable**: Shared memory-mapped heartbeat slots for process fleets
+- **GracefulShutdown**: Orderly shutdown with prioritized, parallel callback groups
+- **AdaptiveLimiter**: Concurrency limit that follows upstream latency
+- **AdmissionController**: Priority-aware load shedding on queue depth and loop lag
+- **Bulkhead**: Cap concurrent calls with a bounded wait queue
 - **CircuitBreaker**: Protect against cascading failures
+- **deadline**: Time budget shared by every kstlib wait in a block
 - **RateLimiter**: Token bucket rate limiting for request throttling
+- **HedgePolicy**: Hedged async attempts to cut tail latency of idempotent calls
+- **RetryPolicy**: Retries with backoff, jitter, deadlines and retry budgets
 - **Watchdog**: Detect thread/process freezes and hangs
 
 Examples:
@@ -17,6 +24,14 @@
     >>> Heartbeat.is_alive("/tmp/app.heartbeat")  # doctest: +SKIP
     True
 
+    Supervising a fleet through a shared heartbeat table:
+
+    >>> from kstlib.resilience import HeartbeatTable
+    >>> table = HeartbeatTable("/dev/shm/fleet.hbt")  # doctest: +SKIP
+    >>> Heartbeat(table=table, slot_name="bot-btc").start()  # doctest: +SKIP
+    >>> [info.name for info in table.dead(max_age=30)]  # doctest: +SKIP
+    ['bot-eth']
+
     Graceful shutdown with cleanup:
 
     >>> from kstlib.resilience import GracefulShutdown
@@ -43,6 +58,45 @@
     >>> limiter.acquire()  # doctest: +SKIP
     True
 
+    Shedding low-priority work first when the event loop is overloaded:
+
+    >>> from kstlib.resilience import AdmissionController, Priority
+    >>> controller = AdmissionController(max_queue=200, max_lag=0.05)
+    >>> async with controller.admit(Priority.LOW):  # doctest: +SKIP
+    ...     await update_candles()
+
+    Capping concurrent calls to a slow dependency:
+
+    >>> from kstlib.resilience import bulkhead
+    >>> @bulkhead(max_concurrent=4, max_queue=8, timeout=2.0)
+    ... def call_slow_service():  # doctest: +SKIP
+    ...     return requests.get("http://slow.example.com")
+
+    Letting latency drive the concurrency limit:
+
+    >>> from kstlib.resilience import AdaptiveLimiter
+    >>> limiter = AdaptiveLimiter(initial_limit=10, max_limit=100)
+    >>> result = limiter.call(fetch_quotes)  # doctest: +SKIP
+
+    Retrying with exponential backoff and jitter:
+
+    >>> from kstlib.resilience import retry
+    >>> @retry(max_attempts=5, base_delay=0.2, deadline=10.0)
+    ... def call_flaky_api():  # doctest: +SKIP
+    ...     return requests.get("http://api.example.com")
+
+    One time budget across pool, rate limiter and HTTP waits:
+
+    >>> from kstlib.resilience import deadline
+    >>> with deadline(2.0):  # doctest: +SKIP
+    ...     async with pool.connection() as conn:
+    ...         await client.call_async("binance.ticker", symbol="BTCUSDT")
+
+    Hedging slow idempotent reads:
+
+    >>> from kstlib.resilience import hedge
+    >>> ticker = await hedge(lambda: fetch_ticker("BTC"), delay=0.05)  # doctest: +SKIP
+
     Watchdog for freeze detection:
 
     >>> from kstlib.resilience import Watchdog
@@ -54,48 +108,101 @@
     ...         do_work()
 """
 
+from kstlib.resilience.adaptive_limiter import AdaptiveLimiter
+from kstlib.resilience.admission import AdmissionController, AdmissionStats, Priority
+from kstlib.resilience.bulkhead import Bulkhead, BulkheadStats, bulkhead
 from kstlib.resilience.circuit_breaker import (
     CircuitBreaker,
     CircuitState,
     CircuitStats,
     circuit_breaker,
 )
+from kstlib.resilience.deadline import (
+    Deadline,
+    check_deadline,
+    clamp_timeout,
+    current_deadline,
+    deadline,
+    remaining_time,
+)
 from kstlib.resilience.exceptions import (
+    AdmissionError,
+    AdmissionRejectedError,
+    BulkheadError,
+    BulkheadFullError,
     CircuitBreakerError,
     CircuitOpenError,
+    DeadlineExceededError,
     HeartbeatError,
     RateLimitError,
     RateLimitExceededError,
+    RetryError,
+    RetryExhaustedError,
     ShutdownError,
     WatchdogError,
     WatchdogTimeoutError,
 )
 from kstlib.resilience.heartbeat import Heartbeat, HeartbeatState
+from kstlib.resilience.heartbeat_table import HeartbeatSlot, HeartbeatSlotInfo, HeartbeatTable
+from kstlib.resilience.hedge import HedgePolicy, HedgeStats, hedge
 from kstlib.resilience.rate_limiter import RateLimiter, RateLimiterStats, rate_limiter
-from kstlib.resilience.shutdown import CleanupCallback, GracefulShutdown
+from kstlib.resilience.retry import RetryBudget, RetryPolicy, RetryStats, retry
+from kstlib.resilience.shutdown import CleanupCallback, CleanupResult, GracefulShutdown, ShutdownReport
 from kstlib.resilience.watchdog import Watchdog, WatchdogStats, watchdog_context
 
 __all__ = [
+    "AdaptiveLimiter",
+    "AdmissionController",
+    "AdmissionError",
+    "AdmissionRejectedError",
+    "AdmissionStats",
+    "Bulkhead",
+    "BulkheadError",
+    "BulkheadFullError",
+    "BulkheadStats",
     "CircuitBreaker",
     "CircuitBreakerError",
     "CircuitOpenError",
     "CircuitState",
     "CircuitStats",
     "CleanupCallback",
+    "CleanupResult",
+    "Deadline",
+    "DeadlineExceededError",
     "GracefulShutdown",
     "Heartbeat",
     "HeartbeatError",
+    "HeartbeatSlot",
+    "HeartbeatSlotInfo",
     "HeartbeatState",
+    "HeartbeatTable",
+    "HedgePolicy",
+    "HedgeStats",
+    "Priority",
     "RateLimitError",
     "RateLimitExceededError",
     "RateLimiter",
     "RateLimiterStats",
+    "RetryBudget",
+    "RetryError",
+    "RetryExhaustedError",
+    "RetryPolicy",
+    "RetryStats",
     "ShutdownError",
+    "ShutdownReport",
     "Watchdog",
     "WatchdogError",
     "WatchdogStats",
     "WatchdogTimeoutError",
+    "bulkhead",
+    "check_deadline",
     "circuit_breaker",
+    "clamp_timeout",
+    "current_deadline",
+    "deadline",
+    "hedge",
     "rate_limiter",
+    "remaining_time",
+    "retry",
     "watchdog_context",
 ]
@@ -0,0 +1,142 @@
+"""Process-wide timer scheduler shared by watchdogs.
+
+One daemon thread keeps a heap of deadlines and sleeps until the earliest
+one, so the number of threads and wake-ups does not grow with the number of
+timers. Timer callbacks run on that thread and must return quickly. Short
+blocking work (file reads, liveness probes) should be handed to
+:func:`get_callback_executor`; work that may block indefinitely, such as
+user callbacks, needs a thread of its own.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+log = logging.getLogger(__name__)
+
+#: Worker threads available for short blocking timer work (watchdog checks).
+CALLBACK_WORKERS = 4
+
+
+class TimerHandle:
+    """Handle to a scheduled timer. Cancellation is lazy (O(1))."""
+
+    __slots__ = ("callback", "cancelled", "when")
+
+    def __init__(self, when: float, callback: Callable[[], object]) -> None:
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Prevent the callback from running."""
+        self.cancelled = True
+
+
+class TimerScheduler:
+    """Heap of monotonic deadlines served by one lazily started thread.
+
+    Examples:
+        >>> scheduler = TimerScheduler()
+        >>> fired = threading.Event()
+        >>> handle = scheduler.call_later(0.01, fired.set)
+        >>> fired.wait(1.0)
+        True
+    """
+
+    def __init__(self, name: str = "kstlib-timers") -> None:
+        self._name = name
+        self._heap: list[tuple[float, int, TimerHandle]] = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of scheduled, non-cancelled timers."""
+        with self._cond:
+            return sum(1 for _, _, handle in self._heap if not handle.cancelled)
+
+    @property
+    def thread(self) -> threading.Thread | None:
+        """Scheduler thread (None until the first timer is scheduled)."""
+        return self._thread
+
+    def call_at(self, when: float, callback: Callable[[], object]) -> TimerHandle:
+        """Run ``callback`` on the scheduler thread at monotonic time ``when``."""
+        handle = TimerHandle(when, callback)
+        with self._cond:
+            heapq.heappush(self._heap, (when, next(self._counter), handle))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            elif self._heap[0][2] is handle:
+                # New earliest deadline: shorten the current sleep
+                self._cond.notify()
+        return handle
+
+    def call_later(self, delay: float, callback: Callable[[], object]) -> TimerHandle:
+        """Run ``callback`` on the scheduler thread after ``delay`` seconds."""
+        return self.call_at(time.monotonic() + delay, callback)
+
+    def _next_due(self) -> TimerHandle:
+        """Block until the earliest live timer is due and pop it."""
+        with self._cond:
+            while True:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                delay = self._heap[0][0] - time.monotonic()
+                if delay <= 0:
+                    return heapq.heappop(self._heap)[2]
+                self._cond.wait(delay)
+
+    def _run(self) -> None:
+        """Scheduler thread main loop."""
+        while True:
+            handle = self._next_due()
+            if handle.cancelled:
+                continue
+            try:
+                handle.callback()
+            except Exception:
+                log.exception("Timer callback failed")
+
+
+_scheduler: TimerScheduler | None = None
+_executor: ThreadPoolExecutor | None = None
+_init_lock = threading.Lock()
+
+
+def get_scheduler() -> TimerScheduler:
+    """Return the process-wide timer scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        with _init_lock:
+            if _scheduler is None:
+                _scheduler = TimerScheduler()
+    return _scheduler
+
+
+def get_callback_executor() -> ThreadPoolExecutor:
+    """Return the bounded pool that runs blocking timer work."""
+    global _executor
+    if _executor is None:
+        with _init_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=CALLBACK_WORKERS, thread_name_prefix="kstlib-timer-work")
+    return _executor
+
+
+__all__ = ["TimerHandle", "TimerScheduler", "get_callback_executor", "get_scheduler"]
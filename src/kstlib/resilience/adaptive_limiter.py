@@ -0,0 +1,280 @@
+"""Adaptive concurrency limiter driven by observed latency.
+
+A static concurrency cap is only right for as long as upstream capacity
+stays the same. :class:`AdaptiveLimiter` instead derives its limit from
+measured round-trip times (RTT). When latency stays close to the best RTT
+seen so far, the limit grows. When latency climbs (queueing upstream) or a
+call is dropped (timeout, 429), the limit shrinks.
+
+Two algorithms are available:
+
+- ``"gradient"`` (default): ``limit * clamp(tolerance * min_rtt / rtt)``
+  plus ``sqrt(limit)`` headroom, smoothed with an EWMA. This is the
+  gradient approach popularised by Netflix's concurrency-limits.
+- ``"aimd"``: additive increase (+1 per sample while the limit is in use),
+  multiplicative decrease (``* backoff_ratio``) on drops or when the RTT
+  exceeds ``tolerance * min_rtt``.
+
+Examples:
+    >>> limiter = AdaptiveLimiter(initial_limit=4, max_limit=16)
+    >>> limiter.call(lambda: "ok")
+    'ok'
+    >>> limiter.limit >= 4
+    True
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Literal, TypeVar
+
+from typing_extensions import ParamSpec
+
+from kstlib.resilience.bulkhead import Bulkhead
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+log = logging.getLogger(__name__)
+
+LimitAlgorithm = Literal["gradient", "aimd"]
+
+_GRADIENT_FLOOR = 0.5
+
+
+class AdaptiveLimiter(Bulkhead):
+    """Concurrency limiter whose limit follows upstream latency.
+
+    Works like a :class:`~kstlib.resilience.bulkhead.Bulkhead` (FIFO wait
+    queue, fast rejection with ``BulkheadFullError``, sync and async paths),
+    except that ``max_concurrent`` is recomputed after every sample.
+    :meth:`call` and :meth:`acall` measure RTT automatically. With explicit
+    :meth:`acquire` / :meth:`release`, pass the measured RTT to ``release``.
+
+    Args:
+        initial_limit: Starting concurrency limit.
+        min_limit: Lower bound for the limit.
+        max_limit: Upper bound for the limit.
+        algorithm: ``"gradient"`` or ``"aimd"``.
+        max_queue: Maximum callers waiting for a slot.
+        timeout: Default wait timeout in seconds (None = wait forever).
+        tolerance: Accepted RTT inflation over ``min_rtt`` before backing off.
+        backoff_ratio: Multiplier applied to the limit on drops.
+        smoothing: EWMA weight of a new gradient estimate (0 < x <= 1).
+        probe_interval: Samples between ``min_rtt`` resets (0 = never).
+        drop_on: Exceptions from :meth:`call`/:meth:`acall` treated as drops.
+        name: Optional name for logging and monitoring.
+
+    Examples:
+        >>> limiter = AdaptiveLimiter(initial_limit=10, algorithm="aimd")
+        >>> limiter.acquire()
+        >>> limiter.release(0.05, dropped=True)  # e.g. HTTP 429
+        >>> limiter.limit
+        9
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        algorithm: LimitAlgorithm = "gradient",
+        max_queue: int = 1000,
+        timeout: float | None = None,
+        tolerance: float = 1.5,
+        backoff_ratio: float = 0.9,
+        smoothing: float = 0.2,
+        probe_interval: int = 500,
+        drop_on: tuple[type[BaseException], ...] = (TimeoutError, asyncio.TimeoutError),
+        name: str | None = None,
+    ) -> None:
+        """Initialize adaptive limiter.
+
+        Raises:
+            ValueError: If limits, ratios or the algorithm name are invalid.
+        """
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError("initial_limit must be between min_limit and max_limit")
+        if algorithm not in ("gradient", "aimd"):
+            raise ValueError(f"Unknown algorithm: {algorithm!r}")
+        if tolerance < 1.0:
+            raise ValueError("tolerance must be at least 1.0")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        if probe_interval < 0:
+            raise ValueError("probe_interval must not be negative")
+
+        super().__init__(initial_limit, max_queue, timeout=timeout, name=name)
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._algorithm: LimitAlgorithm = algorithm
+        self._tolerance = tolerance
+        self._backoff_ratio = backoff_ratio
+        self._smoothing = smoothing
+        self._probe_interval = probe_interval
+        self._drop_on = drop_on
+        self._min_rtt: float | None = None
+        self._samples = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return self._max_concurrent
+
+    @property
+    def min_rtt(self) -> float | None:
+        """Lowest RTT observed since the last probe (seconds)."""
+        return self._min_rtt
+
+    @property
+    def algorithm(self) -> LimitAlgorithm:
+        """Limit algorithm in use."""
+        return self._algorithm
+
+    def release(self, rtt: float | None = None, *, dropped: bool = False) -> None:
+        """Release a slot and feed the latency sample into the limit.
+
+        Args:
+            rtt: Measured round-trip time in seconds (None = no sample).
+            dropped: True if the call was dropped (timeout, overload reply).
+        """
+        with self._lock:
+            inflight = self._active
+            self._active = max(0, self._active - 1)
+            if rtt is not None or dropped:
+                self._update_limit(rtt, dropped=dropped, inflight=inflight)
+            self._wake_waiters()
+
+    def _update_limit(self, rtt: float | None, *, dropped: bool, inflight: int) -> None:
+        """Recompute the limit from one sample. Must hold lock."""
+        self._samples += 1
+        if self._probe_interval and self._samples % self._probe_interval == 0:
+            # Forget the baseline now and then so a faster upstream is noticed
+            self._min_rtt = None
+        if rtt is not None and rtt > 0 and (self._min_rtt is None or rtt < self._min_rtt):
+            self._min_rtt = rtt
+
+        limit = self._limit
+        if dropped:
+            limit *= self._backoff_ratio
+        elif rtt is not None and self._min_rtt is not None:
+            if self._algorithm == "aimd":
+                limit = self._aimd(limit, rtt, self._min_rtt, inflight)
+            else:
+                limit = self._gradient(limit, rtt, self._min_rtt, inflight)
+
+        limit = min(float(self._max_limit), max(float(self._min_limit), limit))
+        previous = self._max_concurrent
+        self._limit = limit
+        self._max_concurrent = int(limit)
+        if self._max_concurrent != previous:
+            log.debug(
+                "AdaptiveLimiter %s: limit %d -> %d (rtt=%s, min_rtt=%.4fs)",
+                self._name or "unnamed",
+                previous,
+                self._max_concurrent,
+                f"{rtt:.4f}s" if rtt is not None else "n/a",
+                self._min_rtt or 0.0,
+            )
+
+    def _aimd(self, limit: float, rtt: float, min_rtt: float, inflight: int) -> float:
+        """Additive increase, multiplicative decrease."""
+        if rtt > self._tolerance * min_rtt:
+            return limit * self._backoff_ratio
+        if inflight * 2 >= limit:
+            return limit + 1.0
+        return limit
+
+    def _gradient(self, limit: float, rtt: float, min_rtt: float, inflight: int) -> float:
+        """Scale the limit by the latency gradient, with sqrt(limit) headroom."""
+        gradient = max(_GRADIENT_FLOOR, min(1.0, self._tolerance * min_rtt / rtt))
+        target = limit * gradient + math.sqrt(limit)
+        if target > limit and inflight * 2 < limit:
+            # Application-limited: unused capacity says nothing about upstream
+            return limit
+        return limit * (1.0 - self._smoothing) + target * self._smoothing
+
+    def call(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Execute a function inside the limiter, sampling its latency.
+
+        Exceptions listed in ``drop_on`` count as drops. Other exceptions
+        release the slot without a latency sample.
+
+        Args:
+            func: Function to execute.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Function result.
+
+        Raises:
+            BulkheadFullError: If no slot could be acquired.
+        """
+        self.acquire()
+        start = time.monotonic()
+        try:
+            result = func(*args, **kwargs)
+        except self._drop_on:
+            self.release(time.monotonic() - start, dropped=True)
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.release(time.monotonic() - start)
+        return result
+
+    async def acall(
+        self,
+        func: Callable[P, Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """Execute an async function inside the limiter, sampling its latency.
+
+        Args:
+            func: Async function to execute.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Function result.
+
+        Raises:
+            BulkheadFullError: If no slot could be acquired.
+        """
+        await self.acquire_async()
+        start = time.monotonic()
+        try:
+            result = await func(*args, **kwargs)
+        except self._drop_on:
+            self.release(time.monotonic() - start, dropped=True)
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.release(time.monotonic() - start)
+        return result
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        name_part = f", name={self._name!r}" if self._name else ""
+        return (
+            f"AdaptiveLimiter(limit={self._max_concurrent}, algorithm={self._algorithm!r}, "
+            f"min_limit={self._min_limit}, max_limit={self._max_limit}{name_part})"
+        )
+
+
+__all__ = ["AdaptiveLimiter", "LimitAlgorithm"]
@@ -0,0 +1,384 @@
+"""Priority-aware admission control and load shedding for async workloads.
+
+An :class:`AdmissionController` sits in front of work that shares one event
+loop. Callers tag each unit of work with a :class:`Priority`. The controller
+derives a load level from two signals: queue depth (work in flight plus an
+optional external queue) and event-loop lag. When the load passes a
+priority's threshold, work of that priority is delayed or rejected.
+Low-priority work is shed first, so order placement keeps its latency
+while market-data bookkeeping backs off.
+
+Load is ``max(depth / max_queue, lag / max_lag)``: 1.0 means one signal is at
+its limit. With the default thresholds, ``LOW`` work is shed at 0.5,
+``NORMAL`` at 0.8, ``HIGH`` at 1.0, and ``CRITICAL`` work is never shed.
+
+Examples:
+    >>> controller = AdmissionController(max_queue=2, max_lag=None)
+    >>> controller.try_acquire(Priority.LOW)
+    True
+    >>> controller.try_acquire(Priority.LOW)  # Load 0.5: LOW is shed
+    False
+    >>> controller.try_acquire(Priority.HIGH)
+    True
+    >>> controller.stats.shed[Priority.LOW]
+    1
+
+    In async code:
+
+    >>> async with controller.admit(Priority.HIGH):  # doctest: +SKIP
+    ...     await place_order(order)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+from kstlib.resilience.deadline import clamp_timeout
+from kstlib.resilience.exceptions import AdmissionRejectedError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Mapping
+
+log = logging.getLogger(__name__)
+
+#: Weight of a new lag sample when lag is falling (rises are taken at once).
+LAG_DECAY = 0.5
+
+
+class Priority(IntEnum):
+    """Priority of a unit of work. Lower values are more important.
+
+    Any ``int`` works as a priority; these names cover the usual tiers.
+    """
+
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+
+#: Load level at which each priority is shed. Missing priorities are never shed.
+DEFAULT_SHED_AT: Mapping[int, float] = {
+    Priority.HIGH: 1.0,
+    Priority.NORMAL: 0.8,
+    Priority.LOW: 0.5,
+}
+
+
+@dataclass
+class AdmissionStats:
+    """Statistics for admission control, keyed by priority.
+
+    Attributes:
+        admitted: Work admitted per priority.
+        delayed: Admitted work that had to wait first, per priority.
+        shed: Work rejected per priority.
+        max_in_flight: Highest number of admitted units in flight.
+        peak_lag: Highest event-loop lag observed (seconds).
+
+    Examples:
+        >>> stats = AdmissionStats()
+        >>> stats.record_shed(3)
+        >>> stats.record_shed(3)
+        >>> (stats.shed, stats.total_shed)
+        ({3: 2}, 2)
+    """
+
+    admitted: dict[int, int] = field(default_factory=dict)
+    delayed: dict[int, int] = field(default_factory=dict)
+    shed: dict[int, int] = field(default_factory=dict)
+    max_in_flight: int = 0
+    peak_lag: float = 0.0
+
+    def record_admitted(self, priority: int, *, waited: bool = False) -> None:
+        """Record admitted work."""
+        self.admitted[priority] = self.admitted.get(priority, 0) + 1
+        if waited:
+            self.delayed[priority] = self.delayed.get(priority, 0) + 1
+
+    def record_shed(self, priority: int) -> None:
+        """Record rejected work."""
+        self.shed[priority] = self.shed.get(priority, 0) + 1
+
+    @property
+    def total_admitted(self) -> int:
+        """Admitted work over all priorities."""
+        return sum(self.admitted.values())
+
+    @property
+    def total_shed(self) -> int:
+        """Rejected work over all priorities."""
+        return sum(self.shed.values())
+
+
+class AdmissionController:
+    """Admit or shed prioritized work based on queue depth and loop lag.
+
+    Args:
+        max_queue: Queue depth that counts as full load.
+        max_lag: Event-loop lag (seconds) that counts as full load
+            (None = ignore lag).
+        shed_at: Load level at which each priority is shed. Priorities
+            missing from the mapping are never shed.
+        max_wait: Default time (seconds) that over-threshold work waits for
+            the load to drop before it is rejected (0 = reject at once).
+        queue_depth: Optional callable returning the length of an external
+            queue, added to the work in flight.
+        lag_interval: Sampling period of the loop-lag probe (seconds).
+        name: Optional name for identification.
+
+    Examples:
+        >>> controller = AdmissionController(max_queue=100, max_lag=0.05)
+        >>> controller.load
+        0.0
+
+        Measure loop lag and delay bookkeeping for up to 200ms:
+
+        >>> async def main():  # doctest: +SKIP
+        ...     await controller.astart()
+        ...     async with controller.admit(Priority.LOW, timeout=0.2):
+        ...         await update_candles()
+        ...     await controller.astop()
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_queue: int = 100,
+        max_lag: float | None = 0.1,
+        *,
+        shed_at: Mapping[int, float] | None = None,
+        max_wait: float = 0.0,
+        queue_depth: Callable[[], int] | None = None,
+        lag_interval: float = 0.05,
+        name: str | None = None,
+    ) -> None:
+        """Initialize admission controller.
+
+        Raises:
+            ValueError: If a limit, threshold or interval is out of range.
+        """
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        if max_lag is not None and max_lag <= 0:
+            raise ValueError("max_lag must be positive")
+        if max_wait < 0:
+            raise ValueError("max_wait must not be negative")
+        if lag_interval <= 0:
+            raise ValueError("lag_interval must be positive")
+        thresholds = dict(DEFAULT_SHED_AT if shed_at is None else shed_at)
+        if any(level <= 0 for level in thresholds.values()):
+            raise ValueError("shed_at levels must be positive")
+
+        self._max_queue = max_queue
+        self._max_lag = max_lag
+        self._shed_at = thresholds
+        self._max_wait = max_wait
+        self._queue_depth = queue_depth
+        self._lag_interval = lag_interval
+        self._name = name
+        self._in_flight = 0
+        self._lag = 0.0
+        self._probe: asyncio.Task[None] | None = None
+        self._lock = threading.Lock()
+        self._stats = AdmissionStats()
+
+    @property
+    def in_flight(self) -> int:
+        """Admitted units that have not been released."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Work in flight plus the external queue, if any."""
+        external = self._queue_depth() if self._queue_depth is not None else 0
+        return self._in_flight + external
+
+    @property
+    def lag(self) -> float:
+        """Smoothed event-loop lag in seconds."""
+        return self._lag
+
+    @property
+    def load(self) -> float:
+        """Current load level (1.0 = a signal is at its limit)."""
+        return self._load()[0]
+
+    @property
+    def stats(self) -> AdmissionStats:
+        """Statistics for this controller."""
+        return self._stats
+
+    @property
+    def name(self) -> str | None:
+        """Name of this controller."""
+        return self._name
+
+    def _load(self) -> tuple[float, str]:
+        """Return the load level and the signal that drives it."""
+        depth_load = self.queue_depth / self._max_queue
+        lag_load = self._lag / self._max_lag if self._max_lag is not None else 0.0
+        if lag_load > depth_load:
+            return lag_load, "lag"
+        return depth_load, "queue"
+
+    def _try_admit(self, priority: int, *, waited: bool) -> tuple[float, str] | None:
+        """Admit work if its priority is under threshold.
+
+        Returns:
+            None if admitted, else the (load, reason) that blocked it.
+        """
+        threshold = self._shed_at.get(priority)
+        with self._lock:
+            load, reason = self._load()
+            if threshold is not None and load >= threshold:
+                return load, reason
+            self._in_flight += 1
+            self._stats.max_in_flight = max(self._stats.max_in_flight, self._in_flight)
+            self._stats.record_admitted(priority, waited=waited)
+        return None
+
+    def _reject(self, priority: int, load: float, reason: str) -> AdmissionRejectedError:
+        """Count and build the error for shed work."""
+        with self._lock:
+            self._stats.record_shed(priority)
+        log.debug("Admission '%s' shed priority %d (%s load %.2f)", self._name or "unnamed", priority, reason, load)
+        return AdmissionRejectedError(
+            f"Admission '{self._name or 'unnamed'}' shed priority {priority} work ({reason} load {load:.2f})",
+            priority=priority,
+            load=load,
+            reason=reason,
+        )
+
+    def try_acquire(self, priority: int = Priority.NORMAL) -> bool:
+        """Admit work only if its priority is under threshold right now.
+
+        Usable from sync code. Admitted work must be released with
+        :meth:`release`.
+
+        Args:
+            priority: Priority of the work.
+
+        Returns:
+            True if admitted, False if shed.
+        """
+        blocked = self._try_admit(priority, waited=False)
+        if blocked is None:
+            return True
+        self._reject(priority, *blocked)
+        return False
+
+    async def acquire(self, priority: int = Priority.NORMAL, *, timeout: float | None = None) -> None:
+        """Admit work, waiting up to ``timeout`` for the load to drop.
+
+        Args:
+            priority: Priority of the work.
+            timeout: Maximum wait in seconds (defaults to ``max_wait``),
+                clamped to the remaining ``deadline()`` budget.
+
+        Raises:
+            AdmissionRejectedError: If the load stayed over the priority's
+                threshold for the whole wait.
+            DeadlineExceededError: If the ``deadline()`` budget is spent.
+        """
+        wait = clamp_timeout(self._max_wait if timeout is None else timeout, "admission")
+        give_up = time.monotonic() + wait
+        waited = False
+        while True:
+            blocked = self._try_admit(priority, waited=waited)
+            if blocked is None:
+                return
+            remaining = give_up - time.monotonic()
+            if remaining <= 0:
+                raise self._reject(priority, *blocked)
+            waited = True
+            await asyncio.sleep(min(self._lag_interval, remaining))
+
+    def release(self) -> None:
+        """Mark one admitted unit of work as done."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    @contextlib.asynccontextmanager
+    async def admit(self, priority: int = Priority.NORMAL, *, timeout: float | None = None) -> AsyncIterator[None]:
+        """Run a block as admitted work of the given priority.
+
+        Args:
+            priority: Priority of the work.
+            timeout: Maximum wait in seconds (defaults to ``max_wait``).
+
+        Yields:
+            None once admitted; the unit is released on exit.
+
+        Raises:
+            AdmissionRejectedError: If the work was shed.
+
+        Examples:
+            >>> async def bookkeeping(controller):
+            ...     async with controller.admit(Priority.LOW):
+            ...         return controller.in_flight
+            >>> asyncio.run(bookkeeping(AdmissionController()))
+            1
+        """
+        await self.acquire(priority, timeout=timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def record_lag(self, seconds: float) -> None:
+        """Feed one event-loop lag sample.
+
+        Rising lag is taken at once, falling lag decays by ``LAG_DECAY`` per
+        sample, so a single fast tick does not end shedding.
+
+        Args:
+            seconds: How late a loop timer fired.
+        """
+        sample = max(0.0, seconds)
+        with self._lock:
+            self._lag = sample if sample >= self._lag else self._lag + (sample - self._lag) * LAG_DECAY
+            self._stats.peak_lag = max(self._stats.peak_lag, sample)
+
+    async def _probe_lag(self) -> None:
+        """Sleep ``lag_interval`` in a loop and record how late each wake-up is."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._lag_interval
+            await asyncio.sleep(self._lag_interval)
+            self.record_lag(loop.time() - expected)
+
+    async def astart(self) -> None:
+        """Start sampling the running event loop's lag. No-op if running."""
+        if self._probe is not None and not self._probe.done():
+            return
+        self._probe = asyncio.get_running_loop().create_task(self._probe_lag())
+
+    async def astop(self) -> None:
+        """Stop the lag probe and reset the lag to zero."""
+        probe, self._probe = self._probe, None
+        if probe is not None:
+            probe.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await probe
+        with self._lock:
+            self._lag = 0.0
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        name_part = f", name={self._name!r}" if self._name else ""
+        return f"AdmissionController(max_queue={self._max_queue}, max_lag={self._max_lag}{name_part})"
+
+
+__all__ = [
+    "DEFAULT_SHED_AT",
+    "AdmissionController",
+    "AdmissionStats",
+    "Priority",
+]
@@ -0,0 +1,486 @@
+"""Bulkhead pattern: cap concurrent calls to one dependency.
+
+A bulkhead allows at most ``max_concurrent`` executions at a time and lets
+up to ``max_queue`` callers wait for a slot. When the wait queue is full,
+new callers are rejected immediately instead of piling up, so one slow
+dependency cannot use up every worker thread or flood the event loop.
+
+Examples:
+    As a decorator:
+
+    >>> @bulkhead(max_concurrent=4, max_queue=8, timeout=2.0)
+    ... def call_slow_service():  # doctest: +SKIP
+    ...     return requests.get("http://slow.example.com")
+
+    Direct usage:
+
+    >>> bh = Bulkhead(max_concurrent=2)
+    >>> with bh:
+    ...     bh.active
+    1
+    >>> bh.call(lambda: 42)
+    42
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar, overload
+
+from typing_extensions import ParamSpec, Self
+
+from kstlib.resilience.deadline import check_deadline, clamp_timeout
+from kstlib.resilience.exceptions import BulkheadFullError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class BulkheadStats:
+    """Statistics for bulkhead monitoring.
+
+    Attributes:
+        total_acquired: Calls that obtained a slot.
+        total_rejected: Calls rejected because the wait queue was full.
+        total_timeouts: Calls that gave up waiting for a slot.
+        total_waited: Total time spent waiting for slots (seconds).
+        max_active: Highest number of concurrent executions observed.
+        max_waiting: Highest wait-queue depth observed.
+
+    Examples:
+        >>> stats = BulkheadStats()
+        >>> stats.record_acquired(0.25)
+        >>> stats.record_rejected()
+        >>> (stats.total_acquired, stats.total_rejected, stats.total_waited)
+        (1, 1, 0.25)
+    """
+
+    total_acquired: int = 0
+    total_rejected: int = 0
+    total_timeouts: int = 0
+    total_waited: float = 0.0
+    max_active: int = 0
+    max_waiting: int = 0
+
+    def record_acquired(self, waited: float = 0.0) -> None:
+        """Record a slot acquisition and the time spent waiting for it."""
+        self.total_acquired += 1
+        self.total_waited += waited
+
+    def record_rejected(self) -> None:
+        """Record a fast rejection (queue full)."""
+        self.total_rejected += 1
+
+    def record_timeout(self) -> None:
+        """Record a caller that gave up waiting."""
+        self.total_timeouts += 1
+
+
+class _Waiter:
+    """Queued caller waiting for a slot (thread or coroutine)."""
+
+    __slots__ = ("event", "future", "granted", "loop")
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop | None = None,
+        future: asyncio.Future[None] | None = None,
+    ) -> None:
+        self.granted = False
+        self.event = threading.Event() if loop is None else None
+        self.loop = loop
+        self.future = future
+
+    def wake(self) -> bool:
+        """Hand the slot to this waiter. Returns False if it cannot be woken."""
+        if self.event is not None:
+            self.event.set()
+            return True
+        if self.loop is None or self.future is None or self.loop.is_closed():
+            return False
+        self.loop.call_soon_threadsafe(_resolve_future, self.future)
+        return True
+
+
+def _resolve_future(future: asyncio.Future[None]) -> None:
+    """Complete a waiter future unless it was cancelled meanwhile."""
+    if not future.done():
+        future.set_result(None)
+
+
+class Bulkhead:
+    """Concurrency limiter with a bounded wait queue.
+
+    Slots are handed over directly from a finishing call to the oldest
+    waiter, so waiters are served in FIFO order and a newcomer cannot
+    barge ahead of the queue. Sync and async callers share the same slots.
+
+    Args:
+        max_concurrent: Maximum simultaneous executions.
+        max_queue: Maximum callers waiting for a slot (0 = reject when busy).
+        timeout: Default wait timeout in seconds (None = wait forever).
+        name: Optional name for logging and monitoring.
+
+    Examples:
+        >>> bh = Bulkhead(max_concurrent=1, max_queue=0)
+        >>> bh.try_acquire()
+        True
+        >>> bh.try_acquire()  # Busy and no queue
+        False
+        >>> bh.release()
+        >>> bh.stats.total_acquired
+        1
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int = 0,
+        *,
+        timeout: float | None = None,
+        name: str | None = None,
+    ) -> None:
+        """Initialize bulkhead.
+
+        Args:
+            max_concurrent: Maximum simultaneous executions.
+            max_queue: Maximum callers waiting for a slot.
+            timeout: Default wait timeout in seconds.
+            name: Optional name for identification.
+
+        Raises:
+            ValueError: If max_concurrent < 1, max_queue < 0 or timeout < 0.
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+        if timeout is not None and timeout < 0:
+            raise ValueError("timeout must not be negative")
+
+        self._max_concurrent = max_concurrent
+        self._max_queue = max_queue
+        self._timeout = timeout
+        self._name = name
+        self._active = 0
+        self._waiters: deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+        self._stats = BulkheadStats()
+
+    @property
+    def max_concurrent(self) -> int:
+        """Maximum simultaneous executions."""
+        return self._max_concurrent
+
+    @property
+    def max_queue(self) -> int:
+        """Maximum callers waiting for a slot."""
+        return self._max_queue
+
+    @property
+    def active(self) -> int:
+        """Executions currently holding a slot."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Callers currently waiting for a slot."""
+        return len(self._waiters)
+
+    @property
+    def stats(self) -> BulkheadStats:
+        """Statistics for this bulkhead."""
+        return self._stats
+
+    @property
+    def name(self) -> str | None:
+        """Name of this bulkhead."""
+        return self._name
+
+    def _full_error(self, reason: str) -> BulkheadFullError:
+        """Build the error raised on rejection or timeout."""
+        return BulkheadFullError(
+            f"{type(self).__name__} '{self._name or 'unnamed'}' {reason}",
+            max_concurrent=self._max_concurrent,
+            max_queue=self._max_queue,
+        )
+
+    def _try_enter(self, waiter: _Waiter | None) -> _Waiter | None:
+        """Take a free slot or enqueue ``waiter``. Must hold lock.
+
+        Returns:
+            None if a slot was taken, else the queued waiter.
+
+        Raises:
+            BulkheadFullError: If no slot is free and the queue is full.
+        """
+        if self._active < self._max_concurrent and not self._waiters:
+            self._active += 1
+            self._stats.max_active = max(self._stats.max_active, self._active)
+            self._stats.record_acquired()
+            return None
+        if waiter is None or len(self._waiters) >= self._max_queue:
+            self._stats.record_rejected()
+            raise self._full_error("is full")
+        self._waiters.append(waiter)
+        self._stats.max_waiting = max(self._stats.max_waiting, len(self._waiters))
+        return waiter
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """Withdraw a waiter that stopped waiting.
+
+        Returns:
+            True if the slot had already been granted (caller now owns it).
+        """
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            return False
+
+    def acquire(self, *, timeout: float | None = None) -> None:
+        """Acquire a slot, waiting in the queue if needed.
+
+        Args:
+            timeout: Maximum wait in seconds (defaults to the bulkhead timeout).
+
+        Raises:
+            BulkheadFullError: If the queue is full or the wait timed out.
+            DeadlineExceededError: If the ``deadline()`` budget ran out.
+        """
+        effective = clamp_timeout(self._timeout if timeout is None else timeout, "bulkhead acquire")
+        with self._lock:
+            waiter = self._try_enter(_Waiter())
+        if waiter is None:
+            return
+
+        start = time.monotonic()
+        if not waiter.event.wait(effective) and not self._abandon(waiter):  # type: ignore[union-attr]
+            self._stats.record_timeout()
+            check_deadline("bulkhead acquire")
+            raise self._full_error(f"wait timed out after {effective}s")
+        self._stats.record_acquired(time.monotonic() - start)
+
+    def try_acquire(self) -> bool:
+        """Acquire a slot only if one is free right now.
+
+        Returns:
+            True if a slot was acquired, False otherwise.
+        """
+        with self._lock:
+            try:
+                self._try_enter(None)
+            except BulkheadFullError:
+                return False
+        return True
+
+    async def acquire_async(self, *, timeout: float | None = None) -> None:
+        """Acquire a slot without blocking the event loop.
+
+        Args:
+            timeout: Maximum wait in seconds (defaults to the bulkhead timeout).
+
+        Raises:
+            BulkheadFullError: If the queue is full or the wait timed out.
+            DeadlineExceededError: If the ``deadline()`` budget ran out.
+        """
+        effective = clamp_timeout(self._timeout if timeout is None else timeout, "bulkhead acquire")
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            waiter = self._try_enter(_Waiter(loop, loop.create_future()))
+        if waiter is None:
+            return
+
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), effective)  # type: ignore[arg-type]
+        except asyncio.TimeoutError:
+            if not self._abandon(waiter):
+                self._stats.record_timeout()
+                check_deadline("bulkhead acquire")
+                raise self._full_error(f"wait timed out after {effective}s") from None
+        except asyncio.CancelledError:
+            if self._abandon(waiter):
+                self.release()
+            raise
+        self._stats.record_acquired(time.monotonic() - start)
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to the oldest waiters. Must hold lock."""
+        while self._waiters and self._active < self._max_concurrent:
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            if waiter.wake():
+                self._active += 1
+                self._stats.max_active = max(self._stats.max_active, self._active)
+
+    def release(self) -> None:
+        """Release a slot, handing it to the oldest waiter if any."""
+        with self._lock:
+            self._active = max(0, self._active - 1)
+            self._wake_waiters()
+
+    def call(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Execute a function inside the bulkhead.
+
+        Args:
+            func: Function to execute.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Function result.
+
+        Raises:
+            BulkheadFullError: If no slot could be acquired.
+        """
+        self.acquire()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.release()
+
+    async def acall(
+        self,
+        func: Callable[P, Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """Execute an async function inside the bulkhead.
+
+        Args:
+            func: Async function to execute.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Function result.
+
+        Raises:
+            BulkheadFullError: If no slot could be acquired.
+
+        Examples:
+            >>> async def double(x): return x * 2
+            >>> asyncio.run(Bulkhead(max_concurrent=1).acall(double, 5))
+            10
+        """
+        await self.acquire_async()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            self.release()
+
+    def __enter__(self) -> Self:
+        """Enter context manager, acquiring a slot."""
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Exit context manager, releasing the slot."""
+        self.release()
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager, acquiring a slot."""
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Exit async context manager, releasing the slot."""
+        self.release()
+
+    def __call__(self, func: Callable[P, R]) -> Callable[P, R] | Callable[P, Awaitable[R]]:
+        """Use the bulkhead as a decorator.
+
+        Args:
+            func: Function to wrap.
+
+        Returns:
+            Wrapped function limited by this bulkhead.
+        """
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                return await self.acall(func, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            return self.call(func, *args, **kwargs)
+
+        return sync_wrapper
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        name_part = f", name={self._name!r}" if self._name else ""
+        return f"Bulkhead(max_concurrent={self._max_concurrent}, max_queue={self._max_queue}{name_part})"
+
+
+@overload
+def bulkhead(func: Callable[P, R]) -> Callable[P, R]: ...
+
+
+@overload
+def bulkhead(
+    *,
+    max_concurrent: int = 10,
+    max_queue: int = 0,
+    timeout: float | None = None,
+    name: str | None = None,
+) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
+
+
+def bulkhead(
+    func: Callable[P, R] | None = None,
+    *,
+    max_concurrent: int = 10,
+    max_queue: int = 0,
+    timeout: float | None = None,
+    name: str | None = None,
+) -> Callable[P, R] | Callable[[Callable[P, R]], Callable[P, R]]:
+    """Bulkhead decorator for sync and async functions.
+
+    Can be used with or without arguments:
+
+    Examples:
+        Without arguments (10 concurrent calls, no queue):
+
+        >>> @bulkhead
+        ... def fetch():  # doctest: +SKIP
+        ...     pass
+
+        With a bounded wait queue:
+
+        >>> @bulkhead(max_concurrent=4, max_queue=16, timeout=1.0)
+        ... async def fetch_async():  # doctest: +SKIP
+        ...     pass
+    """
+    bh = Bulkhead(max_concurrent, max_queue, timeout=timeout, name=name)
+
+    if func is not None:
+        return bh(func)  # type: ignore[return-value]
+    return bh  # type: ignore[return-value]
+
+
+__all__ = ["Bulkhead", "BulkheadStats", "bulkhead"]
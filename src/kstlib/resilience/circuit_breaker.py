@@ -8,16 +8,18 @@
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import TYPE_CHECKING, TypeVar, overload
+from typing import TYPE_CHECKING, Literal, TypeVar, overload
 
 from typing_extensions import ParamSpec
 
 from kstlib.limits import (
     HARD_MAX_CIRCUIT_FAILURES,
     HARD_MAX_CIRCUIT_RESET_TIMEOUT,
+    HARD_MAX_CIRCUIT_WINDOW_SIZE,
     HARD_MAX_HALF_OPEN_CALLS,
     HARD_MIN_CIRCUIT_FAILURES,
     HARD_MIN_CIRCUIT_RESET_TIMEOUT,
+    HARD_MIN_CIRCUIT_WINDOW_SIZE,
     HARD_MIN_HALF_OPEN_CALLS,
     clamp_with_limits,
     get_resilience_limits,
@@ -30,6 +32,13 @@
 P = ParamSpec("P")
 R = TypeVar("R")
 
+WindowType = Literal["count", "time"]
+
+# Outcome flags stored per slot in the count-based window
+_OUTCOME_RECORDED = 1
+_OUTCOME_FAILED = 2
+_OUTCOME_SLOW = 4
+
 
 class CircuitState(Enum):
     """State of the circuit breaker.
@@ -54,6 +63,7 @@ class CircuitStats:
         successful_calls: Number of successful calls.
         failed_calls: Number of failed calls.
         rejected_calls: Number of calls rejected due to open circuit.
+        slow_calls: Number of calls slower than the slow-call threshold.
         state_changes: Number of state transitions.
 
     Examples:
@@ -71,6 +81,7 @@ class CircuitStats:
     successful_calls: int = 0
     failed_calls: int = 0
     rejected_calls: int = 0
+    slow_calls: int = 0
     state_changes: int = 0
 
     def record_success(self) -> None:
@@ -88,23 +99,183 @@ def record_rejection(self) -> None:
         self.total_calls += 1
         self.rejected_calls += 1
 
+    def record_slow_call(self) -> None:
+        """Record a call exceeding the slow-call duration."""
+        self.slow_calls += 1
+
     def record_state_change(self) -> None:
         """Record a state transition."""
         self.state_changes += 1
 
 
+class _StripedCounter:
+    """Counter with one cell per thread, summed lazily on read.
+
+    Each thread increments its own cell without taking a lock. Cells of
+    threads that have exited are folded into a retired total when a new
+    thread registers or when the value is read, so memory stays bounded
+    by the number of live threads.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._cells: list[tuple[threading.Thread, list[int]]] = []
+        self._retired = 0
+        self._lock = threading.Lock()
+
+    def increment(self) -> None:
+        """Add one to the calling thread's cell."""
+        cell: list[int] | None = getattr(self._local, "cell", None)
+        if cell is None:
+            cell = self._register()
+        cell[0] += 1
+
+    def _register(self) -> list[int]:
+        """Create and register a cell for the calling thread."""
+        cell = [0]
+        with self._lock:
+            self._prune()
+            self._cells.append((threading.current_thread(), cell))
+        self._local.cell = cell
+        return cell
+
+    def _prune(self) -> None:
+        """Fold cells of exited threads into the retired total. Must hold lock."""
+        alive = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                alive.append((thread, cell))
+            else:
+                self._retired += cell[0]
+        self._cells = alive
+
+    @property
+    def value(self) -> int:
+        """Sum of all cells."""
+        with self._lock:
+            self._prune()
+            return self._retired + sum(cell[0] for _, cell in self._cells)
+
+
+class _CountWindow:
+    """Ring buffer over the last ``size`` call outcomes.
+
+    Running totals are updated as slots are overwritten, so recording an
+    outcome and reading the totals are both O(1).
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._slots = bytearray(size)
+        self._index = 0
+        self.calls = 0
+        self.failures = 0
+        self.slow = 0
+
+    def record(self, failed: bool, slow: bool) -> None:
+        """Record one outcome, evicting the oldest one when full."""
+        old = self._slots[self._index]
+        if old & _OUTCOME_RECORDED:
+            self.calls -= 1
+            self.failures -= bool(old & _OUTCOME_FAILED)
+            self.slow -= bool(old & _OUTCOME_SLOW)
+        self._slots[self._index] = (
+            _OUTCOME_RECORDED | (_OUTCOME_FAILED if failed else 0) | (_OUTCOME_SLOW if slow else 0)
+        )
+        self._index = (self._index + 1) % self.size
+        self.calls += 1
+        self.failures += failed
+        self.slow += slow
+
+    def expire(self, now: float) -> None:
+        """Count windows never expire by time."""
+
+    def reset(self) -> None:
+        """Forget all recorded outcomes."""
+        self._slots = bytearray(self.size)
+        self._index = 0
+        self.calls = self.failures = self.slow = 0
+
+
+class _TimeWindow:
+    """Per-second buckets covering the last ``size`` seconds.
+
+    Buckets that fall out of the window are subtracted from the running
+    totals as time advances. Each bucket is cleared at most once per
+    elapsed second, so the cost per call is amortized O(1).
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._calls = [0] * size
+        self._failures = [0] * size
+        self._slow = [0] * size
+        self._head: int | None = None
+        self.calls = 0
+        self.failures = 0
+        self.slow = 0
+
+    def expire(self, now: float) -> None:
+        """Drop buckets older than the window relative to ``now``."""
+        second = int(now)
+        if self._head is None:
+            self._head = second
+            return
+        elapsed = second - self._head
+        if elapsed <= 0:
+            return
+        for offset in range(1, min(elapsed, self.size) + 1):
+            slot = (self._head + offset) % self.size
+            self.calls -= self._calls[slot]
+            self.failures -= self._failures[slot]
+            self.slow -= self._slow[slot]
+            self._calls[slot] = self._failures[slot] = self._slow[slot] = 0
+        self._head = second
+
+    def record(self, failed: bool, slow: bool) -> None:
+        """Record one outcome in the bucket of the last expired-to second."""
+        slot = (self._head or 0) % self.size
+        self._calls[slot] += 1
+        self._failures[slot] += failed
+        self._slow[slot] += slow
+        self.calls += 1
+        self.failures += failed
+        self.slow += slow
+
+    def reset(self) -> None:
+        """Forget all recorded outcomes."""
+        self._calls = [0] * self.size
+        self._failures = [0] * self.size
+        self._slow = [0] * self.size
+        self._head = None
+        self.calls = self.failures = self.slow = 0
+
+
 class CircuitBreaker:
     """Circuit breaker for protecting against cascading failures.
 
     Implements the circuit breaker pattern to prevent repeated calls
     to a failing service and allow recovery time.
 
+    By default the circuit opens after ``max_failures`` consecutive failures.
+    When ``window_size`` is set, the breaker instead tracks outcomes in a
+    sliding window (the last N calls, or the last N seconds) and opens when
+    the failure rate or the slow-call rate reaches its threshold, once at
+    least ``minimum_calls`` calls have been recorded.
+
     Args:
         max_failures: Failures before opening circuit (default from config).
         reset_timeout: Seconds before attempting recovery (default from config).
         half_open_max_calls: Calls allowed in half-open state (default from config).
         excluded_exceptions: Exceptions that don't count as failures.
         name: Optional name for the circuit breaker.
+        window_size: Sliding window size (calls or seconds). None keeps the
+            consecutive-failures behavior.
+        window_type: ``"count"`` (last N calls) or ``"time"`` (last N seconds).
+        failure_rate_threshold: Failure ratio (0-1] that opens the circuit.
+        slow_call_duration: Seconds after which a call counts as slow.
+        slow_call_rate_threshold: Slow-call ratio (0-1] that opens the circuit.
+        minimum_calls: Calls required in the window before rates are evaluated.
 
     Examples:
         As a decorator:
@@ -124,6 +295,17 @@ class CircuitBreaker:
         >>> cb = CircuitBreaker(max_failures=5)
         >>> cb.state
         <CircuitState.CLOSED: 1>
+
+        Failure-rate window over the last 10 calls:
+
+        >>> cb = CircuitBreaker(window_size=10, failure_rate_threshold=0.4, minimum_calls=5)
+        >>> for i in range(5):
+        ...     try:
+        ...         _ = cb.call(lambda: 1 / (i % 2))
+        ...     except ZeroDivisionError:
+        ...         pass
+        >>> cb.state.name
+        'OPEN'
     """
 
     def __init__(
@@ -134,6 +316,12 @@ def __init__(
         half_open_max_calls: int | None = None,
         excluded_exceptions: tuple[type[Exception], ...] = (),
         name: str | None = None,
+        window_size: int | None = None,
+        window_type: WindowType = "count",
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: float | None = None,
+        slow_call_rate_threshold: float = 1.0,
+        minimum_calls: int = 10,
     ) -> None:
         """Initialize circuit breaker.
 
@@ -143,6 +331,15 @@ def __init__(
             half_open_max_calls: Calls allowed in half-open state. Uses config if None.
             excluded_exceptions: Exceptions that don't count as failures.
             name: Optional name for the circuit breaker.
+            window_size: Sliding window size, in calls or seconds. None disables it.
+            window_type: ``"count"`` or ``"time"``.
+            failure_rate_threshold: Failure ratio in (0, 1] that opens the circuit.
+            slow_call_duration: Seconds after which a call is slow. None disables it.
+            slow_call_rate_threshold: Slow-call ratio in (0, 1] that opens the circuit.
+            minimum_calls: Calls required in the window before evaluating rates.
+
+        Raises:
+            ValueError: If window options are invalid or used without a window.
         """
         limits = get_resilience_limits()
 
@@ -170,17 +367,37 @@ def __init__(
         self._excluded_exceptions = excluded_exceptions
         self._name = name
 
+        # Sliding window (None keeps the consecutive-failures behavior)
+        self._window = self._build_window(window_size, window_type, slow_call_duration)
+        if not 0.0 < failure_rate_threshold <= 1.0:
+            raise ValueError("failure_rate_threshold must be in (0, 1]")
+        if not 0.0 < slow_call_rate_threshold <= 1.0:
+            raise ValueError("slow_call_rate_threshold must be in (0, 1]")
+        if slow_call_duration is not None and slow_call_duration <= 0:
+            raise ValueError("slow_call_duration must be positive")
+        if minimum_calls < 1:
+            raise ValueError("minimum_calls must be at least 1")
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_duration = slow_call_duration
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._minimum_calls = minimum_calls
+        if isinstance(self._window, _CountWindow):
+            self._minimum_calls = min(minimum_calls, self._window.size)
+
         # State
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._last_failure_time: float | None = None
         self._half_open_calls = 0
 
-        # Thread safety
+        # Thread safety: transitions and slow paths are serialized by the lock,
+        # CLOSED-state successes only bump a per-thread counter.
         self._lock = threading.Lock()
 
         # Statistics
         self._stats = CircuitStats()
+        self._fast_successes = _StripedCounter()
+        self._merged_fast_successes = 0
 
     @property
     def state(self) -> CircuitState:
@@ -197,13 +414,86 @@ def name(self) -> str | None:
     @property
     def stats(self) -> CircuitStats:
         """Return circuit breaker statistics."""
+        with self._lock:
+            fast = self._fast_successes.value
+            delta = fast - self._merged_fast_successes
+            if delta:
+                self._stats.total_calls += delta
+                self._stats.successful_calls += delta
+                self._merged_fast_successes = fast
         return self._stats
 
     @property
     def failure_count(self) -> int:
-        """Return current failure count."""
+        """Return current failure count (failures in the window when windowed)."""
+        if self._window is not None:
+            return self._window.failures
         return self._failure_count
 
+    @property
+    def failure_rate(self) -> float:
+        """Return the failure ratio over the sliding window (0.0 without window)."""
+        with self._lock:
+            if self._window is None:
+                return 0.0
+            self._window.expire(time.monotonic())
+            return self._window.failures / self._window.calls if self._window.calls else 0.0
+
+    @property
+    def slow_call_rate(self) -> float:
+        """Return the slow-call ratio over the sliding window (0.0 without window)."""
+        with self._lock:
+            if self._window is None:
+                return 0.0
+            self._window.expire(time.monotonic())
+            return self._window.slow / self._window.calls if self._window.calls else 0.0
+
+    @staticmethod
+    def _build_window(
+        window_size: int | None,
+        window_type: WindowType,
+        slow_call_duration: float | None,
+    ) -> _CountWindow | _TimeWindow | None:
+        """Create the sliding window matching the constructor options."""
+        if window_size is None:
+            if slow_call_duration is not None:
+                raise ValueError("slow_call_duration requires window_size")
+            return None
+        size = int(clamp_with_limits(window_size, HARD_MIN_CIRCUIT_WINDOW_SIZE, HARD_MAX_CIRCUIT_WINDOW_SIZE))
+        if window_type == "count":
+            return _CountWindow(size)
+        if window_type == "time":
+            return _TimeWindow(size)
+        raise ValueError(f"window_type must be 'count' or 'time', got {window_type!r}")
+
+    def _open_circuit(self) -> None:
+        """Transition to OPEN. Must hold lock."""
+        self._state = CircuitState.OPEN
+        self._last_failure_time = time.monotonic()
+        self._stats.record_state_change()
+        if self._window is not None:
+            self._window.reset()
+
+    def _record_in_window(self, failed: bool, duration: float) -> None:
+        """Record an outcome in the window and trip on thresholds. Must hold lock."""
+        window = self._window
+        if window is None:
+            return
+        slow = self._slow_call_duration is not None and duration >= self._slow_call_duration
+        if slow:
+            self._stats.record_slow_call()
+        if self._state != CircuitState.CLOSED:
+            return
+        window.expire(time.monotonic())
+        window.record(failed, slow)
+        if window.calls < self._minimum_calls:
+            return
+        if (
+            window.failures >= self._failure_rate_threshold * window.calls
+            or window.slow >= self._slow_call_rate_threshold * window.calls
+        ):
+            self._open_circuit()
+
     def _check_state_transition(self) -> None:
         """Check and perform state transition if needed."""
         if self._state == CircuitState.OPEN and self._last_failure_time is not None:
@@ -213,10 +503,22 @@ def _check_state_transition(self) -> None:
                 self._half_open_calls = 0
                 self._stats.record_state_change()
 
-    def _record_success(self) -> None:
+    def _record_success(self, duration: float = 0.0) -> None:
         """Record a successful call and update state."""
+        if self._window is None and self._state is CircuitState.CLOSED:
+            # Fast path: no transition can follow a CLOSED success
+            self._fast_successes.increment()
+            if self._failure_count:
+                # Reset under the lock so a concurrent failure is not lost
+                with self._lock:
+                    if self._state == CircuitState.CLOSED:
+                        self._failure_count = 0
+            return
+
         with self._lock:
             self._stats.record_success()
+            if self._window is not None:
+                self._record_in_window(False, duration)
             if self._state == CircuitState.HALF_OPEN:
                 self._half_open_calls += 1
                 if self._half_open_calls >= self._half_open_max_calls:
@@ -229,7 +531,7 @@ def _record_success(self) -> None:
                 # Reset failure count on success
                 self._failure_count = 0
 
-    def _record_failure(self, exc: Exception) -> None:
+    def _record_failure(self, exc: Exception, duration: float = 0.0) -> None:
         """Record a failed call and update state."""
         # Check if exception is excluded
         if isinstance(exc, self._excluded_exceptions):
@@ -242,15 +544,19 @@ def _record_failure(self, exc: Exception) -> None:
 
             if self._state == CircuitState.HALF_OPEN:
                 # Failed during recovery, reopen circuit
-                self._state = CircuitState.OPEN
-                self._stats.record_state_change()
-            elif self._state == CircuitState.CLOSED:
-                if self._failure_count >= self._max_failures:
-                    self._state = CircuitState.OPEN
-                    self._stats.record_state_change()
+                self._open_circuit()
+            elif self._window is not None:
+                self._record_in_window(True, duration)
+            elif self._state == CircuitState.CLOSED and self._failure_count >= self._max_failures:
+                self._open_circuit()
 
     def _check_open(self) -> None:
         """Check if circuit is open and raise if so."""
+        if self._state is CircuitState.CLOSED:
+            # Fast path: CLOSED only changes to OPEN under the lock, and a
+            # call racing with that transition is let through either way.
+            return
+
         with self._lock:
             self._check_state_transition()
             if self._state == CircuitState.OPEN:
@@ -285,12 +591,13 @@ def call(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
             10
         """
         self._check_open()
+        start = time.monotonic()
         try:
             result = func(*args, **kwargs)
-            self._record_success()
+            self._record_success(time.monotonic() - start)
             return result
         except Exception as exc:
-            self._record_failure(exc)
+            self._record_failure(exc, time.monotonic() - start)
             raise
 
     async def acall(
@@ -320,12 +627,13 @@ async def acall(
             10
         """
         self._check_open()
+        start = time.monotonic()
         try:
             result = await func(*args, **kwargs)
-            self._record_success()
+            self._record_success(time.monotonic() - start)
             return result
         except Exception as exc:
-            self._record_failure(exc)
+            self._record_failure(exc, time.monotonic() - start)
             raise
 
     def reset(self) -> None:
@@ -348,6 +656,8 @@ def reset(self) -> None:
             self._failure_count = 0
             self._last_failure_time = None
             self._half_open_calls = 0
+            if self._window is not None:
+                self._window.reset()
 
     def __call__(self, func: Callable[P, R]) -> Callable[P, R] | Callable[P, Awaitable[R]]:
         """Use circuit breaker as a decorator.
@@ -386,6 +696,12 @@ def circuit_breaker(
     half_open_max_calls: int | None = None,
     excluded_exceptions: tuple[type[Exception], ...] = (),
     name: str | None = None,
+    window_size: int | None = None,
+    window_type: WindowType = "count",
+    failure_rate_threshold: float = 0.5,
+    slow_call_duration: float | None = None,
+    slow_call_rate_threshold: float = 1.0,
+    minimum_calls: int = 10,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
 
 
@@ -397,6 +713,12 @@ def circuit_breaker(
     half_open_max_calls: int | None = None,
     excluded_exceptions: tuple[type[Exception], ...] = (),
     name: str | None = None,
+    window_size: int | None = None,
+    window_type: WindowType = "count",
+    failure_rate_threshold: float = 0.5,
+    slow_call_duration: float | None = None,
+    slow_call_rate_threshold: float = 1.0,
+    minimum_calls: int = 10,
 ) -> Callable[P, R] | Callable[[Callable[P, R]], Callable[P, R]]:
     """Circuit breaker decorator for functions.
 
@@ -420,6 +742,12 @@ def circuit_breaker(
         >>> @circuit_breaker(excluded_exceptions=(ValueError,))
         ... def validate():  # doctest: +SKIP
         ...     pass
+
+        Failure and slow-call rates over the last 60 seconds:
+
+        >>> @circuit_breaker(window_size=60, window_type="time", slow_call_duration=2.0)
+        ... def fetch():  # doctest: +SKIP
+        ...     pass
     """
     cb = CircuitBreaker(
         max_failures=max_failures,
@@ -427,6 +755,12 @@ def circuit_breaker(
         half_open_max_calls=half_open_max_calls,
         excluded_exceptions=excluded_exceptions,
         name=name,
+        window_size=window_size,
+        window_type=window_type,
+        failure_rate_threshold=failure_rate_threshold,
+        slow_call_duration=slow_call_duration,
+        slow_call_rate_threshold=slow_call_rate_threshold,
+        minimum_calls=minimum_calls,
     )
 
     if func is not None:
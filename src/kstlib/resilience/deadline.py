@@ -0,0 +1,192 @@
+"""Deadline propagation through a context variable.
+
+``deadline(seconds)`` stores an absolute (monotonic) deadline in a
+:class:`contextvars.ContextVar`. Blocking kstlib primitives read it and wait
+for at most ``min(own timeout, remaining budget)``. They raise
+:class:`~kstlib.resilience.exceptions.DeadlineExceededError` instead of
+waiting once the budget is spent. The primitives are ``RapiClient`` requests
+and retries, ``RateLimiter.acquire``, ``Bulkhead.acquire``,
+``ConnectionPool.acquire``, ``RetryPolicy`` sleeps and pipeline steps.
+
+Context variables follow the code path, so the budget applies across
+function calls and ``await`` boundaries, and each asyncio task gets its own
+copy. Nested deadlines can only shorten the budget, never extend it.
+
+A deadline does not interrupt code that is already running. It bounds the
+waits that kstlib performs.
+
+Examples:
+    >>> with deadline(0.5):
+    ...     remaining_time() <= 0.5
+    True
+    >>> remaining_time() is None
+    True
+
+    Waits are clamped to the remaining budget:
+
+    >>> with deadline(0.5):
+    ...     clamp_timeout(30.0) <= 0.5
+    True
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, overload
+
+from kstlib.resilience.exceptions import DeadlineExceededError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+#: Absolute monotonic deadline of the current context (None = unbounded).
+_deadline: ContextVar[float | None] = ContextVar("kstlib_deadline", default=None)
+
+
+@dataclass(frozen=True, slots=True)
+class Deadline:
+    """An active deadline.
+
+    Attributes:
+        expires_at: Absolute deadline on the :func:`time.monotonic` clock.
+        budget: Seconds requested when the deadline was set.
+
+    Examples:
+        >>> d = Deadline(expires_at=time.monotonic() + 1.0, budget=1.0)
+        >>> 0 < d.remaining() <= 1.0
+        True
+        >>> d.expired
+        False
+    """
+
+    expires_at: float
+    budget: float
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (negative once passed)."""
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        """True once the deadline has passed."""
+        return self.remaining() <= 0
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[Deadline]:
+    """Bound every kstlib wait inside the block to ``seconds`` in total.
+
+    Args:
+        seconds: Time budget for the block. An enclosing deadline that
+            expires earlier wins.
+
+    Yields:
+        The effective deadline.
+
+    Raises:
+        ValueError: If seconds is negative.
+
+    Examples:
+        >>> with deadline(2.0):
+        ...     with deadline(10.0) as inner:  # Cannot extend the outer budget
+        ...         inner.remaining() <= 2.0
+        True
+    """
+    if seconds < 0:
+        raise ValueError("seconds must not be negative")
+    expires_at = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        expires_at = min(expires_at, outer)
+    token = _deadline.set(expires_at)
+    try:
+        yield Deadline(expires_at=expires_at, budget=seconds)
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> float | None:
+    """Return the absolute monotonic deadline of the current context, if any."""
+    return _deadline.get()
+
+
+def remaining_time() -> float | None:
+    """Return the seconds left in the current budget (None = no deadline).
+
+    Examples:
+        >>> remaining_time() is None
+        True
+    """
+    expires_at = _deadline.get()
+    return None if expires_at is None else expires_at - time.monotonic()
+
+
+def check_deadline(operation: str | None = None) -> None:
+    """Raise if the current deadline has passed.
+
+    Args:
+        operation: Name used in the error message.
+
+    Raises:
+        DeadlineExceededError: If the budget is spent.
+
+    Examples:
+        >>> with deadline(0):
+        ...     check_deadline("fetch")
+        Traceback (most recent call last):
+        ...
+        kstlib.resilience.exceptions.DeadlineExceededError: Deadline exceeded before fetch
+    """
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        where = f" before {operation}" if operation else ""
+        raise DeadlineExceededError(f"Deadline exceeded{where}", operation=operation)
+
+
+@overload
+def clamp_timeout(timeout: float, operation: str | None = None) -> float: ...
+
+
+@overload
+def clamp_timeout(timeout: float | None, operation: str | None = None) -> float | None: ...
+
+
+def clamp_timeout(timeout: float | None, operation: str | None = None) -> float | None:
+    """Return ``min(timeout, remaining budget)`` for a wait about to start.
+
+    Args:
+        timeout: The primitive's own timeout (None = unbounded).
+        operation: Name used in the error message.
+
+    Returns:
+        The timeout to use; None only if neither bound is set.
+
+    Raises:
+        DeadlineExceededError: If the budget is already spent.
+
+    Examples:
+        >>> clamp_timeout(5.0)
+        5.0
+        >>> clamp_timeout(None) is None
+        True
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        where = f" before {operation}" if operation else ""
+        raise DeadlineExceededError(f"Deadline exceeded{where}", operation=operation)
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+__all__ = [
+    "Deadline",
+    "check_deadline",
+    "clamp_timeout",
+    "current_deadline",
+    "deadline",
+    "remaining_time",
+]
@@ -3,6 +3,26 @@
 from __future__ import annotations
 
 
+class DeadlineExceededError(TimeoutError):
+    """Raised when the time budget set by ``deadline()`` is spent.
+
+    Subclasses :class:`TimeoutError`, so existing timeout handlers catch it.
+
+    Attributes:
+        operation: What was about to wait or was waiting (None if unknown).
+    """
+
+    def __init__(self, message: str, operation: str | None = None) -> None:
+        """Initialize DeadlineExceededError.
+
+        Args:
+            message: Human-readable error message.
+            operation: Name of the operation that ran out of time.
+        """
+        super().__init__(message)
+        self.operation = operation
+
+
 class HeartbeatError(RuntimeError):
     """Raised when the heartbeat encounters an error.
 
@@ -17,6 +37,61 @@ class ShutdownError(RuntimeError):
     """
 
 
+class BulkheadError(RuntimeError):
+    """Base exception for bulkhead errors."""
+
+
+class BulkheadFullError(BulkheadError):
+    """Raised when no bulkhead slot could be acquired.
+
+    Either the wait queue was already full or the wait timed out.
+
+    Attributes:
+        max_concurrent: Concurrency limit of the bulkhead.
+        max_queue: Wait-queue limit of the bulkhead.
+    """
+
+    def __init__(self, message: str, max_concurrent: int, max_queue: int) -> None:
+        """Initialize BulkheadFullError.
+
+        Args:
+            message: Human-readable error message.
+            max_concurrent: Concurrency limit of the bulkhead.
+            max_queue: Wait-queue limit of the bulkhead.
+        """
+        super().__init__(message)
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+
+
+class AdmissionError(RuntimeError):
+    """Base exception for admission control errors."""
+
+
+class AdmissionRejectedError(AdmissionError):
+    """Raised when work is shed by an admission controller.
+
+    Attributes:
+        priority: Priority of the rejected work.
+        load: Load level (1.0 = at threshold) when the work was rejected.
+        reason: ``"queue"`` or ``"lag"``, whichever signal was over its share.
+    """
+
+    def __init__(self, message: str, priority: int, load: float, reason: str) -> None:
+        """Initialize AdmissionRejectedError.
+
+        Args:
+            message: Human-readable error message.
+            priority: Priority of the rejected work.
+            load: Load level when the work was rejected.
+            reason: Overloaded signal (``"queue"`` or ``"lag"``).
+        """
+        super().__init__(message)
+        self.priority = priority
+        self.load = load
+        self.reason = reason
+
+
 class CircuitBreakerError(RuntimeError):
     """Base exception for circuit breaker errors."""
 
@@ -61,6 +136,34 @@ def __init__(self, message: str, retry_after: float) -> None:
         self.retry_after = retry_after
 
 
+class RetryError(RuntimeError):
+    """Base exception for retry policy errors."""
+
+
+class RetryExhaustedError(RetryError):
+    """Raised when a retry policy gives up.
+
+    Attributes:
+        attempts: Number of attempts made.
+        last_error: Exception raised by the last attempt.
+        reason: Why retrying stopped: ``"attempts"``, ``"deadline"`` or ``"budget"``.
+    """
+
+    def __init__(self, message: str, attempts: int, last_error: BaseException, reason: str) -> None:
+        """Initialize RetryExhaustedError.
+
+        Args:
+            message: Human-readable error message.
+            attempts: Number of attempts made.
+            last_error: Exception raised by the last attempt.
+            reason: Why retrying stopped.
+        """
+        super().__init__(message)
+        self.attempts = attempts
+        self.last_error = last_error
+        self.reason = reason
+
+
 class WatchdogError(RuntimeError):
     """Base exception for watchdog errors."""
 
@@ -84,11 +187,18 @@ def __init__(self, message: str, seconds_inactive: float) -> None:
 
 
 __all__ = [
+    "AdmissionError",
+    "AdmissionRejectedError",
+    "BulkheadError",
+    "BulkheadFullError",
     "CircuitBreakerError",
     "CircuitOpenError",
+    "DeadlineExceededError",
     "HeartbeatError",
     "RateLimitError",
     "RateLimitExceededError",
+    "RetryError",
+    "RetryExhaustedError",
     "ShutdownError",
     "WatchdogError",
     "WatchdogTimeoutError",
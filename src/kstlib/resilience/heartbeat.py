@@ -1,4 +1,20 @@
-"""Heartbeat mechanism for process liveness signaling."""
+"""Heartbeat mechanism for process liveness signaling.
+
+Each beat writes one compact JSON record. The pid, hostname and metadata part
+of the record is rendered once, and the timestamp always has the same length,
+so every record of a given heartbeat has the same size. With
+``write_mode="inplace"`` the record is rewritten at offset 0 of a file
+descriptor kept open between beats, so a beat costs one ``pwrite`` (plus an
+optional ``fsync``). The default ``"replace"`` mode writes a temp file and
+renames it over the state file.
+
+The async loop hands writes to a small dedicated thread pool, so a slow disk
+never stalls the event loop.
+
+A :class:`~kstlib.resilience.heartbeat_table.HeartbeatTable` can be used
+instead of (or alongside) the state file: each beat then also updates the
+process slot in the shared table.
+"""
 
 from __future__ import annotations
 
@@ -9,11 +25,13 @@
 import os
 import socket
 import threading
+import time
 from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Literal, Protocol, runtime_checkable
 
 from typing_extensions import Self
 
@@ -30,8 +48,33 @@
 if TYPE_CHECKING:
     import types
 
+    from kstlib.resilience.heartbeat_table import HeartbeatSlot, HeartbeatTable
+
 # Type aliases for callbacks
 OnAlertCallback = Callable[[str, str, Mapping[str, Any]], Awaitable[None] | None]
+HeartbeatWriteMode = Literal["replace", "inplace"]
+
+_WRITE_MODES = ("replace", "inplace")
+
+#: Worker threads for heartbeat file writes issued by async loops.
+IO_WORKERS = 2
+
+_io_executor: ThreadPoolExecutor | None = None
+_io_executor_lock = threading.Lock()
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    """Return the pool that runs heartbeat writes for async loops.
+
+    Kept apart from the default loop executor so heartbeats never queue
+    behind unrelated blocking work.
+    """
+    global _io_executor
+    if _io_executor is None:
+        with _io_executor_lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="kstlib-heartbeat-io")
+    return _io_executor
 
 
 @runtime_checkable
@@ -130,6 +173,13 @@ class Heartbeat:
         on_beat: Callback invoked after each successful beat. Can be sync or async.
             Use this to delegate state writing to an external component.
         metadata: Optional dict included in each heartbeat.
+        write_mode: ``"replace"`` (temp file + atomic rename) or ``"inplace"``
+            (rewrite the fixed-size record through a descriptor kept open).
+        fsync: Flush each write to disk. Uses ``resilience.heartbeat.fsync``
+            from config if None.
+        table: Optional shared heartbeat table. A slot is claimed on start
+            (or first beat) and released on stop.
+        slot_name: Name of the table slot (defaults to ``pid-<pid>``).
 
     Examples:
         Sync context manager:
@@ -154,6 +204,15 @@ class Heartbeat:
         ...     target=ws_manager,
         ...     on_target_dead=lambda: restart_ws(),
         ... )
+
+        Cheapest writes for a latency-sensitive loop:
+
+        >>> hb = Heartbeat("/dev/shm/bot.heartbeat", write_mode="inplace", fsync=False)  # doctest: +SKIP
+
+        Beat into a shared fleet table instead of a JSON file:
+
+        >>> table = HeartbeatTable("/dev/shm/fleet.hbt")  # doctest: +SKIP
+        >>> hb = Heartbeat(table=table, slot_name="bot-btc")  # doctest: +SKIP
     """
 
     def __init__(
@@ -167,6 +226,10 @@ def __init__(
         on_target_dead: Callable[[], Awaitable[None] | None] | None = None,
         on_beat: Callable[[], Awaitable[None] | None] | None = None,
         metadata: dict[str, Any] | None = None,
+        write_mode: HeartbeatWriteMode = "replace",
+        fsync: bool | None = None,
+        table: HeartbeatTable | None = None,
+        slot_name: str | None = None,
     ) -> None:
         """Initialize heartbeat.
 
@@ -179,7 +242,16 @@ def __init__(
             on_target_dead: Callback invoked when target is detected as dead.
             on_beat: Callback invoked after each successful beat.
             metadata: Optional dict included in each heartbeat.
+            write_mode: ``"replace"`` or ``"inplace"``.
+            fsync: Flush each write to disk. Uses config default if None.
+            table: Optional shared heartbeat table.
+            slot_name: Name of the table slot.
+
+        Raises:
+            ValueError: If write_mode is unknown.
         """
+        if write_mode not in _WRITE_MODES:
+            raise ValueError(f"write_mode must be one of {_WRITE_MODES}, got {write_mode!r}")
         self._state_file = Path(state_file) if state_file else None
         self._on_missed_beat = on_missed_beat
         self._on_alert = on_alert
@@ -195,6 +267,23 @@ def __init__(
             if interval is None
             else clamp_with_limits(interval, HARD_MIN_HEARTBEAT_INTERVAL, HARD_MAX_HEARTBEAT_INTERVAL)
         )
+        self._write_mode: HeartbeatWriteMode = write_mode
+        self._fsync = limits.heartbeat_fsync if fsync is None else fsync
+
+        # Write state: static record prefix, cached timestamp second, open fd
+        self._write_lock = threading.Lock()
+        self._record_prefix = b""
+        self._record_size = 0
+        self._ts_second = -1
+        self._ts_head = ""
+        self._fd: int | None = None
+        self._dir_ready = False
+        self._render_static()
+
+        # Shared table backend
+        self._table = table
+        self._slot_name = slot_name
+        self._slot: HeartbeatSlot | None = None
 
         # Threading state
         self._running = False
@@ -216,6 +305,21 @@ def state_file(self) -> Path | None:
         """Return the path to the state file, or None if not configured."""
         return self._state_file
 
+    @property
+    def write_mode(self) -> HeartbeatWriteMode:
+        """Return how the state file is written."""
+        return self._write_mode
+
+    @property
+    def fsync(self) -> bool:
+        """Return whether each write is flushed to disk."""
+        return self._fsync
+
+    @property
+    def slot(self) -> HeartbeatSlot | None:
+        """Return the claimed table slot, if any."""
+        return self._slot
+
     @property
     def is_shutdown(self) -> bool:
         """Check if shutdown has been requested."""
@@ -246,13 +350,19 @@ def start(self) -> None:
         """Start the heartbeat background thread.
 
         Raises:
-            HeartbeatError: If heartbeat is already running.
+            HeartbeatError: If heartbeat is already running or no table
+                slot can be claimed.
         """
         with self._lock:
             if self._running:
                 raise HeartbeatError("Heartbeat is already running")
+            # Show up in the table right away, not one interval later
+            self._beat_table()
             self._running = True
             self._stop_event.clear()
+            # pid changes after fork, hostname may have been renamed
+            with self._write_lock:
+                self._render_static()
             self._thread = threading.Thread(target=self._run_loop, daemon=True)
             self._thread.start()
 
@@ -263,6 +373,7 @@ def stop(self) -> None:
         """
         with self._lock:
             if not self._running:
+                self._release_backends()
                 return
             self._running = False
             self._stop_event.set()
@@ -270,6 +381,49 @@ def stop(self) -> None:
         if self._thread is not None:
             self._thread.join(timeout=self._interval + 1.0)
             self._thread = None
+        self._release_backends()
+
+    def set_metadata(self, metadata: dict[str, Any]) -> None:
+        """Replace the metadata written with each heartbeat.
+
+        Args:
+            metadata: New JSON-serializable metadata.
+        """
+        with self._write_lock:
+            self._metadata = metadata
+            self._render_static()
+
+    def _render_static(self) -> None:
+        """Pre-render the part of the record that does not change between beats."""
+        static = json.dumps(
+            {"pid": os.getpid(), "hostname": socket.gethostname(), "metadata": self._metadata},
+            separators=(",", ":"),
+        )
+        # Timestamp goes last so the prefix is a plain byte string
+        self._record_prefix = (static[:-1] + ',"timestamp":"').encode()
+
+    def _timestamp(self) -> str:
+        """Return the current UTC time as fixed-length ISO 8601.
+
+        The date and time-of-day part is only formatted once per second.
+        """
+        now = time.time()
+        second = int(now)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_head = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        micros = min(int((now - second) * 1_000_000), 999_999)
+        return f"{self._ts_head}.{micros:06d}+00:00"
+
+    def _record(self) -> bytes:
+        """Build the record for the current beat.
+
+        Records are padded with spaces to the largest size written so far,
+        so an in-place rewrite never leaves stale bytes after the JSON.
+        """
+        record = self._record_prefix + self._timestamp().encode() + b'"}'
+        self._record_size = max(self._record_size, len(record) + 1)
+        return record.ljust(self._record_size - 1) + b"\n"
 
     def beat(self) -> None:
         """Write a heartbeat immediately (manual trigger).
@@ -280,25 +434,86 @@ def beat(self) -> None:
         Raises:
             HeartbeatError: If state file is configured and cannot be written.
         """
+        if self._table is not None:
+            self._beat_table()
+
         # Skip file write if no state_file configured
         if self._state_file is None:
             return
 
-        state = HeartbeatState(
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            pid=os.getpid(),
-            hostname=socket.gethostname(),
-            metadata=self._metadata,
-        )
+        with self._write_lock:
+            try:
+                if not self._dir_ready:
+                    # Ensure parent directory exists with proper permissions
+                    self._state_file.parent.mkdir(parents=True, exist_ok=True, mode=0o755)
+                    self._dir_ready = True
+                record = self._record()
+                if self._write_mode == "inplace":
+                    self._write_inplace(self._state_file, record)
+                else:
+                    self._write_replace(self._state_file, record)
+            except OSError as exc:
+                # Directory or file may have been removed: redo setup next beat
+                self._dir_ready = False
+                self._close_fd()
+                if self._slot is not None:
+                    self._slot.record_missed()
+                raise HeartbeatError(f"Failed to write heartbeat: {exc}") from exc
+
+    def _write_replace(self, path: Path, record: bytes) -> None:
+        """Write atomically using a temp file and rename."""
+        temp_file = path.with_suffix(".tmp")
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
         try:
-            # Ensure parent directory exists with proper permissions
-            self._state_file.parent.mkdir(parents=True, exist_ok=True, mode=0o755)
-            # Write atomically using temp file
-            temp_file = self._state_file.with_suffix(".tmp")
-            temp_file.write_text(json.dumps(state.to_dict(), indent=2))
-            temp_file.replace(self._state_file)
-        except OSError as exc:
-            raise HeartbeatError(f"Failed to write heartbeat: {exc}") from exc
+            os.write(fd, record)
+            if self._fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        temp_file.replace(path)
+
+    def _write_inplace(self, path: Path, record: bytes) -> None:
+        """Overwrite the record at offset 0 of the kept-open state file."""
+        if self._fd is None:
+            self._fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o644)
+            # Drop whatever a previous writer (e.g. replace mode) left behind
+            os.ftruncate(self._fd, 0)
+        if hasattr(os, "pwrite"):
+            os.pwrite(self._fd, record, 0)
+        else:  # pragma: no cover - Windows
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            os.write(self._fd, record)
+        if self._fsync:
+            os.fsync(self._fd)
+
+    def _beat_table(self) -> None:
+        """Update the table slot, claiming it on first use."""
+        if self._table is None:
+            return
+        with self._write_lock:
+            if self._slot is None:
+                try:
+                    self._slot = self._table.claim(self._slot_name)
+                except OSError as exc:
+                    raise HeartbeatError(f"Failed to claim heartbeat slot: {exc}") from exc
+            else:
+                self._slot.beat()
+
+    def _release_backends(self) -> None:
+        """Close the in-place descriptor and release the table slot."""
+        self._close_fd()
+        with self._write_lock:
+            if self._slot is not None:
+                with contextlib.suppress(Exception):
+                    self._slot.release()
+                self._slot = None
+
+    def _close_fd(self) -> None:
+        """Close the in-place descriptor, if open."""
+        if self._fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = None
 
     def _run_loop(self) -> None:
         """Background thread loop that writes heartbeats and checks target."""
@@ -338,6 +553,8 @@ async def astart(self) -> None:
             if self._running:
                 raise HeartbeatError("Heartbeat is already running")
             self._running = True
+            with self._write_lock:
+                self._render_static()
 
         self._async_task = asyncio.create_task(self._async_loop())
 
@@ -348,6 +565,7 @@ async def astop(self) -> None:
         """
         with self._lock:
             if not self._running:
+                self._release_backends()
                 return
             self._running = False
 
@@ -356,6 +574,7 @@ async def astop(self) -> None:
             with contextlib.suppress(asyncio.CancelledError):
                 await self._async_task
             self._async_task = None
+        self._release_backends()
 
     async def _invoke_callback_async(
         self,
@@ -394,9 +613,9 @@ async def _async_loop(self) -> None:
         log.debug("Heartbeat async loop started (interval=%.1fs)", self._interval)
         while self._running and not self._shutdown_requested:
             try:
-                # Run beat in executor to avoid blocking
+                # Write on the heartbeat IO pool, never on the event loop
                 loop = asyncio.get_running_loop()
-                await loop.run_in_executor(None, self.beat)
+                await loop.run_in_executor(_get_io_executor(), self.beat)
                 # Invoke on_beat callback after successful beat
                 if self._on_beat is not None:
                     log.debug("Invoking on_beat callback")
@@ -428,11 +647,16 @@ def read_state(state_file: str | Path) -> HeartbeatState | None:
         path = Path(state_file)
         if not path.exists():
             return None
-        try:
-            data = json.loads(path.read_text())
-            return HeartbeatState.from_dict(data)
-        except (json.JSONDecodeError, KeyError, OSError):
-            return None
+        # One retry covers a read racing an in-place rewrite of a resized record
+        for _ in range(2):
+            try:
+                data = json.loads(path.read_text())
+                return HeartbeatState.from_dict(data)
+            except json.JSONDecodeError:
+                continue
+            except (KeyError, OSError):
+                return None
+        return None
 
     @staticmethod
     def is_alive(state_file: str | Path, max_age_seconds: float = 30.0) -> bool:
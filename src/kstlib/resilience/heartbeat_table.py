@@ -0,0 +1,410 @@
+"""Shared memory-mapped heartbeat table for supervising many processes.
+
+A :class:`HeartbeatTable` is a small file mapped into memory by every
+process that uses it. The file holds a header followed by fixed-size slots,
+one per process. Each slot stores the owner pid, a name, the monotonic time of
+the last beat and a few counters. Every field is an aligned 8-byte word, so a
+beat is two stores into shared memory and never tears the timestamp.
+
+A writer claims a slot once and then only touches that slot. A supervisor
+copies the slot area in one read and decodes it with :mod:`struct`, so
+checking a whole fleet takes microseconds, with no file parsing and no ISO
+datetimes.
+
+Timestamps come from :func:`time.monotonic_ns`, which is system-wide on
+Linux, macOS and Windows. All processes sharing a table must therefore run on
+the same host (use a local path such as ``/dev/shm`` or ``/run``, not a
+network file system).
+
+Examples:
+    Writer side:
+
+    >>> table = HeartbeatTable("/dev/shm/fleet.hbt")  # doctest: +SKIP
+    >>> slot = table.claim("bot-btc")  # doctest: +SKIP
+    >>> slot.beat()  # doctest: +SKIP
+
+    Supervisor side:
+
+    >>> for info in HeartbeatTable("/dev/shm/fleet.hbt").dead(max_age=30):  # doctest: +SKIP
+    ...     print(f"{info.name} (pid {info.pid}) silent for {info.age:.0f}s")
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from kstlib.resilience.exceptions import HeartbeatError
+
+if sys.platform != "win32":
+    import fcntl
+
+if TYPE_CHECKING:
+    import types
+
+    from typing_extensions import Self
+
+log = logging.getLogger(__name__)
+
+#: Default number of slots in a new table.
+DEFAULT_SLOTS = 64
+
+#: Maximum number of UTF-8 bytes stored for a slot name.
+NAME_SIZE = 16
+
+_MAGIC = b"KSTHBT01"
+_VERSION = 1
+# magic, version, slot size, slot count (padded to 64 bytes)
+_HEADER = struct.Struct("<8sIIQ40x")
+# pid, beat_ns, beats, missed, started_ns, name, reserved
+_SLOT = struct.Struct(f"<qqQQq{NAME_SIZE}s8x")
+# beat_ns, beats: written together on every beat
+_BEAT = struct.Struct("<qQ")
+_MISSED = struct.Struct("<Q")
+_PID = struct.Struct("<q")
+_BEAT_OFFSET = 8
+_MISSED_OFFSET = 24
+_MAX_SLOTS = 65536
+
+
+@dataclass(frozen=True, slots=True)
+class HeartbeatSlotInfo:
+    """Snapshot of one occupied slot.
+
+    Attributes:
+        index: Slot index in the table.
+        pid: Process ID of the owner.
+        name: Slot name.
+        age: Seconds since the last beat.
+        beats: Beats written since the slot was claimed.
+        missed: Failures recorded by the owner.
+        uptime: Seconds since the slot was claimed.
+
+    Examples:
+        >>> info = HeartbeatSlotInfo(0, 1234, "bot", age=2.5, beats=10, missed=0, uptime=60.0)
+        >>> info.is_alive(max_age=5)
+        True
+    """
+
+    index: int
+    pid: int
+    name: str
+    age: float
+    beats: int
+    missed: int
+    uptime: float
+
+    def is_alive(self, max_age: float) -> bool:
+        """Return True if the last beat is at most ``max_age`` seconds old."""
+        return self.age <= max_age
+
+
+class HeartbeatSlot:
+    """Writer handle for a claimed slot.
+
+    Obtained from :meth:`HeartbeatTable.claim`. Only the owning process
+    should write to a slot.
+
+    Examples:
+        >>> slot = table.claim("worker-1")  # doctest: +SKIP
+        >>> slot.beat()  # doctest: +SKIP
+        >>> slot.release()  # doctest: +SKIP
+    """
+
+    __slots__ = ("_beats", "_missed", "_offset", "_table", "index", "name", "pid")
+
+    def __init__(self, table: HeartbeatTable, index: int, name: str, pid: int) -> None:
+        """Bind the handle to a slot claimed by ``pid``."""
+        self._table = table
+        self._offset = table.slot_offset(index)
+        self._beats = 0
+        self._missed = 0
+        self.index = index
+        self.name = name
+        self.pid = pid
+
+    @property
+    def beats(self) -> int:
+        """Beats written through this handle."""
+        return self._beats
+
+    def beat(self) -> None:
+        """Record a beat: store the current monotonic time and bump the counter."""
+        self._beats += 1
+        _BEAT.pack_into(self._table.buffer, self._offset + _BEAT_OFFSET, time.monotonic_ns(), self._beats)
+
+    def record_missed(self) -> None:
+        """Increment the missed-beat counter (e.g. a failed state file write)."""
+        self._missed += 1
+        _MISSED.pack_into(self._table.buffer, self._offset + _MISSED_OFFSET, self._missed)
+
+    def release(self) -> None:
+        """Free the slot, unless another process has taken it over."""
+        self._table.release(self)
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"HeartbeatSlot(index={self.index}, name={self.name!r}, pid={self.pid})"
+
+
+class HeartbeatTable:
+    """Memory-mapped table of fixed-size heartbeat slots.
+
+    Opening a path that does not exist creates the table with ``slots``
+    slots. Opening an existing table keeps its slot count.
+
+    Args:
+        path: Table file path (should be on a local file system).
+        slots: Number of slots when creating a new table.
+
+    Raises:
+        ValueError: If ``slots`` is out of range.
+        HeartbeatError: If the file exists but is not a heartbeat table.
+
+    Examples:
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> path = Path(tempfile.mkdtemp()) / "fleet.hbt"
+        >>> with HeartbeatTable(path, slots=8) as table:
+        ...     slot = table.claim("bot-1")
+        ...     slot.beat()
+        ...     [info.name for info in table.scan()]
+        ['bot-1']
+    """
+
+    def __init__(self, path: str | Path, *, slots: int = DEFAULT_SLOTS) -> None:
+        """Open or create the table."""
+        if not 1 <= slots <= _MAX_SLOTS:
+            raise ValueError(f"slots must be in [1, {_MAX_SLOTS}]")
+        self._path = Path(path)
+        self._claim_lock = threading.Lock()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            with self._file_lock():
+                self._slots = self._init_file(slots)
+            self._mm = mmap.mmap(self._fd, _HEADER.size + self._slots * _SLOT.size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def _init_file(self, slots: int) -> int:
+        """Write the header of a new table or validate an existing one."""
+        size = os.fstat(self._fd).st_size
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        if size == 0:
+            os.ftruncate(self._fd, _HEADER.size + slots * _SLOT.size)
+            os.write(self._fd, _HEADER.pack(_MAGIC, _VERSION, _SLOT.size, slots))
+            return slots
+        header = os.read(self._fd, _HEADER.size)
+        if len(header) < _HEADER.size:
+            raise HeartbeatError(f"Not a heartbeat table: {self._path}")
+        magic, version, slot_size, count = _HEADER.unpack(header)
+        if magic != _MAGIC or version != _VERSION or slot_size != _SLOT.size:
+            raise HeartbeatError(f"Not a heartbeat table: {self._path}")
+        if size < _HEADER.size + count * _SLOT.size:
+            raise HeartbeatError(f"Truncated heartbeat table: {self._path}")
+        return int(count)
+
+    def _file_lock(self) -> _FileLock:
+        """Exclusive lock between processes (and threads) for claims and setup."""
+        return _FileLock(self._fd, self._claim_lock)
+
+    @property
+    def path(self) -> Path:
+        """Table file path."""
+        return self._path
+
+    @property
+    def slots(self) -> int:
+        """Number of slots in the table."""
+        return self._slots
+
+    @property
+    def buffer(self) -> mmap.mmap:
+        """Shared memory mapping (used by :class:`HeartbeatSlot`)."""
+        return self._mm
+
+    def slot_offset(self, index: int) -> int:
+        """Byte offset of slot ``index`` in the mapping."""
+        return _HEADER.size + index * _SLOT.size
+
+    def claim(self, name: str | None = None, *, reclaim_after: float | None = None) -> HeartbeatSlot:
+        """Claim a slot for the current process.
+
+        A slot that already carries ``name`` is taken over, so a restarted
+        process keeps its slot. Otherwise the first free slot is used. If
+        none is free and ``reclaim_after`` is set, the stalest slot silent
+        for longer than that is reused.
+
+        Args:
+            name: Slot name (defaults to ``pid-<pid>``), truncated to 16 UTF-8 bytes.
+            reclaim_after: Age in seconds after which a slot may be reused.
+
+        Returns:
+            Writer handle for the claimed slot, with a first beat recorded.
+
+        Raises:
+            HeartbeatError: If no slot is available.
+        """
+        pid = os.getpid()
+        raw_name = _encode_name(name if name is not None else f"pid-{pid}")
+        with self._file_lock():
+            index = self._pick_slot(raw_name, reclaim_after)
+            now = time.monotonic_ns()
+            offset = self.slot_offset(index)
+            # Publish the pid last so scanners never see a half-written slot
+            _SLOT.pack_into(self._mm, offset, 0, now, 0, 0, now, raw_name)
+            _PID.pack_into(self._mm, offset, pid)
+        slot = HeartbeatSlot(self, index, _decode_name(raw_name), pid)
+        slot.beat()
+        log.debug("Claimed heartbeat slot %d (%s) in %s", index, slot.name, self._path)
+        return slot
+
+    def _pick_slot(self, raw_name: bytes, reclaim_after: float | None) -> int:
+        """Return the index to claim. Must hold the file lock."""
+        records = self._records()
+        free = None
+        for index, (pid, _, _, _, _, slot_name) in enumerate(records):
+            if pid and slot_name == raw_name:
+                return index
+            if not pid and free is None:
+                free = index
+        if free is not None:
+            return free
+        if reclaim_after is not None:
+            now = time.monotonic_ns()
+            stale = max(range(len(records)), key=lambda i: now - records[i][1])
+            if (now - records[stale][1]) / 1e9 > reclaim_after:
+                return stale
+        raise HeartbeatError(f"Heartbeat table is full ({self._slots} slots): {self._path}")
+
+    def release(self, slot: HeartbeatSlot) -> None:
+        """Free ``slot`` if it still belongs to its handle's process."""
+        with self._file_lock():
+            offset = self.slot_offset(slot.index)
+            pid = _PID.unpack_from(self._mm, offset)[0]
+            slot_name = _SLOT.unpack_from(self._mm, offset)[5]
+            if pid == slot.pid and _decode_name(slot_name) == slot.name:
+                _PID.pack_into(self._mm, offset, 0)
+
+    def _records(self) -> list[tuple[int, int, int, int, int, bytes]]:
+        """Decode every slot from one copy of the slot area."""
+        data = self._mm[_HEADER.size : _HEADER.size + self._slots * _SLOT.size]
+        return list(_SLOT.iter_unpack(data))
+
+    def _snapshot(self, stale_before_ns: int | None = None) -> list[HeartbeatSlotInfo]:
+        """Decode occupied slots, optionally only those last beaten before a cutoff."""
+        now = time.monotonic_ns()
+        cutoff = now + 1 if stale_before_ns is None else stale_before_ns
+        return [
+            HeartbeatSlotInfo(
+                index=index,
+                pid=pid,
+                name=_decode_name(slot_name),
+                age=max(0, now - beat_ns) / 1e9,
+                beats=beats,
+                missed=missed,
+                uptime=max(0, now - started_ns) / 1e9,
+            )
+            for index, (pid, beat_ns, beats, missed, started_ns, slot_name) in enumerate(
+                _SLOT.iter_unpack(self._mm[_HEADER.size : _HEADER.size + self._slots * _SLOT.size])
+            )
+            if pid and beat_ns < cutoff
+        ]
+
+    def scan(self) -> list[HeartbeatSlotInfo]:
+        """Return a snapshot of every occupied slot.
+
+        Examples:
+            >>> [info.name for info in table.scan()]  # doctest: +SKIP
+            ['bot-btc', 'bot-eth']
+        """
+        return self._snapshot()
+
+    def dead(self, max_age: float) -> list[HeartbeatSlotInfo]:
+        """Return the occupied slots whose last beat is older than ``max_age`` seconds.
+
+        Live slots are skipped before any object is built, so a healthy
+        fleet costs one copy and one ``struct`` pass.
+
+        Examples:
+            >>> table.dead(max_age=30)  # doctest: +SKIP
+            [HeartbeatSlotInfo(index=3, pid=4242, name='bot-sol', age=45.2, ...)]
+        """
+        return self._snapshot(time.monotonic_ns() - int(max_age * 1e9))
+
+    def find(self, name: str) -> HeartbeatSlotInfo | None:
+        """Return the occupied slot called ``name``, if any."""
+        wanted = _decode_name(_encode_name(name))
+        for info in self.scan():
+            if info.name == wanted:
+                return info
+        return None
+
+    def close(self) -> None:
+        """Unmap the table and close the file. Safe to call twice."""
+        if not self._mm.closed:
+            self._mm.close()
+            os.close(self._fd)
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        """Close the table on exit."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"HeartbeatTable(path={str(self._path)!r}, slots={self._slots})"
+
+
+class _FileLock:
+    """Thread lock plus an exclusive ``flock`` on the table file (POSIX only)."""
+
+    __slots__ = ("_fd", "_lock")
+
+    def __init__(self, fd: int, lock: threading.Lock) -> None:
+        """Wrap the table descriptor and its in-process lock."""
+        self._fd = fd
+        self._lock = lock
+
+    def __enter__(self) -> None:
+        """Take the thread lock, then the file lock."""
+        self._lock.acquire()
+        if sys.platform != "win32":
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Release both locks."""
+        if sys.platform != "win32":
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._lock.release()
+
+
+def _encode_name(name: str) -> bytes:
+    """Encode and truncate a slot name to its stored form."""
+    return name.encode()[:NAME_SIZE].ljust(NAME_SIZE, b"\0")
+
+
+def _decode_name(raw: bytes) -> str:
+    """Decode a stored slot name (a truncated multi-byte char is dropped)."""
+    return raw.rstrip(b"\0").decode(errors="ignore")
+
+
+__all__ = ["DEFAULT_SLOTS", "NAME_SIZE", "HeartbeatSlot", "HeartbeatSlotInfo", "HeartbeatTable"]
@@ -0,0 +1,319 @@
+"""Hedged requests for idempotent async calls.
+
+A hedged call starts one attempt. If that attempt has not finished after
+``delay`` seconds, it starts a second one (and so on, up to ``max_hedges``
+extra attempts). The first successful result wins and the other attempts
+are cancelled. Hedging trims tail latency caused by an occasional slow
+upstream node, at the cost of some extra load. That extra load is bounded
+by a :class:`~kstlib.resilience.retry.RetryBudget` and, optionally, a
+:class:`~kstlib.resilience.rate_limiter.RateLimiter`.
+
+Only hedge idempotent operations (reads): every attempt may reach the
+server.
+
+Examples:
+    One-off hedge with a fixed delay:
+
+    >>> async def fetch():  # doctest: +SKIP
+    ...     return await client.get("/ticker")
+    >>> await hedge(fetch, delay=0.05, max_hedges=1)  # doctest: +SKIP
+
+    Reusable policy whose delay follows the observed p95 latency:
+
+    >>> policy = HedgePolicy(percentile=95.0, max_hedges=1)
+    >>> policy.delay  # Initial delay until enough samples are recorded
+    0.1
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from kstlib.resilience.rate_limiter import RateLimiter
+    from kstlib.resilience.retry import RetryBudget
+
+T = TypeVar("T")
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class HedgeStats:
+    """Statistics for hedged calls.
+
+    Attributes:
+        total_calls: Hedged calls started.
+        hedges_sent: Extra attempts started after the delay.
+        hedge_wins: Calls won by a hedge rather than the first attempt.
+        budget_rejections: Hedges skipped because the budget was empty.
+        rate_limited: Hedges skipped because the rate limiter had no token.
+
+    Examples:
+        >>> stats = HedgeStats()
+        >>> stats.record_call()
+        >>> stats.record_hedge()
+        >>> stats.hedges_sent
+        1
+    """
+
+    total_calls: int = 0
+    hedges_sent: int = 0
+    hedge_wins: int = 0
+    budget_rejections: int = 0
+    rate_limited: int = 0
+
+    def record_call(self) -> None:
+        """Record a hedged call."""
+        self.total_calls += 1
+
+    def record_hedge(self) -> None:
+        """Record an extra attempt."""
+        self.hedges_sent += 1
+
+    def record_hedge_win(self) -> None:
+        """Record a call won by a hedge."""
+        self.hedge_wins += 1
+
+    def record_budget_rejection(self) -> None:
+        """Record a hedge denied by the budget."""
+        self.budget_rejections += 1
+
+    def record_rate_limited(self) -> None:
+        """Record a hedge denied by the rate limiter."""
+        self.rate_limited += 1
+
+
+class HedgePolicy:
+    """Reusable hedging configuration with a latency-percentile delay.
+
+    With ``delay=None`` the policy waits for the ``percentile`` of recent
+    attempt latencies (a sliding window of ``window`` samples) before hedging.
+    ``initial_delay`` is used until ``min_samples`` latencies are recorded.
+
+    Args:
+        delay: Fixed hedge delay in seconds (None = percentile-based).
+        max_hedges: Maximum extra attempts per call.
+        percentile: Latency percentile used as delay (0 < p <= 100).
+        initial_delay: Delay used until enough samples are recorded.
+        min_samples: Samples needed before the percentile is trusted.
+        window: Number of recent latencies kept.
+        budget: Optional budget shared with other hedged calls.
+        rate_limiter: Optional rate limiter charged one token per hedge.
+        name: Optional name for logging.
+
+    Examples:
+        >>> policy = HedgePolicy(percentile=50.0, min_samples=3)
+        >>> for latency in (0.01, 0.02, 0.03):
+        ...     policy.record_latency(latency)
+        >>> policy.delay
+        0.02
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        delay: float | None = None,
+        max_hedges: int = 1,
+        percentile: float = 95.0,
+        initial_delay: float = 0.1,
+        min_samples: int = 20,
+        window: int = 256,
+        budget: RetryBudget | None = None,
+        rate_limiter: RateLimiter | None = None,
+        name: str | None = None,
+    ) -> None:
+        """Initialize hedge policy.
+
+        Raises:
+            ValueError: If any setting is out of range.
+        """
+        if delay is not None and delay < 0:
+            raise ValueError("delay must not be negative")
+        if max_hedges < 0:
+            raise ValueError("max_hedges must not be negative")
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be in (0, 100]")
+        if initial_delay < 0:
+            raise ValueError("initial_delay must not be negative")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError("need 1 <= min_samples <= window")
+
+        self._fixed_delay = delay
+        self._max_hedges = max_hedges
+        self._percentile = percentile
+        self._initial_delay = initial_delay
+        self._min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._cached_delay: float | None = None
+        self._budget = budget
+        self._rate_limiter = rate_limiter
+        self._name = name
+        self._stats = HedgeStats()
+
+    @property
+    def delay(self) -> float:
+        """Current hedge delay in seconds."""
+        if self._fixed_delay is not None:
+            return self._fixed_delay
+        if len(self._latencies) < self._min_samples:
+            return self._initial_delay
+        if self._cached_delay is None:
+            ordered = sorted(self._latencies)
+            rank = max(0, math.ceil(self._percentile / 100 * len(ordered)) - 1)
+            self._cached_delay = ordered[rank]
+        return self._cached_delay
+
+    @property
+    def max_hedges(self) -> int:
+        """Maximum extra attempts per call."""
+        return self._max_hedges
+
+    @property
+    def stats(self) -> HedgeStats:
+        """Statistics for this policy."""
+        return self._stats
+
+    @property
+    def name(self) -> str | None:
+        """Name of this policy."""
+        return self._name
+
+    def record_latency(self, seconds: float) -> None:
+        """Add an attempt latency to the percentile window."""
+        self._latencies.append(seconds)
+        self._cached_delay = None
+
+    def _may_hedge(self) -> bool:
+        """Check budget and rate limiter before starting a hedge."""
+        if self._budget is not None and not self._budget.try_withdraw():
+            self._stats.record_budget_rejection()
+            return False
+        if self._rate_limiter is not None and not self._rate_limiter.try_acquire():
+            self._stats.record_rate_limited()
+            return False
+        return True
+
+    async def run(self, coro_factory: Callable[[], Awaitable[T]]) -> T:
+        """Run ``coro_factory`` with hedging.
+
+        Args:
+            coro_factory: Zero-argument callable returning a new awaitable
+                per attempt.
+
+        Returns:
+            Result of the first attempt that succeeds.
+
+        Raises:
+            Exception: The error of the last failing attempt, if every
+                started attempt fails.
+
+        Examples:
+            >>> async def fetch(): return "tick"
+            >>> asyncio.run(HedgePolicy(delay=0.01).run(fetch))
+            'tick'
+        """
+        self._stats.record_call()
+        if self._budget is not None:
+            self._budget.deposit()
+
+        delay = self.delay
+        started: dict[asyncio.Future[T], tuple[int, float]] = {}
+
+        def launch() -> asyncio.Future[T]:
+            task = asyncio.ensure_future(coro_factory())
+            started[task] = (len(started), time.monotonic())
+            return task
+
+        pending: set[asyncio.Future[T]] = {launch()}
+        can_hedge = self._max_hedges > 0
+        try:
+            while True:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if done:
+                    winner = self._pick_winner(done, started)
+                    if winner is not None:
+                        return winner.result()
+                    if not pending:
+                        raise next(iter(done)).exception()  # type: ignore[misc]
+                    continue
+                # Timer fired: the running attempts are slow, try one more
+                if self._may_hedge():
+                    self._stats.record_hedge()
+                    log.debug("Hedge %s: attempt %d after %.3fs", self._name or "unnamed", len(started) + 1, delay)
+                    pending.add(launch())
+                    can_hedge = len(started) <= self._max_hedges
+                else:
+                    can_hedge = False
+        finally:
+            for task in started:
+                task.cancel()
+            await asyncio.gather(*started, return_exceptions=True)
+
+    def _pick_winner(
+        self,
+        done: set[asyncio.Future[T]],
+        started: dict[asyncio.Future[T], tuple[int, float]],
+    ) -> asyncio.Future[T] | None:
+        """Return the first successful finished attempt and record its latency."""
+        for task in done:
+            if task.exception() is None:
+                index, start = started[task]
+                self.record_latency(time.monotonic() - start)
+                if index > 0:
+                    self._stats.record_hedge_win()
+                return task
+        return None
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        delay = "percentile" if self._fixed_delay is None else f"{self._fixed_delay}"
+        return f"HedgePolicy(delay={delay}, max_hedges={self._max_hedges}, percentile={self._percentile})"
+
+
+async def hedge(
+    coro_factory: Callable[[], Awaitable[T]],
+    *,
+    delay: float,
+    max_hedges: int = 1,
+    budget: RetryBudget | None = None,
+    rate_limiter: RateLimiter | None = None,
+) -> T:
+    """Run an idempotent async operation with hedged attempts.
+
+    Args:
+        coro_factory: Zero-argument callable returning a new awaitable per attempt.
+        delay: Seconds to wait before each extra attempt.
+        max_hedges: Maximum extra attempts.
+        budget: Optional budget that hedges draw from.
+        rate_limiter: Optional rate limiter charged one token per hedge.
+
+    Returns:
+        Result of the first attempt that succeeds.
+
+    Examples:
+        >>> calls = []
+        >>> async def fetch():
+        ...     calls.append(1)
+        ...     await asyncio.sleep(0.05 if len(calls) == 1 else 0)
+        ...     return len(calls)
+        >>> asyncio.run(hedge(fetch, delay=0.01))  # Hedge wins
+        2
+    """
+    policy = HedgePolicy(delay=delay, max_hedges=max_hedges, budget=budget, rate_limiter=rate_limiter)
+    return await policy.run(coro_factory)
+
+
+__all__ = ["HedgePolicy", "HedgeStats", "hedge"]
@@ -36,6 +36,7 @@
 
 from typing_extensions import ParamSpec, Self
 
+from kstlib.resilience.deadline import check_deadline, clamp_timeout
 from kstlib.resilience.exceptions import RateLimitExceededError
 
 if TYPE_CHECKING:
@@ -220,6 +221,7 @@ def acquire(self, *, blocking: bool = True, timeout: float | None = None) -> boo
 
         Raises:
             RateLimitExceededError: If timeout exceeded while waiting.
+            DeadlineExceededError: If the ``deadline()`` budget ran out.
 
         Examples:
             >>> limiter = RateLimiter(rate=10, per=1.0)
@@ -228,6 +230,8 @@ def acquire(self, *, blocking: bool = True, timeout: float | None = None) -> boo
             >>> limiter.acquire(blocking=False)  # Returns immediately
             True
         """
+        if blocking:
+            timeout = clamp_timeout(timeout, "rate limiter acquire")
         start_time = time.monotonic()
         deadline = start_time + timeout if timeout is not None else None
 
@@ -255,6 +259,7 @@ def acquire(self, *, blocking: bool = True, timeout: float | None = None) -> boo
                     remaining = deadline - time.monotonic()
                     if remaining <= 0:
                         self._stats.record_rejected()
+                        check_deadline("rate limiter acquire")
                         raise RateLimitExceededError(
                             f"Rate limit timeout after {timeout}s",
                             retry_after=wait_time,
@@ -292,6 +297,7 @@ async def acquire_async(self, *, timeout: float | None = None) -> bool:
 
         Raises:
             RateLimitExceededError: If timeout exceeded.
+            DeadlineExceededError: If the ``deadline()`` budget ran out.
 
         Examples:
             >>> import asyncio
@@ -299,6 +305,7 @@ async def acquire_async(self, *, timeout: float | None = None) -> bool:
             >>> asyncio.run(limiter.acquire_async())
             True
         """
+        timeout = clamp_timeout(timeout, "rate limiter acquire")
         start_time = time.monotonic()
         deadline = start_time + timeout if timeout is not None else None
 
@@ -320,6 +327,7 @@ async def acquire_async(self, *, timeout: float | None = None) -> bool:
                     remaining = deadline - time.monotonic()
                     if remaining <= 0:
                         self._stats.record_rejected()
+                        check_deadline("rate limiter acquire")
                         raise RateLimitExceededError(
                             f"Rate limit timeout after {timeout}s",
                             retry_after=wait_time,
@@ -329,6 +337,24 @@ async def acquire_async(self, *, timeout: float | None = None) -> bool:
             # Async sleep outside the lock
             await asyncio.sleep(min(wait_time, 0.1))
 
+    def refund(self) -> None:
+        """Give back a token that was acquired but not used.
+
+        The bucket never exceeds its capacity, so refunding cannot create
+        a burst larger than ``rate``.
+
+        Examples:
+            >>> limiter = RateLimiter(rate=1, per=60.0)
+            >>> limiter.try_acquire()
+            True
+            >>> limiter.refund()
+            >>> limiter.try_acquire()
+            True
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._max_tokens, self._tokens + 1.0)
+
     def reset(self) -> None:
         """Reset the rate limiter to full capacity.
 
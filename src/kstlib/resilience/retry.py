@@ -0,0 +1,573 @@
+"""Retry policy with exponential backoff, jitter, deadlines and retry budgets.
+
+Provides a single retry engine for sync and async code. Delays grow
+exponentially and are randomized (full or decorrelated jitter) so that
+clients failing together do not retry together. A ``Retry-After`` hint
+carried by the exception is honored, an overall deadline bounds the total
+time spent (as does an enclosing ``deadline()`` block), and an optional token-bucket :class:`RetryBudget` caps retries
+to a fraction of regular traffic so an outage does not double the load.
+
+Examples:
+    As a decorator:
+
+    >>> @retry(max_attempts=5, base_delay=0.2)
+    ... def fetch():  # doctest: +SKIP
+    ...     return requests.get("http://api.example.com")
+
+    Direct usage with a shared budget:
+
+    >>> budget = RetryBudget(ratio=0.1)
+    >>> policy = RetryPolicy(max_attempts=3, base_delay=0.0, budget=budget)
+    >>> policy.call(lambda: 42)
+    42
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal, TypeVar, overload
+
+from typing_extensions import ParamSpec
+
+from kstlib.resilience.deadline import remaining_time
+from kstlib.resilience.exceptions import RetryExhaustedError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+JitterMode = Literal["none", "full", "decorrelated"]
+
+log = logging.getLogger(__name__)
+
+
+def retry_after_from_exception(exc: BaseException) -> float | None:
+    """Return the ``retry_after`` hint carried by an exception, if any.
+
+    Args:
+        exc: Exception raised by the attempt.
+
+    Returns:
+        Seconds to wait before retrying, or None if the exception has no hint.
+
+    Examples:
+        >>> from kstlib.resilience.exceptions import RateLimitExceededError
+        >>> retry_after_from_exception(RateLimitExceededError("slow down", retry_after=2.5))
+        2.5
+        >>> retry_after_from_exception(ValueError("boom")) is None
+        True
+    """
+    value = getattr(exc, "retry_after", None)
+    if isinstance(value, (int, float)) and value >= 0:
+        return float(value)
+    return None
+
+
+@dataclass
+class RetryStats:
+    """Statistics for retry policy monitoring.
+
+    Attributes:
+        total_calls: Number of calls made through the policy.
+        total_retries: Number of retry attempts (excluding first attempts).
+        exhausted: Number of calls that gave up.
+        budget_rejections: Retries denied by the retry budget.
+        total_delay: Total time spent sleeping between attempts (seconds).
+
+    Examples:
+        >>> stats = RetryStats()
+        >>> stats.record_call()
+        >>> stats.record_retry(0.5)
+        >>> (stats.total_calls, stats.total_retries, stats.total_delay)
+        (1, 1, 0.5)
+    """
+
+    total_calls: int = 0
+    total_retries: int = 0
+    exhausted: int = 0
+    budget_rejections: int = 0
+    total_delay: float = 0.0
+
+    def record_call(self) -> None:
+        """Record a call entering the policy."""
+        self.total_calls += 1
+
+    def record_retry(self, delay: float) -> None:
+        """Record a retry and the delay that preceded it."""
+        self.total_retries += 1
+        self.total_delay += delay
+
+    def record_exhausted(self) -> None:
+        """Record a call that gave up."""
+        self.exhausted += 1
+
+    def record_budget_rejection(self) -> None:
+        """Record a retry denied by the budget."""
+        self.budget_rejections += 1
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a fraction of regular calls.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws
+    one, so retries stay below ``ratio`` times the call volume. A floor of
+    ``min_per_second`` tokens is refilled over time so that low-traffic
+    clients can still retry. The bucket holds at most ``max_tokens``.
+
+    Share one budget between all policies talking to the same dependency.
+
+    Args:
+        ratio: Tokens deposited per call (0.1 = retries up to 10% of calls).
+        min_per_second: Tokens refilled per second regardless of traffic.
+        max_tokens: Bucket capacity (also the initial token count).
+
+    Examples:
+        >>> budget = RetryBudget(ratio=0.5, min_per_second=0.0, max_tokens=1)
+        >>> budget.try_withdraw()
+        True
+        >>> budget.try_withdraw()
+        False
+        >>> budget.deposit()
+        >>> budget.deposit()
+        >>> budget.try_withdraw()
+        True
+    """
+
+    def __init__(
+        self,
+        *,
+        ratio: float = 0.1,
+        min_per_second: float = 1.0,
+        max_tokens: float = 10.0,
+    ) -> None:
+        """Initialize retry budget.
+
+        Args:
+            ratio: Tokens deposited per call.
+            min_per_second: Tokens refilled per second.
+            max_tokens: Bucket capacity.
+
+        Raises:
+            ValueError: If a parameter is negative or max_tokens is below 1.
+        """
+        if ratio < 0:
+            raise ValueError("ratio must not be negative")
+        if min_per_second < 0:
+            raise ValueError("min_per_second must not be negative")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+
+        self._ratio = float(ratio)
+        self._min_per_second = float(min_per_second)
+        self._max_tokens = float(max_tokens)
+        self._tokens = self._max_tokens
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Current available tokens (after refill)."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self) -> None:
+        """Add the time-based floor refill. Must hold lock."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if elapsed > 0 and self._min_per_second:
+            self._tokens = min(self._max_tokens, self._tokens + elapsed * self._min_per_second)
+
+    def deposit(self) -> None:
+        """Credit the budget for one regular call."""
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_withdraw(self) -> bool:
+        """Take one token for a retry.
+
+        Returns:
+            True if the retry is allowed, False if the budget is exhausted.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"RetryBudget(ratio={self._ratio}, min_per_second={self._min_per_second}, max_tokens={self._max_tokens})"
+
+
+class RetryPolicy:
+    """Retry engine with exponential backoff, jitter and deadlines.
+
+    Args:
+        max_attempts: Total attempts including the first one.
+        base_delay: Delay before the first retry (seconds).
+        max_delay: Upper bound for computed delays (seconds).
+        multiplier: Exponential growth factor between retries.
+        jitter: ``"none"``, ``"full"`` (uniform in [0, backoff]) or
+            ``"decorrelated"`` (uniform in [base, 3 * previous]).
+        deadline: Overall time budget for all attempts (seconds).
+        retry_on: Exception types that trigger a retry.
+        budget: Optional shared :class:`RetryBudget`.
+        retry_after: Callable extracting a ``Retry-After`` delay from an
+            exception. Defaults to reading its ``retry_after`` attribute.
+        name: Optional name for logging.
+
+    Examples:
+        >>> policy = RetryPolicy(max_attempts=3, base_delay=1.0, jitter="none")
+        >>> [policy.compute_delay(n) for n in (1, 2, 3)]
+        [1.0, 2.0, 4.0]
+
+        >>> attempts = []
+        >>> def flaky():
+        ...     attempts.append(1)
+        ...     if len(attempts) < 3:
+        ...         raise ConnectionError("reset")
+        ...     return "ok"
+        >>> RetryPolicy(max_attempts=3, base_delay=0.0).call(flaky)
+        'ok'
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: JitterMode = "full",
+        deadline: float | None = None,
+        retry_on: tuple[type[BaseException], ...] = (Exception,),
+        budget: RetryBudget | None = None,
+        retry_after: Callable[[BaseException], float | None] | None = retry_after_from_exception,
+        name: str | None = None,
+    ) -> None:
+        """Initialize retry policy.
+
+        Args:
+            max_attempts: Total attempts including the first one.
+            base_delay: Delay before the first retry in seconds.
+            max_delay: Upper bound for computed delays in seconds.
+            multiplier: Exponential growth factor.
+            jitter: Jitter mode.
+            deadline: Overall time budget in seconds (None = unbounded).
+            retry_on: Exception types that trigger a retry.
+            budget: Optional shared retry budget.
+            retry_after: Extractor for server-provided retry delays (None disables).
+            name: Optional name for logging.
+
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError("delays must not be negative")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        if jitter not in ("none", "full", "decorrelated"):
+            raise ValueError(f"jitter must be 'none', 'full' or 'decorrelated', got {jitter!r}")
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive")
+
+        self._max_attempts = max_attempts
+        self._base_delay = float(base_delay)
+        self._max_delay = float(max_delay)
+        self._multiplier = float(multiplier)
+        self._jitter = jitter
+        self._deadline = deadline
+        self._retry_on = retry_on
+        self._budget = budget
+        self._retry_after = retry_after
+        self._name = name
+        self._random = random.Random()  # noqa: S311 - jitter, not cryptography
+        self._stats = RetryStats()
+
+    @property
+    def max_attempts(self) -> int:
+        """Total attempts including the first one."""
+        return self._max_attempts
+
+    @property
+    def budget(self) -> RetryBudget | None:
+        """Shared retry budget, if any."""
+        return self._budget
+
+    @property
+    def stats(self) -> RetryStats:
+        """Statistics for this policy."""
+        return self._stats
+
+    @property
+    def name(self) -> str | None:
+        """Name of this policy."""
+        return self._name
+
+    def compute_delay(self, retry_number: int, previous_delay: float | None = None) -> float:
+        """Compute the delay before a given retry.
+
+        Args:
+            retry_number: 1 for the first retry, 2 for the second, etc.
+            previous_delay: Delay used before the previous retry (decorrelated jitter).
+
+        Returns:
+            Delay in seconds, bounded by ``max_delay``.
+        """
+        if self._jitter == "decorrelated":
+            previous = previous_delay if previous_delay is not None else self._base_delay
+            upper = max(self._base_delay, previous * 3)
+            return min(self._max_delay, self._random.uniform(self._base_delay, upper))
+
+        backoff = min(self._max_delay, self._base_delay * self._multiplier ** (retry_number - 1))
+        if self._jitter == "full":
+            return self._random.uniform(0.0, backoff)
+        return backoff
+
+    def _next_delay(
+        self,
+        exc: BaseException,
+        attempt: int,
+        previous_delay: float | None,
+        started: float,
+    ) -> float:
+        """Decide whether to retry after ``attempt`` failed and return the delay.
+
+        Raises:
+            RetryExhaustedError: If attempts, deadline or budget are exhausted.
+        """
+        label = self._name or "unnamed"
+        if attempt >= self._max_attempts:
+            self._stats.record_exhausted()
+            raise RetryExhaustedError(
+                f"Retry policy '{label}' gave up after {attempt} attempts: {exc}",
+                attempts=attempt,
+                last_error=exc,
+                reason="attempts",
+            ) from exc
+
+        delay = self.compute_delay(attempt, previous_delay)
+        hint = self._retry_after(exc) if self._retry_after is not None else None
+        if hint is not None:
+            delay = max(delay, hint)
+
+        if self._deadline is not None and time.monotonic() + delay - started > self._deadline:
+            self._stats.record_exhausted()
+            raise RetryExhaustedError(
+                f"Retry policy '{label}' deadline of {self._deadline}s exceeded: {exc}",
+                attempts=attempt,
+                last_error=exc,
+                reason="deadline",
+            ) from exc
+
+        left = remaining_time()
+        if left is not None and delay >= left:
+            self._stats.record_exhausted()
+            raise RetryExhaustedError(
+                f"Retry policy '{label}' stopped, caller deadline leaves {max(left, 0.0):.3f}s: {exc}",
+                attempts=attempt,
+                last_error=exc,
+                reason="deadline",
+            ) from exc
+
+        if self._budget is not None and not self._budget.try_withdraw():
+            self._stats.record_budget_rejection()
+            self._stats.record_exhausted()
+            raise RetryExhaustedError(
+                f"Retry policy '{label}' budget exhausted: {exc}",
+                attempts=attempt,
+                last_error=exc,
+                reason="budget",
+            ) from exc
+
+        log.debug("Retry %d/%d for '%s' in %.3fs: %s", attempt, self._max_attempts - 1, label, delay, exc)
+        self._stats.record_retry(delay)
+        return delay
+
+    def _start(self) -> float:
+        """Record a call and credit the budget. Returns the start time."""
+        self._stats.record_call()
+        if self._budget is not None:
+            self._budget.deposit()
+        return time.monotonic()
+
+    def call(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Execute a function, retrying on failure.
+
+        Args:
+            func: Function to execute.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Function result.
+
+        Raises:
+            RetryExhaustedError: If the call kept failing until a limit was hit.
+        """
+        started = self._start()
+        delay: float | None = None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return func(*args, **kwargs)
+            except self._retry_on as exc:
+                delay = self._next_delay(exc, attempt, delay, started)
+            time.sleep(delay)
+
+    async def acall(
+        self,
+        func: Callable[P, Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """Execute an async function, retrying on failure.
+
+        Args:
+            func: Async function to execute.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Function result.
+
+        Raises:
+            RetryExhaustedError: If the call kept failing until a limit was hit.
+
+        Examples:
+            >>> async def ok(): return 1
+            >>> asyncio.run(RetryPolicy().acall(ok))
+            1
+        """
+        started = self._start()
+        delay: float | None = None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await func(*args, **kwargs)
+            except self._retry_on as exc:
+                delay = self._next_delay(exc, attempt, delay, started)
+            await asyncio.sleep(delay)
+
+    def __call__(self, func: Callable[P, R]) -> Callable[P, R] | Callable[P, Awaitable[R]]:
+        """Use the policy as a decorator.
+
+        Args:
+            func: Function to wrap.
+
+        Returns:
+            Wrapped function retried according to this policy.
+        """
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                return await self.acall(func, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            return self.call(func, *args, **kwargs)
+
+        return sync_wrapper
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        name_part = f", name={self._name!r}" if self._name else ""
+        return (
+            f"RetryPolicy(max_attempts={self._max_attempts}, base_delay={self._base_delay}, "
+            f"jitter={self._jitter!r}{name_part})"
+        )
+
+
+@overload
+def retry(func: Callable[P, R]) -> Callable[P, R]: ...
+
+
+@overload
+def retry(
+    *,
+    max_attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    multiplier: float = 2.0,
+    jitter: JitterMode = "full",
+    deadline: float | None = None,
+    retry_on: tuple[type[BaseException], ...] = (Exception,),
+    budget: RetryBudget | None = None,
+    name: str | None = None,
+) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
+
+
+def retry(
+    func: Callable[P, R] | None = None,
+    *,
+    max_attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    multiplier: float = 2.0,
+    jitter: JitterMode = "full",
+    deadline: float | None = None,
+    retry_on: tuple[type[BaseException], ...] = (Exception,),
+    budget: RetryBudget | None = None,
+    name: str | None = None,
+) -> Callable[P, R] | Callable[[Callable[P, R]], Callable[P, R]]:
+    """Retry decorator for sync and async functions.
+
+    Can be used with or without arguments:
+
+    Examples:
+        Without arguments (3 attempts, full jitter):
+
+        >>> @retry
+        ... def fetch():  # doctest: +SKIP
+        ...     pass
+
+        Only network errors, bounded by a 10s deadline:
+
+        >>> @retry(max_attempts=5, retry_on=(ConnectionError,), deadline=10.0)
+        ... async def fetch_async():  # doctest: +SKIP
+        ...     pass
+    """
+    policy = RetryPolicy(
+        max_attempts=max_attempts,
+        base_delay=base_delay,
+        max_delay=max_delay,
+        multiplier=multiplier,
+        jitter=jitter,
+        deadline=deadline,
+        retry_on=retry_on,
+        budget=budget,
+        name=name,
+    )
+
+    if func is not None:
+        return policy(func)  # type: ignore[return-value]
+    return policy  # type: ignore[return-value]
+
+
+__all__ = [
+    "JitterMode",
+    "RetryBudget",
+    "RetryPolicy",
+    "RetryStats",
+    "retry",
+    "retry_after_from_exception",
+]
@@ -1,17 +1,25 @@
-"""Graceful shutdown handler with prioritized cleanup callbacks."""
+"""Graceful shutdown handler with prioritized cleanup callbacks.
+
+Callbacks run in priority groups: lower priorities first, and all callbacks
+that share a priority run concurrently (sync callbacks in threads, async
+callbacks as tasks). Each callback keeps its own timeout. Every run produces
+a :class:`ShutdownReport` with per-callback status and duration.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import contextlib
 import inspect
+import itertools
 import logging
 import signal
 import sys
 import threading
+import time
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from typing_extensions import Self
 
@@ -31,6 +39,7 @@
 SyncCallback = Callable[[], None]
 AsyncCallback = Callable[[], Coroutine[Any, Any, None]]
 Callback = SyncCallback | AsyncCallback
+CleanupStatus = Literal["ok", "timeout", "error"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -63,14 +72,90 @@ class CleanupCallback:
     is_async: bool = False
 
 
+@dataclass(frozen=True, slots=True)
+class CleanupResult:
+    """Outcome of one cleanup callback.
+
+    Attributes:
+        name: Callback identifier.
+        priority: Priority group the callback ran in.
+        status: ``"ok"``, ``"timeout"`` or ``"error"``.
+        duration: Seconds spent (the timeout, if the callback timed out).
+        error: Error message when status is ``"error"``.
+
+    Examples:
+        >>> CleanupResult("db", 10, "ok", 0.25).duration
+        0.25
+    """
+
+    name: str
+    priority: int
+    status: CleanupStatus
+    duration: float
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ShutdownReport:
+    """Per-callback timings of a shutdown run.
+
+    Attributes:
+        results: One result per callback, in execution order.
+        duration: Wall-clock seconds for the whole run.
+
+    Examples:
+        >>> report = ShutdownReport(
+        ...     results=(CleanupResult("db", 10, "ok", 0.2), CleanupResult("ws", 10, "timeout", 5.0)),
+        ...     duration=5.0,
+        ... )
+        >>> report.timed_out
+        ['ws']
+        >>> [r.name for r in report.slowest(1)]
+        ['ws']
+    """
+
+    results: tuple[CleanupResult, ...]
+    duration: float
+
+    @property
+    def timed_out(self) -> list[str]:
+        """Names of callbacks that exceeded their timeout."""
+        return [r.name for r in self.results if r.status == "timeout"]
+
+    @property
+    def failed(self) -> list[str]:
+        """Names of callbacks that raised."""
+        return [r.name for r in self.results if r.status == "error"]
+
+    def slowest(self, n: int = 5) -> list[CleanupResult]:
+        """Return the ``n`` slowest callbacks, slowest first."""
+        return sorted(self.results, key=lambda r: r.duration, reverse=True)[:n]
+
+    def format(self) -> str:
+        """Render the report as a plain-text table.
+
+        Examples:
+            >>> print(ShutdownReport((CleanupResult("db", 10, "ok", 0.2),), 0.2).format())
+            priority  name  status  duration
+                  10  db    ok        0.200s
+            total: 0.200s
+        """
+        width = max([4, *(len(r.name) for r in self.results)])
+        lines = [f"priority  {'name':<{width}}  status  duration"]
+        lines.extend(f"{r.priority:>8}  {r.name:<{width}}  {r.status:<7} {r.duration:>7.3f}s" for r in self.results)
+        lines.append(f"total: {self.duration:.3f}s")
+        return "\n".join(lines)
+
+
 class GracefulShutdown:
     """Graceful shutdown handler with prioritized cleanup callbacks.
 
     Manages orderly shutdown on SIGTERM/SIGINT with timeout enforcement.
-    Callbacks execute in priority order (lower = first).
+    Callbacks execute in priority order (lower = first). Callbacks sharing a
+    priority run concurrently, each bounded by its own timeout.
 
     Args:
-        timeout: Total timeout for all callbacks (default from config).
+        timeout: Default per-callback timeout (default from config).
         signals: Signals to handle (default: SIGTERM, SIGINT).
         force_exit_code: Exit code when timeout exceeded (default: 1).
 
@@ -134,6 +219,7 @@ def __init__(
         # Shutdown state
         self._shutting_down = False
         self._shutdown_event = threading.Event()
+        self._report: ShutdownReport | None = None
 
         # Original signal handlers (for restoration)
         self._original_handlers: dict[signal.Signals, Any] = {}
@@ -154,6 +240,11 @@ def is_installed(self) -> bool:
         """Return True if signal handlers are installed."""
         return self._installed
 
+    @property
+    def report(self) -> ShutdownReport | None:
+        """Return the report of the last shutdown run, if any."""
+        return self._report
+
     def register(
         self,
         name: str,
@@ -169,6 +260,7 @@ def register(
             callback: Cleanup function (sync or async).
             priority: Execution order (lower runs first, default 100).
             timeout: Per-callback timeout (None = use global).
+                Callbacks with the same priority run concurrently.
 
         Raises:
             ShutdownError: If name already registered or shutdown in progress.
@@ -250,97 +342,162 @@ def _signal_handler(self, _signum: int, _frame: types.FrameType | None) -> None:
         """Handle incoming signal."""
         self.trigger()
 
-    def trigger(self) -> None:
+    def trigger(self) -> ShutdownReport | None:
         """Trigger shutdown programmatically.
 
         Useful for testing or triggering shutdown from code.
-        Runs callbacks synchronously in priority order.
+        Runs priority groups in order; callbacks within a group run in
+        parallel threads.
+
+        Returns:
+            Report of the run, or None if shutdown was already in progress.
+
+        Examples:
+            >>> shutdown = GracefulShutdown()
+            >>> shutdown.register("db", lambda: None)
+            >>> shutdown.trigger().results[0].status
+            'ok'
         """
         with self._lock:
             if self._shutting_down:
-                return
+                return None
             self._shutting_down = True
 
         log.info("Shutdown requested")
         self._shutdown_event.set()
-        self._run_callbacks_sync()
+        return self._finish(self._run_callbacks_sync())
 
-    async def atrigger(self) -> None:
+    async def atrigger(self) -> ShutdownReport | None:
         """Trigger shutdown programmatically (async version).
 
-        Runs callbacks asynchronously in priority order.
+        Runs priority groups in order; callbacks within a group run as
+        concurrent tasks (sync callbacks in the default executor).
+
+        Returns:
+            Report of the run, or None if shutdown was already in progress.
         """
         with self._lock:
             if self._shutting_down:
-                return
+                return None
             self._shutting_down = True
 
         log.info("Shutdown requested")
         self._shutdown_event.set()
-        await self._run_callbacks_async()
+        return self._finish(await self._run_callbacks_async())
+
+    def _finish(self, report: ShutdownReport) -> ShutdownReport:
+        """Store and log the report of a shutdown run."""
+        self._report = report
+        log.info(
+            "Shutdown callbacks finished in %.3fs (%d run, %d timed out, %d failed)",
+            report.duration,
+            len(report.results),
+            len(report.timed_out),
+            len(report.failed),
+        )
+        for result in report.slowest(len(report.results)):
+            log.debug("Shutdown callback '%s': %s in %.3fs", result.name, result.status, result.duration)
+        return report
 
     def _get_sorted_callbacks(self) -> list[CleanupCallback]:
         """Return callbacks sorted by priority (ascending)."""
         with self._lock:
             return sorted(self._callbacks.values(), key=lambda cb: cb.priority)
 
-    def _run_callbacks_sync(self) -> None:
-        """Run all callbacks synchronously with timeout."""
-        callbacks = self._get_sorted_callbacks()
+    def _get_priority_groups(self) -> list[list[CleanupCallback]]:
+        """Return callbacks grouped by priority, lowest priority first."""
+        return [list(group) for _, group in itertools.groupby(self._get_sorted_callbacks(), key=lambda cb: cb.priority)]
+
+    def _timeout_for(self, cb: CleanupCallback) -> float:
+        """Return the effective timeout of a callback."""
+        return cb.timeout if cb.timeout is not None else self._timeout
+
+    def _run_callbacks_sync(self) -> ShutdownReport:
+        """Run all priority groups in order, each group in parallel threads."""
+        started = time.monotonic()
+        results: list[CleanupResult] = []
+        for group in self._get_priority_groups():
+            results.extend(self._run_group_sync(group))
+        return ShutdownReport(results=tuple(results), duration=time.monotonic() - started)
+
+    def _run_group_sync(self, group: list[CleanupCallback]) -> list[CleanupResult]:
+        """Start one thread per callback and wait for each up to its timeout.
 
-        for cb in callbacks:
-            cb_timeout = cb.timeout if cb.timeout is not None else self._timeout
+        A callback still running at its timeout is reported as timed out and
+        left to finish in its (daemon) thread.
+        """
+        outcomes: dict[str, CleanupResult] = {}
+        running: list[tuple[CleanupCallback, threading.Thread, float]] = []
+        for cb in group:
+            thread = threading.Thread(
+                target=self._run_one_sync,
+                args=(cb, outcomes),
+                name=f"kstlib-shutdown-{cb.name}",
+                daemon=True,
+            )
+            running.append((cb, thread, time.monotonic()))
+            thread.start()
 
+        for cb, thread, cb_started in running:
+            thread.join(timeout=max(0.0, cb_started + self._timeout_for(cb) - time.monotonic()))
+            if thread.is_alive():
+                log.warning("Shutdown callback '%s' timed out", cb.name)
+                outcomes.setdefault(cb.name, CleanupResult(cb.name, cb.priority, "timeout", self._timeout_for(cb)))
+        return [outcomes[cb.name] for cb in group]
+
+    def _run_one_sync(self, cb: CleanupCallback, outcomes: dict[str, CleanupResult]) -> None:
+        """Thread body: run one callback and record its outcome."""
+        started = time.monotonic()
+        status: CleanupStatus = "ok"
+        error: str | None = None
+        try:
             if cb.is_async:
-                # Run async callback in new event loop
+                # Async callback gets its own event loop in this thread
                 async_callback = cast("AsyncCallback", cb.callback)
-                try:
-                    loop = asyncio.new_event_loop()
-                    try:
-                        loop.run_until_complete(asyncio.wait_for(async_callback(), timeout=cb_timeout))
-                    finally:
-                        loop.close()
-                except asyncio.TimeoutError:
-                    log.warning("Shutdown callback '%s' timed out", cb.name)
-                except Exception:  # pylint: disable=broad-exception-caught
-                    # Intentional: shutdown must continue even if callback fails
-                    log.warning("Shutdown callback '%s' failed", cb.name, exc_info=True)
+                asyncio.run(asyncio.wait_for(async_callback(), timeout=self._timeout_for(cb)))
             else:
-                # Run sync callback with timeout via thread
-                # Wrap in suppress to prevent unhandled thread exceptions
-                def safe_callback(fn: SyncCallback) -> None:
-                    with contextlib.suppress(Exception):
-                        fn()
-
-                sync_callback = cast("SyncCallback", cb.callback)
-                thread = threading.Thread(target=safe_callback, args=(sync_callback,))
-                thread.start()
-                thread.join(timeout=cb_timeout)
-                # If thread still running after timeout, we continue anyway
-
-    async def _run_callbacks_async(self) -> None:
-        """Run all callbacks asynchronously with timeout."""
-        callbacks = self._get_sorted_callbacks()
-
-        for cb in callbacks:
-            cb_timeout = cb.timeout if cb.timeout is not None else self._timeout
-
-            try:
-                if cb.is_async:
-                    async_cb = cast("AsyncCallback", cb.callback)
-                    await asyncio.wait_for(async_cb(), timeout=cb_timeout)
-                else:
-                    # Run sync callback in executor
-                    loop = asyncio.get_running_loop()
-                    await asyncio.wait_for(
-                        loop.run_in_executor(None, cb.callback),
-                        timeout=cb_timeout,
-                    )
-            except asyncio.TimeoutError:
-                log.warning("Shutdown callback '%s' timed out", cb.name)
-            except Exception:  # pylint: disable=broad-exception-caught
-                # Intentional: shutdown must continue even if callback fails
-                log.warning("Shutdown callback '%s' failed", cb.name, exc_info=True)
+                cast("SyncCallback", cb.callback)()
+        except asyncio.TimeoutError:
+            log.warning("Shutdown callback '%s' timed out", cb.name)
+            status = "timeout"
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Intentional: shutdown must continue even if callback fails
+            log.warning("Shutdown callback '%s' failed", cb.name, exc_info=True)
+            status, error = "error", str(exc)
+        # setdefault: the waiting side may already have recorded a timeout
+        outcomes.setdefault(cb.name, CleanupResult(cb.name, cb.priority, status, time.monotonic() - started, error))
+
+    async def _run_callbacks_async(self) -> ShutdownReport:
+        """Run all priority groups in order, each group as concurrent tasks."""
+        started = time.monotonic()
+        results: list[CleanupResult] = []
+        for group in self._get_priority_groups():
+            results.extend(await asyncio.gather(*(self._run_one_async(cb) for cb in group)))
+        return ShutdownReport(results=tuple(results), duration=time.monotonic() - started)
+
+    async def _run_one_async(self, cb: CleanupCallback) -> CleanupResult:
+        """Run one callback with its timeout and return its outcome."""
+        started = time.monotonic()
+        cb_timeout = self._timeout_for(cb)
+        try:
+            if cb.is_async:
+                async_cb = cast("AsyncCallback", cb.callback)
+                await asyncio.wait_for(async_cb(), timeout=cb_timeout)
+            else:
+                # Run sync callback in executor
+                loop = asyncio.get_running_loop()
+                await asyncio.wait_for(
+                    loop.run_in_executor(None, cb.callback),
+                    timeout=cb_timeout,
+                )
+        except asyncio.TimeoutError:
+            log.warning("Shutdown callback '%s' timed out", cb.name)
+            return CleanupResult(cb.name, cb.priority, "timeout", time.monotonic() - started)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Intentional: shutdown must continue even if callback fails
+            log.warning("Shutdown callback '%s' failed", cb.name, exc_info=True)
+            return CleanupResult(cb.name, cb.priority, "error", time.monotonic() - started, str(exc))
+        return CleanupResult(cb.name, cb.priority, "ok", time.monotonic() - started)
 
     def wait(self, timeout: float | None = None) -> bool:
         """Wait for shutdown signal.
@@ -414,4 +571,4 @@ async def __aexit__(
             await self.atrigger()
 
 
-__all__ = ["CleanupCallback", "GracefulShutdown"]
+__all__ = ["CleanupCallback", "CleanupResult", "CleanupStatus", "GracefulShutdown", "ShutdownReport"]
@@ -3,6 +3,21 @@
 Provides configurable timeout monitoring for long-running operations,
 with automatic callback invocation when activity stops.
 
+Watchdogs do not own threads or tasks. Sync watchdogs register deadlines
+with one process-wide timer thread (see ``kstlib.resilience._timers``) and
+run their checks on a small shared worker pool. Async watchdogs schedule
+their checks on the event loop timer heap (``loop.call_later``). Thread
+count and wake-ups therefore stay flat as watchdogs are added. When a sync
+watchdog fires, its ``on_timeout`` callback runs on a short-lived thread of
+its own, so a blocking callback never delays the checks of other watchdogs. A ping-based
+watchdog wakes up once per ``timeout`` instead of polling.
+
+Instead of pings, a watchdog can poll a heartbeat JSON state file
+(:meth:`Watchdog.from_state_file`) or a shared
+:class:`~kstlib.resilience.heartbeat_table.HeartbeatTable`
+(:meth:`Watchdog.from_heartbeat_table`). One table watchdog can supervise a
+whole fleet of processes.
+
 Examples:
     Basic usage with callback:
 
@@ -26,6 +41,7 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import contextlib
 import inspect
 import json
@@ -36,7 +52,7 @@
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from typing_extensions import Self
 
@@ -47,8 +63,12 @@
     clamp_with_limits,
     get_resilience_limits,
 )
+from kstlib.resilience._timers import TimerHandle, get_callback_executor, get_scheduler
 from kstlib.resilience.exceptions import WatchdogTimeoutError
 
+if TYPE_CHECKING:
+    from kstlib.resilience.heartbeat_table import HeartbeatTable
+
 log = logging.getLogger(__name__)
 
 # Type alias for alert callback
@@ -171,12 +191,17 @@ def __init__(
         self._triggered = False
         self._shutdown_requested = False
         self._lock = threading.Lock()
-        self._stop_event = threading.Event()
-        self._thread: threading.Thread | None = None
-        self._async_task: asyncio.Task[None] | None = None
-        self._callback_task: asyncio.Task[None] | None = None
-
-        # State file monitoring (when using from_state_file)
+        self._check_interval = min(1.0, self._timeout / 4)
+        self._generation = 0  # Bumped on start/stop so stale timers are ignored
+        self._timer: TimerHandle | asyncio.TimerHandle | None = None
+        self._tick_future: concurrent.futures.Future[None] | None = None
+        self._tick_thread: int | None = None
+        self._async_tick_task: asyncio.Task[None] | None = None
+
+        # Liveness probe (from_state_file / from_heartbeat_table) replacing pings
+        self._probe: Callable[[], bool] | None = None
+        self._probe_blocking = False  # Run in executor from async code
+        self._probe_alert: Callable[[], tuple[str, dict[str, Any]]] | None = None
         self._state_file: Path | None = None
         self._max_age: float = 30.0
 
@@ -265,6 +290,77 @@ def from_state_file(
         )
         instance._state_file = Path(state_file)
         instance._max_age = max_age
+        instance._probe = instance._is_state_file_alive
+        instance._probe_blocking = True
+        instance._probe_alert = lambda: (
+            f"Heartbeat state file is stale: {state_file}",
+            {"state_file": str(state_file), "max_age": max_age},
+        )
+        return instance
+
+    @classmethod
+    def from_heartbeat_table(
+        cls,
+        table: HeartbeatTable,
+        slot_name: str | None = None,
+        *,
+        check_interval: float | None = None,
+        max_age: float = 30.0,
+        on_timeout: Callable[[], None] | Callable[[], Awaitable[None]] | None = None,
+        on_alert: OnAlertCallback | None = None,
+        name: str | None = None,
+    ) -> Self:
+        """Create a watchdog that monitors a shared heartbeat table.
+
+        With ``slot_name`` the watchdog tracks one slot, and a missing slot
+        counts as dead. Without it, the watchdog supervises every occupied
+        slot and triggers when any of them is older than ``max_age``. The
+        alert context lists the dead slots.
+
+        Args:
+            table: Heartbeat table to scan.
+            slot_name: Slot to monitor (None = all slots).
+            check_interval: Seconds between scans (defaults to max_age/2).
+            max_age: Maximum slot age in seconds before triggering timeout.
+            on_timeout: Callback for timeout events.
+            on_alert: Callback for alerting (channel, message, context).
+            name: Optional identifier.
+
+        Returns:
+            Configured Watchdog instance.
+
+        Examples:
+            >>> table = HeartbeatTable("/dev/shm/fleet.hbt")  # doctest: +SKIP
+            >>> wd = Watchdog.from_heartbeat_table(  # doctest: +SKIP
+            ...     table,
+            ...     max_age=30.0,
+            ...     on_alert=notify_ops,
+            ... )
+            >>> await wd.astart()  # doctest: +SKIP
+        """
+        interval = check_interval if check_interval is not None else max_age / 2
+        instance = cls(
+            timeout=interval,
+            on_timeout=on_timeout,
+            on_alert=on_alert,
+            name=name or f"heartbeat_table_watcher:{slot_name or table.path}",
+        )
+        instance._max_age = max_age
+        dead: list[str] = []
+
+        def probe() -> bool:
+            if slot_name is None:
+                dead[:] = [info.name for info in table.dead(max_age)]
+            else:
+                info = table.find(slot_name)
+                dead[:] = [] if info is not None and info.is_alive(max_age) else [slot_name]
+            return not dead
+
+        instance._probe = probe
+        instance._probe_alert = lambda: (
+            f"Heartbeat slots are stale: {', '.join(dead)}",
+            {"table": str(table.path), "slots": list(dead), "max_age": max_age},
+        )
         return instance
 
     def shutdown(self) -> None:
@@ -306,7 +402,7 @@ async def aping(self) -> None:
         self.ping()
 
     def start(self) -> None:
-        """Start watchdog monitoring in a background thread.
+        """Start watchdog monitoring on the shared timer thread.
 
         Raises:
             RuntimeError: If watchdog is already running.
@@ -324,12 +420,10 @@ def start(self) -> None:
 
             self._running = True
             self._triggered = False
-            self._stop_event.clear()
             self._last_ping = time.monotonic()
             self._stats.record_start()
-
-        self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self._thread.start()
+            self._generation += 1
+            self._schedule_sync(self._generation)
 
     def stop(self) -> None:
         """Stop watchdog monitoring.
@@ -347,12 +441,14 @@ def stop(self) -> None:
             if not self._running:
                 return
             self._running = False
+            self._generation += 1
+            self._cancel_timer()
+            tick = self._tick_future
 
-        self._stop_event.set()
-
-        if self._thread is not None:
-            self._thread.join(timeout=1.0)
-            self._thread = None
+        # Let an in-flight check finish (unless stop() is called from it)
+        if tick is not None and self._tick_thread != threading.get_ident():
+            with contextlib.suppress(concurrent.futures.TimeoutError, concurrent.futures.CancelledError):
+                tick.result(timeout=1.0)
 
     async def astart(self) -> None:
         """Start watchdog monitoring asynchronously.
@@ -366,11 +462,10 @@ async def astart(self) -> None:
 
             self._running = True
             self._triggered = False
-            self._stop_event.clear()
             self._last_ping = time.monotonic()
             self._stats.record_start()
-
-        self._async_task = asyncio.create_task(self._async_monitor_loop())
+            self._generation += 1
+            self._schedule_async(asyncio.get_running_loop(), self._generation)
 
     async def astop(self) -> None:
         """Stop watchdog monitoring asynchronously.
@@ -381,14 +476,14 @@ async def astop(self) -> None:
             if not self._running:
                 return
             self._running = False
+            self._generation += 1
+            self._cancel_timer()
+            task = self._async_tick_task
 
-        self._stop_event.set()
-
-        if self._async_task is not None:
-            self._async_task.cancel()
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
-                await self._async_task
-            self._async_task = None
+                await task
 
     def reset(self) -> None:
         """Reset watchdog state without stopping.
@@ -399,28 +494,72 @@ def reset(self) -> None:
             self._last_ping = time.monotonic()
             self._triggered = False
 
-    def _monitor_loop(self) -> None:
-        """Background thread monitoring loop."""
-        check_interval = min(1.0, self._timeout / 4)
+    def _next_delay(self) -> float:
+        """Seconds until the next check is useful. Must hold lock.
 
-        while not self._stop_event.wait(timeout=check_interval):
-            if self._shutdown_requested:
-                break
+        A ping-based watchdog only needs to wake up when the timeout would
+        expire. State files and triggered watchdogs are polled instead.
+        """
+        if self._probe is not None or self._triggered:
+            return self._check_interval
+        remaining = self._last_ping + self._timeout - time.monotonic()
+        return max(remaining, 0.0)
+
+    def _cancel_timer(self) -> None:
+        """Cancel the pending timer. Must hold lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _is_current(self, generation: int) -> bool:
+        """Return True if a timer of ``generation`` should still act. Must hold lock."""
+        return self._running and not self._shutdown_requested and generation == self._generation
+
+    def _schedule_sync(self, generation: int) -> None:
+        """Schedule the next sync check on the shared timer thread. Must hold lock."""
+        self._timer = get_scheduler().call_later(self._next_delay(), lambda: self._on_sync_timer(generation))
+
+    def _on_sync_timer(self, generation: int) -> None:
+        """Timer thread callback: hand the check to the worker pool."""
+        with self._lock:
+            if not self._is_current(generation):
+                return
+            self._tick_future = get_callback_executor().submit(self._sync_tick, generation)
+
+    def _sync_tick(self, generation: int) -> None:
+        """Run one sync check on a worker thread and schedule the next one."""
+        self._tick_thread = threading.get_ident()
+        try:
             self._check_timeout()
+        finally:
+            self._tick_thread = None
+        with self._lock:
+            if self._is_current(generation):
+                self._schedule_sync(generation)
 
-    async def _async_monitor_loop(self) -> None:
-        """Async monitoring loop."""
-        check_interval = min(1.0, self._timeout / 4)
+    def _schedule_async(self, loop: asyncio.AbstractEventLoop, generation: int) -> None:
+        """Schedule the next async check on the loop timer heap. Must hold lock."""
+        self._timer = loop.call_later(self._next_delay(), self._on_async_timer, loop, generation)
 
-        while self._running and not self._shutdown_requested:
-            await asyncio.sleep(check_interval)
-            await self._async_check_timeout()
+    def _on_async_timer(self, loop: asyncio.AbstractEventLoop, generation: int) -> None:
+        """Loop timer callback: run the check as a task (callbacks may await)."""
+        with self._lock:
+            if not self._is_current(generation):
+                return
+        self._async_tick_task = loop.create_task(self._async_tick(loop, generation))
+
+    async def _async_tick(self, loop: asyncio.AbstractEventLoop, generation: int) -> None:
+        """Run one async check and schedule the next one."""
+        await self._async_check_timeout()
+        with self._lock:
+            if self._is_current(generation):
+                self._schedule_async(loop, generation)
 
     def _check_timeout(self) -> None:
         """Check for timeout and invoke callback if needed."""
-        # If monitoring a state file, check that instead of ping time
-        if self._state_file is not None:
-            self._check_state_file_sync()
+        # If monitoring a state file or table, check that instead of ping time
+        if self._probe is not None:
+            self._check_probe_sync()
             return
 
         with self._lock:
@@ -434,25 +573,14 @@ def _check_timeout(self) -> None:
             self._triggered = True
             self._stats.record_timeout()
 
-        # Invoke callback outside lock - suppress errors to prevent watchdog crash
-        if self._on_timeout is not None:
-            with contextlib.suppress(Exception):
-                result = self._on_timeout()
-                # Handle async callback in sync context
-                if inspect.iscoroutine(result):
-                    # Run async callback in new event loop
-                    try:
-                        loop = asyncio.get_running_loop()
-                        self._callback_task = loop.create_task(result)
-                    except RuntimeError:
-                        asyncio.run(result)
-
-    def _check_state_file_sync(self) -> None:
-        """Check heartbeat state file (sync version)."""
-        if self._state_file is None:
+        self._dispatch_callback()
+
+    def _check_probe_sync(self) -> None:
+        """Check the heartbeat state file or table (sync version)."""
+        if self._probe is None:
             return
 
-        is_alive = self._is_state_file_alive()
+        is_alive = self._probe()
 
         with self._lock:
             if is_alive:
@@ -466,12 +594,28 @@ def _check_state_file_sync(self) -> None:
             self._triggered = True
             self._stats.record_timeout()
 
-        # Invoke callbacks outside lock
-        if self._on_timeout is not None:
-            with contextlib.suppress(Exception):
-                result = self._on_timeout()
-                if inspect.iscoroutine(result):
-                    result.close()  # Cannot await in sync context
+        self._dispatch_callback()
+
+    def _dispatch_callback(self) -> None:
+        """Run the sync on_timeout callback on its own thread.
+
+        Checks share a small worker pool; a slow or blocking callback must not
+        hold a worker and delay the checks of other watchdogs.
+        """
+        if self._on_timeout is None:
+            return
+        thread_name = f"watchdog-callback-{self._name}" if self._name else "watchdog-callback"
+        threading.Thread(target=self._invoke_callback, name=thread_name, daemon=True).start()
+
+    def _invoke_callback(self) -> None:
+        """Callback thread body - suppress errors to prevent watchdog crash."""
+        if self._on_timeout is None:
+            return
+        with contextlib.suppress(Exception):
+            result = self._on_timeout()
+            # Async callback from a sync watchdog: run it in a new event loop
+            if inspect.iscoroutine(result):
+                asyncio.run(result)
 
     def _is_state_file_alive(self) -> bool:
         """Check if heartbeat state file is recent enough."""
@@ -490,9 +634,9 @@ def _is_state_file_alive(self) -> bool:
 
     async def _async_check_timeout(self) -> None:
         """Async version of timeout check."""
-        # If monitoring a state file, check that instead of ping time
-        if self._state_file is not None:
-            await self._check_state_file_async()
+        # If monitoring a state file or table, check that instead of ping time
+        if self._probe is not None:
+            await self._check_probe_async()
             return
 
         with self._lock:
@@ -513,14 +657,17 @@ async def _async_check_timeout(self) -> None:
                 if inspect.iscoroutine(result):
                     await result
 
-    async def _check_state_file_async(self) -> None:
-        """Check heartbeat state file (async version)."""
-        if self._state_file is None:
+    async def _check_probe_async(self) -> None:
+        """Check the heartbeat state file or table (async version)."""
+        if self._probe is None:
             return
 
-        # Run file check in executor to avoid blocking
-        loop = asyncio.get_running_loop()
-        is_alive = await loop.run_in_executor(None, self._is_state_file_alive)
+        if self._probe_blocking:
+            # Run file check in executor to avoid blocking
+            loop = asyncio.get_running_loop()
+            is_alive = await loop.run_in_executor(None, self._probe)
+        else:
+            is_alive = self._probe()
 
         with self._lock:
             if is_alive:
@@ -535,13 +682,10 @@ async def _check_state_file_async(self) -> None:
             self._stats.record_timeout()
 
         # Send alert if callback provided
-        if self._on_alert is not None:
+        if self._on_alert is not None and self._probe_alert is not None:
             with contextlib.suppress(Exception):
-                alert_result = self._on_alert(
-                    "watchdog",
-                    f"Heartbeat state file is stale: {self._state_file}",
-                    {"state_file": str(self._state_file), "max_age": self._max_age},
-                )
+                message, context = self._probe_alert()
+                alert_result = self._on_alert("watchdog", message, context)
                 if asyncio.iscoroutine(alert_result):
                     await alert_result
 
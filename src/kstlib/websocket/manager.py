@@ -47,6 +47,8 @@
 if TYPE_CHECKING:
     import types
 
+    from kstlib.resilience.adaptive_limiter import AdaptiveLimiter
+
 from kstlib.limits import get_websocket_limits
 from kstlib.websocket.exceptions import (
     WebSocketClosedError,
@@ -168,6 +170,8 @@ def __init__(
         disconnect_margin: float | None = None,
         # Queue settings
         queue_size: int | None = None,
+        # Flow control
+        send_limiter: AdaptiveLimiter | None = None,
         # Config
         config: Mapping[str, Any] | None = None,
     ) -> None:
@@ -193,6 +197,8 @@ def __init__(
             reconnect_check_interval: Seconds between should_reconnect checks.
             disconnect_margin: Seconds before platform limit to disconnect.
             queue_size: Maximum messages in queue (0 = unlimited).
+            send_limiter: Optional adaptive concurrency limiter for ``send()``.
+                Concurrent sends wait for a slot, and send latency drives the limit.
             config: Optional config mapping for limits resolution.
 
         Raises:
@@ -226,6 +232,7 @@ def __init__(
         )
         self._disconnect_margin = disconnect_margin if disconnect_margin is not None else limits.disconnect_margin
         self._queue_size = queue_size if queue_size is not None else limits.queue_size
+        self._send_limiter = send_limiter
 
         # Settings
         self._reconnect_strategy = reconnect_strategy
@@ -954,7 +961,10 @@ async def send(self, data: Any) -> None:
             )
 
         message = json.dumps(data) if isinstance(data, dict | list) else str(data)
-        await self._ws.send(message)
+        if self._send_limiter is not None:
+            await self._send_limiter.acall(self._ws.send, message)
+        else:
+            await self._ws.send(message)
         self._stats.record_message_sent(len(message))
 
     async def receive(self, timeout: float | None = None) -> Any:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
@@ -10,6 +11,8 @@
 
 from kstlib.db.exceptions import DatabaseConnectionError, PoolExhaustedError
 from kstlib.db.pool import ConnectionPool, PoolStats
+from kstlib.resilience.deadline import deadline
+from kstlib.resilience.exceptions import DeadlineExceededError
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -133,6 +136,22 @@ async def test_pool_exhausted_raises(self) -> None:
         finally:
             await pool.close()
 
+    @pytest.mark.asyncio
+    async def test_acquire_bounded_by_deadline(self) -> None:
+        """An enclosing deadline cuts the acquire wait short."""
+        pool = ConnectionPool(":memory:", min_size=1, max_size=1, acquire_timeout=10.0)
+        try:
+            conn = await pool.acquire()
+            start = time.monotonic()
+            with deadline(0.2), pytest.raises(DeadlineExceededError, match="pool acquire"):
+                await pool.acquire()
+            assert time.monotonic() - start < 2.0
+            with deadline(0), pytest.raises(DeadlineExceededError):
+                await pool.acquire()
+            await pool.release(conn)
+        finally:
+            await pool.close()
+
     @pytest.mark.asyncio
     async def test_close_shuts_down_pool(self) -> None:
         """Close shuts down all connections."""
@@ -0,0 +1,125 @@
+"""Tests for event-loop lag sampling and blocking-call detection."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from kstlib.metrics import EventLoopMonitor, get_call_stats, register_call_stats
+from kstlib.resilience.admission import AdmissionController
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+def _block_loop(seconds: float) -> None:
+    """Hold the event loop like a blocking call would."""
+    time.sleep(seconds)
+
+
+def _unique_name() -> str:
+    return f"loop-{uuid.uuid4().hex[:8]}"
+
+
+class TestEventLoopMonitorInit:
+    """Tests for constructor validation and defaults."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"interval": 0}, "interval"),
+            ({"block_threshold": 0}, "block_threshold"),
+            ({"window": 0}, "window"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, Any], match: str) -> None:
+        """Out-of-range settings raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            EventLoopMonitor(**kwargs)
+
+    def test_empty_stats(self) -> None:
+        """A fresh monitor reports zeros."""
+        monitor = EventLoopMonitor(name=_unique_name())
+        stats = monitor.stats()
+        assert (stats.samples, stats.p99, stats.max, stats.blocked) == (0, 0.0, 0.0, 0)
+        assert not monitor.running
+
+    def test_register_call_stats_is_shared(self) -> None:
+        """Registering a name twice returns the same entry."""
+        name = _unique_name()
+        assert register_call_stats(name) is register_call_stats(name)
+        assert get_call_stats(name) is not None
+
+
+class TestEventLoopMonitorSampling:
+    """Tests for lag sampling and blocking detection on a live loop."""
+
+    @pytest.mark.asyncio
+    async def test_samples_lag_percentiles(self) -> None:
+        """Samples accumulate and feed the metrics registry."""
+        name = _unique_name()
+        async with EventLoopMonitor(interval=0.005, block_threshold=None, name=name) as monitor:
+            # Read through a local so mypy does not narrow monitor.running for the check below
+            started = monitor.running
+            await asyncio.sleep(0.1)
+        assert started
+        assert not monitor.running
+        stats = monitor.stats()
+        assert stats.samples >= 3
+        assert stats.p50 <= stats.p90 <= stats.p99 <= stats.max
+        lag_stats = get_call_stats(f"{name}.lag")
+        assert lag_stats is not None
+        assert lag_stats.call_count == stats.samples
+
+    @pytest.mark.asyncio
+    async def test_detects_blocking_call_with_stack(self) -> None:
+        """A blocking callback is reported with the stack that held the loop."""
+        alerts: list[tuple[str, str, Mapping[str, Any]]] = []
+
+        async def on_alert(channel: str, message: str, context: Mapping[str, Any]) -> None:
+            alerts.append((channel, message, context))
+
+        name = _unique_name()
+        monitor = EventLoopMonitor(interval=0.01, block_threshold=0.05, name=name, on_alert=on_alert)
+        await monitor.astart()
+        await asyncio.sleep(0.03)
+        _block_loop(0.2)
+        await asyncio.sleep(0.05)
+        await monitor.astop()
+
+        assert monitor.stats().blocked >= 1
+        event = monitor.events[0]
+        assert event.duration >= 0.05
+        assert "_block_loop" in event.stack
+        assert alerts
+        assert alerts[0][0] == "event_loop"
+        assert "blocked" in alerts[0][1]
+        assert alerts[0][2]["stack"] == event.stack
+        blocked_stats = get_call_stats(f"{name}.blocked")
+        assert blocked_stats is not None
+        assert blocked_stats.call_count == monitor.stats().blocked
+
+    @pytest.mark.asyncio
+    async def test_feeds_admission_controller(self) -> None:
+        """on_lag forwards samples, e.g. to an admission controller."""
+        controller = AdmissionController(max_lag=0.05)
+        async with EventLoopMonitor(interval=0.01, block_threshold=None, on_lag=controller.record_lag):
+            await asyncio.sleep(0.02)
+            _block_loop(0.1)
+            await asyncio.sleep(0.02)
+        assert controller.stats.peak_lag >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_start_is_idempotent(self) -> None:
+        """Starting twice keeps one sampling task."""
+        monitor = EventLoopMonitor(interval=0.01, name=_unique_name())
+        await monitor.astart()
+        task = monitor._task
+        await monitor.astart()
+        assert monitor._task is task
+        await monitor.astop()
+        await monitor.astop()
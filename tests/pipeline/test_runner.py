@@ -25,6 +25,7 @@
     _load_pipeline_config,
     _parse_pipeline_config,
 )
+from kstlib.resilience.deadline import deadline
 
 # ============================================================================
 # PipelineRunner tests
@@ -256,6 +257,33 @@ def test_default_timeout_applied(self) -> None:
         result = runner.run()
         assert result.results[0].status == StepStatus.SUCCESS
 
+    def test_deadline_clamps_step_timeout(self) -> None:
+        """Steps get at most the remaining deadline budget."""
+        config = PipelineConfig(
+            name="deadline",
+            steps=(StepConfig(name="step", type=StepType.SHELL, command="echo ok", timeout=60.0),),
+            default_timeout=300.0,
+        )
+        runner = PipelineRunner(config)
+        with patch("kstlib.pipeline.runner._STEP_EXECUTORS") as executors, deadline(5.0):
+            runner.run()
+        step_config = executors[StepType.SHELL].execute.call_args.args[0]
+        assert 0 < step_config.timeout <= 5.0
+
+    def test_deadline_passed_times_out_without_running(self) -> None:
+        """Steps are not started once the deadline has passed."""
+        config = PipelineConfig(
+            name="deadline",
+            steps=(StepConfig(name="step", type=StepType.SHELL, command="echo ok"),),
+            on_error=ErrorPolicy.CONTINUE,
+        )
+        runner = PipelineRunner(config)
+        with patch("kstlib.pipeline.runner._STEP_EXECUTORS") as executors, deadline(0):
+            result = runner.run()
+        executors[StepType.SHELL].execute.assert_not_called()
+        assert result.results[0].status == StepStatus.TIMEOUT
+        assert result.results[0].error == "Deadline exceeded before step started"
+
 
 class TestPipelineRunnerFailFastCleanup:
     """Tests for fail_fast cleanup step execution."""
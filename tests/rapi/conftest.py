@@ -0,0 +1,41 @@
+"""Shared fixtures for rapi tests."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from kstlib.rapi import RapiClient, RapiConfigManager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@pytest.fixture
+def rapi_client() -> Callable[..., RapiClient]:
+    """Provide a factory for a RapiClient on a single ``ex`` API (``https://ex.com``).
+
+    The factory takes the endpoints mapping, ``api`` for extra API settings
+    (``rate_limit``, ``http``...), ``limits`` to override RapiLimits fields
+    (retries then run without delay), and any other keyword argument for
+    RapiClient itself.
+    """
+
+    def factory(
+        endpoints: dict[str, Any],
+        *,
+        api: dict[str, Any] | None = None,
+        limits: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> RapiClient:
+        manager = RapiConfigManager(
+            {"api": {"ex": {"base_url": "https://ex.com", "endpoints": endpoints, **(api or {})}}}
+        )
+        client = RapiClient(config_manager=manager, **kwargs)
+        if limits is not None:
+            client._limits = replace(client._limits, **{"retry_delay": 0.0, "retry_backoff": 1.0, **limits})
+        return client
+
+    return factory
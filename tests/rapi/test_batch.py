@@ -0,0 +1,179 @@
+"""Tests for concurrent batch calls (call_many and variants)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import httpx
+import pytest
+
+from kstlib.rapi import BatchCall, BatchResult
+from kstlib.rapi.batch import BatchItem, to_batch_calls
+from kstlib.rapi.exceptions import EndpointNotFoundError
+from kstlib.resilience.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from kstlib.rapi import RapiClient
+
+
+ENDPOINTS = {"ticker": {"path": "/ticker/{symbol}"}}
+
+
+def _response(request: httpx.Request) -> httpx.Response:
+    """Echo the requested symbol back as JSON."""
+    symbol = request.url.path.rsplit("/", 1)[-1]
+    return httpx.Response(200, json={"symbol": symbol}, request=request)
+
+
+class TestToBatchCalls:
+    """Tests for batch item normalization."""
+
+    def test_accepts_refs_tuples_and_calls(self) -> None:
+        """All supported item forms become BatchCall objects."""
+        call = BatchCall("ex.ticker", kwargs={"symbol": "A"})
+        calls = to_batch_calls(["ex.time", ("ex.ticker", {"symbol": "B"}), call])
+        assert calls == [BatchCall("ex.time"), BatchCall("ex.ticker", kwargs={"symbol": "B"}), call]
+
+    def test_rejects_unknown_items(self) -> None:
+        """Unsupported items raise TypeError."""
+        with pytest.raises(TypeError, match="Unsupported batch item"):
+            to_batch_calls([42])  # type: ignore[list-item]
+
+
+class TestCallMany:
+    """Tests for the thread-pool batch API."""
+
+    @mock.patch("httpx.Client")
+    def test_results_in_input_order_with_errors(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Results keep input order and failures are reported per item."""
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def send(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return _response(request)
+
+        mock_client_class.return_value.send.side_effect = send
+        client = rapi_client(ENDPOINTS)
+        items: list[BatchItem] = [("ex.ticker", {"symbol": f"S{i}"}) for i in range(12)]
+        items.insert(5, "missing.endpoint")
+
+        results = client.call_many(items, max_concurrency=3)
+
+        assert [r.index for r in results] == list(range(13))
+        assert isinstance(results[5].error, EndpointNotFoundError)
+        assert results[5].response is None
+        assert [r.response.data["symbol"] for r in results if r.response is not None] == [f"S{i}" for i in range(12)]
+        assert all(r.ok for r in results if r.index != 5)
+        assert peak <= 3
+
+    @mock.patch("httpx.Client")
+    def test_iter_many_streams_as_completed(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """iter_many yields faster calls first."""
+
+        def send(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/SLOW"):
+                time.sleep(0.1)
+            return _response(request)
+
+        mock_client_class.return_value.send.side_effect = send
+        client = rapi_client(ENDPOINTS)
+
+        results = list(client.iter_many([("ex.ticker", {"symbol": "SLOW"}), ("ex.ticker", {"symbol": "FAST"})]))
+
+        assert [r.index for r in results] == [1, 0]
+
+    @mock.patch("httpx.Client")
+    def test_rate_limiter_per_api(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Every call to the API takes a token from its rate limiter."""
+        mock_client_class.return_value.send.side_effect = _response
+        limiter = RateLimiter(rate=100, per=1.0)
+        client = rapi_client(ENDPOINTS, rate_limiters={"ex": limiter})
+
+        client.call_many([("ex.ticker", {"symbol": str(i)}) for i in range(5)])
+
+        assert limiter.stats.total_acquired == 5
+
+    def test_invalid_concurrency(self, rapi_client: Callable[..., RapiClient]) -> None:
+        """max_concurrency below 1 is rejected."""
+        client = rapi_client(ENDPOINTS)
+        with pytest.raises(ValueError, match="max_concurrency"):
+            client.call_many(["ex.ticker"], max_concurrency=0)
+
+    def test_empty_batch(self, rapi_client: Callable[..., RapiClient]) -> None:
+        """An empty batch returns no results."""
+        assert rapi_client(ENDPOINTS).call_many([]) == []
+
+
+class TestCallManyAsync:
+    """Tests for the asyncio batch API."""
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_bounded_and_ordered(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """At most max_concurrency calls run and results keep input order."""
+        in_flight = 0
+        peak = 0
+
+        async def send(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _response(request)
+
+        mock_client_class.return_value.send = send
+        client = rapi_client(ENDPOINTS)
+
+        results = await client.call_many_async(
+            [BatchCall("ex.ticker", kwargs={"symbol": f"S{i}"}) for i in range(10)],
+            max_concurrency=4,
+        )
+
+        assert peak == 4
+        assert [r.response.data["symbol"] for r in results if r.response is not None] == [f"S{i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_iter_many_async_reports_errors(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Streaming results carry per-item errors without stopping the batch."""
+        mock_client_class.return_value.send = mock.AsyncMock(side_effect=_response)
+        client = rapi_client(ENDPOINTS)
+
+        results: list[BatchResult] = [
+            result async for result in client.iter_many_async(["missing.endpoint", ("ex.ticker", {"symbol": "A"})])
+        ]
+
+        assert sorted(r.index for r in results) == [0, 1]
+        by_index = {r.index: r for r in results}
+        assert isinstance(by_index[0].error, EndpointNotFoundError)
+        assert by_index[1].ok
+
+    @pytest.mark.asyncio
+    async def test_call_many_async_invalid_concurrency(self, rapi_client: Callable[..., RapiClient]) -> None:
+        """max_concurrency below 1 is rejected."""
+        client = rapi_client(ENDPOINTS)
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await client.call_many_async(["ex.ticker"], max_concurrency=0)
@@ -0,0 +1,231 @@
+"""Tests for the RAPI response cache."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import httpx
+import pytest
+
+from kstlib.rapi import (
+    CacheConfig,
+    DiskResponseStore,
+    MemoryResponseStore,
+)
+from kstlib.rapi.cache import CacheEntry, freshness_lifetime
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from kstlib.rapi import RapiClient
+
+
+def _entry(text: str = "x", expires_at: float = 0.0, etag: str | None = None) -> CacheEntry:
+    return CacheEntry(200, {"content-type": "application/json"}, {"v": text}, text, "ex.info", expires_at, etag)
+
+
+def _endpoints(cache: Any = 60) -> dict[str, Any]:
+    return {"info": {"path": "/info", "cache": cache}, "live": {"path": "/live"}}
+
+
+def _reply(status: int = 200, headers: dict[str, str] | None = None, payload: Any = None) -> Any:
+    def send(request: httpx.Request) -> httpx.Response:
+        if status == 304:
+            return httpx.Response(304, headers=headers, request=request)
+        return httpx.Response(status, headers=headers, json=payload or {"v": 1}, request=request)
+
+    return send
+
+
+class TestStores:
+    """Tests for the memory and disk stores."""
+
+    def test_memory_store_evicts_lru(self) -> None:
+        """The least recently used entry is evicted first."""
+        store = MemoryResponseStore(max_entries=2)
+        store.set("a", _entry("a"))
+        store.set("b", _entry("b"))
+        assert store.get("a") is not None
+        store.set("c", _entry("c"))
+        assert store.get("b") is None
+        assert len(store) == 2
+        store.delete("a")
+        store.clear()
+        assert len(store) == 0
+
+    def test_memory_store_validates_size(self) -> None:
+        """max_entries below 1 is rejected."""
+        with pytest.raises(ValueError, match="max_entries"):
+            MemoryResponseStore(max_entries=0)
+
+    def test_disk_store_roundtrip(self, tmp_path: Path) -> None:
+        """Entries survive a new store instance on the same directory."""
+        DiskResponseStore(tmp_path).set("abc123", _entry("disk", etag='"v1"'))
+        store = DiskResponseStore(tmp_path)
+        assert store.get("abc123") == _entry("disk", etag='"v1"')
+        store.delete("abc123")
+        assert store.get("abc123") is None
+
+    def test_disk_store_ignores_corrupt_files(self, tmp_path: Path) -> None:
+        """Unreadable files count as misses and clear() removes them."""
+        store = DiskResponseStore(tmp_path)
+        (tmp_path / "bad.json").write_text("{not json", encoding="utf-8")
+        assert store.get("bad") is None
+        store.clear()
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_disk_store_rejects_path_keys(self, tmp_path: Path) -> None:
+        """Keys cannot escape the cache directory."""
+        with pytest.raises(ValueError, match="Invalid cache key"):
+            DiskResponseStore(tmp_path).get("../etc/passwd")
+
+
+class TestFreshness:
+    """Tests for Cache-Control handling."""
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({}, 60.0),
+            ({"Cache-Control": "max-age=10"}, 10.0),
+            ({"Cache-Control": "max-age=10", "Age": "4"}, 6.0),
+            ({"Cache-Control": "no-cache"}, 0.0),
+            ({"Cache-Control": "private, no-store"}, None),
+            ({"Cache-Control": "max-age=oops"}, 60.0),
+        ],
+    )
+    def test_lifetime(self, headers: dict[str, str], expected: float | None) -> None:
+        """Cache-Control overrides the configured TTL."""
+        assert freshness_lifetime(headers, CacheConfig(ttl=60)) == expected
+
+    def test_headers_ignored_when_disabled(self) -> None:
+        """respect_headers=False always uses the TTL."""
+        config = CacheConfig(ttl=5, respect_headers=False)
+        assert freshness_lifetime({"Cache-Control": "no-store"}, config) == 5.0
+
+
+class TestClientCache:
+    """Tests for caching in RapiClient.call / call_async."""
+
+    @mock.patch("httpx.Client")
+    def test_fresh_hit_skips_request(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """A second call within the TTL is served from cache."""
+        mock_client_class.return_value.send.side_effect = _reply(payload={"symbols": ["BTCUSDT"]})
+        client = rapi_client(_endpoints())
+
+        first = client.call("ex.info")
+        second = client.call("ex.info")
+
+        assert mock_client_class.return_value.send.call_count == 1
+        assert not first.from_cache
+        assert second.from_cache
+        assert second.data == {"symbols": ["BTCUSDT"]}
+        stats = client.cache_stats
+        assert (stats.hits, stats.misses, stats.stored) == (1, 1, 1)
+
+    @mock.patch("httpx.Client")
+    def test_hits_do_not_share_data(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Changing a returned response leaves the cached entry untouched."""
+        mock_client_class.return_value.send.side_effect = _reply(payload={"symbols": ["BTCUSDT"]})
+        client = rapi_client(_endpoints())
+
+        client.call("ex.info").data["symbols"].append("MISS")
+        client.call("ex.info").data["symbols"].append("HIT")
+
+        assert client.call("ex.info").data == {"symbols": ["BTCUSDT"]}
+
+    @mock.patch("httpx.Client")
+    def test_uncached_endpoint_always_requests(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Endpoints without a cache entry are never cached."""
+        mock_client_class.return_value.send.side_effect = _reply()
+        client = rapi_client(_endpoints())
+        client.call("ex.live")
+        client.call("ex.live")
+        assert mock_client_class.return_value.send.call_count == 2
+        assert client.cache_stats.misses == 0
+
+    @mock.patch("httpx.Client")
+    def test_stale_entry_revalidated_with_etag(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Stale entries send If-None-Match and a 304 refreshes them."""
+        send = mock_client_class.return_value.send
+        send.side_effect = _reply(headers={"ETag": '"v1"', "Cache-Control": "no-cache"}, payload={"v": 1})
+        client = rapi_client(_endpoints())
+        client.call("ex.info")
+
+        send.side_effect = _reply(status=304, headers={"Cache-Control": "max-age=60"})
+        response = client.call("ex.info")
+
+        assert send.call_args.args[0].headers["If-None-Match"] == '"v1"'
+        assert response.status_code == 200
+        assert response.from_cache
+        assert response.data == {"v": 1}
+        assert client.cache_stats.revalidated == 1
+        assert client.call("ex.info").from_cache
+        assert send.call_count == 2
+
+    @mock.patch("httpx.Client")
+    def test_no_store_and_errors_not_cached(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """no-store responses and non-200 replies are not stored."""
+        send = mock_client_class.return_value.send
+        client = rapi_client(_endpoints())
+
+        send.side_effect = _reply(headers={"Cache-Control": "no-store"})
+        client.call("ex.info")
+        send.side_effect = _reply(status=404)
+        client.call("ex.info")
+        client.call("ex.info")
+
+        assert send.call_count == 3
+        assert client.cache_stats.stored == 0
+
+    @mock.patch("httpx.Client")
+    def test_params_are_part_of_key(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Different query parameters are cached separately."""
+        mock_client_class.return_value.send.side_effect = _reply()
+        client = rapi_client(_endpoints())
+        client.call("ex.info", symbol="BTC")
+        client.call("ex.info", symbol="ETH")
+        client.call("ex.info", symbol="BTC")
+        assert mock_client_class.return_value.send.call_count == 2
+
+    @mock.patch("httpx.Client")
+    def test_disk_store_shared_between_clients(
+        self, mock_client_class: mock.Mock, tmp_path: Path, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """A disk store serves entries written by another client."""
+        mock_client_class.return_value.send.side_effect = _reply()
+        rapi_client(_endpoints(), response_store=DiskResponseStore(tmp_path)).call("ex.info")
+
+        other = rapi_client(_endpoints(), response_store=DiskResponseStore(tmp_path))
+        assert other.call("ex.info").from_cache
+        assert mock_client_class.return_value.send.call_count == 1
+
+    @mock.patch("httpx.Client")
+    def test_entry_expires(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Entries past their TTL are fetched again."""
+        mock_client_class.return_value.send.side_effect = _reply()
+        client = rapi_client(_endpoints({"ttl": 0.05}))
+        client.call("ex.info")
+        time.sleep(0.06)
+        assert not client.call("ex.info").from_cache
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_async_hit(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """call_async uses the same cache."""
+        mock_client_class.return_value.send = mock.AsyncMock(side_effect=_reply())
+        client = rapi_client(_endpoints())
+        await client.call_async("ex.info")
+        assert (await client.call_async("ex.info")).from_cache
+        assert mock_client_class.return_value.send.await_count == 1
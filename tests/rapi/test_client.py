@@ -1,12 +1,14 @@
 """Tests for kstlib.rapi.client module."""
 
+import asyncio
+import time
 from pathlib import Path
 from unittest import mock
 
 import httpx
 import pytest
 
-from kstlib.rapi.client import RapiClient, RapiResponse
+from kstlib.rapi.client import RapiClient, RapiResponse, _parse_retry_after
 from kstlib.rapi.config import RapiConfigManager, SafeguardConfig
 from kstlib.rapi.exceptions import (
     ConfirmationRequiredError,
@@ -14,6 +16,11 @@
     RequestError,
     ResponseTooLargeError,
 )
+from kstlib.resilience.adaptive_limiter import AdaptiveLimiter
+from kstlib.resilience.deadline import deadline
+from kstlib.resilience.exceptions import DeadlineExceededError
+from kstlib.resilience.hedge import HedgePolicy
+from kstlib.resilience.retry import RetryBudget
 
 
 class TestRapiResponse:
@@ -56,6 +63,42 @@ def test_full_response(self) -> None:
         assert response.data == {"key": "value"}
         assert response.elapsed == 0.123
 
+    def test_lazy_body_decoding(self) -> None:
+        """Text and data are decoded from the raw body on first access."""
+        decoder = mock.Mock(side_effect=lambda raw: {"raw": raw})
+        headers = httpx.Headers({"Content-Type": "application/json; charset=latin-1"})
+        response = RapiResponse(200, headers, content='{"é": 1}'.encode("latin-1"), json_decoder=decoder)
+
+        assert response.ok
+        decoder.assert_not_called()
+        assert response.text == '{"é": 1}'
+        assert response.data == response.data == {"raw": response.content}
+        decoder.assert_called_once()
+        assert response.headers == {"content-type": "application/json; charset=latin-1"}
+        assert not hasattr(response, "__dict__")
+
+    def test_lazy_data_ignores_non_json(self) -> None:
+        """Bodies without a JSON content type, or invalid JSON, have no data."""
+        assert RapiResponse(200, {"Content-Type": "text/plain"}, content=b"[1]").data is None
+        assert RapiResponse(200, {"Content-Type": "application/json"}, content=b"{oops").data is None
+        assert RapiResponse(200, {"Content-Type": "application/json"}, content=b"[1]").data == [1]
+
+    @mock.patch("httpx.Client")
+    def test_client_json_decoder_hook(self, mock_client_class: mock.Mock) -> None:
+        """RapiClient(json_decoder=...) decodes JSON bodies of its responses."""
+        mock_client_class.return_value.send.side_effect = lambda request: httpx.Response(
+            200, json={"ip": "1.2.3.4"}, request=request
+        )
+        manager = RapiConfigManager(
+            {"api": {"ex": {"base_url": "https://ex.com", "endpoints": {"ip": {"path": "/ip"}}}}}
+        )
+        decoder = mock.Mock(return_value={"decoded": True})
+
+        response = RapiClient(config_manager=manager, json_decoder=decoder).call("ex.ip")
+
+        assert response.data == {"decoded": True}
+        decoder.assert_called_once_with(b'{"ip":"1.2.3.4"}')
+
 
 class TestRapiClientInit:
     """Tests for RapiClient initialization."""
@@ -88,58 +131,66 @@ def test_custom_config_manager(self) -> None:
 class TestRapiClientHeaderMerge:
     """Tests for header merging in RapiClient."""
 
-    def test_merge_headers_all_levels(self) -> None:
-        """Merge headers from service, endpoint, and runtime levels."""
-        config = {
-            "api": {
-                "test": {
-                    "base_url": "https://test.com",
-                    "headers": {"X-Service": "service-value"},
-                    "endpoints": {
-                        "ep": {
-                            "path": "/",
-                            "headers": {"X-Endpoint": "endpoint-value"},
-                        }
-                    },
+    @staticmethod
+    def _manager() -> RapiConfigManager:
+        return RapiConfigManager(
+            {
+                "api": {
+                    "test": {
+                        "base_url": "https://test.com",
+                        "headers": {"X-Service": "service-value", "X-Header": "service"},
+                        "endpoints": {
+                            "ep": {
+                                "path": "/",
+                                "headers": {"X-Endpoint": "endpoint-value", "X-Header": "endpoint"},
+                            }
+                        },
+                    }
                 }
             }
-        }
-        manager = RapiConfigManager(config)
+        )
+
+    def test_merge_headers_all_levels(self) -> None:
+        """Merge headers from service, endpoint, and runtime levels."""
+        manager = self._manager()
         client = RapiClient(config_manager=manager)
 
-        merged = client._merge_headers(
-            {"X-Service": "service-value"},
-            {"X-Endpoint": "endpoint-value"},
-            {"X-Runtime": "runtime-value"},
-        )
+        api, endpoint = manager.resolve("test.ep")
+        request = client._build_request(api, endpoint, (), {}, None, {"X-Runtime": "runtime-value"})
 
-        assert merged["X-Service"] == "service-value"
-        assert merged["X-Endpoint"] == "endpoint-value"
-        assert merged["X-Runtime"] == "runtime-value"
+        assert request.headers["X-Service"] == "service-value"
+        assert request.headers["X-Endpoint"] == "endpoint-value"
+        assert request.headers["X-Runtime"] == "runtime-value"
 
     def test_merge_headers_override(self) -> None:
         """Later levels override earlier levels."""
-        client = RapiClient(config_manager=RapiConfigManager({}))
-
-        merged = client._merge_headers(
-            {"X-Header": "service"},
-            {"X-Header": "endpoint"},
-            {"X-Header": "runtime"},
-        )
+        manager = self._manager()
+        client = RapiClient(config_manager=manager)
+        api, endpoint = manager.resolve("test.ep")
 
-        assert merged["X-Header"] == "runtime"
+        assert manager.template("test.ep").static_headers["X-Header"] == "endpoint"
+        request = client._build_request(api, endpoint, (), {}, None, {"X-Header": "runtime"})
+        assert request.headers["X-Header"] == "runtime"
 
     def test_merge_headers_partial(self) -> None:
         """Merge with empty levels."""
-        client = RapiClient(config_manager=RapiConfigManager({}))
-
-        merged = client._merge_headers(
-            {"X-Service": "value"},
-            {},
-            {},
+        manager = RapiConfigManager(
+            {
+                "api": {
+                    "test": {
+                        "base_url": "https://test.com",
+                        "headers": {"X-Service": "value"},
+                        "endpoints": {"ep": {"path": "/"}},
+                    }
+                }
+            }
         )
+        client = RapiClient(config_manager=manager)
 
-        assert merged["X-Service"] == "value"
+        api, endpoint = manager.resolve("test.ep")
+        request = client._build_request(api, endpoint, (), {}, None, None)
+
+        assert request.headers["X-Service"] == "value"
 
 
 class TestRapiClientBuildRequest:
@@ -502,6 +553,28 @@ def test_apply_auth_bearer(self) -> None:
 
         assert headers.get("Authorization") == "Bearer my_bearer_token"
 
+    def test_load_credentials(self) -> None:
+        """load_credentials resolves and caches the credentials of every API."""
+        config = {
+            "api": {
+                "a": {"base_url": "https://a.com", "credentials": "key_a", "endpoints": {"ep": {"path": "/"}}},
+                "b": {"base_url": "https://b.com", "credentials": "key_b", "endpoints": {"ep": {"path": "/"}}},
+                "c": {"base_url": "https://c.com", "endpoints": {"ep": {"path": "/"}}},
+            }
+        }
+        cred_config = {"key_a": {"type": "env", "var": "KEY_A"}, "key_b": {"type": "env", "var": "KEY_B"}}
+        client = RapiClient(config_manager=RapiConfigManager(config), credentials_config=cred_config)
+
+        with mock.patch.dict("os.environ", {"KEY_A": "a1", "KEY_B": "b1"}):
+            records = client.load_credentials()
+            assert list(client.load_credentials("b")) == ["key_b"]
+
+        assert {name: record.value for name, record in records.items()} == {"key_a": "a1", "key_b": "b1"}
+        headers: dict[str, str] = {}
+        with mock.patch.dict("os.environ", {}, clear=True):
+            client._apply_auth(headers, client.config_manager.apis["a"])
+        assert headers["Authorization"] == "Bearer a1"
+
     def test_apply_auth_basic(self) -> None:
         """Apply basic authentication."""
         config = {
@@ -616,6 +689,7 @@ def test_call_function(self, mock_client_class: mock.Mock) -> None:
             confirm=None,
         )
         assert response.status_code == 200
+        mock_client.close.assert_called_once()
 
     @mock.patch("kstlib.rapi.client.RapiClient")
     @pytest.mark.asyncio
@@ -629,11 +703,13 @@ async def mock_call_async(*args: object, **kwargs: object) -> RapiResponse:
             return RapiResponse(status_code=200)
 
         mock_client.call_async = mock_call_async
+        mock_client.aclose = mock.AsyncMock()
         mock_client_class.return_value = mock_client
 
         response = await call_async("test.endpoint")
 
         assert response.status_code == 200
+        mock_client.aclose.assert_awaited_once()
 
 
 class TestRapiClientFactoryMethods:
@@ -1228,6 +1304,548 @@ def test_call_5xx_error_with_retry(self, mock_client_class: mock.Mock) -> None:
         # Should retry on 5xx
         assert mock_client.send.call_count == 2
 
+    @staticmethod
+    def _throttled_client(mock_client_class: mock.Mock, *responses: mock.Mock) -> RapiClient:
+        mock_client = mock.Mock()
+        mock_client.send.side_effect = list(responses)
+        mock_client.__enter__ = mock.Mock(return_value=mock_client)
+        mock_client.__exit__ = mock.Mock(return_value=False)
+        mock_client_class.return_value = mock_client
+
+        config = {"api": {"test": {"base_url": "https://test.com", "endpoints": {"ep": {"path": "/"}}}}}
+        client = RapiClient(config_manager=RapiConfigManager(config))
+        client._limits = client._limits.__class__(
+            timeout=1.0,
+            max_response_size=1000000,
+            max_retries=2,
+            retry_delay=0.01,
+            retry_backoff=1.0,
+        )
+        return client
+
+    @staticmethod
+    def _response(status: int, headers: dict[str, str]) -> mock.Mock:
+        response = mock.Mock(spec=httpx.Response)
+        response.status_code = status
+        response.headers = headers
+        response.text = ""
+        response.content = b""
+        return response
+
+    @mock.patch("kstlib.resilience.retry.time.sleep")
+    @mock.patch("httpx.Client")
+    def test_call_429_honors_retry_after(self, mock_client_class: mock.Mock, mock_sleep: mock.Mock) -> None:
+        """Retry a 429 after the server-provided Retry-After delay."""
+        client = self._throttled_client(
+            mock_client_class,
+            self._response(429, {"retry-after": "2"}),
+            self._response(200, {}),
+        )
+
+        response = client.call("test.ep")
+
+        assert response.status_code == 200
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] >= 2.0
+
+    @mock.patch("kstlib.resilience.retry.time.sleep")
+    @mock.patch("httpx.Client")
+    def test_call_429_returned_when_retries_exhausted(
+        self, mock_client_class: mock.Mock, mock_sleep: mock.Mock
+    ) -> None:
+        """Return the last throttled response once retries are exhausted."""
+        client = self._throttled_client(
+            mock_client_class,
+            *(self._response(429, {"retry-after": "1"}) for _ in range(3)),
+        )
+
+        response = client.call("test.ep")
+
+        assert response.status_code == 429
+        assert mock_sleep.call_count == 2
+
+    @mock.patch("httpx.Client")
+    def test_call_429_without_retry_after_not_retried(self, mock_client_class: mock.Mock) -> None:
+        """A 429 without Retry-After is returned as before."""
+        client = self._throttled_client(mock_client_class, self._response(429, {}))
+
+        response = client.call("test.ep")
+
+        assert response.status_code == 429
+
+    @mock.patch("httpx.Client")
+    def test_retry_budget_limits_retries(self, mock_client_class: mock.Mock) -> None:
+        """An exhausted client-wide retry budget stops retrying early."""
+        client = self._throttled_client(mock_client_class)
+        mock_client_class.return_value.send.side_effect = httpx.NetworkError("down")
+        client._retry_budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=1)
+
+        with pytest.raises(RequestError, match="after 2 attempts"):
+            client.call("test.ep")
+
+        assert mock_client_class.return_value.send.call_count == 2
+
+    @pytest.mark.asyncio
+    @mock.patch("kstlib.resilience.retry.asyncio.sleep")
+    @mock.patch("httpx.AsyncClient")
+    async def test_call_async_503_honors_retry_after(
+        self, mock_client_class: mock.Mock, mock_sleep: mock.AsyncMock
+    ) -> None:
+        """Async calls retry a 503 after Retry-After without blocking the loop."""
+        mock_client = mock.AsyncMock()
+        mock_client.send.side_effect = [self._response(503, {"retry-after": "1"}), self._response(200, {})]
+        mock_client.__aenter__ = mock.AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = mock.AsyncMock(return_value=False)
+        mock_client_class.return_value = mock_client
+
+        config = {"api": {"test": {"base_url": "https://test.com", "endpoints": {"ep": {"path": "/"}}}}}
+        client = RapiClient(config_manager=RapiConfigManager(config))
+
+        response = await client.call_async("test.ep")
+
+        assert response.status_code == 200
+        assert mock_sleep.await_args is not None
+        assert mock_sleep.await_args.args[0] >= 1.0
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_seconds(self) -> None:
+        """Delta-seconds values are parsed."""
+        assert _parse_retry_after("30") == 30.0
+
+    def test_http_date(self) -> None:
+        """HTTP-date values are converted to a delay."""
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_missing_or_invalid(self) -> None:
+        """Missing or garbage values yield None."""
+        assert _parse_retry_after(None) is None
+        assert _parse_retry_after("later") is None
+
+
+class TestRapiClientConcurrencyLimiter:
+    """Tests for the adaptive concurrency limiter integration."""
+
+    @staticmethod
+    def _manager() -> RapiConfigManager:
+        return RapiConfigManager(
+            {"api": {"test": {"base_url": "https://test.com", "endpoints": {"ep": {"path": "/"}}}}}
+        )
+
+    @staticmethod
+    def _response(status: int) -> mock.Mock:
+        response = mock.Mock(spec=httpx.Response)
+        response.status_code = status
+        response.headers = {}
+        response.text = ""
+        response.content = b""
+        return response
+
+    @mock.patch("httpx.Client")
+    def test_success_feeds_latency_sample(self, mock_client_class: mock.Mock) -> None:
+        """Each attempt holds a slot and reports its latency."""
+        limiter = AdaptiveLimiter(initial_limit=4)
+        mock_client = mock.Mock()
+        mock_client.send.return_value = self._response(200)
+        mock_client.__enter__ = mock.Mock(return_value=mock_client)
+        mock_client.__exit__ = mock.Mock(return_value=False)
+        mock_client_class.return_value = mock_client
+
+        client = RapiClient(config_manager=self._manager(), concurrency_limiter=limiter)
+        client.call("test.ep")
+
+        assert limiter.active == 0
+        assert limiter.stats.total_acquired == 1
+        assert limiter.min_rtt is not None
+
+    @mock.patch("httpx.Client")
+    def test_throttled_response_counts_as_drop(self, mock_client_class: mock.Mock) -> None:
+        """A 429 without Retry-After shrinks the limit."""
+        limiter = AdaptiveLimiter(initial_limit=10, algorithm="aimd", backoff_ratio=0.5)
+        mock_client = mock.Mock()
+        mock_client.send.return_value = self._response(429)
+        mock_client.__enter__ = mock.Mock(return_value=mock_client)
+        mock_client.__exit__ = mock.Mock(return_value=False)
+        mock_client_class.return_value = mock_client
+
+        client = RapiClient(config_manager=self._manager(), concurrency_limiter=limiter)
+        response = client.call("test.ep")
+
+        assert response.status_code == 429
+        assert limiter.limit == 5
+
+    @mock.patch("httpx.Client")
+    def test_timeout_counts_as_drop(self, mock_client_class: mock.Mock) -> None:
+        """Timeouts shrink the limit and release the slot."""
+        limiter = AdaptiveLimiter(initial_limit=8, algorithm="aimd", backoff_ratio=0.5)
+        mock_client = mock.Mock()
+        mock_client.send.side_effect = httpx.TimeoutException("slow")
+        mock_client.__enter__ = mock.Mock(return_value=mock_client)
+        mock_client.__exit__ = mock.Mock(return_value=False)
+        mock_client_class.return_value = mock_client
+
+        client = RapiClient(config_manager=self._manager(), concurrency_limiter=limiter)
+        client._limits = client._limits.__class__(
+            timeout=1.0,
+            max_response_size=1000000,
+            max_retries=0,
+            retry_delay=0.01,
+            retry_backoff=1.0,
+        )
+
+        with pytest.raises(RequestError):
+            client.call("test.ep")
+
+        assert limiter.active == 0
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_async_call_uses_limiter(self, mock_client_class: mock.Mock) -> None:
+        """Async attempts hold a slot as well."""
+        limiter = AdaptiveLimiter(initial_limit=4)
+        mock_client = mock.AsyncMock()
+        mock_client.send.return_value = self._response(200)
+        mock_client.__aenter__ = mock.AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = mock.AsyncMock(return_value=False)
+        mock_client_class.return_value = mock_client
+
+        client = RapiClient(config_manager=self._manager(), concurrency_limiter=limiter)
+        await client.call_async("test.ep")
+
+        assert limiter.active == 0
+        assert limiter.stats.total_acquired == 1
+
+    @mock.patch("httpx.Client")
+    def test_deadline_spent_waiting_for_slot_releases_it(self, mock_client_class: mock.Mock) -> None:
+        """A budget that runs out while waiting for a slot does not leak the slot."""
+        limiter = AdaptiveLimiter(initial_limit=4)
+        acquire = limiter.acquire
+
+        def slow_acquire() -> None:
+            acquire()
+            time.sleep(0.02)
+
+        client = RapiClient(config_manager=self._manager(), concurrency_limiter=limiter)
+        with mock.patch.object(limiter, "acquire", slow_acquire):
+            for _ in range(2):
+                with pytest.raises(DeadlineExceededError), deadline(0.01):
+                    client.call("test.ep")
+
+        assert limiter.active == 0
+        mock_client_class.return_value.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_async_deadline_spent_waiting_for_slot_releases_it(self, mock_client_class: mock.Mock) -> None:
+        """Async attempts release the slot as well."""
+        limiter = AdaptiveLimiter(initial_limit=4)
+        acquire = limiter.acquire_async
+
+        async def slow_acquire() -> None:
+            await acquire()
+            await asyncio.sleep(0.02)
+
+        client = RapiClient(config_manager=self._manager(), concurrency_limiter=limiter)
+        with (
+            mock.patch.object(limiter, "acquire_async", slow_acquire),
+            pytest.raises(DeadlineExceededError),
+            deadline(0.01),
+        ):
+            await client.call_async("test.ep")
+
+        assert limiter.active == 0
+        mock_client_class.return_value.send.assert_not_called()
+
+
+class TestRapiClientDeadline:
+    """Tests for deadline propagation into requests."""
+
+    @staticmethod
+    def _manager() -> RapiConfigManager:
+        return RapiConfigManager(
+            {"api": {"test": {"base_url": "https://test.com", "endpoints": {"ep": {"path": "/"}}}}}
+        )
+
+    @staticmethod
+    def _mock_client(mock_client_class: mock.Mock) -> mock.Mock:
+        mock_client = mock.Mock()
+        mock_client.__enter__ = mock.Mock(return_value=mock_client)
+        mock_client.__exit__ = mock.Mock(return_value=False)
+        mock_client_class.return_value = mock_client
+        return mock_client
+
+    @mock.patch("httpx.Client")
+    def test_timeout_clamped_to_deadline(self, mock_client_class: mock.Mock) -> None:
+        """The HTTP timeout never exceeds the remaining budget."""
+        mock_client = self._mock_client(mock_client_class)
+        response = mock.Mock(spec=httpx.Response)
+        response.status_code = 200
+        response.headers = {}
+        response.text = ""
+        response.content = b""
+        mock_client.send.return_value = response
+
+        client = RapiClient(config_manager=self._manager())
+        with deadline(2.0):
+            client.call("test.ep", timeout=30.0)
+
+        sent = mock_client.send.call_args.args[0]
+        assert sent.extensions["timeout"]["read"] <= 2.0
+
+    @mock.patch("httpx.Client")
+    def test_expired_deadline_fails_fast(self, mock_client_class: mock.Mock) -> None:
+        """No request is sent once the deadline has passed."""
+        client = RapiClient(config_manager=self._manager())
+        with deadline(0), pytest.raises(DeadlineExceededError, match="request"):
+            client.call("test.ep")
+        mock_client_class.assert_not_called()
+
+    @mock.patch("httpx.Client")
+    def test_timeout_at_deadline_is_not_retried(self, mock_client_class: mock.Mock) -> None:
+        """A timeout that spends the budget raises instead of retrying."""
+        mock_client = self._mock_client(mock_client_class)
+
+        def slow_send(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.06)
+            raise httpx.TimeoutException("slow")
+
+        mock_client.send.side_effect = slow_send
+        client = RapiClient(config_manager=self._manager())
+        with deadline(0.05), pytest.raises(DeadlineExceededError):
+            client.call("test.ep")
+        assert mock_client.send.call_count == 1
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_async_expired_deadline_fails_fast(self, mock_client_class: mock.Mock) -> None:
+        """Async calls honor the deadline as well."""
+        client = RapiClient(config_manager=self._manager())
+        with deadline(0), pytest.raises(DeadlineExceededError):
+            await client.call_async("test.ep")
+        mock_client_class.assert_not_called()
+
+
+class TestRapiClientHedging:
+    """Tests for hedged async calls on read-only endpoints."""
+
+    @staticmethod
+    def _client(mock_client_class: mock.Mock, policy: HedgePolicy, send: mock.AsyncMock) -> RapiClient:
+        mock_client = mock.AsyncMock()
+        mock_client.send = send
+        mock_client.__aenter__ = mock.AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = mock.AsyncMock(return_value=False)
+        mock_client_class.return_value = mock_client
+        config = {
+            "api": {
+                "test": {
+                    "base_url": "https://test.com",
+                    "endpoints": {"read": {"path": "/r"}, "write": {"path": "/w", "method": "POST"}},
+                }
+            }
+        }
+        return RapiClient(config_manager=RapiConfigManager(config), hedge_policy=policy)
+
+    @staticmethod
+    def _response(status: int) -> mock.Mock:
+        response = mock.Mock(spec=httpx.Response)
+        response.status_code = status
+        response.headers = {}
+        response.text = ""
+        response.content = b""
+        return response
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_slow_get_is_hedged(self, mock_client_class: mock.Mock) -> None:
+        """A slow GET gets a second request and the faster reply wins."""
+        slow, fast = self._response(200), self._response(200)
+        fast.status_code = 204
+        calls = 0
+
+        async def send(_request: httpx.Request) -> mock.Mock:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(1.0)
+                return slow
+            return fast
+
+        policy = HedgePolicy(delay=0.01)
+        client = self._client(mock_client_class, policy, mock.AsyncMock(side_effect=send))
+
+        response = await client.call_async("test.read")
+
+        assert response.status_code == 204
+        assert policy.stats.hedge_wins == 1
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_post_is_never_hedged(self, mock_client_class: mock.Mock) -> None:
+        """Non read-only endpoints bypass the hedge policy."""
+        policy = HedgePolicy(delay=0.0)
+        send = mock.AsyncMock(return_value=self._response(201))
+        client = self._client(mock_client_class, policy, send)
+
+        await client.call_async("test.write")
+
+        assert policy.stats.total_calls == 0
+        assert send.await_count == 1
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_hedge_keeps_first_attempt_timeout(self, mock_client_class: mock.Mock) -> None:
+        """Starting a hedge does not rewrite the timeout of the attempt in flight."""
+        timeouts: list[tuple[object, object]] = []
+        calls = 0
+
+        async def send(request: httpx.Request) -> mock.Mock:
+            nonlocal calls
+            calls += 1
+            before = request.extensions["timeout"]
+            await asyncio.sleep(0.06 if calls == 1 else 0.5)
+            timeouts.append((before, request.extensions["timeout"]))
+            return self._response(200)
+
+        client = self._client(mock_client_class, HedgePolicy(delay=0.02), mock.AsyncMock(side_effect=send))
+        with deadline(5.0):
+            await client.call_async("test.read")
+
+        assert calls == 2
+        [(before, after)] = timeouts
+        assert after is before
+
+
+class TestRapiClientConnectionPool:
+    """Tests for the long-lived per-API HTTP clients."""
+
+    @staticmethod
+    def _manager(http: dict[str, object] | None = None) -> RapiConfigManager:
+        return RapiConfigManager(
+            {
+                "api": {
+                    "test": {
+                        "base_url": "https://test.com",
+                        "http": http or {},
+                        "endpoints": {"ep": {"path": "/"}},
+                    },
+                    "other": {"base_url": "https://other.com", "endpoints": {"ep2": {"path": "/"}}},
+                }
+            }
+        )
+
+    @staticmethod
+    def _response() -> mock.Mock:
+        response = mock.Mock(spec=httpx.Response)
+        response.status_code = 200
+        response.headers = {}
+        response.text = ""
+        response.content = b""
+        return response
+
+    @mock.patch("httpx.Client")
+    def test_client_reused_per_api(self, mock_client_class: mock.Mock) -> None:
+        """Calls to one API share a client; each API gets its own."""
+        mock_client_class.return_value.send.return_value = self._response()
+        client = RapiClient(config_manager=self._manager())
+
+        client.call("test.ep")
+        client.call("test.ep")
+        assert mock_client_class.call_count == 1
+        client.call("other.ep2")
+        assert mock_client_class.call_count == 2
+
+    @mock.patch("httpx.Client")
+    def test_pool_limits_from_config(self, mock_client_class: mock.Mock) -> None:
+        """The http section sizes the connection pool."""
+        mock_client_class.return_value.send.return_value = self._response()
+        manager = self._manager({"max_connections": 4, "max_keepalive_connections": 2, "keepalive_expiry": 60})
+        RapiClient(config_manager=manager).call("test.ep")
+
+        kwargs = mock_client_class.call_args.kwargs
+        assert kwargs["limits"] == httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=60.0)
+        assert kwargs["follow_redirects"] is False
+
+    @mock.patch("httpx.Client")
+    def test_http2_falls_back_without_h2(
+        self,
+        mock_client_class: mock.Mock,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """HTTP/2 without the h2 package logs a hint and uses HTTP/1.1."""
+        mock_client_class.return_value.send.return_value = self._response()
+        monkeypatch.setattr("importlib.util.find_spec", lambda _name: None)
+        RapiClient(config_manager=self._manager({"http2": True})).call("test.ep")
+
+        assert mock_client_class.call_args.kwargs["http2"] is False
+        assert "kstlib[http2]" in caplog.text
+
+    @pytest.mark.parametrize(("http", "expected"), [({}, [None, None]), ({"cookies": True}, [None, "sid=abc"])])
+    def test_cookies_kept_only_when_enabled(self, http: dict[str, object], expected: list[str | None]) -> None:
+        """Set-Cookie does not carry over to later calls unless http.cookies is on."""
+        sent: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request.headers.get("cookie"))
+            return httpx.Response(200, headers={"set-cookie": "sid=abc; Path=/"})
+
+        real_client = httpx.Client
+        with mock.patch(
+            "httpx.Client", side_effect=lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw)
+        ):
+            client = RapiClient(config_manager=self._manager(http))
+            client.call("test.ep")
+            client.call("test.ep")
+
+        assert sent == expected
+        assert bool(client._http_client("test").cookies) is bool(http)
+
+    @mock.patch("httpx.Client")
+    def test_close_and_context_manager(self, mock_client_class: mock.Mock) -> None:
+        """Leaving the context closes pooled clients; later calls reopen."""
+        mock_client_class.return_value.send.return_value = self._response()
+        with RapiClient(config_manager=self._manager()) as client:
+            client.call("test.ep")
+        mock_client_class.return_value.close.assert_called_once()
+
+        client.call("test.ep")
+        assert mock_client_class.call_count == 2
+
+    @mock.patch("httpx.Client")
+    def test_preconnect_defaults_to_flagged_apis(self, mock_client_class: mock.Mock) -> None:
+        """Only APIs with http.preconnect are warmed by default."""
+        client = RapiClient(config_manager=self._manager({"preconnect": True}))
+        assert client.preconnect() == {"test": True}
+        mock_client_class.return_value.head.assert_called_once_with("https://test.com")
+
+    @mock.patch("httpx.Client")
+    def test_preconnect_reports_failures(self, mock_client_class: mock.Mock) -> None:
+        """Network errors are reported per API, unknown APIs raise."""
+        mock_client_class.return_value.head.side_effect = httpx.ConnectError("refused")
+        client = RapiClient(config_manager=self._manager())
+        assert client.preconnect("other") == {"other": False}
+        with pytest.raises(EndpointNotFoundError):
+            client.preconnect("missing")
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_async_client_reused_and_closed(self, mock_client_class: mock.Mock) -> None:
+        """Async calls share a client per loop, closed by the async context."""
+        mock_client = mock_client_class.return_value
+        mock_client.send = mock.AsyncMock(return_value=self._response())
+        mock_client.head = mock.AsyncMock()
+        mock_client.aclose = mock.AsyncMock()
+
+        async with RapiClient(config_manager=self._manager()) as client:
+            assert await client.preconnect_async("test") == {"test": True}
+            await client.call_async("test.ep")
+            await client.call_async("test.ep")
+        assert mock_client_class.call_count == 1
+        mock_client.aclose.assert_awaited_once()
+
 
 class TestRapiClientHmacAuth:
     """Tests for HMAC authentication in RapiClient."""
@@ -0,0 +1,197 @@
+"""Tests for in-flight request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import httpx
+import pytest
+
+from kstlib.rapi import RequestCoalescer
+from kstlib.resilience.admission import Priority
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from kstlib.rapi import RapiClient
+
+
+ENDPOINTS = {"klines": {"path": "/klines"}, "order": {"path": "/order", "method": "POST"}}
+
+
+async def _slow_send(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(0.02)
+    return httpx.Response(200, json={"symbol": request.url.params.get("symbol")}, request=request)
+
+
+class TestRequestCoalescer:
+    """Tests for the coalescer itself."""
+
+    def test_threads_share_one_call(self) -> None:
+        """Threads arriving while a call is in flight reuse its result."""
+        coalescer = RequestCoalescer()
+        calls = 0
+        barrier = threading.Barrier(5)
+
+        def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            time.sleep(0.05)
+            return "value"
+
+        results: list[str] = []
+
+        def worker() -> None:
+            barrier.wait()
+            results.append(coalescer.run("k", fetch))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == 1
+        assert results == ["value"] * 5
+        assert (coalescer.stats.leaders, coalescer.stats.shared) == (1, 4)
+
+    def test_errors_propagate_and_are_not_kept(self) -> None:
+        """A failing call raises in the caller and the next call runs again."""
+        coalescer = RequestCoalescer()
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            coalescer.run("k", fail)
+        assert coalescer.run("k", lambda: 1) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_follower_keeps_request(self) -> None:
+        """Cancelling one waiter does not cancel the shared request."""
+        coalescer = RequestCoalescer()
+
+        async def fetch() -> str:
+            await asyncio.sleep(0.05)
+            return "value"
+
+        first = asyncio.ensure_future(coalescer.run_async("k", fetch))
+        second = asyncio.ensure_future(coalescer.run_async("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "value"
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_cancels_request(self) -> None:
+        """The request is cancelled when nobody waits for it anymore."""
+        coalescer = RequestCoalescer()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fetch() -> None:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiter = asyncio.ensure_future(coalescer.run_async("k", fetch))
+        await started.wait()
+        waiter.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+class TestClientCoalescing:
+    """Tests for RapiClient(coalesce=True)."""
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_identical_reads_share_request(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Concurrent identical GETs send one request; other params do not."""
+        send = mock.AsyncMock(side_effect=_slow_send)
+        mock_client_class.return_value.send = send
+        client = rapi_client(ENDPOINTS, coalesce=True)
+
+        responses = await asyncio.gather(
+            *(client.call_async("ex.klines", symbol="BTC") for _ in range(5)),
+            client.call_async("ex.klines", symbol="ETH"),
+        )
+
+        assert send.await_count == 2
+        assert [r.data["symbol"] for r in responses] == ["BTC"] * 5 + ["ETH"]
+        assert client.coalesce_stats is not None
+        assert client.coalesce_stats.shared == 4
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_priorities_not_shared(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """An urgent read does not join a low-priority request in flight."""
+        send = mock.AsyncMock(side_effect=_slow_send)
+        mock_client_class.return_value.send = send
+        client = rapi_client(ENDPOINTS, coalesce=True)
+
+        await asyncio.gather(
+            client.call_async("ex.klines", symbol="BTC", request_priority=Priority.LOW),
+            client.call_async("ex.klines", symbol="BTC", request_priority=Priority.CRITICAL),
+            client.call_async("ex.klines", symbol="BTC", request_priority=Priority.CRITICAL),
+        )
+
+        assert send.await_count == 2
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_mutating_methods_not_shared(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """POST endpoints always send their own request."""
+        send = mock.AsyncMock(side_effect=_slow_send)
+        mock_client_class.return_value.send = send
+        client = rapi_client(ENDPOINTS, coalesce=True)
+
+        await asyncio.gather(*(client.call_async("ex.order", body={"qty": 1}) for _ in range(3)))
+
+        assert send.await_count == 3
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_disabled_by_default(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Without coalesce=True every call sends a request."""
+        send = mock.AsyncMock(side_effect=_slow_send)
+        mock_client_class.return_value.send = send
+        client = rapi_client(ENDPOINTS)
+
+        await asyncio.gather(*(client.call_async("ex.klines", symbol="BTC") for _ in range(3)))
+
+        assert send.await_count == 3
+        assert client.coalesce_stats is None
+
+    @mock.patch("httpx.Client")
+    def test_sync_batch_shares_request(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """call_many threads requesting the same read share one request."""
+
+        def send(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.05)
+            return httpx.Response(200, json={"ok": True}, request=request)
+
+        mock_client_class.return_value.send.side_effect = send
+        client = rapi_client(ENDPOINTS, coalesce=True)
+
+        results = client.call_many([("ex.klines", {"symbol": "BTC"})] * 4, max_concurrency=4)
+
+        assert all(r.ok for r in results)
+        assert mock_client_class.return_value.send.call_count == 1
@@ -6,8 +6,15 @@
 
 from kstlib.rapi.config import (
     ApiConfig,
+    CacheConfig,
     EndpointConfig,
+    EndpointTemplate,
+    HttpConfig,
+    PaginationConfig,
+    PathFormatter,
     RapiConfigManager,
+    RateBucket,
+    RateLimitConfig,
     SafeguardConfig,
     _expand_env_vars,
     _expand_env_vars_recursive,
@@ -1286,6 +1293,299 @@ def test_from_yaml_invalid_algorithm_rejected(self, tmp_path: Path) -> None:
             RapiConfigManager.from_file(str(rapi_file))
 
 
+class TestHttpConfig:
+    """Tests for HttpConfig and the per-API http section."""
+
+    def test_defaults(self) -> None:
+        """APIs without an http section get the default pool."""
+        manager = RapiConfigManager({"api": {"test": {"base_url": "https://test.com"}}})
+        api = manager.get_api("test")
+        assert api is not None
+        assert api.http == HttpConfig()
+        assert api.http.http2 is False
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"max_connections": 0}, "max_connections"),
+            ({"max_keepalive_connections": -1}, "max_keepalive_connections"),
+            ({"keepalive_expiry": -1.0}, "keepalive_expiry"),
+        ],
+    )
+    def test_invalid_values(self, kwargs: dict[str, float], match: str) -> None:
+        """Out-of-range pool settings raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            HttpConfig(**kwargs)  # type: ignore[arg-type]
+
+    def test_from_rapi_file_and_defaults(self, tmp_path: Path) -> None:
+        """The http section is read from files and inherited from defaults."""
+        rapi_file = tmp_path / "binance.rapi.yml"
+        rapi_file.write_text(
+            """
+name: binance
+base_url: "https://api.binance.com"
+http:
+  max_connections: 8
+  http2: true
+  preconnect: true
+endpoints:
+  ticker:
+    path: "/api/v3/ticker/price"
+"""
+        )
+        other_file = tmp_path / "kraken.rapi.yml"
+        other_file.write_text(
+            """
+name: kraken
+base_url: "https://api.kraken.com"
+endpoints:
+  ticker:
+    path: "/0/public/Ticker"
+"""
+        )
+
+        manager = RapiConfigManager.from_files(
+            [rapi_file, other_file],
+            defaults={"http": {"keepalive_expiry": 30}},
+        )
+
+        binance = manager.get_api("binance")
+        kraken = manager.get_api("kraken")
+        assert binance is not None
+        assert kraken is not None
+        assert binance.http == HttpConfig(max_connections=8, http2=True, preconnect=True)
+        assert kraken.http.keepalive_expiry == 30.0
+
+
+class TestCacheConfig:
+    """Tests for the per-endpoint cache entry."""
+
+    def test_shorthand_and_mapping(self) -> None:
+        """A number is a TTL, a mapping sets every field, absent means off."""
+        manager = RapiConfigManager(
+            {
+                "api": {
+                    "ex": {
+                        "base_url": "https://ex.com",
+                        "endpoints": {
+                            "time": {"path": "/time", "cache": 5},
+                            "info": {"path": "/info", "cache": {"ttl": 300, "revalidate": False}},
+                            "live": {"path": "/live"},
+                        },
+                    }
+                }
+            }
+        )
+        api = manager.get_api("ex")
+        assert api is not None
+        assert api.endpoints["time"].cache == CacheConfig(ttl=5.0)
+        assert api.endpoints["info"].cache == CacheConfig(ttl=300.0, revalidate=False)
+        assert api.endpoints["live"].cache is None
+
+    def test_ignored_on_mutating_methods(self) -> None:
+        """Only GET endpoints are cached."""
+        manager = RapiConfigManager(
+            {
+                "api": {
+                    "ex": {
+                        "base_url": "https://ex.com",
+                        "endpoints": {"order": {"path": "/order", "method": "POST", "cache": 60}},
+                    }
+                }
+            }
+        )
+        api = manager.get_api("ex")
+        assert api is not None
+        assert api.endpoints["order"].cache is None
+
+    def test_invalid_values(self) -> None:
+        """Negative TTLs and unknown shapes are rejected."""
+        with pytest.raises(ValueError, match="ttl"):
+            CacheConfig(ttl=-1)
+        with pytest.raises(ValueError, match="Invalid cache config"):
+            RapiConfigManager(
+                {"api": {"ex": {"base_url": "https://ex.com", "endpoints": {"e": {"path": "/", "cache": "yes"}}}}}
+            )
+
+
+class TestPaginationConfig:
+    """Tests for the per-endpoint pagination entry."""
+
+    def test_shorthand_and_mapping(self) -> None:
+        """A string is a style, a mapping sets fields, absent means off."""
+        manager = RapiConfigManager(
+            {
+                "api": {
+                    "ex": {
+                        "base_url": "https://ex.com",
+                        "endpoints": {
+                            "repos": {"path": "/repos", "pagination": "link"},
+                            "trades": {"path": "/trades", "pagination": {"style": "offset", "items": "data"}},
+                            "time": {"path": "/time"},
+                        },
+                    }
+                }
+            }
+        )
+        api = manager.get_api("ex")
+        assert api is not None
+        assert api.endpoints["repos"].pagination == PaginationConfig(style="link")
+        assert api.endpoints["trades"].pagination == PaginationConfig(style="offset", items="data")
+        assert api.endpoints["time"].pagination is None
+
+    def test_invalid_values(self) -> None:
+        """Unknown styles, options and bounds are rejected."""
+        with pytest.raises(ValueError, match="Invalid pagination style"):
+            PaginationConfig(style="token")
+        with pytest.raises(ValueError, match="prefetch"):
+            PaginationConfig(style="page", prefetch=-1)
+        with pytest.raises(ValueError, match="Unknown pagination options"):
+            RapiConfigManager(
+                {
+                    "api": {
+                        "ex": {
+                            "base_url": "https://ex.com",
+                            "endpoints": {"e": {"path": "/", "pagination": {"style": "page", "size": 10}}},
+                        }
+                    }
+                }
+            )
+
+
+class TestRateLimitConfig:
+    """Tests for the per-API rate_limit section."""
+
+    def test_buckets_and_weights(self) -> None:
+        """Buckets and endpoint weights are parsed from the API section."""
+        manager = RapiConfigManager(
+            {
+                "api": {
+                    "ex": {
+                        "base_url": "https://ex.com",
+                        "rate_limit": {
+                            "buckets": {
+                                "weight_1m": {"limit": 6000, "per": 60, "header": "X-MBX-USED-WEIGHT-1M"},
+                                "orders_10s": {"limit": 50, "per": 10, "default_weight": 0},
+                            },
+                            "weights": {"depth": 50, "order": {"orders_10s": 1}},
+                        },
+                        "endpoints": {"depth": {"path": "/depth"}, "order": {"path": "/order", "method": "POST"}},
+                    }
+                }
+            }
+        )
+        api = manager.get_api("ex")
+        assert api is not None
+        assert api.rate_limit is not None
+        assert api.rate_limit.buckets[0] == RateBucket(
+            name="weight_1m", limit=6000, per=60.0, header="X-MBX-USED-WEIGHT-1M"
+        )
+        assert api.rate_limit.weights_for("depth") == {"weight_1m": 50, "orders_10s": 50}
+        assert api.rate_limit.weights_for("order") == {"weight_1m": 1, "orders_10s": 1}
+
+    def test_absent_means_off(self) -> None:
+        """APIs without a rate_limit section track no quota."""
+        manager = RapiConfigManager({"api": {"ex": {"base_url": "https://ex.com", "endpoints": {}}}})
+        api = manager.get_api("ex")
+        assert api is not None
+        assert api.rate_limit is None
+
+    def test_invalid_values(self) -> None:
+        """Malformed sections, bounds and bucket references are rejected."""
+        with pytest.raises(ValueError, match="limit must be at least 1"):
+            RateBucket(name="w", limit=0, per=60)
+        with pytest.raises(ValueError, match="unknown buckets"):
+            RateLimitConfig(buckets=(RateBucket(name="w", limit=10, per=1),), weights={"e": {"x": 1}})
+        for section, message in (
+            ([1200], "expected a 'buckets' mapping"),
+            ({"buckets": {"w": {"limit": 10}}}, "needs 'limit' and 'per'"),
+            ({"buckets": {"w": {"limit": 10, "per": 1}}, "window": 60}, "Unknown rate_limit options"),
+            ({"buckets": {"w": {"limit": 10, "per": 1}}, "weights": {"e": "heavy"}}, "Invalid rate_limit weight"),
+        ):
+            with pytest.raises(ValueError, match=message):
+                RapiConfigManager({"api": {"ex": {"base_url": "https://ex.com", "rate_limit": section}}})
+
+
+class TestEndpointTemplate:
+    """Tests for precompiled endpoint templates and memoized resolution."""
+
+    @staticmethod
+    def _manager() -> RapiConfigManager:
+        return RapiConfigManager(
+            {
+                "api": {
+                    "ex": {
+                        "base_url": "https://ex.com",
+                        "credentials": "ex_key",
+                        "headers": {"Accept": "application/json", "X-Level": "service"},
+                        "endpoints": {
+                            "klines": {
+                                "path": "/klines/{symbol}",
+                                "query": {"limit": "500"},
+                                "headers": {"X-Level": "endpoint"},
+                            },
+                            "time": {"path": "/time", "auth": False},
+                        },
+                    }
+                }
+            }
+        )
+
+    def test_compiled_at_load(self) -> None:
+        """Static headers, query defaults and auth are precomputed."""
+        template = self._manager().template("ex.klines")
+        assert template.static_headers == {"Accept": "application/json", "X-Level": "endpoint"}
+        assert template.auth_type == "bearer"
+        assert template.url_error is None
+        assert template.url(("BTCUSDT",), {}) == "https://ex.com/klines/BTCUSDT"
+        assert template.query({"symbol": "BTCUSDT", "startTime": 1}) == {"limit": "500", "startTime": "1"}
+
+    def test_auth_disabled_endpoint(self) -> None:
+        """auth: false endpoints have no auth strategy."""
+        assert self._manager().template("time").auth_type is None
+
+    def test_resolve_is_memoized(self) -> None:
+        """Full and short references resolve to the same objects."""
+        manager = self._manager()
+        api, endpoint = manager.resolve("ex.klines")
+        assert manager.resolve("klines") == (api, endpoint)
+        assert manager.resolve("klines")[1] is endpoint
+        assert manager.template("klines") is manager.template("ex.klines")
+        with pytest.raises(EndpointNotFoundError):
+            manager.template("ex.missing")
+
+    def test_merge_recompiles(self) -> None:
+        """Merging another manager makes its endpoints resolvable."""
+        manager = self._manager()
+        with pytest.raises(EndpointNotFoundError):
+            manager.resolve("other.ping")
+        manager._merge_apis(
+            RapiConfigManager({"api": {"other": {"base_url": "https://o.com", "endpoints": {"ping": {}}}}}),
+        )
+        assert manager.template("other.ping").url((), {}) == "https://o.com/ping"
+
+    def test_invalid_base_url_reported(self) -> None:
+        """Unsafe base URLs are flagged at compile time, not rejected."""
+        api = ApiConfig(name="bad", base_url="ftp://bad.com")
+        template = EndpointTemplate.compile(api, EndpointConfig(name="ep", api_name="bad", path="/"))
+        assert template.url_error is not None
+        assert "scheme" in template.url_error
+
+    @pytest.mark.parametrize(
+        ("path", "args", "kwargs", "expected"),
+        [
+            ("/a/{0}/b/{1}", ("x", "y"), {}, "/a/x/b/y"),
+            ("/{name}/{name}", (), {"name": "n"}, "/n/n"),
+            ("/{a}/{b}", ("1",), {"b": "2"}, "/1/2"),
+            ("/{a}/{b}", ("1", "2"), {}, "/1/2"),
+            ("/{id}", (), {"id": "{other}"}, "/{other}"),
+        ],
+    )
+    def test_path_formatter(self, path: str, args: tuple[str, ...], kwargs: dict[str, str], expected: str) -> None:
+        """Placeholders are filled like build_path; values are not re-scanned."""
+        assert PathFormatter(path).format(args, kwargs) == expected
+
+
 class TestSafeguardConfig:
     """Tests for SafeguardConfig dataclass."""
 
@@ -3,6 +3,9 @@
 import json
 import os
 import tempfile
+import threading
+import time
+from typing import Any
 from unittest import mock
 
 import pytest
@@ -357,6 +360,159 @@ def test_clear_cache(self) -> None:
         assert record2.value == "value2"
 
 
+class TestCredentialResolverExpiry:
+    """Tests for expiry-aware caching, refresh-ahead and resolve_many."""
+
+    @staticmethod
+    def _resolver(clock: list[float], refresh_ahead: float = 60.0) -> CredentialResolver:
+        config = {"binance": {"type": "env", "var": "BINANCE_KEY"}, "kraken": {"type": "env", "var": "KRAKEN_KEY"}}
+        return CredentialResolver(config, refresh_ahead=refresh_ahead, clock=lambda: clock[0])
+
+    @staticmethod
+    def _wait_for(predicate: Any) -> None:
+        end = time.monotonic() + 2
+        while not predicate() and time.monotonic() < end:
+            time.sleep(0.001)
+
+    def test_expired_record_resolved_again(self) -> None:
+        """A cached record past expires_at is not returned."""
+        clock = [1000.0]
+        resolver = self._resolver(clock, refresh_ahead=0)
+        records = iter([CredentialRecord(value="old", expires_at=1100.0), CredentialRecord(value="new")])
+
+        with mock.patch.object(resolver, "_resolve_env", side_effect=lambda *_: next(records)):
+            assert resolver.resolve("binance").value == "old"
+            clock[0] = 1099.0
+            assert resolver.resolve("binance").value == "old"
+            clock[0] = 1100.0
+            assert resolver.resolve("binance").value == "new"
+
+    def test_refresh_ahead_in_background(self) -> None:
+        """Near expiry the cached record is returned while a refresh runs."""
+        clock = [1000.0]
+        resolver = self._resolver(clock)
+        release = threading.Event()
+        calls: list[str] = []
+
+        def source(*_: Any) -> CredentialRecord:
+            calls.append(threading.current_thread().name)
+            if len(calls) > 1:
+                release.wait(2)
+            return CredentialRecord(value=f"token{len(calls)}", expires_at=clock[0] + 300)
+
+        with mock.patch.object(resolver, "_resolve_env", side_effect=source):
+            assert resolver.resolve("binance").value == "token1"
+            clock[0] = 1250.0
+            assert resolver.resolve("binance").value == "token1"
+            assert resolver.resolve("binance").value == "token1"
+            release.set()
+            self._wait_for(lambda: resolver.resolve("binance").value == "token2")
+
+        assert resolver.resolve("binance").value == "token2"
+        assert len(calls) == 2
+        assert calls[1] == "credential-refresh-binance"
+
+    def test_failed_refresh_keeps_record(self) -> None:
+        """A failed background refresh keeps serving the cached record."""
+        clock = [1000.0]
+        resolver = self._resolver(clock)
+        record = CredentialRecord(value="token", expires_at=1300.0)
+        failures = iter([CredentialError("binance", "sops failed")])
+
+        def source(*_: Any) -> CredentialRecord:
+            error = next(failures, None)
+            if error is not None:
+                raise error
+            return record
+
+        with mock.patch.object(resolver, "_resolve_env", side_effect=source):
+            resolver._cache["binance"] = record
+            clock[0] = 1250.0
+            assert resolver.resolve("binance") is record
+            self._wait_for(lambda: "binance" in resolver._retry_refresh_at)
+            assert resolver.resolve("binance") is record
+
+    def test_unchanged_record_refreshed_once(self) -> None:
+        """A source that keeps returning the same record is not re-read on every resolve."""
+        clock = [1000.0]
+        resolver = self._resolver(clock)
+        calls = 0
+
+        def source(*_: Any) -> CredentialRecord:
+            nonlocal calls
+            calls += 1
+            return CredentialRecord(value="token", expires_at=1300.0)
+
+        with mock.patch.object(resolver, "_resolve_env", side_effect=source):
+            resolver.resolve("binance")
+            clock[0] = 1250.0
+            resolver.resolve("binance")
+            self._wait_for(lambda: "binance" in resolver._retry_refresh_at)
+            for _ in range(200):
+                clock[0] += 0.2
+                assert resolver.resolve("binance").value == "token"
+
+        assert calls == 2
+
+    def test_concurrent_resolves_share_lookup(self) -> None:
+        """Threads resolving the same credential trigger one lookup."""
+        resolver = self._resolver([1000.0])
+        started = threading.Event()
+        release = threading.Event()
+        calls = 0
+
+        def source(*_: Any) -> CredentialRecord:
+            nonlocal calls
+            calls += 1
+            started.set()
+            release.wait(2)
+            return CredentialRecord(value="key")
+
+        results: list[str] = []
+        with mock.patch.object(resolver, "_resolve_env", side_effect=source):
+            threads = [threading.Thread(target=lambda: results.append(resolver.resolve("binance").value))]
+            threads[0].start()
+            started.wait(2)
+            threads.append(threading.Thread(target=lambda: results.append(resolver.resolve("binance").value)))
+            threads[1].start()
+            time.sleep(0.05)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        assert results == ["key", "key"]
+        assert calls == 1
+
+    def test_resolve_many_is_concurrent(self) -> None:
+        """Independent credentials are resolved at the same time."""
+        resolver = self._resolver([1000.0])
+        barrier = threading.Barrier(2, timeout=2)
+
+        def source(name: str, *_: Any) -> CredentialRecord:
+            barrier.wait()
+            return CredentialRecord(value=name)
+
+        with mock.patch.object(resolver, "_resolve_env", side_effect=source):
+            records = resolver.resolve_many(["kraken", "binance", "kraken"])
+
+        assert list(records) == ["kraken", "binance"]
+        assert records["binance"].value == "binance"
+
+    def test_resolve_many_raises_after_all(self) -> None:
+        """A failing credential is raised once the others are cached."""
+        resolver = self._resolver([1000.0])
+
+        with mock.patch.dict(os.environ, {"KRAKEN_KEY": "k"}, clear=True):
+            with pytest.raises(CredentialError, match="missing"):
+                resolver.resolve_many(["missing", "kraken"])
+            assert resolver._cache["kraken"].value == "k"
+
+    def test_invalid_refresh_ahead(self) -> None:
+        """A negative refresh_ahead is rejected."""
+        with pytest.raises(ValueError, match="refresh_ahead"):
+            CredentialResolver({}, refresh_ahead=-1)
+
+
 class TestCredentialResolverNotFound:
     """Tests for CredentialResolver error handling."""
 
@@ -0,0 +1,252 @@
+"""Tests for config-driven pagination (RapiClient.paginate and paginate_async)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import httpx
+import pytest
+
+from kstlib.rapi import PaginationConfig, RequestError
+from kstlib.rapi.pagination import PagePlanner, next_link
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from kstlib.rapi import RapiClient
+
+ROWS = list(range(7))
+NO_RETRY = {"max_retries": 0}
+
+
+def _endpoints(pagination: Any) -> dict[str, Any]:
+    return {"trades": {"path": "/trades/{symbol}", "pagination": pagination}, "time": {"path": "/time"}}
+
+
+def _offset_reply(request: httpx.Request) -> httpx.Response:
+    offset = int(request.url.params["offset"])
+    limit = int(request.url.params["limit"])
+    return httpx.Response(200, json={"data": ROWS[offset : offset + limit]}, request=request)
+
+
+class TestPagePlanner:
+    """Tests for page planning."""
+
+    def test_page_style_starts_from_kwargs(self) -> None:
+        """An explicit page kwarg sets the first page."""
+        planner = PagePlanner(PaginationConfig(style="page", limit_param=None), {"page": 5})
+        assert [planner.params(i) for i in range(2)] == [{"page": 5}, {"page": 6}]
+
+    def test_max_pages_bounds_params(self) -> None:
+        """No params are planned past max_pages."""
+        planner = PagePlanner(PaginationConfig(style="offset", max_pages=2), {})
+        assert planner.params(1) is not None
+        assert planner.params(2) is None
+
+    def test_next_link_with_several_rels(self) -> None:
+        """A link carrying several relations is still found."""
+        assert next_link({"Link": '<https://x.io/?p=2>; rel="next last"'}) == "https://x.io/?p=2"
+
+
+class TestPaginate:
+    """Tests for the sync pagination API."""
+
+    @mock.patch("httpx.Client")
+    def test_offset_style(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Offset pages are requested until a short page arrives."""
+        mock_client_class.return_value.send.side_effect = _offset_reply
+        client = rapi_client(
+            _endpoints({"style": "offset", "items": "data", "limit": 3, "prefetch": 0}), limits=NO_RETRY
+        )
+
+        assert list(client.paginate("ex.trades", symbol="BTC")) == ROWS
+        offsets = [c.args[0].url.params["offset"] for c in mock_client_class.return_value.send.call_args_list]
+        assert offsets == ["0", "3", "6"]
+
+    @mock.patch("httpx.Client")
+    def test_page_style_keeps_call_params(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Page numbers start at start_page and call kwargs go with every page."""
+
+        def reply(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/trades/BTC"
+            assert request.url.params["side"] == "buy"
+            page = int(request.url.params["page"])
+            return httpx.Response(200, json=ROWS[(page - 1) * 4 : page * 4], request=request)
+
+        mock_client_class.return_value.send.side_effect = reply
+        client = rapi_client(
+            _endpoints({"style": "page", "limit": 4, "limit_param": "per_page", "prefetch": 0}), limits=NO_RETRY
+        )
+
+        assert list(client.paginate("ex.trades", symbol="BTC", side="buy")) == ROWS
+
+    @mock.patch("httpx.Client")
+    def test_cursor_style(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Each page sends the cursor found in the previous response."""
+        pages = {None: ([1, 2], "c2"), "c2": ([3], "c3"), "c3": ([4], None)}
+
+        def reply(request: httpx.Request) -> httpx.Response:
+            items, cursor = pages[request.url.params.get("cursor")]
+            return httpx.Response(200, json={"items": items, "meta": {"next": cursor}}, request=request)
+
+        mock_client_class.return_value.send.side_effect = reply
+        client = rapi_client(
+            _endpoints({"style": "cursor", "items": "items", "cursor_path": "meta.next"}), limits=NO_RETRY
+        )
+
+        assert list(client.paginate("ex.trades", symbol="BTC")) == [1, 2, 3, 4]
+        assert mock_client_class.return_value.send.call_count == 3
+
+    @mock.patch("httpx.Client")
+    def test_repeated_cursor_stops(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """A server echoing the same cursor does not loop forever."""
+        mock_client_class.return_value.send.side_effect = lambda request: httpx.Response(
+            200, json={"items": [1], "next_cursor": "same"}, request=request
+        )
+        client = rapi_client(_endpoints({"style": "cursor", "items": "items"}), limits=NO_RETRY)
+
+        assert list(client.paginate("ex.trades", symbol="BTC")) == [1, 1]
+
+    @mock.patch("httpx.Client")
+    def test_link_style(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """The Link header's next URL drives the following request."""
+
+        def reply(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params.get("page", "1"))
+            headers = (
+                {"Link": f'<https://ex.com/trades/BTC?page={page + 1}&per_page=2>; rel="next"'} if page < 3 else {}
+            )
+            return httpx.Response(200, json=[page], headers=headers, request=request)
+
+        mock_client_class.return_value.send.side_effect = reply
+        client = rapi_client(_endpoints("link"), limits=NO_RETRY)
+
+        assert list(client.paginate("ex.trades", symbol="BTC")) == [1, 2, 3]
+        last = mock_client_class.return_value.send.call_args.args[0]
+        assert last.url.params["per_page"] == "2"
+
+    @mock.patch("httpx.Client")
+    def test_prefetch_overlaps_consumption(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """The next pages are requested while the current page is consumed."""
+        sent = threading.Event()
+        calls = 0
+
+        def reply(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls >= 3:
+                sent.set()
+            return _offset_reply(request)
+
+        mock_client_class.return_value.send.side_effect = reply
+        client = rapi_client(
+            _endpoints({"style": "offset", "items": "data", "limit": 3, "prefetch": 2}), limits=NO_RETRY
+        )
+
+        records = client.paginate("ex.trades", symbol="BTC")
+        assert next(records) == 0
+        assert sent.wait(timeout=1)
+        assert [0, *records] == ROWS
+
+    @mock.patch("httpx.Client")
+    def test_prefetch_is_bounded(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """No more than prefetch + 1 pages are requested ahead of the consumer."""
+        mock_client_class.return_value.send.side_effect = lambda request: httpx.Response(
+            200, json={"data": [0, 1, 2]}, request=request
+        )
+        client = rapi_client(
+            _endpoints({"style": "offset", "items": "data", "limit": 3, "prefetch": 2}), limits=NO_RETRY
+        )
+
+        records = client.paginate("ex.trades", symbol="BTC")
+        next(records)
+        time.sleep(0.05)
+        assert mock_client_class.return_value.send.call_count == 3
+        records.close()
+
+    @mock.patch("httpx.Client")
+    def test_max_pages_override(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """max_pages stops the run even if more pages exist."""
+        mock_client_class.return_value.send.side_effect = _offset_reply
+        client = rapi_client(_endpoints({"style": "offset", "items": "data", "limit": 2}), limits=NO_RETRY)
+
+        assert list(client.paginate("ex.trades", symbol="BTC", max_pages=2)) == [0, 1, 2, 3]
+
+    @mock.patch("httpx.Client")
+    def test_error_page_raises(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """A non-2xx page raises RequestError with its status."""
+        mock_client_class.return_value.send.side_effect = lambda request: httpx.Response(
+            403, text="denied", request=request
+        )
+        client = rapi_client(_endpoints("page"), limits=NO_RETRY)
+
+        with pytest.raises(RequestError) as exc_info:
+            list(client.paginate("ex.trades", symbol="BTC"))
+        assert exc_info.value.status_code == 403
+
+    @mock.patch("httpx.Client")
+    def test_items_not_a_list(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """A page whose items path is not a list is reported."""
+        mock_client_class.return_value.send.side_effect = lambda request: httpx.Response(
+            200, json={"data": {"id": 1}}, request=request
+        )
+        client = rapi_client(_endpoints({"style": "page", "items": "data"}), limits=NO_RETRY)
+
+        with pytest.raises(TypeError, match="not a list"):
+            list(client.paginate("ex.trades", symbol="BTC"))
+
+    def test_unpaginated_endpoint_raises_eagerly(self, rapi_client: Callable[..., RapiClient]) -> None:
+        """Endpoints without pagination config are rejected on call."""
+        client = rapi_client(_endpoints("page"))
+        with pytest.raises(ValueError, match="no pagination config"):
+            client.paginate("ex.time")
+
+
+class TestPaginateAsync:
+    """Tests for the async pagination API."""
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_offset_pages_in_flight(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Read-ahead pages run concurrently and records keep page order."""
+        in_flight = peak = 0
+
+        async def send(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _offset_reply(request)
+
+        mock_client_class.return_value.send = send
+        client = rapi_client(
+            _endpoints({"style": "offset", "items": "data", "limit": 2, "prefetch": 3}), limits=NO_RETRY
+        )
+
+        assert [row async for row in client.paginate_async("ex.trades", symbol="BTC")] == ROWS
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_cursor_style(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Cursor pages are chained with async for."""
+
+        async def send(request: httpx.Request) -> httpx.Response:
+            cursor = request.url.params.get("cursor")
+            return httpx.Response(200, json={"items": [cursor or "first"], "next_cursor": None if cursor else "b"})
+
+        mock_client_class.return_value.send = send
+        client = rapi_client(_endpoints({"style": "cursor", "items": "items"}), limits=NO_RETRY)
+
+        assert [row async for row in client.paginate_async("ex.trades", symbol="BTC")] == ["first", "b"]
@@ -0,0 +1,174 @@
+"""Tests for client-side quota tracking (rate_limit sections)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import httpx
+import pytest
+
+from kstlib.rapi import QuotaTracker, RateBucket, RateLimitConfig
+from kstlib.resilience.deadline import deadline
+from kstlib.resilience.exceptions import DeadlineExceededError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from kstlib.rapi import RapiClient
+
+
+class _Clock:
+    """Manual wall clock; patched sleeps advance it."""
+
+    def __init__(self, now: float = 1_000_040.0) -> None:
+        self.now = now
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+    async def asleep(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+
+def _tracker(clock: _Clock, limit: int = 10, weights: dict[str, dict[str, int]] | None = None) -> QuotaTracker:
+    config = RateLimitConfig(
+        buckets=(RateBucket(name="weight_1m", limit=limit, per=60, header="X-Used-Weight-1M"),),
+        weights=weights or {},
+    )
+    return QuotaTracker(config, clock=clock)
+
+
+ENDPOINTS = {"depth": {"path": "/depth"}, "time": {"path": "/time"}}
+RATE_LIMIT = {
+    "buckets": {"weight_1h": {"limit": 100, "per": 3600, "header": "X-Used-Weight-1H"}},
+    "weights": {"depth": 40},
+}
+
+
+class TestQuotaTracker:
+    """Tests for the tracker itself."""
+
+    def test_waits_for_window_reset(self) -> None:
+        """A call that does not fit waits until the window resets."""
+        clock = _Clock()
+        tracker = _tracker(clock, weights={"depth": {"weight_1m": 4}})
+
+        with mock.patch("kstlib.rapi.quota.time.sleep", clock.sleep):
+            assert tracker.reserve("depth") == 0.0
+            assert tracker.reserve("depth") == 0.0
+            waited = tracker.reserve("depth")
+
+        assert waited == pytest.approx(40.0)
+        assert tracker.usage == {"weight_1m": 4}
+        assert tracker.stats.throttled == 1
+        assert tracker.stats.reserved == 3
+
+    def test_heavy_call_fits_empty_window(self) -> None:
+        """A call heavier than the bucket goes through when the window is empty."""
+        tracker = _tracker(_Clock(), limit=5, weights={"export": {"weight_1m": 20}})
+
+        assert tracker.reserve("export") == 0.0
+        assert tracker.usage == {"weight_1m": 20}
+
+    def test_headers_raise_usage_of_current_window(self) -> None:
+        """Reported usage replaces a lower estimate; stale windows are ignored."""
+        clock = _Clock()
+        tracker = _tracker(clock)
+        tracker.reserve("time")
+
+        tracker.observe(httpx.Headers({"x-used-weight-1m": "8"}), sent_at=clock.now)
+        tracker.observe({"X-Used-Weight-1M": "3"})
+        tracker.observe({"X-Used-Weight-1M": "9"}, sent_at=clock.now - 60)
+
+        assert tracker.usage == {"weight_1m": 8}
+        assert tracker.stats.synced == 1
+
+    def test_pause_holds_reservations(self) -> None:
+        """After pause() every reservation waits for the pause to end."""
+        clock = _Clock()
+        tracker = _tracker(clock)
+        tracker.pause(2.5)
+
+        with mock.patch("kstlib.rapi.quota.time.sleep", clock.sleep):
+            assert tracker.reserve("time") == pytest.approx(2.5)
+        assert tracker.stats.pauses == 1
+
+    def test_wait_bounded_by_deadline(self) -> None:
+        """A full bucket raises once the deadline budget is spent."""
+        tracker = _tracker(_Clock(), limit=1)
+        tracker.reserve("time")
+
+        with pytest.raises(DeadlineExceededError), deadline(0.05):
+            tracker.reserve("time")
+
+    @pytest.mark.asyncio
+    async def test_reserve_async(self) -> None:
+        """The async variant waits without blocking the loop."""
+        clock = _Clock()
+        tracker = _tracker(clock, limit=1)
+        tracker.reserve("time")
+
+        with mock.patch("kstlib.rapi.quota.asyncio.sleep", clock.asleep):
+            waited = await tracker.reserve_async("time")
+
+        assert waited == pytest.approx(40.0)
+
+
+class TestClientQuota:
+    """Tests for quota tracking in RapiClient."""
+
+    @mock.patch("httpx.Client")
+    def test_throttles_before_sending(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Reported usage near the limit holds the next call instead of sending it."""
+
+        def send(request: httpx.Request, **kwargs: Any) -> httpx.Response:
+            return httpx.Response(200, json={}, headers={"X-Used-Weight-1H": "70"}, request=request)
+
+        mock_client_class.return_value.send.side_effect = send
+        client = rapi_client(ENDPOINTS, api={"rate_limit": RATE_LIMIT}, limits={"max_retries": 0})
+
+        client.call("ex.time")
+        assert client.quota_usage == {"ex": {"weight_1h": 70}}
+        with pytest.raises(DeadlineExceededError), deadline(0.05):
+            client.call("ex.depth")
+
+        assert mock_client_class.return_value.send.call_count == 1
+
+    @mock.patch("httpx.Client")
+    def test_retry_after_pauses_api(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """A 429 with Retry-After pauses every call to the API."""
+        mock_client_class.return_value.send.side_effect = lambda request: httpx.Response(
+            429, headers={"Retry-After": "30"}, request=request
+        )
+        client = rapi_client(ENDPOINTS, api={"rate_limit": RATE_LIMIT}, limits={"max_retries": 0})
+
+        assert client.call("ex.time").status_code == 429
+        with pytest.raises(DeadlineExceededError), deadline(0.05):
+            client.call("ex.time")
+
+        assert client.quota_stats["ex"].pauses == 1
+        assert mock_client_class.return_value.send.call_count == 1
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_async_weights(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Async calls reserve their endpoint weight."""
+
+        async def send(request: httpx.Request, **kwargs: Any) -> httpx.Response:
+            return httpx.Response(200, json={}, request=request)
+
+        mock_client_class.return_value.send = send
+        client = rapi_client(ENDPOINTS, api={"rate_limit": RATE_LIMIT}, limits={"max_retries": 0})
+
+        await client.call_async("ex.depth")
+        await client.call_async("ex.time")
+
+        assert client.quota_usage == {"ex": {"weight_1h": 41}}
@@ -0,0 +1,185 @@
+"""Tests for priority scheduling of rate-limited requests."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import httpx
+import pytest
+
+from kstlib.rapi import RapiClient, RapiConfigManager, RequestScheduler
+from kstlib.resilience import RateLimiter
+from kstlib.resilience.admission import Priority
+from kstlib.resilience.deadline import deadline
+from kstlib.resilience.exceptions import DeadlineExceededError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _drained(per: float) -> RateLimiter:
+    """Return a limiter with one token per ``per`` seconds and none left."""
+    limiter = RateLimiter(rate=1, per=per)
+    limiter.acquire()
+    return limiter
+
+
+def _wait_depth(scheduler: RequestScheduler, depth: int) -> None:
+    end = time.monotonic() + 1
+    while scheduler.depth < depth and time.monotonic() < end:
+        time.sleep(0.001)
+
+
+def _run_threads(scheduler: RequestScheduler, priorities: list[int], gap: float = 0.0) -> list[int]:
+    """Queue one thread per priority (in list order) and return dispatch order."""
+    order: list[int] = []
+
+    def worker(priority: int) -> None:
+        scheduler.acquire(priority)
+        order.append(priority)
+
+    threads = []
+    for depth, priority in enumerate(priorities, start=1):
+        thread = threading.Thread(target=worker, args=(priority,))
+        thread.start()
+        threads.append(thread)
+        _wait_depth(scheduler, depth)
+        time.sleep(gap)
+    for thread in threads:
+        thread.join()
+    return order
+
+
+class TestRequestScheduler:
+    """Tests for the scheduler itself."""
+
+    def test_highest_priority_first(self) -> None:
+        """Queued requests get tokens most important first."""
+        scheduler = RequestScheduler(_drained(per=0.05))
+
+        order = _run_threads(scheduler, [Priority.LOW, Priority.NORMAL, Priority.CRITICAL, Priority.LOW])
+
+        assert order == [Priority.CRITICAL, Priority.NORMAL, Priority.LOW, Priority.LOW]
+        stats = scheduler.stats
+        assert (stats.depth, stats.max_depth) == (0, 4)
+        assert stats.dispatched == {0: 1, 2: 1, 3: 2}
+        assert stats.mean_wait(Priority.LOW) > 0
+
+    def test_aging_prevents_starvation(self) -> None:
+        """A LOW request that waited long enough goes before a new CRITICAL one."""
+        aged = RequestScheduler(_drained(per=0.15), aging=0.01)
+        assert _run_threads(aged, [Priority.LOW, Priority.CRITICAL], gap=0.05) == [Priority.LOW, Priority.CRITICAL]
+
+        strict = RequestScheduler(_drained(per=0.15), aging=None)
+        assert _run_threads(strict, [Priority.LOW, Priority.CRITICAL], gap=0.05) == [Priority.CRITICAL, Priority.LOW]
+
+    def test_deadline_leaves_queue(self) -> None:
+        """A wait past the deadline budget raises and frees its queue slot."""
+        scheduler = RequestScheduler(_drained(per=10))
+
+        with deadline(0.05), pytest.raises(DeadlineExceededError):
+            scheduler.acquire()
+        assert scheduler.depth == 0
+        assert scheduler.stats.queued == {Priority.NORMAL: 0}
+
+    @pytest.mark.asyncio
+    async def test_async_priority_and_cancellation(self) -> None:
+        """Async waiters follow priority; a cancelled one leaves the queue."""
+        scheduler = RequestScheduler(_drained(per=0.05))
+        order: list[int] = []
+
+        async def worker(priority: int) -> None:
+            await scheduler.acquire_async(priority)
+            order.append(priority)
+
+        tasks = []
+        for priority in (Priority.LOW, Priority.HIGH, Priority.NORMAL):
+            tasks.append(asyncio.ensure_future(worker(priority)))
+            await asyncio.sleep(0)
+        cancelled = tasks.pop()
+        cancelled.cancel()
+        await asyncio.gather(*tasks)
+
+        assert order == [Priority.HIGH, Priority.LOW]
+        assert cancelled.cancelled()
+        assert scheduler.depth == 0
+
+    @pytest.mark.asyncio
+    async def test_granted_then_cancelled_refunds_token(self) -> None:
+        """A waiter cancelled after its grant hands the token to the next waiter."""
+        limiter = _drained(per=10)
+        scheduler = RequestScheduler(limiter)
+        first = asyncio.ensure_future(scheduler.acquire_async(Priority.HIGH))
+        second = asyncio.ensure_future(scheduler.acquire_async(Priority.LOW))
+        await asyncio.sleep(0)
+
+        limiter.reset()
+        with scheduler._lock:
+            scheduler._dispatch()
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+
+        assert await asyncio.wait_for(second, 1.0) < 1.0
+        assert first.cancelled()
+        assert scheduler.depth == 0
+
+    def test_invalid_aging(self) -> None:
+        """Aging must be positive."""
+        with pytest.raises(ValueError, match="aging"):
+            RequestScheduler(RateLimiter(rate=1), aging=0)
+
+
+class TestClientPriority:
+    """Tests for call priorities in RapiClient."""
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_priority_orders_rate_limited_calls(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Under rate-limit pressure, the CRITICAL call is sent before queued polls."""
+        sent: list[str] = []
+
+        async def send(request: httpx.Request) -> httpx.Response:
+            sent.append(request.url.path)
+            return httpx.Response(200, json={}, request=request)
+
+        mock_client_class.return_value.send = send
+        limiter = RateLimiter(rate=1, per=0.05)
+        endpoints = {"poll": {"path": "/poll"}, "order": {"path": "/order", "method": "POST"}}
+        client = rapi_client(endpoints, rate_limiters={"ex": limiter})
+        limiter.acquire()
+
+        polls = [asyncio.ensure_future(client.call_async("ex.poll", request_priority=Priority.LOW)) for _ in range(3)]
+        await asyncio.sleep(0.005)
+        order = client.call_async("ex.order", body={"qty": 1}, request_priority=Priority.CRITICAL)
+        await asyncio.gather(order, *polls)
+
+        assert sent[0] == "/order"
+        stats = client.scheduler_stats["ex"]
+        assert stats.dispatched == {Priority.LOW: 3, Priority.CRITICAL: 1}
+        assert stats.max_depth == 4
+
+    @mock.patch("httpx.Client")
+    def test_priority_query_param_is_sent(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """An endpoint parameter named ``priority`` is still a query param."""
+        mock_client_class.return_value.send.side_effect = lambda request: httpx.Response(200, json={}, request=request)
+        client = rapi_client({"search": {"path": "/search"}})
+
+        client.call("ex.search", priority="urgent")
+
+        request = mock_client_class.return_value.send.call_args.args[0]
+        assert request.url.params["priority"] == "urgent"
+
+    def test_request_priority_must_be_int(self) -> None:
+        """A non-int priority is rejected before anything is sent."""
+        client = RapiClient(config_manager=RapiConfigManager({}))
+
+        with pytest.raises(TypeError, match="request_priority"):
+            client.call("ex.search", request_priority="urgent")  # type: ignore[arg-type]
@@ -0,0 +1,192 @@
+"""Tests for per-endpoint request statistics (RapiClient.stats)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import httpx
+import pytest
+
+from kstlib.rapi import RequestError
+from kstlib.rapi.stats import HISTOGRAM_BUCKETS, AttemptTimer, EndpointStats, LatencyHistogram, stats_table
+from kstlib.resilience.hedge import HedgePolicy
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from kstlib.rapi import RapiClient
+
+
+ENDPOINTS = {"depth": {"path": "/depth"}, "order": {"path": "/order", "method": "POST"}, "export": {"path": "/export"}}
+
+
+class TestLatencyHistogram:
+    """Tests for the bounded histogram."""
+
+    def test_percentiles_within_bucket_width(self) -> None:
+        """Percentiles are within one bucket (about 9%) above the exact value."""
+        samples = [0.001 * 1.003**i for i in range(3000)]
+        histogram = LatencyHistogram()
+        for sample in samples:
+            histogram.record(sample)
+
+        for p in (50, 90, 99):
+            exact = samples[int(p / 100 * len(samples)) - 1]
+            assert exact <= histogram.percentile(p) <= exact * 1.1
+        assert histogram.percentile(100) == samples[-1]
+
+    def test_memory_is_bounded(self) -> None:
+        """Extreme samples land in the first and last buckets."""
+        histogram = LatencyHistogram()
+        for seconds in (0.0, 1e-9, 3600.0, 1e6):
+            histogram.record(seconds)
+
+        assert len(histogram._buckets) == HISTOGRAM_BUCKETS
+        assert histogram._buckets[0] == 2
+        assert histogram._buckets[-1] == 2
+        assert histogram.summary().max == 1e6
+
+    def test_empty(self) -> None:
+        """An empty histogram reports zeros."""
+        assert LatencyHistogram().summary().p99 == 0.0
+
+
+class TestAttemptTimer:
+    """Tests for trace-based connect and TTFB timing."""
+
+    def test_trace_events(self) -> None:
+        """Connect spans TCP + TLS; TTFB ends with the response headers."""
+        times = iter([10.0, 10.5, 10.6, 10.9, 11.2])
+        with mock.patch("kstlib.rapi.stats.time.monotonic", side_effect=lambda: next(times)):
+            timer = AttemptTimer()
+            timer.trace("connection.connect_tcp.started", {})
+            timer.trace("connection.connect_tcp.complete", {})
+            timer.trace("connection.start_tls.complete", {})
+            timer.trace("http11.receive_response_headers.complete", {})
+
+        assert timer.connect == pytest.approx(0.4)
+        assert timer.ttfb == pytest.approx(1.2)
+
+    def test_reused_connection(self) -> None:
+        """Without connection events there is no connect sample."""
+        timer = AttemptTimer()
+        timer.trace("http2.receive_response_headers.complete", {})
+
+        assert timer.connect is None
+        assert timer.ttfb is not None
+
+
+class TestClientStats:
+    """Tests for statistics recorded by RapiClient."""
+
+    @mock.patch("httpx.Client")
+    def test_counts_retries_errors_and_bytes(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Attempts, retries, error classes and body sizes are recorded per endpoint."""
+        replies: list[Any] = [httpx.ConnectError("refused"), httpx.Response(200, content=b"x" * 40)]
+
+        def send(request: httpx.Request) -> httpx.Response:
+            reply = replies.pop(0) if replies else httpx.Response(503, content=b"down")
+            if isinstance(reply, Exception):
+                raise reply
+            reply.request = request
+            return reply
+
+        mock_client_class.return_value.send.side_effect = send
+        client = rapi_client(ENDPOINTS, limits={"max_retries": 1})
+
+        client.call("ex.depth")
+        client.call("ex.order", body={"qty": 1})
+        stats = client.stats()
+
+        depth = stats["ex.depth"]
+        assert (depth.requests, depth.retries, depth.errors) == (2, 1, {"network": 1})
+        assert depth.bytes_received == 40
+        assert depth.total.count == 1
+        order = stats["ex.order"]
+        assert order.errors == {"http_5xx": 1}
+        assert order.bytes_sent == len(b'{"qty": 1}')
+        assert order.error_count == 1
+
+        client.reset_stats()
+        assert client.stats() == {}
+
+    @mock.patch("httpx.Client")
+    def test_ttfb_without_trace_events(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Transports that emit no trace events report TTFB as the total time."""
+        mock_client_class.return_value.send.side_effect = lambda request: httpx.Response(200, json={}, request=request)
+        client = rapi_client(ENDPOINTS, limits={"max_retries": 1})
+        client.call("ex.depth")
+
+        depth = client.stats()["ex.depth"]
+        assert depth.ttfb == depth.total
+        assert depth.connect.count == 0
+
+    @mock.patch("httpx.Client")
+    def test_stream_bytes(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Streamed bodies count the bytes actually read."""
+        mock_client_class.return_value.send.side_effect = lambda request, **_: httpx.Response(
+            200, stream=httpx.ByteStream(b"a\nbb\n"), request=request
+        )
+        client = rapi_client(ENDPOINTS, limits={"max_retries": 1})
+
+        assert list(client.stream("ex.export", mode="lines")) == ["a", "bb"]
+        assert client.stats()["ex.export"].bytes_received == 5
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_async_timeouts(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Async attempts record timeouts as errors."""
+
+        async def send(request: httpx.Request, **kwargs: Any) -> httpx.Response:
+            raise httpx.ReadTimeout("slow", request=request)
+
+        mock_client_class.return_value.send = send
+        client = rapi_client(ENDPOINTS, limits={"max_retries": 0})
+
+        with pytest.raises(RequestError):
+            await client.call_async("ex.depth")
+
+        assert client.stats()["ex.depth"].errors == {"timeout": 1}
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_hedged_attempts_keep_their_own_timer(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Concurrent hedged attempts feed their trace events to their own timers."""
+        traces: list[Any] = []
+
+        async def send(request: httpx.Request, **kwargs: Any) -> httpx.Response:
+            index = len(traces)
+            traces.append(request.extensions["trace"])
+            await request.extensions["trace"]("connection.connect_tcp.started", {})
+            await asyncio.sleep(0.06 if index == 0 else 0.5)
+            # httpcore looks the hook up on every event, as done here
+            await request.extensions["trace"]("connection.connect_tcp.complete", {})
+            await request.extensions["trace"]("http11.receive_response_headers.complete", {})
+            return httpx.Response(200, json={}, request=request)
+
+        mock_client_class.return_value.send = send
+        client = rapi_client(ENDPOINTS, limits={"max_retries": 1})
+        client._hedge_policy = HedgePolicy(delay=0.02)
+
+        await client.call_async("ex.depth")
+
+        depth = client.stats()["ex.depth"]
+        assert len(traces) == 2
+        assert traces[0] is not traces[1]
+        assert (depth.requests, depth.connect.count, depth.ttfb.count) == (1, 1, 1)
+        assert depth.connect.max >= 0.05
+
+    def test_stats_table(self) -> None:
+        """Snapshots render as a monitoring table."""
+        table = stats_table({"ex.depth": EndpointStats(requests=3, errors={"timeout": 1})})
+
+        assert table.row_count == 1
+        assert "ex.depth" in table.render()
@@ -0,0 +1,191 @@
+"""Tests for streamed responses (RapiClient.stream and stream_async)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import httpx
+import pytest
+
+from kstlib.rapi import RequestError, ResponseTooLargeError
+from kstlib.rapi.streaming import RecordDecoder
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator
+
+    from kstlib.rapi import RapiClient
+
+
+ENDPOINTS = {"export": {"path": "/export/{day}"}}
+
+
+class _Body(httpx.SyncByteStream):
+    """Chunked body that records whether it was closed."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self.chunks
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _AsyncBody(httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.chunks:
+            yield chunk
+
+
+class TestRecordDecoder:
+    """Tests for incremental record decoding."""
+
+    def test_lines_span_chunks_and_strip_crlf(self) -> None:
+        """Lines split across chunks and multi-byte characters are rebuilt."""
+        decoder = RecordDecoder("lines")
+        text = "é first\r\nsecond\nthird".encode()
+        records = [line for i in range(len(text)) for line in decoder.feed(text[i : i + 1])]
+        records.extend(decoder.flush())
+        assert records == ["é first", "second", "third"]
+
+    def test_ndjson_skips_blank_lines(self) -> None:
+        """Blank lines between NDJSON records are ignored."""
+        decoder = RecordDecoder("ndjson")
+        assert list(decoder.feed(b'{"a": 1}\n\n[2]\n')) == [{"a": 1}, [2]]
+        assert list(decoder.flush()) == []
+
+    def test_invalid_mode(self) -> None:
+        """Unknown modes are rejected."""
+        with pytest.raises(ValueError, match="Invalid stream mode"):
+            RecordDecoder("csv")  # type: ignore[arg-type]
+
+
+class TestStream:
+    """Tests for the sync streaming API."""
+
+    @mock.patch("httpx.Client")
+    def test_ndjson_records(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Records are yielded as chunks arrive and the response is closed."""
+        body = _Body([b'{"id": 1}\n{"id"', b': 2}\n{"id": 3}'])
+
+        def send(request: httpx.Request, **kwargs: Any) -> httpx.Response:
+            assert kwargs == {"stream": True}
+            return httpx.Response(200, stream=body, request=request)
+
+        mock_client_class.return_value.send.side_effect = send
+        client = rapi_client(ENDPOINTS, limits={"max_retries": 1})
+
+        records = list(client.stream("ex.export", mode="ndjson", day="2024-01-02"))
+
+        assert records == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert body.closed
+        assert mock_client_class.return_value.send.call_args.args[0].url.path == "/export/2024-01-02"
+
+    @mock.patch("httpx.Client")
+    def test_size_limit_enforced_per_chunk(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """The stream fails once received bytes exceed max_response_size."""
+        body = _Body([b"x" * 60, b"x" * 60, b"x" * 60])
+        mock_client_class.return_value.send.side_effect = lambda request, **_: httpx.Response(
+            200, stream=body, request=request
+        )
+        client = rapi_client(ENDPOINTS, limits={"max_retries": 1, "max_response_size": 100})
+
+        chunks: list[bytes] = []
+        with pytest.raises(ResponseTooLargeError) as exc_info:
+            chunks.extend(client.stream("ex.export", day="d"))
+
+        assert chunks == [b"x" * 60]
+        assert exc_info.value.response_size == 120
+        assert body.closed
+
+    @mock.patch("httpx.Client")
+    def test_content_length_rejected_upfront(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """A declared Content-Length above the limit fails before reading."""
+        body = _Body([b"x" * 10])
+        mock_client_class.return_value.send.side_effect = lambda request, **_: httpx.Response(
+            200, headers={"Content-Length": "500"}, stream=body, request=request
+        )
+
+        client = rapi_client(ENDPOINTS, limits={"max_retries": 1, "max_response_size": 100})
+
+        with pytest.raises(ResponseTooLargeError):
+            next(client.stream("ex.export", day="d"))
+        assert body.closed
+
+    @mock.patch("httpx.Client")
+    def test_error_status_raises(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Non-2xx replies raise RequestError with the status code."""
+        mock_client_class.return_value.send.side_effect = lambda request, **_: httpx.Response(404, request=request)
+
+        client = rapi_client(ENDPOINTS, limits={"max_retries": 1})
+
+        with pytest.raises(RequestError) as exc_info:
+            list(client.stream("ex.export", day="d"))
+        assert exc_info.value.status_code == 404
+
+    @mock.patch("httpx.Client")
+    def test_retry_after_retried_before_body(
+        self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]
+    ) -> None:
+        """Retry-After replies are retried while opening the stream."""
+        replies = iter(
+            [
+                httpx.Response(503, headers={"Retry-After": "0"}),
+                httpx.Response(200, stream=_Body([b"ok\n"])),
+            ]
+        )
+        mock_client_class.return_value.send.side_effect = lambda _request, **_: next(replies)
+        client = rapi_client(ENDPOINTS, limits={"max_retries": 1})
+
+        assert list(client.stream("ex.export", mode="lines", day="d")) == ["ok"]
+        assert mock_client_class.return_value.send.call_count == 2
+
+    def test_invalid_mode_raises_eagerly(self, rapi_client: Callable[..., RapiClient]) -> None:
+        """Mode and endpoint are validated when stream() is called."""
+        client = rapi_client(ENDPOINTS)
+        with pytest.raises(ValueError, match="Invalid stream mode"):
+            client.stream("ex.export", mode="xml", day="d")  # type: ignore[arg-type]
+
+
+class TestStreamAsync:
+    """Tests for the async streaming API."""
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_lines(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """Lines are yielded with async for."""
+
+        async def send(request: httpx.Request, **kwargs: Any) -> httpx.Response:
+            return httpx.Response(200, stream=_AsyncBody([b"a\r\nb", b"\nc"]), request=request)
+
+        mock_client_class.return_value.send = send
+        client = rapi_client(ENDPOINTS, limits={"max_retries": 1})
+
+        lines = [line async for line in client.stream_async("ex.export", mode="lines", day="d")]
+
+        assert lines == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    @mock.patch("httpx.AsyncClient")
+    async def test_size_limit(self, mock_client_class: mock.Mock, rapi_client: Callable[..., RapiClient]) -> None:
+        """The async stream enforces the size limit chunk by chunk."""
+
+        async def send(request: httpx.Request, **kwargs: Any) -> httpx.Response:
+            return httpx.Response(200, stream=_AsyncBody([b"x" * 80] * 3), request=request)
+
+        mock_client_class.return_value.send = send
+        client = rapi_client(ENDPOINTS, limits={"max_retries": 1, "max_response_size": 100})
+
+        with pytest.raises(ResponseTooLargeError):
+            async for _ in client.stream_async("ex.export", day="d"):
+                pass
@@ -0,0 +1,232 @@
+"""Tests for the AdaptiveLimiter class."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from kstlib.resilience.adaptive_limiter import AdaptiveLimiter
+from kstlib.resilience.bulkhead import Bulkhead
+from kstlib.resilience.exceptions import BulkheadFullError
+
+
+def _saturate(limiter: AdaptiveLimiter, rtt: float, rounds: int = 1) -> None:
+    """Fill every slot, then release them all with the same RTT."""
+    for _ in range(rounds):
+        held = limiter.limit
+        for _ in range(held):
+            limiter.acquire()
+        for _ in range(held):
+            limiter.release(rtt)
+
+
+class TestAdaptiveLimiterInit:
+    """Tests for AdaptiveLimiter initialization."""
+
+    def test_defaults(self) -> None:
+        """Defaults start at the initial limit with no baseline."""
+        limiter = AdaptiveLimiter()
+        assert isinstance(limiter, Bulkhead)
+        assert limiter.limit == 10
+        assert limiter.max_concurrent == 10
+        assert limiter.algorithm == "gradient"
+        assert limiter.min_rtt is None
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"min_limit": 0}, "min_limit"),
+            ({"initial_limit": 500}, "initial_limit"),
+            ({"initial_limit": 1, "min_limit": 2}, "initial_limit"),
+            ({"algorithm": "vegas"}, "algorithm"),
+            ({"tolerance": 0.5}, "tolerance"),
+            ({"backoff_ratio": 1.0}, "backoff_ratio"),
+            ({"smoothing": 0.0}, "smoothing"),
+            ({"probe_interval": -1}, "probe_interval"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, object], match: str) -> None:
+        """Invalid settings raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            AdaptiveLimiter(**kwargs)  # type: ignore[arg-type]
+
+    def test_repr(self) -> None:
+        """Repr shows current limit and algorithm."""
+        limiter = AdaptiveLimiter(initial_limit=5, algorithm="aimd", name="api")
+        assert repr(limiter) == "AdaptiveLimiter(limit=5, algorithm='aimd', min_limit=1, max_limit=200, name='api')"
+
+
+class TestAdaptiveLimiterAimd:
+    """Tests for the AIMD algorithm."""
+
+    def test_grows_while_latency_is_stable(self) -> None:
+        """Stable RTT with the limit in use grows the limit additively."""
+        limiter = AdaptiveLimiter(initial_limit=4, algorithm="aimd")
+        _saturate(limiter, 0.01)
+        assert limiter.limit > 4
+        assert limiter.min_rtt == 0.01
+
+    def test_does_not_grow_when_underused(self) -> None:
+        """A single call in flight tells nothing about upstream capacity."""
+        limiter = AdaptiveLimiter(initial_limit=10, algorithm="aimd")
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release(0.01)
+        assert limiter.limit == 10
+
+    def test_backs_off_on_latency_increase(self) -> None:
+        """RTT above tolerance * min_rtt shrinks the limit."""
+        limiter = AdaptiveLimiter(initial_limit=10, algorithm="aimd", tolerance=2.0, backoff_ratio=0.5)
+        limiter.acquire()
+        limiter.release(0.01)
+        limiter.acquire()
+        limiter.release(0.05)
+        assert limiter.limit == 5
+
+    def test_backs_off_on_drop(self) -> None:
+        """Dropped calls shrink the limit even without an RTT."""
+        limiter = AdaptiveLimiter(initial_limit=10, algorithm="aimd", backoff_ratio=0.5)
+        limiter.acquire()
+        limiter.release(dropped=True)
+        assert limiter.limit == 5
+
+    def test_limit_is_bounded(self) -> None:
+        """The limit never leaves [min_limit, max_limit]."""
+        limiter = AdaptiveLimiter(initial_limit=3, min_limit=2, max_limit=6, algorithm="aimd", backoff_ratio=0.1)
+        _saturate(limiter, 0.01, rounds=10)
+        assert limiter.limit == 6
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(dropped=True)
+        assert limiter.limit == 2
+
+
+class TestAdaptiveLimiterGradient:
+    """Tests for the gradient algorithm."""
+
+    def test_grows_at_min_latency(self) -> None:
+        """RTT at the baseline lets the limit grow by its headroom."""
+        limiter = AdaptiveLimiter(initial_limit=10, smoothing=1.0)
+        _saturate(limiter, 0.02)
+        assert limiter.limit > 10
+
+    def test_shrinks_when_latency_rises(self) -> None:
+        """RTT far above the baseline pulls the limit down."""
+        limiter = AdaptiveLimiter(initial_limit=50, tolerance=1.0, smoothing=1.0)
+        limiter.acquire()
+        limiter.release(0.01)
+        _saturate(limiter, 0.2, rounds=3)
+        assert limiter.limit < 50
+
+    def test_probe_resets_baseline(self) -> None:
+        """min_rtt is rediscovered every probe_interval samples."""
+        limiter = AdaptiveLimiter(initial_limit=5, probe_interval=3)
+        for rtt in (0.01, 0.05, 0.05):
+            limiter.acquire()
+            limiter.release(rtt)
+        assert limiter.min_rtt == 0.05
+
+
+class TestAdaptiveLimiterSlots:
+    """Tests for slot handling when the limit moves."""
+
+    def test_shrunk_limit_holds_back_waiters(self) -> None:
+        """After a drop, waiters wait until inflight falls below the new limit."""
+        limiter = AdaptiveLimiter(initial_limit=2, algorithm="aimd", backoff_ratio=0.5, max_queue=5)
+        limiter.acquire()
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def worker() -> None:
+            limiter.acquire(timeout=5.0)
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        while limiter.waiting == 0:
+            threading.Event().wait(0.001)
+
+        limiter.release(dropped=True)  # limit 2 -> 1, one call still in flight
+        assert limiter.limit == 1
+        assert not acquired.wait(0.05)
+
+        limiter.release(0.01)
+        thread.join(timeout=5.0)
+        assert acquired.is_set()
+        limiter.release()
+
+    def test_rejects_when_queue_full(self) -> None:
+        """Queue limits still apply."""
+        limiter = AdaptiveLimiter(initial_limit=1, max_queue=0)
+        limiter.acquire()
+        with pytest.raises(BulkheadFullError, match="AdaptiveLimiter"):
+            limiter.acquire()
+
+
+class TestAdaptiveLimiterCall:
+    """Tests for call/acall latency sampling."""
+
+    def test_call_samples_latency(self) -> None:
+        """call() records the RTT of each execution."""
+        limiter = AdaptiveLimiter()
+        assert limiter.call(lambda: 3) == 3
+        assert limiter.min_rtt is not None
+        assert limiter.active == 0
+
+    def test_drop_on_exception_shrinks_limit(self) -> None:
+        """Exceptions listed in drop_on count as drops."""
+        limiter = AdaptiveLimiter(initial_limit=10, algorithm="aimd", backoff_ratio=0.5)
+
+        def slow() -> None:
+            raise TimeoutError
+
+        with pytest.raises(TimeoutError):
+            limiter.call(slow)
+        assert limiter.limit == 5
+        assert limiter.active == 0
+
+    def test_other_exception_is_ignored(self) -> None:
+        """Other exceptions release the slot without a sample."""
+        limiter = AdaptiveLimiter(initial_limit=10, algorithm="aimd", backoff_ratio=0.5)
+
+        def broken() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            limiter.call(broken)
+        assert limiter.limit == 10
+        assert limiter.min_rtt is None
+        assert limiter.active == 0
+
+    @pytest.mark.asyncio
+    async def test_acall_samples_latency(self) -> None:
+        """acall() records the RTT and honours the limit."""
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=2, max_queue=10)
+        current = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal current, peak
+            current += 1
+            peak = max(peak, current)
+            await asyncio.sleep(0.001)
+            current -= 1
+
+        await asyncio.gather(*(limiter.acall(work) for _ in range(6)))
+        assert peak == 2
+        assert limiter.min_rtt is not None
+        assert limiter.active == 0
+
+    @pytest.mark.asyncio
+    async def test_acall_drop_on_timeout(self) -> None:
+        """asyncio timeouts inside acall count as drops."""
+        limiter = AdaptiveLimiter(initial_limit=10, algorithm="aimd", backoff_ratio=0.5)
+
+        async def slow() -> None:
+            await asyncio.wait_for(asyncio.sleep(1), 0.001)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await limiter.acall(slow)
+        assert limiter.limit == 5
@@ -0,0 +1,172 @@
+"""Tests for priority-aware admission control."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from kstlib.resilience.admission import AdmissionController, AdmissionStats, Priority
+from kstlib.resilience.deadline import deadline
+from kstlib.resilience.exceptions import AdmissionRejectedError, DeadlineExceededError
+
+
+class TestAdmissionStats:
+    """Tests for AdmissionStats."""
+
+    def test_counts_per_priority(self) -> None:
+        """Admitted, delayed and shed work is counted per priority."""
+        stats = AdmissionStats()
+        stats.record_admitted(Priority.HIGH)
+        stats.record_admitted(Priority.LOW, waited=True)
+        stats.record_shed(Priority.LOW)
+        assert stats.admitted == {Priority.HIGH: 1, Priority.LOW: 1}
+        assert stats.delayed == {Priority.LOW: 1}
+        assert stats.total_admitted == 2
+        assert stats.total_shed == 1
+
+
+class TestAdmissionControllerInit:
+    """Tests for constructor validation."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"max_queue": 0}, "max_queue"),
+            ({"max_lag": 0}, "max_lag"),
+            ({"max_wait": -1}, "max_wait"),
+            ({"lag_interval": 0}, "lag_interval"),
+            ({"shed_at": {Priority.LOW: 0}}, "shed_at"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, object], match: str) -> None:
+        """Out-of-range settings raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            AdmissionController(**kwargs)  # type: ignore[arg-type]
+
+
+class TestAdmissionControllerShedding:
+    """Tests for shedding decisions."""
+
+    def test_low_priority_shed_first(self) -> None:
+        """As depth grows, LOW is shed before NORMAL, NORMAL before HIGH."""
+        controller = AdmissionController(max_queue=10, max_lag=None)
+        for _ in range(5):
+            assert controller.try_acquire(Priority.CRITICAL)
+        assert not controller.try_acquire(Priority.LOW)  # load 0.5
+        assert controller.try_acquire(Priority.NORMAL)
+        for _ in range(2):
+            assert controller.try_acquire(Priority.CRITICAL)
+        assert not controller.try_acquire(Priority.NORMAL)  # load 0.8
+        assert controller.try_acquire(Priority.HIGH)
+        assert controller.try_acquire(Priority.HIGH)
+        assert not controller.try_acquire(Priority.HIGH)  # load 1.0
+        assert controller.try_acquire(Priority.CRITICAL)  # never shed
+        assert controller.stats.shed == {Priority.LOW: 1, Priority.NORMAL: 1, Priority.HIGH: 1}
+        assert controller.stats.max_in_flight == 11
+
+    def test_release_restores_capacity(self) -> None:
+        """Released work no longer counts toward the depth."""
+        controller = AdmissionController(max_queue=2, max_lag=None)
+        assert controller.try_acquire(Priority.LOW)
+        assert not controller.try_acquire(Priority.LOW)
+        controller.release()
+        assert controller.in_flight == 0
+        assert controller.try_acquire(Priority.LOW)
+
+    def test_external_queue_depth(self) -> None:
+        """An external queue length adds to the depth."""
+        backlog = [0]
+        controller = AdmissionController(max_queue=10, max_lag=None, queue_depth=lambda: backlog[0])
+        backlog[0] = 6
+        assert controller.queue_depth == 6
+        assert not controller.try_acquire(Priority.LOW)
+        assert controller.try_acquire(Priority.NORMAL)
+
+    def test_loop_lag_drives_load(self) -> None:
+        """Lag over the threshold sheds work even with an empty queue."""
+        controller = AdmissionController(max_queue=100, max_lag=0.1)
+        controller.record_lag(0.06)
+        assert controller.load == pytest.approx(0.6)
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            asyncio.run(controller.acquire(Priority.LOW))
+        assert exc_info.value.reason == "lag"
+        assert exc_info.value.priority == Priority.LOW
+        assert controller.try_acquire(Priority.NORMAL)
+
+    def test_lag_decays_slowly(self) -> None:
+        """One fast tick does not cancel a lag spike."""
+        controller = AdmissionController(max_lag=0.1)
+        controller.record_lag(0.2)
+        controller.record_lag(0.0)
+        assert controller.lag == pytest.approx(0.1)
+        assert controller.stats.peak_lag == pytest.approx(0.2)
+
+    def test_custom_thresholds(self) -> None:
+        """Priorities missing from shed_at are never shed."""
+        controller = AdmissionController(max_queue=1, max_lag=None, shed_at={7: 0.5})
+        assert controller.try_acquire(7)
+        assert not controller.try_acquire(7)
+        assert controller.try_acquire(Priority.LOW)
+
+
+class TestAdmissionControllerAsync:
+    """Tests for async admission, delays and the lag probe."""
+
+    @pytest.mark.asyncio
+    async def test_admit_context_manager(self) -> None:
+        """admit() holds one unit for the duration of the block."""
+        controller = AdmissionController()
+        async with controller.admit(Priority.HIGH):
+            assert controller.in_flight == 1
+        assert controller.in_flight == 0
+        assert controller.stats.admitted == {Priority.HIGH: 1}
+
+    @pytest.mark.asyncio
+    async def test_delayed_until_capacity(self) -> None:
+        """Over-threshold work waits for capacity within its timeout."""
+        controller = AdmissionController(max_queue=2, max_lag=None, lag_interval=0.01)
+        await controller.acquire(Priority.HIGH)
+
+        async def finish_soon() -> None:
+            await asyncio.sleep(0.05)
+            controller.release()
+
+        task = asyncio.create_task(finish_soon())
+        await controller.acquire(Priority.LOW, timeout=1.0)
+        await task
+        assert controller.stats.delayed == {Priority.LOW: 1}
+        assert controller.stats.total_shed == 0
+
+    @pytest.mark.asyncio
+    async def test_delay_times_out(self) -> None:
+        """Work that waits too long is shed."""
+        controller = AdmissionController(max_queue=2, max_lag=None, max_wait=0.05, lag_interval=0.01)
+        await controller.acquire(Priority.HIGH)
+        start = time.monotonic()
+        with pytest.raises(AdmissionRejectedError, match="shed priority 3"):
+            await controller.acquire(Priority.LOW)
+        assert time.monotonic() - start >= 0.04
+        assert controller.stats.shed == {Priority.LOW: 1}
+
+    @pytest.mark.asyncio
+    async def test_wait_bounded_by_deadline(self) -> None:
+        """An expired deadline fails before waiting."""
+        controller = AdmissionController()
+        with deadline(0), pytest.raises(DeadlineExceededError):
+            await controller.acquire(Priority.LOW, timeout=5.0)
+
+    @pytest.mark.asyncio
+    async def test_lag_probe_detects_blocking(self) -> None:
+        """The probe measures how late the loop wakes up."""
+        controller = AdmissionController(max_lag=0.05, lag_interval=0.01)
+        await controller.astart()
+        await controller.astart()  # Idempotent
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)  # noqa: ASYNC251 - block the loop on purpose
+        await asyncio.sleep(0.02)
+        assert controller.stats.peak_lag >= 0.05
+        assert not controller.try_acquire(Priority.LOW)
+        await controller.astop()
+        assert controller.lag == 0.0
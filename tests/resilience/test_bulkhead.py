@@ -0,0 +1,352 @@
+"""Tests for the Bulkhead class and decorator."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kstlib.resilience.bulkhead import Bulkhead, BulkheadStats, bulkhead
+from kstlib.resilience.exceptions import BulkheadError, BulkheadFullError
+
+
+class TestBulkheadStats:
+    """Tests for BulkheadStats dataclass."""
+
+    def test_default_values(self) -> None:
+        """Stats start at zero."""
+        stats = BulkheadStats()
+        assert stats.total_acquired == 0
+        assert stats.total_rejected == 0
+        assert stats.total_timeouts == 0
+        assert stats.total_waited == 0.0
+        assert stats.max_active == 0
+        assert stats.max_waiting == 0
+
+    def test_record_methods(self) -> None:
+        """Record methods increment counters."""
+        stats = BulkheadStats()
+        stats.record_acquired(0.5)
+        stats.record_rejected()
+        stats.record_timeout()
+        assert stats.total_acquired == 1
+        assert stats.total_waited == 0.5
+        assert stats.total_rejected == 1
+        assert stats.total_timeouts == 1
+
+
+class TestBulkheadInit:
+    """Tests for Bulkhead initialization."""
+
+    def test_defaults(self) -> None:
+        """Queue defaults to zero and counters start empty."""
+        bh = Bulkhead(max_concurrent=3, name="db")
+        assert bh.max_concurrent == 3
+        assert bh.max_queue == 0
+        assert bh.active == 0
+        assert bh.waiting == 0
+        assert bh.name == "db"
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"max_concurrent": 0}, "max_concurrent"),
+            ({"max_concurrent": 1, "max_queue": -1}, "max_queue"),
+            ({"max_concurrent": 1, "timeout": -1.0}, "timeout"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, float], match: str) -> None:
+        """Invalid limits raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            Bulkhead(**kwargs)  # type: ignore[arg-type]
+
+    def test_repr(self) -> None:
+        """Repr shows limits and name."""
+        assert repr(Bulkhead(2, 5, name="api")) == "Bulkhead(max_concurrent=2, max_queue=5, name='api')"
+
+
+class TestBulkheadSync:
+    """Tests for the synchronous acquire/release path."""
+
+    def test_acquire_release(self) -> None:
+        """Slots are counted while held."""
+        bh = Bulkhead(max_concurrent=2)
+        bh.acquire()
+        bh.acquire()
+        assert bh.active == 2
+        bh.release()
+        bh.release()
+        assert bh.active == 0
+        assert bh.stats.total_acquired == 2
+        assert bh.stats.max_active == 2
+
+    def test_rejects_fast_without_queue(self) -> None:
+        """A busy bulkhead with no queue rejects immediately."""
+        bh = Bulkhead(max_concurrent=1, name="svc")
+        bh.acquire()
+        start = time.monotonic()
+        with pytest.raises(BulkheadFullError, match="'svc' is full") as exc_info:
+            bh.acquire(timeout=5.0)
+        assert time.monotonic() - start < 1.0
+        assert exc_info.value.max_concurrent == 1
+        assert exc_info.value.max_queue == 0
+        assert bh.stats.total_rejected == 1
+
+    def test_try_acquire(self) -> None:
+        """try_acquire never waits."""
+        bh = Bulkhead(max_concurrent=1, max_queue=5)
+        assert bh.try_acquire() is True
+        assert bh.try_acquire() is False
+        bh.release()
+        assert bh.try_acquire() is True
+
+    def test_wait_timeout(self) -> None:
+        """A queued caller gives up after the timeout."""
+        bh = Bulkhead(max_concurrent=1, max_queue=1, timeout=0.05)
+        bh.acquire()
+        with pytest.raises(BulkheadFullError, match="timed out"):
+            bh.acquire()
+        assert bh.waiting == 0
+        assert bh.stats.total_timeouts == 1
+
+    def test_release_hands_slot_to_waiter(self) -> None:
+        """A waiting thread gets the released slot."""
+        bh = Bulkhead(max_concurrent=1, max_queue=1)
+        bh.acquire()
+        acquired = threading.Event()
+
+        def worker() -> None:
+            bh.acquire(timeout=5.0)
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        while bh.waiting == 0:
+            time.sleep(0.001)
+        # Queue is full now: a third caller is rejected fast
+        with pytest.raises(BulkheadFullError):
+            bh.acquire()
+        bh.release()
+        thread.join(timeout=5.0)
+        assert acquired.is_set()
+        assert bh.active == 1
+        assert bh.stats.total_acquired == 2
+        assert bh.stats.max_waiting == 1
+        bh.release()
+        assert bh.active == 0
+
+    def test_waiters_served_in_fifo_order(self) -> None:
+        """Slots are handed over in arrival order."""
+        bh = Bulkhead(max_concurrent=1, max_queue=3)
+        bh.acquire()
+        order: list[int] = []
+
+        def worker(idx: int) -> None:
+            bh.acquire(timeout=5.0)
+            order.append(idx)
+            bh.release()
+
+        threads = []
+        for idx in range(3):
+            thread = threading.Thread(target=worker, args=(idx,))
+            thread.start()
+            threads.append(thread)
+            while bh.waiting <= idx:
+                time.sleep(0.001)
+        bh.release()
+        for thread in threads:
+            thread.join(timeout=5.0)
+        assert order == [0, 1, 2]
+        assert bh.active == 0
+
+    def test_concurrency_never_exceeds_limit(self) -> None:
+        """Many threads never exceed max_concurrent."""
+        bh = Bulkhead(max_concurrent=3, max_queue=50)
+        current = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal current, peak
+            with lock:
+                current += 1
+                peak = max(peak, current)
+            time.sleep(0.005)
+            with lock:
+                current -= 1
+
+        threads = [threading.Thread(target=bh.call, args=(work,)) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10.0)
+        assert peak <= 3
+        assert bh.active == 0
+        assert bh.stats.total_acquired == 20
+
+    def test_call_releases_on_exception(self) -> None:
+        """The slot is released when the function raises."""
+        bh = Bulkhead(max_concurrent=1)
+
+        def boom() -> None:
+            raise KeyError("x")
+
+        with pytest.raises(KeyError):
+            bh.call(boom)
+        assert bh.active == 0
+
+    def test_context_manager(self) -> None:
+        """Context manager holds a slot for the block."""
+        bh = Bulkhead(max_concurrent=1)
+        with bh as entered:
+            assert entered is bh
+            assert bh.active == 1
+        assert bh.active == 0
+
+
+class TestBulkheadAsync:
+    """Tests for the asynchronous path."""
+
+    @pytest.mark.asyncio
+    async def test_acall(self) -> None:
+        """acall runs the coroutine inside a slot."""
+        bh = Bulkhead(max_concurrent=1)
+
+        async def double(x: int) -> int:
+            assert bh.active == 1
+            return x * 2
+
+        assert await bh.acall(double, 21) == 42
+        assert bh.active == 0
+
+    @pytest.mark.asyncio
+    async def test_async_limit_and_queue(self) -> None:
+        """Coroutines queue up and never exceed the limit."""
+        bh = Bulkhead(max_concurrent=2, max_queue=10)
+        current = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal current, peak
+            current += 1
+            peak = max(peak, current)
+            await asyncio.sleep(0.01)
+            current -= 1
+
+        await asyncio.gather(*(bh.acall(work) for _ in range(8)))
+        assert peak == 2
+        assert bh.active == 0
+        assert bh.stats.total_acquired == 8
+
+    @pytest.mark.asyncio
+    async def test_async_rejects_when_queue_full(self) -> None:
+        """Async callers are rejected fast when the queue is full."""
+        bh = Bulkhead(max_concurrent=1, max_queue=0)
+        await bh.acquire_async()
+        with pytest.raises(BulkheadFullError):
+            await bh.acquire_async()
+        bh.release()
+
+    @pytest.mark.asyncio
+    async def test_async_wait_timeout(self) -> None:
+        """Async waiters give up after the timeout."""
+        bh = Bulkhead(max_concurrent=1, max_queue=1)
+        await bh.acquire_async()
+        with pytest.raises(BulkheadFullError, match="timed out"):
+            await bh.acquire_async(timeout=0.02)
+        assert bh.waiting == 0
+        assert bh.stats.total_timeouts == 1
+        bh.release()
+        assert bh.active == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """Cancelling a waiter leaves the slot count consistent."""
+        bh = Bulkhead(max_concurrent=1, max_queue=1)
+        await bh.acquire_async()
+        task = asyncio.create_task(bh.acquire_async())
+        await asyncio.sleep(0)
+        assert bh.waiting == 1
+        bh.release()  # Slot handed to the waiter...
+        task.cancel()  # ...which is cancelled before it resumes
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+        assert bh.active == 0
+        assert bh.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager(self) -> None:
+        """Async context manager holds a slot for the block."""
+        bh = Bulkhead(max_concurrent=1)
+        async with bh:
+            assert bh.active == 1
+        assert bh.active == 0
+
+
+class TestBulkheadDecorator:
+    """Tests for the bulkhead decorator."""
+
+    def test_decorator_without_arguments(self) -> None:
+        """Bare decorator wraps a sync function."""
+
+        @bulkhead
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        assert add(1, 2) == 3
+
+    def test_decorator_with_arguments(self) -> None:
+        """Decorator with arguments rejects when full."""
+        gate = threading.Event()
+        started = threading.Event()
+
+        @bulkhead(max_concurrent=1, name="slow")
+        def slow() -> str:
+            started.set()
+            gate.wait(5.0)
+            return "done"
+
+        thread = threading.Thread(target=slow)
+        thread.start()
+        started.wait(5.0)
+        with pytest.raises(BulkheadFullError):
+            slow()
+        gate.set()
+        thread.join(timeout=5.0)
+
+    @pytest.mark.asyncio
+    async def test_decorator_async(self) -> None:
+        """Decorator wraps coroutine functions."""
+
+        @bulkhead(max_concurrent=2)
+        async def fetch(x: int) -> int:
+            await asyncio.sleep(0)
+            return x
+
+        assert await fetch(7) == 7
+
+    def test_instance_as_decorator(self) -> None:
+        """A Bulkhead instance can decorate several functions."""
+        bh = Bulkhead(max_concurrent=1)
+
+        @bh
+        def one() -> int:
+            assert bh.active == 1
+            return 1
+
+        assert one() == 1
+        assert bh.stats.total_acquired == 1
+
+
+class TestBulkheadFullError:
+    """Tests for BulkheadFullError."""
+
+    def test_hierarchy(self) -> None:
+        """BulkheadFullError derives from BulkheadError and RuntimeError."""
+        err = BulkheadFullError("full", max_concurrent=2, max_queue=3)
+        assert isinstance(err, BulkheadError)
+        assert isinstance(err, RuntimeError)
+        assert str(err) == "full"
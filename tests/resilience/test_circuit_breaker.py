@@ -535,6 +535,59 @@ def worker(n: int) -> None:
         assert len(results) == 50
         assert len(errors) == 0
 
+    def test_fast_path_stats_merged_across_threads(self) -> None:
+        """Lock-free CLOSED successes are all counted in stats."""
+        import threading
+
+        cb = CircuitBreaker(max_failures=5)
+
+        def worker() -> None:
+            for _ in range(200):
+                cb.call(lambda: 1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        cb.call(lambda: 1)
+
+        assert cb.stats.successful_calls == 8 * 200 + 1
+        assert cb.stats.total_calls == 8 * 200 + 1
+        # Cells of exited threads are folded into the retired total
+        assert len(cb._fast_successes._cells) == 1
+
+    def test_fast_path_resets_failure_count(self) -> None:
+        """A CLOSED success still resets the consecutive-failure count."""
+        cb = CircuitBreaker(max_failures=3)
+        with contextlib.suppress(ZeroDivisionError):
+            cb.call(lambda: 1 / 0)
+        assert cb.failure_count == 1
+
+        cb.call(lambda: 1)
+
+        assert cb.failure_count == 0
+        assert cb.stats.failed_calls == 1
+        assert cb.stats.total_calls == 2
+
+    def test_fast_path_reset_takes_lock(self) -> None:
+        """The fast-path reset waits for a failure being recorded under the lock."""
+        import threading
+
+        cb = CircuitBreaker(max_failures=3)
+        with contextlib.suppress(ZeroDivisionError):
+            cb.call(lambda: 1 / 0)
+
+        with cb._lock:
+            worker = threading.Thread(target=cb.call, args=(lambda: 1,))
+            worker.start()
+            worker.join(0.05)
+            assert worker.is_alive()
+            assert cb._failure_count == 1
+        worker.join()
+
+        assert cb.failure_count == 0
+
 
 class TestCircuitBreakerOpenError:
     """Tests for CircuitOpenError details."""
@@ -572,3 +625,162 @@ def test_error_message_unnamed_circuit(self) -> None:
 
         with pytest.raises(CircuitOpenError, match="unnamed"):
             cb.call(lambda: 42)
+
+
+class TestCircuitBreakerSlidingWindow:
+    """Tests for failure-rate and slow-call sliding windows."""
+
+    @staticmethod
+    def _fail(cb: CircuitBreaker) -> None:
+        with contextlib.suppress(ZeroDivisionError):
+            cb.call(lambda: 1 / 0)
+
+    def test_invalid_window_type(self) -> None:
+        """Unknown window types are rejected."""
+        with pytest.raises(ValueError, match="window_type"):
+            CircuitBreaker(window_size=10, window_type="bogus")  # type: ignore[arg-type]
+
+    def test_invalid_thresholds(self) -> None:
+        """Rates must be in (0, 1]."""
+        with pytest.raises(ValueError, match="failure_rate_threshold"):
+            CircuitBreaker(window_size=10, failure_rate_threshold=0)
+        with pytest.raises(ValueError, match="slow_call_rate_threshold"):
+            CircuitBreaker(window_size=10, slow_call_rate_threshold=1.5)
+
+    def test_slow_call_requires_window(self) -> None:
+        """Slow-call tracking needs a sliding window."""
+        with pytest.raises(ValueError, match="requires window_size"):
+            CircuitBreaker(slow_call_duration=1.0)
+
+    def test_window_size_clamped(self) -> None:
+        """Window size is clamped to hard limits."""
+        cb = CircuitBreaker(window_size=10**9)
+        assert cb._window is not None
+        assert cb._window.size == 10_000
+
+    def test_interleaved_failures_trip_on_rate(self) -> None:
+        """A 50% failure rate opens the circuit although failures never repeat."""
+        cb = CircuitBreaker(max_failures=3, window_size=10, failure_rate_threshold=0.5, minimum_calls=10)
+
+        for _ in range(5):
+            cb.call(lambda: 1)
+            self._fail(cb)
+
+        assert cb.state == CircuitState.OPEN
+
+    def test_minimum_calls_guard(self) -> None:
+        """Rates are not evaluated before minimum_calls outcomes."""
+        cb = CircuitBreaker(window_size=20, minimum_calls=5)
+
+        for _ in range(4):
+            self._fail(cb)
+
+        assert cb.state == CircuitState.CLOSED
+        assert cb.failure_count == 4
+        assert cb.failure_rate == 1.0
+
+        self._fail(cb)
+        assert cb.state == CircuitState.OPEN
+
+    def test_minimum_calls_capped_by_count_window(self) -> None:
+        """A count window never needs more calls than it can hold."""
+        cb = CircuitBreaker(window_size=4, minimum_calls=100)
+        assert cb._minimum_calls == 4
+
+    def test_count_window_evicts_oldest(self) -> None:
+        """Old outcomes leave the ring buffer as new ones arrive."""
+        cb = CircuitBreaker(window_size=4, failure_rate_threshold=1.0, minimum_calls=4)
+
+        for _ in range(3):
+            self._fail(cb)
+        for _ in range(4):
+            cb.call(lambda: 1)
+
+        assert cb.failure_rate == 0.0
+        assert cb.state == CircuitState.CLOSED
+
+    def test_slow_calls_trip_circuit(self) -> None:
+        """Successful but slow calls open the circuit on slow-call rate."""
+        cb = CircuitBreaker(window_size=4, minimum_calls=4, slow_call_duration=1.0, slow_call_rate_threshold=0.5)
+        now = [0.0]
+
+        def work(seconds: float) -> int:
+            now[0] += seconds
+            return 1
+
+        with patch("time.monotonic", side_effect=lambda: now[0]):
+            cb.call(work, 5.0)
+            cb.call(work, 0.1)
+            cb.call(work, 2.0)
+            assert cb.stats.slow_calls == 2
+            assert cb.state == CircuitState.CLOSED
+
+            cb.call(work, 0.1)  # 4th call reaches minimum_calls
+            assert cb.slow_call_rate == 0.0  # window restarts on open
+            assert cb.state == CircuitState.OPEN
+
+    def test_time_window_expires_buckets(self) -> None:
+        """Outcomes older than the time window no longer count."""
+        cb = CircuitBreaker(window_size=10, window_type="time", minimum_calls=3)
+
+        with patch("time.monotonic", return_value=100.0):
+            self._fail(cb)
+            self._fail(cb)
+            assert cb.failure_count == 2
+
+        with patch("time.monotonic", return_value=115.0):
+            self._fail(cb)
+            assert cb.failure_count == 1
+            assert cb.state == CircuitState.CLOSED
+
+    def test_time_window_trips_within_window(self) -> None:
+        """Failures spread over several seconds still add up."""
+        cb = CircuitBreaker(window_size=10, window_type="time", minimum_calls=4, failure_rate_threshold=0.5)
+
+        for second in (100.0, 101.0, 102.0, 103.0):
+            with patch("time.monotonic", return_value=second):
+                if second % 2:
+                    cb.call(lambda: 1)
+                else:
+                    self._fail(cb)
+
+        with patch("time.monotonic", return_value=103.0):
+            assert cb.state == CircuitState.OPEN
+
+    def test_reset_clears_window(self) -> None:
+        """Manual reset forgets windowed outcomes."""
+        cb = CircuitBreaker(window_size=10, minimum_calls=10)
+        for _ in range(3):
+            self._fail(cb)
+
+        cb.reset()
+
+        assert cb.failure_count == 0
+        assert cb.failure_rate == 0.0
+
+    def test_half_open_success_closes_with_empty_window(self) -> None:
+        """Recovery starts a fresh window."""
+        cb = CircuitBreaker(window_size=2, minimum_calls=2, reset_timeout=1)
+        self._fail(cb)
+        self._fail(cb)
+        assert cb.state == CircuitState.OPEN
+
+        original_time = cb._last_failure_time or 0.0
+        with patch("time.monotonic", return_value=original_time + 2):
+            cb.call(lambda: 1)
+            assert cb.state == CircuitState.CLOSED
+            assert cb.failure_rate == 0.0
+
+    def test_decorator_accepts_window_options(self) -> None:
+        """The decorator factory forwards window options."""
+
+        @circuit_breaker(window_size=2, minimum_calls=2)
+        def flaky() -> None:
+            raise RuntimeError("fail")
+
+        for _ in range(2):
+            with contextlib.suppress(RuntimeError):
+                flaky()
+
+        with pytest.raises(CircuitOpenError):
+            flaky()
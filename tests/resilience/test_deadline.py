@@ -0,0 +1,178 @@
+"""Tests for deadline propagation through context variables."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from kstlib.resilience.bulkhead import Bulkhead
+from kstlib.resilience.deadline import (
+    Deadline,
+    check_deadline,
+    clamp_timeout,
+    current_deadline,
+    deadline,
+    remaining_time,
+)
+from kstlib.resilience.exceptions import (
+    BulkheadFullError,
+    DeadlineExceededError,
+    RateLimitExceededError,
+    RetryExhaustedError,
+)
+from kstlib.resilience.rate_limiter import RateLimiter
+from kstlib.resilience.retry import RetryPolicy
+
+
+class TestDeadlineContext:
+    """Tests for the deadline() context manager and helpers."""
+
+    def test_no_deadline_by_default(self) -> None:
+        """Outside a block there is no budget and timeouts pass through."""
+        assert current_deadline() is None
+        assert remaining_time() is None
+        assert clamp_timeout(3.0) == 3.0
+        assert clamp_timeout(None) is None
+        check_deadline()
+
+    def test_sets_and_resets(self) -> None:
+        """The deadline is active inside the block only."""
+        with deadline(1.0) as d:
+            assert isinstance(d, Deadline)
+            assert d.budget == 1.0
+            assert current_deadline() == d.expires_at
+            remaining = remaining_time()
+            assert remaining is not None
+            assert 0 < remaining <= 1.0
+        assert current_deadline() is None
+
+    def test_negative_rejected(self) -> None:
+        """A negative budget is a programming error."""
+        with pytest.raises(ValueError, match="negative"), deadline(-1):
+            pass
+
+    def test_nested_cannot_extend(self) -> None:
+        """An inner deadline cannot outlive the outer one."""
+        with deadline(0.5) as outer:
+            with deadline(10.0) as inner:
+                assert inner.expires_at == outer.expires_at
+            with deadline(0.1) as shorter:
+                assert shorter.expires_at < outer.expires_at
+            assert current_deadline() == outer.expires_at
+
+    def test_clamp_timeout(self) -> None:
+        """Timeouts are cut to the remaining budget."""
+        with deadline(0.5):
+            assert clamp_timeout(30.0) <= 0.5
+            assert clamp_timeout(0.1) == 0.1
+            unbounded = clamp_timeout(None)
+            assert unbounded is not None
+            assert unbounded <= 0.5
+
+    def test_expired_raises(self) -> None:
+        """Spent budgets raise DeadlineExceededError, a TimeoutError."""
+        with deadline(0):
+            with pytest.raises(DeadlineExceededError, match="before fetch") as exc_info:
+                clamp_timeout(1.0, "fetch")
+            assert exc_info.value.operation == "fetch"
+            with pytest.raises(TimeoutError):
+                check_deadline()
+
+    @pytest.mark.asyncio
+    async def test_follows_await_and_isolates_tasks(self) -> None:
+        """Tasks inherit the deadline; a task's own deadline stays local."""
+
+        async def child() -> float | None:
+            with deadline(0.01):
+                await asyncio.sleep(0)
+            return current_deadline()
+
+        with deadline(5.0) as d:
+            assert await asyncio.create_task(child()) == d.expires_at
+            assert current_deadline() == d.expires_at
+
+        async def no_deadline() -> float | None:
+            return current_deadline()
+
+        assert await asyncio.create_task(no_deadline()) is None
+
+
+class TestDeadlinePrimitives:
+    """Tests for primitives that honor the deadline."""
+
+    def test_rate_limiter_wait_clamped(self) -> None:
+        """The limiter wait stops at the deadline."""
+        limiter = RateLimiter(rate=1, per=60.0)
+        limiter.acquire()
+        start = time.monotonic()
+        with deadline(0.1), pytest.raises(DeadlineExceededError, match="rate limiter"):
+            limiter.acquire(timeout=30.0)
+        assert time.monotonic() - start < 1.0
+        assert limiter.stats.total_rejected == 1
+
+    def test_rate_limiter_own_timeout_still_wins(self) -> None:
+        """A shorter own timeout keeps raising RateLimitExceededError."""
+        limiter = RateLimiter(rate=1, per=60.0)
+        limiter.acquire()
+        with deadline(5.0), pytest.raises(RateLimitExceededError):
+            limiter.acquire(timeout=0.05)
+
+    def test_rate_limiter_non_blocking_ignores_deadline(self) -> None:
+        """try_acquire never waits, so it does not consult the deadline."""
+        limiter = RateLimiter(rate=1, per=60.0)
+        with deadline(0):
+            assert limiter.try_acquire() is True
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_async(self) -> None:
+        """The async limiter wait stops at the deadline."""
+        limiter = RateLimiter(rate=1, per=60.0)
+        await limiter.acquire_async()
+        with deadline(0.05), pytest.raises(DeadlineExceededError):
+            await limiter.acquire_async(timeout=30.0)
+
+    def test_bulkhead_wait_clamped(self) -> None:
+        """The bulkhead queue wait stops at the deadline."""
+        bh = Bulkhead(max_concurrent=1, max_queue=1, timeout=30.0)
+        bh.acquire()
+        start = time.monotonic()
+        with deadline(0.1), pytest.raises(DeadlineExceededError, match="bulkhead"):
+            bh.acquire()
+        assert time.monotonic() - start < 1.0
+        assert bh.stats.total_timeouts == 1
+        assert bh.waiting == 0
+
+    def test_bulkhead_full_queue_still_rejects(self) -> None:
+        """A full queue raises BulkheadFullError as before."""
+        bh = Bulkhead(max_concurrent=1, max_queue=0)
+        bh.acquire()
+        with deadline(5.0), pytest.raises(BulkheadFullError):
+            bh.acquire()
+
+    @pytest.mark.asyncio
+    async def test_bulkhead_async(self) -> None:
+        """The async bulkhead wait stops at the deadline."""
+        bh = Bulkhead(max_concurrent=1, max_queue=1, timeout=30.0)
+        await bh.acquire_async()
+        with deadline(0.05), pytest.raises(DeadlineExceededError):
+            await bh.acquire_async()
+        assert bh.waiting == 0
+
+    def test_retry_stops_before_sleeping_past_deadline(self) -> None:
+        """No retry is scheduled when its delay would outlive the budget."""
+        policy = RetryPolicy(max_attempts=5, base_delay=1.0, jitter="none")
+        calls = 0
+
+        def flaky() -> None:
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("down")
+
+        start = time.monotonic()
+        with deadline(0.5), pytest.raises(RetryExhaustedError) as exc_info:
+            policy.call(flaky)
+        assert calls == 1
+        assert exc_info.value.reason == "deadline"
+        assert time.monotonic() - start < 0.5
@@ -4,6 +4,7 @@
 
 import asyncio
 import json
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -12,6 +13,7 @@
 
 from kstlib.resilience.exceptions import HeartbeatError
 from kstlib.resilience.heartbeat import Heartbeat, HeartbeatState
+from kstlib.resilience.heartbeat_table import HeartbeatTable
 
 
 class TestHeartbeatState:
@@ -163,6 +165,173 @@ def test_beat_raises_on_write_error(self, tmp_path: Path) -> None:
             hb.beat()
 
 
+class TestHeartbeatWriteModes:
+    """Tests for the fixed-size record and the write modes."""
+
+    def test_invalid_write_mode(self, heartbeat_file: Path) -> None:
+        """Unknown write modes are rejected."""
+        with pytest.raises(ValueError, match="write_mode"):
+            Heartbeat(heartbeat_file, write_mode="append")  # type: ignore[arg-type]
+
+    def test_records_have_constant_size(self, heartbeat_file: Path) -> None:
+        """Successive records have the same length and a fixed-length timestamp."""
+        hb = Heartbeat(heartbeat_file, metadata={"bot": "alpha"})
+        sizes = set()
+        for _ in range(5):
+            hb.beat()
+            sizes.add(heartbeat_file.stat().st_size)
+        assert len(sizes) == 1
+        state = Heartbeat.read_state(heartbeat_file)
+        assert state is not None
+        assert len(state.timestamp) == len("2026-01-12T10:00:00.000000+00:00")
+        assert datetime.fromisoformat(state.timestamp).tzinfo is not None
+
+    def test_inplace_keeps_descriptor_open(self, heartbeat_file: Path) -> None:
+        """In-place mode rewrites the same inode through one descriptor."""
+        hb = Heartbeat(heartbeat_file, write_mode="inplace")
+        hb.beat()
+        inode = heartbeat_file.stat().st_ino
+        fd = hb._fd
+        hb.beat()
+        assert hb._fd == fd
+        assert heartbeat_file.stat().st_ino == inode
+        assert Heartbeat.is_alive(heartbeat_file, max_age_seconds=5)
+        hb.stop()
+        assert hb._fd is None
+
+    def test_inplace_truncates_previous_content(self, heartbeat_file: Path) -> None:
+        """A longer file left by a previous writer does not corrupt the record."""
+        heartbeat_file.write_text(json.dumps({"padding": "x" * 500}, indent=2))
+        hb = Heartbeat(heartbeat_file, write_mode="inplace")
+        hb.beat()
+        hb.stop()
+        assert Heartbeat.read_state(heartbeat_file) is not None
+
+    def test_inplace_shrinking_metadata_is_padded(self, heartbeat_file: Path) -> None:
+        """Shorter records are padded so no stale bytes follow the JSON."""
+        hb = Heartbeat(heartbeat_file, write_mode="inplace", metadata={"note": "x" * 100})
+        hb.beat()
+        hb.set_metadata({})
+        hb.beat()
+        hb.stop()
+        state = Heartbeat.read_state(heartbeat_file)
+        assert state is not None
+        assert state.metadata == {}
+
+    def test_fsync_from_config(self, heartbeat_file: Path) -> None:
+        """fsync defaults to the resilience.heartbeat.fsync setting."""
+        assert Heartbeat(heartbeat_file).fsync is False
+        assert Heartbeat(heartbeat_file, fsync=True).fsync is True
+
+    @pytest.mark.parametrize("write_mode", ["replace", "inplace"])
+    def test_fsync_called_when_enabled(self, heartbeat_file: Path, write_mode: str) -> None:
+        """Each write is flushed when fsync is enabled."""
+        hb = Heartbeat(heartbeat_file, write_mode=write_mode, fsync=True)  # type: ignore[arg-type]
+        with patch("kstlib.resilience.heartbeat.os.fsync") as fsync:
+            hb.beat()
+        fsync.assert_called_once()
+        hb.stop()
+
+    def test_parent_directory_created_once(self, tmp_path: Path) -> None:
+        """mkdir runs on the first beat only."""
+        hb = Heartbeat(tmp_path / "hb" / "state.json")
+        real_mkdir = Path.mkdir
+        with patch.object(Path, "mkdir", autospec=True, side_effect=real_mkdir) as mkdir:
+            hb.beat()
+            hb.beat()
+        assert mkdir.call_count == 1
+
+    def test_parent_directory_recreated_after_error(self, tmp_path: Path) -> None:
+        """A removed directory is recreated on the beat after the failure."""
+        state_file = tmp_path / "hb" / "state.json"
+        hb = Heartbeat(state_file)
+        hb.beat()
+        state_file.unlink()
+        state_file.parent.rmdir()
+        with pytest.raises(HeartbeatError):
+            hb.beat()
+        hb.beat()
+        assert state_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_async_writes_off_event_loop(self, heartbeat_file: Path) -> None:
+        """The async loop writes on the heartbeat IO pool, not the loop thread."""
+        hb = Heartbeat(heartbeat_file, interval=0.1)
+        threads: list[str] = []
+        original = hb.beat
+
+        def recording_beat() -> None:
+            threads.append(threading.current_thread().name)
+            original()
+
+        hb.beat = recording_beat  # type: ignore[method-assign]
+        async with hb:
+            await asyncio.sleep(0.05)
+        assert threads
+        assert all(name.startswith("kstlib-heartbeat-io") for name in threads)
+
+
+class TestHeartbeatTableBackend:
+    """Tests for beating into a shared HeartbeatTable."""
+
+    def test_start_claims_slot_and_stop_releases(self, tmp_path: Path) -> None:
+        """The slot is claimed on start and freed on stop."""
+        with HeartbeatTable(tmp_path / "fleet.hbt", slots=2) as table:
+            hb = Heartbeat(table=table, slot_name="bot-1", interval=1)
+            hb.start()
+            try:
+                assert hb.slot is not None
+                assert table.find("bot-1") is not None
+            finally:
+                hb.stop()
+            assert hb.slot is None
+            assert table.scan() == []
+
+    def test_beat_updates_slot_and_file(self, tmp_path: Path) -> None:
+        """A beat touches both the table slot and the state file."""
+        state_file = tmp_path / "bot.heartbeat"
+        with HeartbeatTable(tmp_path / "fleet.hbt", slots=2) as table:
+            hb = Heartbeat(state_file, table=table, slot_name="bot-1")
+            hb.beat()
+            hb.beat()
+            info = table.find("bot-1")
+            assert info is not None
+            assert info.beats == 2
+            assert state_file.exists()
+            hb.stop()
+
+    def test_failed_file_write_counts_as_missed(self, tmp_path: Path) -> None:
+        """State file errors are recorded in the slot missed counter."""
+        dir_path = tmp_path / "directory"
+        dir_path.mkdir()
+        with HeartbeatTable(tmp_path / "fleet.hbt", slots=2) as table:
+            hb = Heartbeat(dir_path, table=table, slot_name="bot-1")
+            with pytest.raises(HeartbeatError):
+                hb.beat()
+            info = table.find("bot-1")
+            assert info is not None
+            assert info.missed == 1
+            hb.stop()
+
+    def test_full_table_fails_start(self, tmp_path: Path) -> None:
+        """start() raises when no slot is free."""
+        with HeartbeatTable(tmp_path / "fleet.hbt", slots=1) as table:
+            table.claim("other")
+            hb = Heartbeat(table=table, slot_name="bot-1", interval=1)
+            with pytest.raises(HeartbeatError, match="full"):
+                hb.start()
+            assert hb._running is False
+
+    @pytest.mark.asyncio
+    async def test_async_heartbeat_with_table(self, tmp_path: Path) -> None:
+        """The async loop beats into the table."""
+        with HeartbeatTable(tmp_path / "fleet.hbt", slots=2) as table:
+            async with Heartbeat(table=table, slot_name="bot-1", interval=1):
+                await asyncio.sleep(0.05)
+                assert table.find("bot-1") is not None
+            assert table.scan() == []
+
+
 class TestHeartbeatStartStop:
     """Tests for start() and stop() methods."""
 
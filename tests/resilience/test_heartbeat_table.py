@@ -0,0 +1,147 @@
+"""Tests for the shared memory-mapped heartbeat table."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kstlib.resilience.exceptions import HeartbeatError
+from kstlib.resilience.heartbeat_table import HeartbeatSlotInfo, HeartbeatTable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def table(tmp_path: Path) -> Iterator[HeartbeatTable]:
+    """Provide a small table that is closed after the test."""
+    with HeartbeatTable(tmp_path / "fleet.hbt", slots=4) as hbt:
+        yield hbt
+
+
+class TestHeartbeatTableFile:
+    """Tests for creating and reopening table files."""
+
+    def test_invalid_slot_count(self, tmp_path: Path) -> None:
+        """Slot count must be positive."""
+        with pytest.raises(ValueError, match="slots"):
+            HeartbeatTable(tmp_path / "fleet.hbt", slots=0)
+
+    def test_reopen_keeps_slot_count_and_data(self, table: HeartbeatTable) -> None:
+        """A second handle sees the existing layout and slots."""
+        table.claim("bot-1")
+        with HeartbeatTable(table.path, slots=99) as other:
+            assert other.slots == 4
+            assert [info.name for info in other.scan()] == ["bot-1"]
+
+    def test_rejects_foreign_file(self, tmp_path: Path) -> None:
+        """A file that is not a heartbeat table is refused."""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"x" * 200)
+        with pytest.raises(HeartbeatError, match="Not a heartbeat table"):
+            HeartbeatTable(path)
+
+    def test_close_is_idempotent(self, tmp_path: Path) -> None:
+        """close() can be called twice."""
+        table = HeartbeatTable(tmp_path / "fleet.hbt", slots=1)
+        table.close()
+        table.close()
+
+
+class TestHeartbeatTableSlots:
+    """Tests for claiming, beating and releasing slots."""
+
+    def test_claim_and_beat(self, table: HeartbeatTable) -> None:
+        """Beats update the timestamp and the counter."""
+        slot = table.claim("bot-1")
+        slot.beat()
+        slot.record_missed()
+        info = table.find("bot-1")
+        assert info is not None
+        assert info.index == slot.index
+        assert info.beats == 2  # claim records the first beat
+        assert info.missed == 1
+        assert info.age < 1.0
+
+    def test_default_name_uses_pid(self, table: HeartbeatTable) -> None:
+        """Unnamed slots are called after the pid."""
+        slot = table.claim()
+        assert slot.name == f"pid-{slot.pid}"
+
+    def test_long_name_truncated(self, table: HeartbeatTable) -> None:
+        """Names are cut to 16 bytes and still found by their full name."""
+        slot = table.claim("a-very-long-bot-name")
+        assert slot.name == "a-very-long-bot-"
+        assert table.find("a-very-long-bot-name") is not None
+
+    def test_same_name_reuses_slot(self, table: HeartbeatTable) -> None:
+        """A restarted process takes over its previous slot."""
+        first = table.claim("bot-1")
+        second = table.claim("bot-1")
+        assert second.index == first.index
+        assert len(table.scan()) == 1
+
+    def test_full_table_raises(self, table: HeartbeatTable) -> None:
+        """Claiming beyond the slot count fails without reclaim_after."""
+        for i in range(4):
+            table.claim(f"bot-{i}")
+        with pytest.raises(HeartbeatError, match="full"):
+            table.claim("bot-4")
+
+    def test_reclaim_stale_slot(self, table: HeartbeatTable) -> None:
+        """A full table reuses the stalest slot older than reclaim_after."""
+        slots = [table.claim(f"bot-{i}") for i in range(4)]
+        time.sleep(0.05)
+        for slot in slots[1:]:
+            slot.beat()
+        new = table.claim("bot-new", reclaim_after=0.01)
+        assert new.index == slots[0].index
+        assert table.find("bot-0") is None
+
+    def test_release_frees_slot(self, table: HeartbeatTable) -> None:
+        """Released slots disappear from scans and can be claimed again."""
+        slot = table.claim("bot-1")
+        slot.release()
+        assert table.scan() == []
+        assert table.claim("bot-2").index == slot.index
+
+    def test_release_after_takeover_is_noop(self, table: HeartbeatTable) -> None:
+        """An old handle cannot free a slot claimed by someone else."""
+        old = table.claim("bot-1")
+        old.release()
+        table.claim("bot-2")
+        old.release()
+        assert [info.name for info in table.scan()] == ["bot-2"]
+
+
+class TestHeartbeatTableScan:
+    """Tests for supervisor scans."""
+
+    def test_dead_reports_stale_slots(self, table: HeartbeatTable) -> None:
+        """Slots older than max_age are reported dead."""
+        table.claim("stale")
+        time.sleep(0.05)
+        fresh = table.claim("fresh")
+        fresh.beat()
+        dead = table.dead(max_age=0.03)
+        assert [info.name for info in dead] == ["stale"]
+        assert isinstance(dead[0], HeartbeatSlotInfo)
+
+    def test_sees_other_process(self, table: HeartbeatTable) -> None:
+        """A slot written by another process is visible through the mapping."""
+        code = (
+            "import sys\n"
+            "from kstlib.resilience.heartbeat_table import HeartbeatTable\n"
+            "with HeartbeatTable(sys.argv[1]) as t:\n"
+            "    t.claim('child').beat()\n"
+        )
+        subprocess.run([sys.executable, "-c", code, str(table.path)], check=True, timeout=60)  # noqa: S603
+        info = table.find("child")
+        assert info is not None
+        assert info.beats == 2
+        assert info.age < 60
@@ -0,0 +1,183 @@
+"""Tests for hedged async calls."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from kstlib.resilience.hedge import HedgePolicy, HedgeStats, hedge
+from kstlib.resilience.rate_limiter import RateLimiter
+from kstlib.resilience.retry import RetryBudget
+
+
+class _Attempts:
+    """Coroutine factory whose attempts sleep for scripted durations."""
+
+    def __init__(self, *durations: float, fail: tuple[int, ...] = ()) -> None:
+        """Store per-attempt durations and indices of failing attempts."""
+        self.durations = durations
+        self.fail = fail
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> int:
+        """Run the next scripted attempt and return its index."""
+        index = self.started
+        self.started += 1
+        try:
+            await asyncio.sleep(self.durations[index])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if index in self.fail:
+            raise ConnectionError(f"attempt {index} failed")
+        return index
+
+
+class TestHedgeStats:
+    """Tests for HedgeStats dataclass."""
+
+    def test_record_methods(self) -> None:
+        """Record methods increment counters."""
+        stats = HedgeStats()
+        stats.record_call()
+        stats.record_hedge()
+        stats.record_hedge_win()
+        stats.record_budget_rejection()
+        stats.record_rate_limited()
+        assert stats == HedgeStats(1, 1, 1, 1, 1)
+
+
+class TestHedgePolicyInit:
+    """Tests for HedgePolicy validation and delay computation."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"delay": -1.0}, "delay"),
+            ({"max_hedges": -1}, "max_hedges"),
+            ({"percentile": 0.0}, "percentile"),
+            ({"percentile": 101.0}, "percentile"),
+            ({"initial_delay": -0.1}, "initial_delay"),
+            ({"min_samples": 10, "window": 5}, "min_samples"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, float], match: str) -> None:
+        """Out-of-range settings raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            HedgePolicy(**kwargs)  # type: ignore[arg-type]
+
+    def test_fixed_delay(self) -> None:
+        """A fixed delay ignores recorded latencies."""
+        policy = HedgePolicy(delay=0.2, min_samples=1)
+        policy.record_latency(5.0)
+        assert policy.delay == 0.2
+
+    def test_initial_delay_until_enough_samples(self) -> None:
+        """initial_delay applies until min_samples latencies are known."""
+        policy = HedgePolicy(initial_delay=0.3, min_samples=3)
+        policy.record_latency(0.01)
+        assert policy.delay == 0.3
+
+    def test_percentile_delay(self) -> None:
+        """The delay is the configured latency percentile."""
+        policy = HedgePolicy(percentile=90.0, min_samples=10)
+        for i in range(1, 11):
+            policy.record_latency(i / 100)
+        assert policy.delay == 0.09
+
+    def test_window_drops_old_samples(self) -> None:
+        """Only the most recent window of latencies counts."""
+        policy = HedgePolicy(percentile=100.0, min_samples=2, window=2)
+        for latency in (1.0, 0.1, 0.2):
+            policy.record_latency(latency)
+        assert policy.delay == 0.2
+
+
+class TestHedgeRun:
+    """Tests for hedged execution."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_no_hedge(self) -> None:
+        """A primary finishing before the delay never hedges."""
+        attempts = _Attempts(0.0, 0.0)
+        policy = HedgePolicy(delay=0.5)
+        assert await policy.run(attempts) == 0
+        assert attempts.started == 1
+        assert policy.stats.hedges_sent == 0
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_primary_cancelled(self) -> None:
+        """A slow primary is overtaken by the hedge, then cancelled."""
+        attempts = _Attempts(1.0, 0.0)
+        policy = HedgePolicy(delay=0.01)
+        assert await policy.run(attempts) == 1
+        assert attempts.started == 2
+        assert attempts.cancelled == 1
+        assert policy.stats.hedges_sent == 1
+        assert policy.stats.hedge_wins == 1
+
+    @pytest.mark.asyncio
+    async def test_max_hedges_respected(self) -> None:
+        """No more than max_hedges extra attempts are started."""
+        attempts = _Attempts(0.1, 0.1, 0.1, 0.1)
+        policy = HedgePolicy(delay=0.005, max_hedges=2)
+        await policy.run(attempts)
+        assert attempts.started == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_waits_for_other_attempt(self) -> None:
+        """A failing attempt does not fail the call while another runs."""
+        attempts = _Attempts(0.03, 0.05, fail=(0,))
+        assert await hedge(attempts, delay=0.005) == 1
+
+    @pytest.mark.asyncio
+    async def test_all_attempts_fail(self) -> None:
+        """The error propagates once every attempt failed."""
+        attempts = _Attempts(0.0, fail=(0,))
+        with pytest.raises(ConnectionError, match="attempt 0"):
+            await hedge(attempts, delay=0.5)
+
+    @pytest.mark.asyncio
+    async def test_zero_hedges_is_plain_call(self) -> None:
+        """max_hedges=0 just awaits the single attempt."""
+        attempts = _Attempts(0.02, 0.0)
+        assert await hedge(attempts, delay=0.001, max_hedges=0) == 0
+        assert attempts.started == 1
+
+    @pytest.mark.asyncio
+    async def test_records_winner_latency(self) -> None:
+        """The winning attempt latency feeds the percentile window."""
+        policy = HedgePolicy(min_samples=1, percentile=100.0)
+        await policy.run(_Attempts(0.01))
+        assert 0.005 < policy.delay < 0.5
+
+
+class TestHedgeBudgetAndRateLimit:
+    """Tests for hedge budget and rate limiter accounting."""
+
+    @pytest.mark.asyncio
+    async def test_empty_budget_skips_hedge(self) -> None:
+        """Without budget tokens the call waits for the primary."""
+        budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=1.0)
+        assert budget.try_withdraw() is True  # drain the initial token
+        attempts = _Attempts(0.03, 0.0)
+        policy = HedgePolicy(delay=0.001, budget=budget)
+        assert await policy.run(attempts) == 0
+        assert attempts.started == 1
+        assert policy.stats.budget_rejections == 1
+
+    @pytest.mark.asyncio
+    async def test_hedges_consume_rate_limiter_tokens(self) -> None:
+        """Each hedge takes a rate limiter token; none left means no hedge."""
+        limiter = RateLimiter(rate=1, per=60.0)
+        policy = HedgePolicy(delay=0.001, rate_limiter=limiter)
+
+        assert await policy.run(_Attempts(0.05, 0.0)) == 1
+        assert limiter.tokens < 1
+
+        attempts = _Attempts(0.02, 0.0)
+        assert await policy.run(attempts) == 0
+        assert attempts.started == 1
+        assert policy.stats.rate_limited == 1
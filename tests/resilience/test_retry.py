@@ -0,0 +1,280 @@
+"""Tests for the RetryPolicy, RetryBudget and retry decorator."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from kstlib.resilience.exceptions import RateLimitExceededError, RetryExhaustedError
+from kstlib.resilience.retry import (
+    RetryBudget,
+    RetryPolicy,
+    RetryStats,
+    retry,
+    retry_after_from_exception,
+)
+
+if TYPE_CHECKING:
+    from tests.resilience.conftest import TimeStub
+
+
+class Flaky:
+    """Callable failing a given number of times before succeeding."""
+
+    def __init__(self, failures: int, exc: BaseException | None = None) -> None:
+        """Initialize with the number of failures and the exception to raise."""
+        self.failures = failures
+        self.exc = exc or ConnectionError("reset")
+        self.calls = 0
+
+    def __call__(self) -> str:
+        """Fail until the configured number of failures is reached."""
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.exc
+        return "ok"
+
+
+class TestRetryStats:
+    """Tests for RetryStats dataclass."""
+
+    def test_default_values(self) -> None:
+        """Stats start at zero."""
+        stats = RetryStats()
+        assert stats.total_calls == 0
+        assert stats.total_retries == 0
+        assert stats.exhausted == 0
+        assert stats.budget_rejections == 0
+        assert stats.total_delay == 0.0
+
+
+class TestRetryPolicyInit:
+    """Tests for RetryPolicy validation."""
+
+    def test_invalid_max_attempts(self) -> None:
+        """At least one attempt is required."""
+        with pytest.raises(ValueError, match="max_attempts"):
+            RetryPolicy(max_attempts=0)
+
+    def test_invalid_jitter(self) -> None:
+        """Unknown jitter modes are rejected."""
+        with pytest.raises(ValueError, match="jitter"):
+            RetryPolicy(jitter="random")  # type: ignore[arg-type]
+
+    def test_invalid_multiplier(self) -> None:
+        """Backoff must not shrink."""
+        with pytest.raises(ValueError, match="multiplier"):
+            RetryPolicy(multiplier=0.5)
+
+    def test_invalid_deadline(self) -> None:
+        """Deadline must be positive."""
+        with pytest.raises(ValueError, match="deadline"):
+            RetryPolicy(deadline=0)
+
+
+class TestRetryPolicyDelays:
+    """Tests for backoff and jitter computation."""
+
+    def test_exponential_without_jitter(self) -> None:
+        """Delays grow exponentially and are capped."""
+        policy = RetryPolicy(base_delay=1.0, multiplier=2.0, max_delay=5.0, jitter="none")
+        assert [policy.compute_delay(n) for n in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_full_jitter_bounds(self) -> None:
+        """Full jitter stays within [0, backoff]."""
+        policy = RetryPolicy(base_delay=1.0, multiplier=2.0, jitter="full")
+        for _ in range(100):
+            assert 0.0 <= policy.compute_delay(3) <= 4.0
+
+    def test_decorrelated_jitter_bounds(self) -> None:
+        """Decorrelated jitter stays within [base, min(max, 3 * previous)]."""
+        policy = RetryPolicy(base_delay=0.5, max_delay=10.0, jitter="decorrelated")
+        previous = None
+        for n in range(1, 50):
+            delay = policy.compute_delay(n, previous)
+            assert 0.5 <= delay <= 10.0
+            if previous is not None:
+                assert delay <= max(0.5, previous * 3)
+            previous = delay
+
+
+class TestRetryPolicyCall:
+    """Tests for sync retries."""
+
+    def test_success_after_failures(self) -> None:
+        """Retries until the call succeeds."""
+        func = Flaky(2)
+        policy = RetryPolicy(max_attempts=3, base_delay=0.0)
+
+        assert policy.call(func) == "ok"
+        assert func.calls == 3
+        assert policy.stats.total_retries == 2
+
+    def test_exhausted_attempts(self) -> None:
+        """Gives up after max_attempts with the last error attached."""
+        func = Flaky(10)
+        policy = RetryPolicy(max_attempts=3, base_delay=0.0)
+
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            policy.call(func)
+
+        assert exc_info.value.reason == "attempts"
+        assert exc_info.value.attempts == 3
+        assert isinstance(exc_info.value.last_error, ConnectionError)
+        assert exc_info.value.__cause__ is exc_info.value.last_error
+        assert policy.stats.exhausted == 1
+
+    def test_non_retryable_exception_propagates(self) -> None:
+        """Exceptions outside retry_on are raised immediately."""
+        func = Flaky(1, ValueError("bad input"))
+        policy = RetryPolicy(max_attempts=5, base_delay=0.0, retry_on=(ConnectionError,))
+
+        with pytest.raises(ValueError, match="bad input"):
+            policy.call(func)
+        assert func.calls == 1
+
+    def test_sleeps_between_attempts(self) -> None:
+        """Computed delays are slept between attempts."""
+        policy = RetryPolicy(max_attempts=3, base_delay=1.0, jitter="none")
+
+        with patch("kstlib.resilience.retry.time.sleep") as sleep:
+            policy.call(Flaky(2))
+
+        assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0]
+
+    def test_retry_after_hint_honored(self) -> None:
+        """A retry_after attribute extends the delay."""
+        policy = RetryPolicy(max_attempts=2, base_delay=0.1, jitter="none")
+        func = Flaky(1, RateLimitExceededError("slow down", retry_after=3.0))
+
+        with patch("kstlib.resilience.retry.time.sleep") as sleep:
+            policy.call(func)
+
+        sleep.assert_called_once_with(3.0)
+
+    def test_retry_after_disabled(self) -> None:
+        """retry_after=None ignores server hints."""
+        policy = RetryPolicy(max_attempts=2, base_delay=0.1, jitter="none", retry_after=None)
+        func = Flaky(1, RateLimitExceededError("slow down", retry_after=3.0))
+
+        with patch("kstlib.resilience.retry.time.sleep") as sleep:
+            policy.call(func)
+
+        sleep.assert_called_once_with(0.1)
+
+    def test_deadline_stops_retries(self) -> None:
+        """A delay that would overrun the deadline ends retrying."""
+        policy = RetryPolicy(max_attempts=10, base_delay=5.0, jitter="none", deadline=2.0)
+        func = Flaky(10)
+
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            policy.call(func)
+
+        assert exc_info.value.reason == "deadline"
+        assert func.calls == 1
+
+    def test_decorator(self) -> None:
+        """The policy can decorate a function."""
+        func = Flaky(1)
+        wrapped = RetryPolicy(base_delay=0.0)(func)
+        assert wrapped() == "ok"
+
+
+class TestRetryPolicyAcall:
+    """Tests for async retries."""
+
+    def test_async_success_after_failures(self) -> None:
+        """Async calls are retried with asyncio.sleep."""
+        attempts: list[int] = []
+
+        async def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise TimeoutError("slow")
+            return "ok"
+
+        policy = RetryPolicy(max_attempts=3, base_delay=0.0)
+        assert asyncio.run(policy.acall(flaky)) == "ok"
+        assert len(attempts) == 3
+
+    def test_async_exhausted(self) -> None:
+        """Async calls raise RetryExhaustedError when attempts run out."""
+
+        async def broken() -> None:
+            raise ConnectionError("down")
+
+        policy = RetryPolicy(max_attempts=2, base_delay=0.0)
+        with pytest.raises(RetryExhaustedError):
+            asyncio.run(policy.acall(broken))
+
+    def test_async_decorator(self) -> None:
+        """The retry decorator wraps coroutine functions."""
+        attempts: list[int] = []
+
+        @retry(max_attempts=2, base_delay=0.0)
+        async def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise ConnectionError("reset")
+            return "ok"
+
+        assert asyncio.run(flaky()) == "ok"
+
+
+class TestRetryBudget:
+    """Tests for the token-bucket retry budget."""
+
+    def test_invalid_parameters(self) -> None:
+        """Negative parameters are rejected."""
+        with pytest.raises(ValueError, match="ratio"):
+            RetryBudget(ratio=-1)
+        with pytest.raises(ValueError, match="max_tokens"):
+            RetryBudget(max_tokens=0)
+
+    def test_deposits_fund_retries(self) -> None:
+        """Retries are bounded by deposits from regular calls."""
+        budget = RetryBudget(ratio=0.25, min_per_second=0.0, max_tokens=1)
+        assert budget.try_withdraw()
+        assert not budget.try_withdraw()
+
+        for _ in range(4):
+            budget.deposit()
+        assert budget.try_withdraw()
+
+    def test_time_floor_refill(self, time_stub: TimeStub) -> None:
+        """The floor refills tokens over time."""
+        budget = RetryBudget(ratio=0.0, min_per_second=1.0, max_tokens=2)
+        assert budget.try_withdraw()
+        assert budget.try_withdraw()
+        assert not budget.try_withdraw()
+
+        time_stub.sleep(1.0)
+        assert budget.try_withdraw()
+
+    def test_exhausted_budget_stops_retries(self) -> None:
+        """A policy gives up when the shared budget is empty."""
+        budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=1)
+        policy = RetryPolicy(max_attempts=5, base_delay=0.0, budget=budget)
+        func = Flaky(10)
+
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            policy.call(func)
+
+        assert exc_info.value.reason == "budget"
+        assert func.calls == 2
+        assert policy.stats.budget_rejections == 1
+
+
+class TestRetryAfterFromException:
+    """Tests for the default Retry-After extractor."""
+
+    def test_ignores_invalid_values(self) -> None:
+        """Negative or non-numeric hints are ignored."""
+        exc = RuntimeError("x")
+        exc.retry_after = -1  # type: ignore[attr-defined]
+        assert retry_after_from_exception(exc) is None
+        exc.retry_after = "soon"  # type: ignore[attr-defined]
+        assert retry_after_from_exception(exc) is None
@@ -13,7 +13,7 @@
 import pytest
 
 from kstlib.resilience.exceptions import ShutdownError
-from kstlib.resilience.shutdown import CleanupCallback, GracefulShutdown
+from kstlib.resilience.shutdown import CleanupCallback, CleanupResult, GracefulShutdown, ShutdownReport
 
 
 class TestCleanupCallback:
@@ -620,3 +620,120 @@ def slow_sync() -> None:
         await shutdown.atrigger()
 
         assert "fast" in result
+
+
+class TestGracefulShutdownParallelGroups:
+    """Tests for concurrent priority groups and the shutdown report."""
+
+    def test_same_priority_runs_concurrently(self) -> None:
+        """Callbacks sharing a priority overlap instead of adding up."""
+        shutdown = GracefulShutdown(timeout=5)
+        for name in ("db", "ws", "cache"):
+            shutdown.register(name, lambda: time.sleep(0.2), priority=10)
+
+        start = time.monotonic()
+        report = shutdown.trigger()
+        elapsed = time.monotonic() - start
+
+        assert report is not None
+        assert elapsed < 0.5
+        assert [r.status for r in report.results] == ["ok", "ok", "ok"]
+
+    def test_groups_run_in_priority_order(self) -> None:
+        """A priority group starts only after the previous one finished."""
+        events: list[str] = []
+        lock = threading.Lock()
+
+        def record(name: str, delay: float) -> None:
+            time.sleep(delay)
+            with lock:
+                events.append(name)
+
+        shutdown = GracefulShutdown(timeout=5)
+        shutdown.register("late", lambda: record("late", 0.0), priority=20)
+        shutdown.register("slow", lambda: record("slow", 0.1), priority=10)
+        shutdown.register("fast", lambda: record("fast", 0.0), priority=10)
+        shutdown.trigger()
+
+        assert events == ["fast", "slow", "late"]
+
+    def test_report_statuses_and_durations(self) -> None:
+        """The report records ok, timeout and error outcomes with durations."""
+
+        def failing() -> None:
+            raise RuntimeError("disk full")
+
+        async def hanging() -> None:
+            await asyncio.sleep(5)
+
+        shutdown = GracefulShutdown(timeout=5)
+        shutdown.register("ok", lambda: time.sleep(0.05), priority=1)
+        shutdown.register("hang", hanging, priority=1, timeout=0.1)
+        shutdown.register("fail", failing, priority=1)
+
+        report = shutdown.trigger()
+
+        assert report is shutdown.report
+        by_name = {r.name: r for r in report.results}
+        assert by_name["ok"].status == "ok"
+        assert by_name["ok"].duration >= 0.05
+        assert by_name["hang"].status == "timeout"
+        assert by_name["fail"].status == "error"
+        assert by_name["fail"].error == "disk full"
+        assert report.timed_out == ["hang"]
+        assert report.failed == ["fail"]
+        assert report.duration < 1.0
+
+    def test_sync_timeout_does_not_delay_group_peers(self) -> None:
+        """A stuck sync callback is abandoned at its own timeout."""
+        release = threading.Event()
+        shutdown = GracefulShutdown(timeout=5)
+        shutdown.register("stuck", release.wait, priority=1, timeout=0.1)
+        shutdown.register("quick", lambda: None, priority=1)
+
+        report = shutdown.trigger()
+        release.set()
+
+        assert report is not None
+        assert report.timed_out == ["stuck"]
+        assert report.duration < 1.0
+
+    def test_second_trigger_returns_none(self) -> None:
+        """Only the first trigger produces a report."""
+        shutdown = GracefulShutdown()
+        assert shutdown.trigger() is not None
+        assert shutdown.trigger() is None
+
+    @pytest.mark.asyncio
+    async def test_async_same_priority_runs_concurrently(self) -> None:
+        """atrigger overlaps sync and async callbacks of one priority."""
+
+        async def slow_async() -> None:
+            await asyncio.sleep(0.2)
+
+        shutdown = GracefulShutdown(timeout=5)
+        shutdown.register("a", slow_async, priority=10)
+        shutdown.register("b", slow_async, priority=10)
+        shutdown.register("c", lambda: time.sleep(0.2), priority=10)
+
+        report = await shutdown.atrigger()
+
+        assert report is not None
+        assert report.duration < 0.5
+        assert [r.name for r in report.results] == ["a", "b", "c"]
+
+    def test_report_helpers(self) -> None:
+        """slowest() and format() summarize the run."""
+        report = ShutdownReport(
+            results=(
+                CleanupResult("db", 10, "ok", 0.5),
+                CleanupResult("alert", 20, "error", 0.1, "boom"),
+                CleanupResult("ws", 10, "timeout", 2.0),
+            ),
+            duration=2.6,
+        )
+        assert [r.name for r in report.slowest(2)] == ["ws", "db"]
+        text = report.format()
+        assert "alert" in text
+        assert "timeout" in text
+        assert text.endswith("total: 2.600s")
@@ -0,0 +1,70 @@
+"""Tests for the shared timer scheduler."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from kstlib.resilience._timers import TimerScheduler, get_callback_executor, get_scheduler
+
+
+class TestTimerScheduler:
+    """Tests for TimerScheduler."""
+
+    def test_fires_in_deadline_order(self) -> None:
+        """Timers fire earliest deadline first, whatever the insertion order."""
+        scheduler = TimerScheduler(name="test-order")
+        order: list[int] = []
+        done = threading.Event()
+        scheduler.call_later(0.06, lambda: (order.append(3), done.set()))
+        scheduler.call_later(0.02, lambda: order.append(1))
+        scheduler.call_later(0.04, lambda: order.append(2))
+        assert done.wait(2.0)
+        assert order == [1, 2, 3]
+
+    def test_earlier_deadline_interrupts_sleep(self) -> None:
+        """A new earliest timer wakes the thread instead of waiting for the old one."""
+        scheduler = TimerScheduler(name="test-wake")
+        late = scheduler.call_later(30.0, lambda: None)
+        fired = threading.Event()
+        start = time.monotonic()
+        scheduler.call_later(0.01, fired.set)
+        assert fired.wait(2.0)
+        assert time.monotonic() - start < 1.0
+        late.cancel()
+
+    def test_cancelled_timer_does_not_fire(self) -> None:
+        """Cancelled timers are skipped and not counted as pending."""
+        scheduler = TimerScheduler(name="test-cancel")
+        fired = threading.Event()
+        handle = scheduler.call_later(0.02, fired.set)
+        assert scheduler.pending == 1
+        handle.cancel()
+        assert scheduler.pending == 0
+        assert not fired.wait(0.1)
+
+    def test_single_thread_for_many_timers(self) -> None:
+        """Any number of timers share one thread."""
+        scheduler = TimerScheduler(name="test-threads")
+        handles = [scheduler.call_later(10.0 + i, lambda: None) for i in range(100)]
+        assert scheduler.thread is not None
+        assert sum(1 for t in threading.enumerate() if t.name == "test-threads") == 1
+        for handle in handles:
+            handle.cancel()
+
+    def test_failing_callback_does_not_kill_thread(self) -> None:
+        """Exceptions in callbacks are logged and the thread keeps serving."""
+        scheduler = TimerScheduler(name="test-errors")
+
+        def boom() -> None:
+            raise RuntimeError("boom")
+
+        fired = threading.Event()
+        scheduler.call_later(0.0, boom)
+        scheduler.call_later(0.01, fired.set)
+        assert fired.wait(2.0)
+
+    def test_process_wide_singletons(self) -> None:
+        """get_scheduler and get_callback_executor return shared instances."""
+        assert get_scheduler() is get_scheduler()
+        assert get_callback_executor() is get_callback_executor()
@@ -5,12 +5,17 @@
 import asyncio
 import threading
 import time
+from typing import TYPE_CHECKING
 
 import pytest
 
 from kstlib.resilience.exceptions import WatchdogError, WatchdogTimeoutError
+from kstlib.resilience.heartbeat_table import HeartbeatTable
 from kstlib.resilience.watchdog import Watchdog, WatchdogStats, watchdog_context
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
 
 class TestWatchdogStats:
     """Tests for WatchdogStats dataclass."""
@@ -229,6 +234,119 @@ def test_reset_clears_triggered(self) -> None:
             watchdog.stop()
 
 
+class TestWatchdogSharedScheduler:
+    """Tests for watchdogs sharing one timer thread."""
+
+    def test_many_watchdogs_do_not_add_threads(self) -> None:
+        """Starting many sync watchdogs keeps the thread count flat."""
+        first = Watchdog(timeout=30)
+        first.start()
+        baseline = threading.active_count()
+        watchdogs = [Watchdog(timeout=30, name=f"w{i}") for i in range(50)]
+        try:
+            for wd in watchdogs:
+                wd.start()
+            assert threading.active_count() == baseline
+        finally:
+            first.stop()
+            for wd in watchdogs:
+                wd.stop()
+
+    def test_timeout_fires_for_each_watchdog(self) -> None:
+        """Every registered watchdog is checked on the shared thread."""
+        fired: list[str] = []
+        lock = threading.Lock()
+
+        def make_callback(name: str) -> Callable[[], None]:
+            def callback() -> None:
+                with lock:
+                    fired.append(name)
+
+            return callback
+
+        watchdogs = [Watchdog(timeout=1, on_timeout=make_callback(f"w{i}")) for i in range(5)]
+        for wd in watchdogs:
+            wd.start()
+        try:
+            deadline = time.monotonic() + 3.0
+            while len(fired) < 5 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert sorted(fired) == [f"w{i}" for i in range(5)]
+        finally:
+            for wd in watchdogs:
+                wd.stop()
+
+    def test_stop_prevents_late_callback(self) -> None:
+        """A stopped watchdog never fires."""
+        triggered = threading.Event()
+        wd = Watchdog(timeout=1, on_timeout=triggered.set)
+        wd.start()
+        wd.stop()
+        assert not triggered.wait(1.3)
+
+    def test_restart_does_not_double_schedule(self) -> None:
+        """Stopping and restarting leaves a single timer for the watchdog."""
+        count = 0
+
+        def on_timeout() -> None:
+            nonlocal count
+            count += 1
+
+        wd = Watchdog(timeout=1, on_timeout=on_timeout)
+        wd.start()
+        wd.stop()
+        wd.start()
+        try:
+            time.sleep(1.4)
+            assert count == 1
+        finally:
+            wd.stop()
+
+    def test_blocking_callbacks_do_not_stall_other_watchdogs(self) -> None:
+        """Callbacks that block do not hold the shared check workers."""
+        from kstlib.resilience._timers import CALLBACK_WORKERS
+
+        release = threading.Event()
+        fired = threading.Event()
+        blockers = [Watchdog(timeout=1, on_timeout=release.wait) for _ in range(CALLBACK_WORKERS + 1)]
+        for wd in blockers:
+            wd.start()
+        late = Watchdog(timeout=1.5, on_timeout=fired.set)
+        late.start()
+        try:
+            assert fired.wait(3.0)
+        finally:
+            release.set()
+            late.stop()
+            for wd in blockers:
+                wd.stop()
+
+    @pytest.mark.asyncio
+    async def test_async_watchdogs_create_no_tasks_while_idle(self) -> None:
+        """Async watchdogs wait on loop timers, not on per-watchdog tasks."""
+        baseline = len(asyncio.all_tasks())
+        watchdogs = [Watchdog(timeout=30) for _ in range(20)]
+        for wd in watchdogs:
+            await wd.astart()
+        try:
+            assert len(asyncio.all_tasks()) == baseline
+        finally:
+            for wd in watchdogs:
+                await wd.astop()
+
+    @pytest.mark.asyncio
+    async def test_async_timeout_fires(self) -> None:
+        """Async watchdogs still detect a missing ping."""
+        triggered = asyncio.Event()
+        wd = Watchdog(timeout=1, on_timeout=triggered.set)
+        await wd.astart()
+        try:
+            await asyncio.wait_for(triggered.wait(), 3.0)
+            assert wd.is_triggered
+        finally:
+            await wd.astop()
+
+
 class TestWatchdogAsync:
     """Tests for async functionality."""
 
@@ -698,5 +816,53 @@ def on_timeout() -> None:
         assert callback_called
 
 
+class TestWatchdogHeartbeatTable:
+    """Tests for Watchdog.from_heartbeat_table."""
+
+    def test_single_slot_alive(self, tmp_path: Path) -> None:
+        """A beating slot keeps the watchdog quiet."""
+        with HeartbeatTable(tmp_path / "fleet.hbt", slots=2) as table:
+            slot = table.claim("bot-1")
+            wd = Watchdog.from_heartbeat_table(table, "bot-1", check_interval=0.1, max_age=5.0)
+            assert wd.name == "heartbeat_table_watcher:bot-1"
+            wd.start()
+            slot.beat()
+            time.sleep(0.3)
+            wd.stop()
+            assert not wd.is_triggered
+
+    def test_missing_slot_triggers(self, tmp_path: Path) -> None:
+        """A slot that was never claimed counts as dead."""
+        fired = threading.Event()
+        with HeartbeatTable(tmp_path / "fleet.hbt", slots=2) as table:
+            wd = Watchdog.from_heartbeat_table(table, "ghost", check_interval=0.1, on_timeout=fired.set)
+            wd.start()
+            assert fired.wait(2.0)
+            wd.stop()
+
+    @pytest.mark.asyncio
+    async def test_fleet_alert_lists_dead_slots(self, tmp_path: Path) -> None:
+        """Without a slot name every slot is supervised and dead ones are reported."""
+        alerts: list[tuple[str, str, dict[str, object]]] = []
+
+        def on_alert(channel: str, message: str, context: Mapping[str, object]) -> None:
+            alerts.append((channel, message, dict(context)))
+
+        with HeartbeatTable(tmp_path / "fleet.hbt", slots=4) as table:
+            table.claim("bot-dead")
+            alive = table.claim("bot-alive")
+            wd = Watchdog.from_heartbeat_table(table, check_interval=0.1, max_age=0.1, on_alert=on_alert)
+            await wd.astart()
+            for _ in range(20):
+                alive.beat()
+                await asyncio.sleep(0.02)
+            await wd.astop()
+
+        assert wd.stats.timeouts_triggered >= 1
+        assert alerts[0][0] == "watchdog"
+        assert "bot-dead" in alerts[0][1]
+        assert alerts[0][2]["slots"] == ["bot-dead"]
+
+
 # Import Path for type hints in tests
 from pathlib import Path
@@ -16,6 +16,7 @@
     DEFAULT_MAX_CACHE_FILE_SIZE,
     DEFAULT_MAX_SOPS_CACHE_ENTRIES,
     DEFAULT_RAPI_JSON_INDENT,
+    DEFAULT_RAPI_RETRY_BUDGET_RATIO,
     DEFAULT_RAPI_XML_PRETTY,
     DEFAULT_SHUTDOWN_TIMEOUT,
     HARD_MAX_ATTACHMENT_SIZE,
@@ -25,6 +26,8 @@
     HARD_MAX_CIRCUIT_RESET_TIMEOUT,
     HARD_MAX_HALF_OPEN_CALLS,
     HARD_MAX_HEARTBEAT_INTERVAL,
+    HARD_MAX_RAPI_RETRY_BUDGET_MAX_TOKENS,
+    HARD_MAX_RAPI_RETRY_BUDGET_RATIO,
     HARD_MAX_SHUTDOWN_TIMEOUT,
     HARD_MAX_SOPS_CACHE_ENTRIES,
     HARD_MIN_CIRCUIT_FAILURES,
@@ -37,6 +40,7 @@
     SopsLimits,
     get_cache_limits,
     get_mail_limits,
+    get_rapi_limits,
     get_rapi_render_config,
     get_resilience_limits,
     get_sops_limits,
@@ -366,6 +370,12 @@ def test_reads_from_config(self) -> None:
         assert limits.circuit_reset_timeout == 90.0
         assert limits.circuit_half_open_calls == 2
 
+    def test_heartbeat_fsync(self) -> None:
+        """heartbeat.fsync defaults to False and is read from config."""
+        assert get_resilience_limits(config={}).heartbeat_fsync is False
+        config = {"resilience": {"heartbeat": {"fsync": True}}}
+        assert get_resilience_limits(config=config).heartbeat_fsync is True
+
     def test_clamps_to_hard_maximums(self) -> None:
         """Clamp values to hard maximums."""
         config = {
@@ -522,6 +532,33 @@ def test_returns_default_for_missing_key(self) -> None:
         assert result == "fallback"
 
 
+class TestGetRapiLimits:
+    """Tests for the RAPI retry budget limits."""
+
+    def test_retry_budget_defaults(self) -> None:
+        """The retry budget uses defaults when not configured."""
+        limits = get_rapi_limits(config={})
+        assert limits.retry_budget_ratio == DEFAULT_RAPI_RETRY_BUDGET_RATIO
+        assert limits.retry_budget_per_second == 1.0
+        assert limits.retry_budget_max_tokens == 10.0
+
+    def test_retry_budget_from_config_and_clamped(self) -> None:
+        """Retry budget values are read from rapi.limits and clamped to hard bounds."""
+        config = {
+            "rapi": {
+                "limits": {
+                    "retry_budget_ratio": 5,
+                    "retry_budget_per_second": 0.5,
+                    "retry_budget_max_tokens": 1e9,
+                }
+            }
+        }
+        limits = get_rapi_limits(config=config)
+        assert limits.retry_budget_ratio == HARD_MAX_RAPI_RETRY_BUDGET_RATIO
+        assert limits.retry_budget_per_second == 0.5
+        assert limits.retry_budget_max_tokens == HARD_MAX_RAPI_RETRY_BUDGET_MAX_TOKENS
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # RapiRenderConfig tests
 # ─────────────────────────────────────────────────────────────────────────────
@@ -600,6 +600,28 @@ async def test_send_dict_message(self) -> None:
         await ws.send({"key": "value"})
         ws._ws.send.assert_called_once_with('{"key": "value"}')
 
+    @pytest.mark.asyncio
+    async def test_send_through_adaptive_limiter(self) -> None:
+        """send holds a limiter slot and feeds the send latency."""
+        from kstlib.resilience import AdaptiveLimiter
+        from kstlib.websocket import WebSocketManager
+
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=4)
+        ws = WebSocketManager("wss://example.com/ws", send_limiter=limiter)
+        ws._state = ConnectionState.CONNECTED
+        ws._ws = MagicMock()
+
+        async def fake_send(message: str) -> None:
+            assert limiter.active == 1
+
+        ws._ws.send = AsyncMock(side_effect=fake_send)
+
+        await ws.send("ping")
+        ws._ws.send.assert_called_once_with("ping")
+        assert limiter.active == 0
+        assert limiter.stats.total_acquired == 1
+        assert limiter.min_rtt is not None
+
 
 class TestWebSocketManagerIsConnected:
     """Tests for is_connected property."""